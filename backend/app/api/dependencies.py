@@ -1,6 +1,7 @@
 from fastapi import Depends, Header, HTTPException, status, Request
 from typing import Dict, Optional, Any
 import logging
+import math
 import time
 import re
 from pydantic import BaseModel
@@ -9,8 +10,10 @@ from datetime import datetime, timezone
 
 from app.db.database import get_collection
 from app.db.database import create_audit_log
-from app.db.usage import increment_usage
+from app.db.usage import increment_usage_windows
 from app.core.config import settings, is_production_env
+from app.core.entitlements import ai_quota_limits
+from app.core.rate_limit import RATE_LIMIT_ENGINES, rate_limit_store
 from app.core.security import get_current_user_from_session
 
 logger = logging.getLogger(__name__)
@@ -71,28 +74,37 @@ class SanitizedModel(BaseModel):
         super().__init__(**data)
 
 
-def get_rate_limiter(limit: int = 10, window: int = 60):
+def get_rate_limiter(limit: int = 10, window: int = 60, engine: str = "fixed"):
     """Create a rate limiter dependency with specific limits (issue #180).
 
     Buckets are keyed per **authenticated user** (every rate-limited endpoint
     also requires session auth, so FastAPI's per-request dependency cache makes
-    the user lookup free) and persisted in Mongo via the same atomic
-    ``$inc``+TTL counter as the AI quota (#173) — shared across uvicorn
-    workers, surviving restarts, self-evicting.
-
-    Fixed epoch-aligned windows: a client can burst up to 2x the limit across
-    a window boundary (standard fixed-window tradeoff; the boundary is now
-    predictable, unlike the old first-request-anchored reset). Mongo failure
-    propagates (fail-closed) — auth on these endpoints already requires the
-    same Mongo, so there's no new blast radius.
+    the user lookup free) and persisted in the same ``$inc``+TTL counters as
+    the AI quota (#173) — shared across uvicorn workers, surviving restarts,
+    self-evicting. Admission is decided from the worker's local view
+    (``app.core.rate_limit``), which is reconciled to Mongo in batches, so the
+    request path does no DB write.
+
+    ``engine`` picks the counting algorithm (``app.core.rate_limit``):
+    ``"fixed"`` epoch-aligned windows let a client burst up to 2x the limit
+    across a window boundary (standard fixed-window tradeoff; the boundary is
+    predictable, unlike the old first-request-anchored reset). ``"sliding"``
+    weights in the previous window's count, capping that burst at about the
+    limit; use it where boundary bursts hurt (AI endpoints). A failed
+    reconcile fails closed (503) until the next one succeeds — auth on these
+    endpoints already requires the same Mongo, so there's no new blast radius.
 
     Args:
         limit: Maximum number of requests allowed in the time window
         window: Time window in seconds
+        engine: ``"fixed"`` or ``"sliding"``
 
     Returns:
         A dependency function that can be used with Depends()
     """
+    if engine not in RATE_LIMIT_ENGINES:
+        raise ValueError(f"Unknown rate limit engine: {engine!r}")
+    count_request = RATE_LIMIT_ENGINES[engine]
 
     async def rate_limiter(
         request: Request,
@@ -114,20 +126,24 @@ def get_rate_limiter(limit: int = 10, window: int = 60):
             or (request.client.host if request.client else "unknown")
         )
 
-        now = time.time()
-        bucket_start = int(now // window) * window
-        reset_at = bucket_start + window
+        if rate_limit_store.failed:
+            raise HTTPException(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                detail="Rate limiting is temporarily unavailable. Try again shortly.",
+                headers={"Retry-After": str(max(1, int(rate_limit_store.sync_interval)))},
+            )
 
-        # TTL of 2 windows: the bucket outlives its own window, then Mongo reaps it.
-        count = await increment_usage(
-            subject, f"rl:{request.url.path}:{bucket_start}", ttl_seconds=window * 2
+        now = time.time()
+        count, reset_at = count_request(
+            rate_limit_store, subject, request.url.path, now, window
         )
 
         if count > limit:
             retry_after = max(1, int(reset_at - now) + 1)
             logger.warning(
-                "Rate limit exceeded: subject=%s path=%s limit=%s window=%ss count=%s",
-                subject, request.url.path, limit, window, count,
+                "Rate limit exceeded: subject=%s path=%s limit=%s window=%ss "
+                "engine=%s count=%s",
+                subject, request.url.path, limit, window, engine, round(count, 2),
             )
             raise HTTPException(
                 status_code=status.HTTP_429_TOO_MANY_REQUESTS,
@@ -142,23 +158,35 @@ def get_rate_limiter(limit: int = 10, window: int = 60):
 
         return {
             "limit": limit,
-            "remaining": limit - count,
+            "remaining": max(0, limit - math.ceil(count)),
             "reset": reset_at,
         }
 
     return rate_limiter
 
 
+# (period, bucket strftime format, counter TTL in seconds) for the AI quota,
+# narrowest first: the first exceeded window is the one reported in the 429.
+AI_QUOTA_WINDOWS = (
+    ("hour", "%Y-%m-%dT%H", 2 * 3600),
+    ("day", "%Y-%m-%d", 2 * 86400),
+    ("month", "%Y-%m", 40 * 86400),
+)
+
+
 def get_ai_usage_quota():
     """Create a per-user AI-generation quota dependency (issue #173, cost control).
 
-    Increments a per-user counter (daily + monthly) in Mongo on every call and
-    raises 429 once the configured cap is exceeded — enforced *before* the AI
-    call so a leaked cookie or runaway client can't rack up unbounded spend.
+    Increments the user's hourly/daily/monthly counters in Mongo on every call
+    and raises 429 once a cap is exceeded — enforced *before* the AI call so a
+    leaked cookie or runaway client can't rack up unbounded spend. Every enabled
+    window is bumped in one atomic update (``increment_usage_windows``), so the
+    check costs one round trip however many windows are configured.
 
-    Counts off the user's ``auth_id`` today; swap to plan/entitlement when P0.2
-    lands. ponytail: rejected calls still increment (matches the in-memory
-    limiter) — the counter tracks attempts, which is fine for a spend cap.
+    Counts off the user's ``auth_id``; the caps come from the user's plan
+    (``app.core.entitlements.ai_quota_limits``). ponytail: rejected calls still
+    increment, in every window (matches the in-memory limiter) — the counter
+    tracks attempts, which is fine for a spend cap.
     """
 
     async def check_quota(
@@ -190,15 +218,24 @@ def get_ai_usage_quota():
                 detail="Unable to identify user for AI usage metering.",
             )
 
+        limits = ai_quota_limits(current_user.get("plan"))
         now = datetime.now(timezone.utc)
-        windows = (
-            ("day", now.strftime("%Y-%m-%d"), settings.AI_QUOTA_DAILY_LIMIT, 2 * 86400),
-            ("month", now.strftime("%Y-%m"), settings.AI_QUOTA_MONTHLY_LIMIT, 40 * 86400),
+        # Disabled windows (limit <= 0) are neither counted nor checked.
+        windows = [
+            (period, now.strftime(fmt), limits.get(period, 0), ttl)
+            for period, fmt, ttl in AI_QUOTA_WINDOWS
+            if limits.get(period, 0) > 0
+        ]
+        if not windows:
+            return
+
+        counts = await increment_usage_windows(
+            user_id,
+            {period: bucket for period, bucket, _, _ in windows},
+            ttl_seconds=max(ttl for _, _, _, ttl in windows),
         )
-        for period, bucket, limit, ttl in windows:
-            if limit <= 0:  # window disabled
-                continue
-            count = await increment_usage(user_id, f"{period}:{bucket}", ttl)
+        for period, _, limit, _ in windows:
+            count = counts[period]
             if count > limit:
                 path = getattr(getattr(request, "url", None), "path", "unknown")
                 logger.warning(
@@ -255,6 +292,7 @@ async def audit_request(
     resource_type: str,
     target_id: Optional[str] = None,
     metadata: Optional[Dict] = None,
+    durable: bool = False,
 ) -> Dict[str, Any]:
     """
     Log an audit entry for the current request.
@@ -269,6 +307,8 @@ async def audit_request(
         resource_type: The type of resource being accessed (e.g., "user", "book")
         target_id: The ID of the resource being accessed (if applicable)
         metadata: Optional dictionary of additional metadata to include in the audit log
+        durable: Write the entry before returning instead of queueing it (see
+            app.db.audit_log); for records that must survive a crash
 
     Returns:
         User payload dictionary with sub and email fields
@@ -322,6 +362,7 @@ async def audit_request(
         target_id=target_id or "unknown",
         resource_type=resource_type,
         details=details,
+        durable=durable,
     )
 
     # Return user payload
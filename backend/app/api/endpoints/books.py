@@ -8,6 +8,7 @@ from fastapi import (
     HTTPException,
     status,
     Request,
+    Response,
     Query,
     UploadFile,
     File,
@@ -28,6 +29,9 @@ from app.utils.error_handlers import (
     handle_generic_error,
     generate_request_id,
 )
+from app.utils.etag import book_etag, etag_matches, make_etag, not_modified
+from app.utils.text_patch import TextPatchError, apply_text_patch
+from app.utils.toc_index import TocIndex
 from app.schemas.errors import ErrorCode
 
 from app.core.security import get_current_user_from_session, SessionRoleChecker
@@ -53,11 +57,20 @@ from app.schemas.book import (
     QuestionProgressResponse,
 )
 from app.db.database import (
-    create_book, get_book_by_id, get_book_owner_id, get_book_metadata_by_id,
-    get_books_by_user,
+    create_book, get_book_by_id, get_book_owner_id, get_book_head, get_book_metadata_by_id,
+    get_chapter_by_id, get_chapters_by_ids, get_books_by_user, encode_books_cursor,
     update_book, apply_chapter_content_update, update_book_summary_atomic,
     delete_book
 )
+from app.db.book_stats import book_stats
+from app.db.chapter_content import (
+    content_hash,
+    get_chapter_content_hash,
+    get_chapter_content_hashes,
+    get_chapter_contents,
+    get_stored_chapter_content,
+    iter_chapters,
+)
 from app.db.toc_transactions import (
     update_toc_with_transaction,
     reorder_chapters_with_transaction,
@@ -95,6 +108,10 @@ router = APIRouter()
 # Role-based access controls
 allow_users_and_admins = SessionRoleChecker(["user", "admin"])
 
+# Read/write rounds the autosave makes when the chapter keeps moving (its
+# parent changes) between the read and the write.
+CONTENT_UPDATE_ATTEMPTS = 3
+
 
 # Helper to load offensive words from JSON
 OFFENSIVE_WORDS_PATH = os.path.join(
@@ -163,27 +180,49 @@ async def create_new_book(
 @router.get("/", response_model=List[BookResponse])
 async def get_user_books(
     request: Request,
+    response: Response,
     skip: int = Query(0, ge=0),
     limit: int = Query(100, ge=1, le=100),
+    cursor: Optional[str] = Query(
+        None, description="X-Next-Cursor from the previous page; takes precedence over skip"
+    ),
     current_user: Dict = Depends(get_current_user_from_session),
     rate_limit_info: Dict = Depends(get_rate_limiter(limit=20, window=60)),
 ):
 
-    """Get all books for the current user"""
+    """Get all books for the current user, newest first.
+
+    A full page carries an ``X-Next-Cursor`` header; pass it back as
+    ``cursor`` for the next page. The body stays a plain list so offset
+    (``skip``) callers are unaffected.
+    """
     try:
-        books = await get_books_by_user(
-            user_auth_id=current_user.get("auth_id"),
-            skip=skip,
-            limit=limit
-        )
+        try:
+            books = await get_books_by_user(
+                user_auth_id=current_user.get("auth_id"),
+                skip=skip,
+                limit=limit,
+                cursor=cursor,
+            )
+        except ValueError:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Invalid cursor",
+            )
+
+        if len(books) == limit and books[-1].get("updated_at"):
+            response.headers["X-Next-Cursor"] = encode_books_cursor(books[-1])
 
         # Convert ObjectId to str for all books
         for book in books:
             if "_id" in book:
                 book["id"] = str(book["_id"])
+            book["stats"] = book_stats(book)
 
         return books
 
+    except HTTPException:
+        raise
     except Exception:
         logger.error("Failed to retrieve books", exc_info=True)
         raise HTTPException(
@@ -196,10 +235,17 @@ async def get_user_books(
 async def get_book(
     book_id: str,
     request: Request,
+    response: Response,
     current_user: Dict = Depends(get_current_user_from_session),
     rate_limit_info: Dict = Depends(get_rate_limiter(limit=20, window=60)),
 ):
-    """Get a specific book by ID"""
+    """Get a specific book by ID.
+
+    Carries an ``ETag``; a matching ``If-None-Match`` gets a 304 without the
+    book (or any chapter body) being read. The tag covers the hashes of the
+    chapter bodies, which are written apart from the TOC: a read between an
+    autosave's TOC write and its body write must not pin the old body.
+    """
     try:
         # Validate book_id format
         try:
@@ -210,6 +256,16 @@ async def get_book(
                 detail="Invalid book ID format",
             )
 
+        if_none_match = request.headers.get("if-none-match")
+        if if_none_match:
+            head = await get_book_head(book_id)
+            if head and head.get("owner_id") == current_user.get("auth_id"):
+                etag = book_etag(
+                    head, sorted((await get_chapter_content_hashes(book_id)).items())
+                )
+                if etag_matches(if_none_match, etag):
+                    return not_modified(etag)
+
         # Get the book from the database
         book = await get_book_by_id(book_id)
 
@@ -231,6 +287,20 @@ async def get_book(
         # Convert ObjectId to str
         if "_id" in book:
             book["id"] = str(book["_id"])
+        book["stats"] = book_stats(book)
+        # Hashed from the bodies this response carries, so the tag never
+        # stands for a body other than the one sent. Inline (unmigrated) bodies
+        # have no stored hash, so their books simply never match.
+        response.headers["ETag"] = book_etag(
+            book,
+            sorted(
+                (chapter["id"], content_hash(chapter["content"]))
+                for chapter in iter_chapters(
+                    (book.get("table_of_contents") or {}).get("chapters")
+                )
+                if "content" in chapter and chapter.get("id")
+            ),
+        )
 
         # Log the book view
         await audit_request(
@@ -711,7 +781,7 @@ async def patch_book_summary(
 async def analyze_book_summary(
     book_id: str,
     current_user: Dict = Depends(get_current_user_from_session),
-    rate_limit_info: Dict = Depends(get_rate_limiter(limit=5, window=60)),
+    rate_limit_info: Dict = Depends(get_rate_limiter(limit=5, window=60, engine="sliding")),
 ):
     """
     Analyze the book summary using AI to determine readiness for TOC generation.
@@ -833,7 +903,7 @@ async def generate_clarifying_questions(
     book_id: str,
     data: dict = Body(default={}),
     current_user: Dict = Depends(get_current_user_from_session),
-    rate_limit_info: Dict = Depends(get_rate_limiter(limit=3, window=60)),
+    rate_limit_info: Dict = Depends(get_rate_limiter(limit=3, window=60, engine="sliding")),
 ):
     """
     Generate clarifying questions based on the book summary to improve TOC generation.
@@ -1145,7 +1215,7 @@ async def generate_table_of_contents(
     data: dict = Body(default={}),
     current_user: Dict = Depends(get_current_user_from_session),
     rate_limit_info: Dict = Depends(
-        get_rate_limiter(limit=2, window=300)
+        get_rate_limiter(limit=2, window=300, engine="sliding")
     ),  # 2 per 5 minutes
 ):
     """
@@ -1284,21 +1354,36 @@ async def generate_table_of_contents(
 @router.get("/{book_id}/toc", status_code=status.HTTP_200_OK)
 async def get_book_toc(
     book_id: str,
+    request: Request,
+    response: Response,
     current_user: Dict = Depends(get_current_user_from_session),
 ):
     """
     Get the Table of Contents for a book.
     Returns the current TOC structure or empty structure if none exists.
-    """
 
-    # Get the book and verify ownership
-    book = await get_book_by_id(book_id)
+    Carries an ``ETag``; a matching ``If-None-Match`` gets a 304 after reading
+    only the book's version fields.
+    """
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match:
+        head = await get_book_head(book_id)
+        if head and head.get("owner_id") == current_user.get("auth_id"):
+            etag = book_etag(head, "toc")
+            if etag_matches(if_none_match, etag):
+                return not_modified(etag)
+
+    # Get the book and verify ownership. The TOC is structure only; chapter
+    # bodies are served by the chapter content endpoints. A repeat read of an
+    # unchanged book is answered from the per-worker book cache.
+    book = await get_book_metadata_by_id(book_id)
     if not book:
         raise HTTPException(status_code=404, detail="Book not found")
     if book.get("owner_id") != current_user.get("auth_id"):
         raise HTTPException(
             status_code=403, detail="Not authorized to access this book's TOC"
         )
+    response.headers["ETag"] = book_etag(book, "toc")
 
     # Get TOC from book record
     toc = book.get("table_of_contents", {})
@@ -1337,12 +1422,17 @@ async def get_book_toc(
 @router.put("/{book_id}/toc", status_code=status.HTTP_200_OK)
 async def update_book_toc(
     book_id: str,
+    request: Request,
     data: dict = Body(...),
     current_user: Dict = Depends(get_current_user_from_session),
 ):
     """
     Update the Table of Contents for a book.
     Saves user edits to the TOC structure with transaction support.
+
+    An ``If-Match`` with the TOC's ETag is an alternative to
+    ``toc.expected_version``: a stale tag gets 412, and the write is guarded
+    on the version that tag was issued for.
     """
     # Validate TOC data. Both keys are *required*, not defaulted: the update
     # replaces `table_of_contents` wholesale, so defaulting a missing key to
@@ -1381,6 +1471,24 @@ async def update_book_toc(
                 status_code=400, detail=f"Chapter {i} must have a title"
             )
 
+    if_match = request.headers.get("if-match")
+    if if_match:
+        head = await get_book_head(book_id)
+        if not head:
+            raise HTTPException(status_code=404, detail="Book not found")
+        if head.get("owner_id") != current_user.get("auth_id"):
+            raise HTTPException(
+                status_code=403, detail="Not authorized to update this book's TOC"
+            )
+        if not etag_matches(if_match, book_etag(head, "toc"), weak=False):
+            raise HTTPException(
+                status_code=status.HTTP_412_PRECONDITION_FAILED,
+                detail="The TOC has changed since it was read. Please refresh and try again.",
+            )
+        toc_data["expected_version"] = (head.get("table_of_contents") or {}).get(
+            "version", 1
+        )
+
     try:
         logger.info(f"Updating TOC for book_id={book_id}, user_auth_id={current_user.get('auth_id')}")
 
@@ -1421,10 +1529,26 @@ async def update_book_toc(
 # Enhanced Chapter Content Integration Endpoints
 
 
+def _chapter_content_etag(chapter: Dict, digest: str, include_metadata: bool) -> str:
+    """ETag over everything the content response is built from."""
+    return make_etag(
+        digest,
+        include_metadata,
+        chapter.get("title", ""),
+        chapter.get("status", "draft"),
+        chapter.get("word_count", 0),
+        chapter.get("last_modified"),
+        chapter.get("is_active_tab", False),
+        len(chapter.get("subchapters") or []),
+    )
+
+
 @router.get("/{book_id}/chapters/{chapter_id}/content", response_model=dict)
 async def get_chapter_content(
     book_id: str,
     chapter_id: str,
+    request: Request,
+    response: Response,
     current_user: Dict = Depends(get_current_user_from_session),
     include_metadata: bool = Query(
         True, description="Include chapter metadata in response"
@@ -1432,9 +1556,17 @@ async def get_chapter_content(
 ):
     """
     Get chapter content with enhanced metadata for tab interface.
+
+    Carries an ``ETag`` over the body's hash and the chapter's metadata. With
+    a matching ``If-None-Match`` the body is never read: the chapter entry and
+    the stored ``content_hash`` answer the 304.
     """
-    # Get the book and verify ownership
-    book = await get_book_by_id(book_id)
+    if_none_match = request.headers.get("if-none-match")
+    # Read only this chapter plus the owner, not the whole book; the body too
+    # unless a stored hash may let us skip it.
+    book = await get_chapter_by_id(
+        book_id, chapter_id, include_content=not if_none_match
+    )
     if not book:
         raise HTTPException(status_code=404, detail="Book not found")
     if book.get("owner_id") != current_user.get("auth_id"):
@@ -1442,25 +1574,32 @@ async def get_chapter_content(
             status_code=403, detail="Not authorized to access this book's content"
         )
 
-    # Find the chapter in TOC
-    current_toc = book.get("table_of_contents", {})
-    chapters = current_toc.get("chapters", [])
-
-    def find_chapter(chapter_list):
-        for chapter in chapter_list:
-            if chapter.get("id") == chapter_id:
-                return chapter
-            if chapter.get("subchapters"):
-                found = find_chapter(chapter["subchapters"])
-                if found:
-                    return found
-        return None
-
-    chapter = find_chapter(chapters)
+    chapter = book["chapter"]
     if not chapter:
         raise HTTPException(
             status_code=404, detail="Chapter not found"
-        )  # Log chapter access
+        )
+
+    stored_digest = None
+    if if_none_match:
+        stored_digest = await get_chapter_content_hash(book_id, chapter_id)
+        if stored_digest is None:
+            # No stored hash (no body yet, or one written before hashes were
+            # kept): read the chapter with its body after all.
+            book = await get_chapter_by_id(book_id, chapter_id)
+            chapter = (book or {}).get("chapter")
+            if not chapter:
+                raise HTTPException(status_code=404, detail="Chapter not found")
+    digest = stored_digest or content_hash(chapter.get("content", ""))
+    etag = _chapter_content_etag(chapter, digest, include_metadata)
+    not_changed = etag_matches(if_none_match, etag)
+    if stored_digest and not not_changed:
+        # The stored body wins over any inline copy, as on a full read.
+        chapter["content"] = (await get_chapter_contents(book_id, [chapter_id])).get(
+            chapter_id, ""
+        )
+
+    # Log chapter access
     try:
         await chapter_access_service.log_access(
             user_id=current_user.get("auth_id"),
@@ -1475,6 +1614,10 @@ async def get_chapter_content(
         )
     except Exception:
         logger.error("Failed to log chapter content access", exc_info=True)
+    if not_changed:
+        return not_modified(etag)
+    response.headers["ETag"] = etag
+
     # Prepare response
     response = {
         "book_id": book_id,
@@ -1511,92 +1654,113 @@ async def get_chapter_content(
 async def update_chapter_content(
     book_id: str,
     chapter_id: str,
-    content: str = Body(..., embed=True),
+    content: Optional[str] = Body(None, embed=True),
     auto_update_metadata: bool = Body(True, embed=True),
+    patch: Optional[List[Dict[str, Any]]] = Body(None, embed=True),
+    base_hash: Optional[str] = Body(None, embed=True),
+    result_hash: Optional[str] = Body(None, embed=True),
     current_user: Dict = Depends(get_current_user_from_session),
 ):
     """
     Update chapter content with automatic metadata updates.
+
+    Send either the full ``content`` or a delta: ``patch`` ops (see
+    ``app.utils.text_patch``) against the stored body whose hash is
+    ``base_hash``, plus the ``result_hash`` of the text they produce. A delta
+    whose base is not the stored body, or that does not produce
+    ``result_hash``, is rejected with 409 ``CONTENT_PATCH_MISMATCH``; the
+    client then sends the full content. The response carries the new
+    ``content_hash`` to base the next delta on.
     """
+    if (content is None) == (patch is None):
+        raise HTTPException(
+            status_code=422, detail="Send exactly one of content or patch"
+        )
+    if patch is not None and not (base_hash and result_hash):
+        raise HTTPException(
+            status_code=422, detail="A patch requires base_hash and result_hash"
+        )
     # Verify ownership and read the TOC *structure*. The projection drops every
     # chapter's draft HTML, which this handler never reads — it only walks the
     # tree to find the target chapter, its parent, and its current status, then
     # writes through the scoped apply_chapter_content_update below. This is the
     # 3s autosave path, so the whole-document read it used to do was the worst
     # instance of the overfetch in #344.
-    book = await get_book_metadata_by_id(book_id)
-    if not book:
-        raise HTTPException(status_code=404, detail="Book not found")
-    if book.get("owner_id") != current_user.get("auth_id"):
-        raise HTTPException(
-            status_code=403, detail="Not authorized to modify this book's content"
-        )
-
-    # Get current TOC
-    current_toc = book.get("table_of_contents", {})
-    chapters = current_toc.get("chapters", [])
+    #
+    # The write only misses when the chapter is gone or has moved under another
+    # parent since the read; re-read to tell which. A concurrent save to the
+    # same chapter never makes it miss (the stats delta is corrected in place).
+    for attempt in range(CONTENT_UPDATE_ATTEMPTS):
+        book = await get_book_metadata_by_id(book_id)
+        if not book:
+            raise HTTPException(status_code=404, detail="Book not found")
+        if book.get("owner_id") != current_user.get("auth_id"):
+            raise HTTPException(
+                status_code=403, detail="Not authorized to modify this book's content"
+            )
 
-    # Locate the chapter and compute only the fields that change. We persist via
-    # a targeted arrayFilters $set (below) instead of rewriting the whole TOC, so
-    # a concurrent autosave to a different chapter can't clobber this one (#177).
-    def compute_chapter_update(chapter_list, parent_id=None):
-        for chapter in chapter_list:
-            if chapter.get("id") == chapter_id:
-                fields = {"content": content}
-                if auto_update_metadata:
-                    word_count = len(content.split()) if content else 0
-                    fields["word_count"] = word_count
-                    fields["last_modified"] = datetime.now(timezone.utc).isoformat()
-                    # ~200 words per minute
-                    fields["estimated_reading_time"] = max(1, word_count // 200)
-                    # Status transition based on content length (simple heuristic)
-                    current_status = chapter.get("status", "draft")
-                    if word_count > 100 and current_status == "draft":
-                        fields["status"] = "in-progress"
-                    elif word_count > 500 and current_status == "in-progress":
-                        fields["status"] = "completed"
-                return fields, parent_id
-            # Recursively search subchapters (parent is this chapter's id)
-            if chapter.get("subchapters"):
-                result = compute_chapter_update(
-                    chapter["subchapters"], parent_id=chapter.get("id")
+        # Get current TOC
+        current_toc = book.get("table_of_contents", {})
+        chapters = current_toc.get("chapters", [])
+
+        # Locate the chapter and compute only the fields that change. We persist
+        # via a targeted arrayFilters $set (below) instead of rewriting the whole
+        # TOC, so a concurrent autosave to a different chapter can't clobber this
+        # one (#177).
+        node = TocIndex(chapters).node(chapter_id)
+        if not node:
+            raise HTTPException(status_code=404, detail="Chapter not found")
+        if content is None:
+            content = await _apply_content_patch(
+                book_id, chapter_id, patch, base_hash, result_hash
+            )
+        chapter_fields = {"content": content}
+        if auto_update_metadata:
+            word_count = len(content.split()) if content else 0
+            chapter_fields["word_count"] = word_count
+            chapter_fields["last_modified"] = datetime.now(timezone.utc).isoformat()
+            # ~200 words per minute
+            chapter_fields["estimated_reading_time"] = max(1, word_count // 200)
+            # Status transition based on content length (simple heuristic)
+            current_status = node.chapter.get("status", "draft")
+            if word_count > 100 and current_status == "draft":
+                chapter_fields["status"] = "in-progress"
+            elif word_count > 500 and current_status == "in-progress":
+                chapter_fields["status"] = "completed"
+
+        if attempt == 0:
+            # Log chapter access
+            try:
+                await chapter_access_service.log_access(
+                    user_id=current_user.get("auth_id"),
+                    book_id=book_id,
+                    chapter_id=chapter_id,
+                    access_type="update_content",
+                    metadata={
+                        "content_length": len(content) if content else 0,
+                        "auto_updated_metadata": auto_update_metadata,
+                        "update_timestamp": datetime.now(timezone.utc).isoformat(),
+                    },
                 )
-                if result:
-                    return result
-        return None
-
-    computed = compute_chapter_update(chapters)
-    if not computed:
-        raise HTTPException(
-            status_code=404, detail="Chapter not found"
-        )  # Log chapter access
-    chapter_fields, parent_chapter_id = computed
-    try:
-        await chapter_access_service.log_access(
-            user_id=current_user.get("auth_id"),
+            except Exception:
+                logger.error("Failed to log chapter content update", exc_info=True)
+
+        # Persist via a targeted, concurrency-safe positional update (only this
+        # chapter's fields + an atomic version $inc) rather than a whole-TOC
+        # rewrite. A miss means the chapter was deleted/moved or changed since
+        # the read; the next read tells which.
+        persisted = await apply_chapter_content_update(
             book_id=book_id,
             chapter_id=chapter_id,
-            access_type="update_content",
-            metadata={
-                "content_length": len(content) if content else 0,
-                "auto_updated_metadata": auto_update_metadata,
-                "update_timestamp": datetime.now(timezone.utc).isoformat(),
-            },
+            parent_chapter_id=node.parent_id,
+            chapter_fields=chapter_fields,
+            user_auth_id=current_user.get("auth_id"),
+            previous=node.chapter,
+            stats_stored="stats" in book,
         )
-    except Exception:
-        logger.error("Failed to log chapter content update", exc_info=True)
-
-    # Persist via a targeted, concurrency-safe positional update (only this
-    # chapter's fields + an atomic version $inc) rather than a whole-TOC rewrite.
-    persisted = await apply_chapter_content_update(
-        book_id=book_id,
-        chapter_id=chapter_id,
-        parent_chapter_id=parent_chapter_id,
-        chapter_fields=chapter_fields,
-        user_auth_id=current_user.get("auth_id"),
-    )
-    if not persisted:
-        # The chapter was deleted/moved between the read above and this write.
+        if persisted:
+            break
+    else:
         raise HTTPException(status_code=404, detail="Chapter not found")
 
     return {
@@ -1605,9 +1769,46 @@ async def update_chapter_content(
         "success": True,
         "message": "Chapter content updated successfully",
         "metadata_updated": auto_update_metadata,
+        "content_hash": content_hash(content),
     }
 
 
+async def _apply_content_patch(
+    book_id: str,
+    chapter_id: str,
+    patch: List[Dict[str, Any]],
+    base_hash: str,
+    result_hash: str,
+) -> str:
+    """Resolve a delta autosave to the full body it produces.
+
+    The base is checked against the stored ``content_hash``, read together
+    with the body, and the result against ``result_hash``, so a client whose
+    copy drifted never persists a mangled body.
+
+    ponytail: the check and the write are not one atomic step; a full save
+    landing in between is overwritten, exactly as two full saves overwrite
+    each other (last writer wins).
+    """
+    mismatch = HTTPException(
+        status_code=409,
+        detail={
+            "message": "Chapter content does not match the patch; send the full content",
+            "error_code": ErrorCode.CONTENT_PATCH_MISMATCH.value,
+        },
+    )
+    stored = await get_stored_chapter_content(book_id, chapter_id) or {}
+    if stored.get("content_hash") != base_hash:
+        raise mismatch
+    try:
+        content = apply_text_patch(stored.get("content", ""), patch)
+    except TextPatchError:
+        raise mismatch
+    if content_hash(content) != result_hash:
+        raise mismatch
+    return content
+
+
 @router.get("/{book_id}/chapters/{chapter_id}/analytics", response_model=dict)
 async def get_chapter_analytics(
     book_id: str,
@@ -1630,18 +1831,12 @@ async def get_chapter_analytics(
         )
 
     try:
-        # Get chapter analytics
-        # The service aggregates analytics for the whole book; this route is
-        # chapter-specific, so keep only entries for the requested chapter.
-        book_analytics = await chapter_access_service.get_chapter_analytics(
+        # Get chapter analytics from the per-day rollups of this chapter only
+        analytics = await chapter_access_service.get_chapter_analytics(
             book_id=book_id,
             days=days,
+            chapter_id=chapter_id,
         )
-        analytics = [
-            entry
-            for entry in book_analytics
-            if entry.get("_id", {}).get("chapter_id") == chapter_id
-        ]
 
         return {
             "book_id": book_id,
@@ -1674,8 +1869,9 @@ async def batch_get_chapter_content(
             status_code=400, detail="Cannot request more than 20 chapters at once"
         )
 
-    # Get the book and verify ownership
-    book = await get_book_by_id(book_id)
+    # Read only the requested chapters (and their bodies) plus the owner; the
+    # rest of the manuscript never leaves Mongo.
+    book = await get_chapters_by_ids(book_id, chapter_ids)
     if not book:
         raise HTTPException(status_code=404, detail="Book not found")
     if book.get("owner_id") != current_user.get("auth_id"):
@@ -1683,26 +1879,14 @@ async def batch_get_chapter_content(
             status_code=403, detail="Not authorized to access this book's content"
         )
 
-    # Get current TOC
-    current_toc = book.get("table_of_contents", {})
-    chapters = current_toc.get("chapters", [])
-
-    def find_chapter(chapter_list, target_id):
-        for chapter in chapter_list:
-            if chapter.get("id") == target_id:
-                return chapter
-            if chapter.get("subchapters"):
-                found = find_chapter(chapter["subchapters"], target_id)
-                if found:
-                    return found
-        return None
+    chapters_by_id = book["chapters"]
 
     # Collect chapter data
     chapter_data = {}
     found_chapters = []
 
     for chapter_id in chapter_ids:
-        chapter = find_chapter(chapters, chapter_id)
+        chapter = chapters_by_id.get(chapter_id)
         if chapter:
             found_chapters.append(chapter)
 
@@ -1766,7 +1950,7 @@ async def generate_chapter_questions(
     chapter_id: str,
     request_data: GenerateQuestionsRequest = Body(...),
     current_user: Dict = Depends(get_current_user_from_session),
-    rate_limit_info: Dict = Depends(get_rate_limiter(limit=3, window=120)), # 3 per 2 minutes
+    rate_limit_info: Dict = Depends(get_rate_limiter(limit=3, window=120, engine="sliding")), # 3 per 2 minutes
 ):
     """
     Generate interview-style questions for a specific chapter based on its content and metadata.
@@ -2259,7 +2443,7 @@ async def regenerate_single_question(
     question_id: str,
     request_data: RegenerateQuestionRequest = Body(default=RegenerateQuestionRequest()),
     current_user: Dict = Depends(get_current_user_from_session),
-    rate_limit_info: Dict = Depends(get_rate_limiter(limit=2, window=180)),  # 2 per 3 minutes
+    rate_limit_info: Dict = Depends(get_rate_limiter(limit=2, window=180, engine="sliding")),  # 2 per 3 minutes
 ):
     """
     Regenerate a single question, replacing it with a fresh, meaningfully different one.
@@ -2426,7 +2610,7 @@ async def regenerate_chapter_questions(
     request_data: GenerateQuestionsRequest = Body(...),
     preserve_responses: bool = Query(True, description="Preserve questions with responses"),
     current_user: Dict = Depends(get_current_user_from_session),
-    rate_limit_info: Dict = Depends(get_rate_limiter(limit=2, window=180)), # 2 per 3 minutes
+    rate_limit_info: Dict = Depends(get_rate_limiter(limit=2, window=180, engine="sliding")), # 2 per 3 minutes
 ):
     """
     Regenerate questions for a chapter, optionally preserving existing responses.
@@ -2532,15 +2716,16 @@ async def generate_chapter_draft(
     data: dict = Body(default={}),
     current_user: Dict = Depends(get_current_user_from_session),
     rate_limit_info: Dict = Depends(
-        get_rate_limiter(limit=5, window=3600)
+        get_rate_limiter(limit=5, window=3600, engine="sliding")
     ),  # 5 per hour
 ):
     """
     Generate a draft chapter based on Q&A responses using AI.
     This transforms interview-style responses into narrative content.
     """
-    # Get the book and verify ownership
-    book = await get_book_by_id(book_id)
+    # Verify ownership and read the chapter's title/description plus the book
+    # metadata the prompt needs; no chapter body is read.
+    book = await get_chapter_by_id(book_id, chapter_id, include_content=False)
     if not book:
         raise HTTPException(status_code=404, detail="Book not found")
     if book.get("owner_id") != current_user.get("auth_id"):
@@ -2548,22 +2733,7 @@ async def generate_chapter_draft(
             status_code=403, detail="Not authorized to generate draft for this book"
         )
 
-    # Get chapter information from TOC
-    toc = book.get("table_of_contents", {})
-    chapters = toc.get("chapters", [])
-
-    # Find the chapter
-    chapter_info = None
-    for chapter in chapters:
-        if chapter.get("id") == chapter_id:
-            chapter_info = chapter
-            break
-        # Check subchapters
-        for subchapter in chapter.get("subchapters", []):
-            if subchapter.get("id") == chapter_id:
-                chapter_info = subchapter
-                break
-
+    chapter_info = book["chapter"]
     if not chapter_info:
         raise HTTPException(status_code=404, detail="Chapter not found in table of contents")
 
@@ -2727,7 +2897,7 @@ async def transform_chapter_style(
     data: dict = Body(default={}),
     current_user: Dict = Depends(get_current_user_from_session),
     rate_limit_info: Dict = Depends(
-        get_rate_limiter(limit=10, window=3600)
+        get_rate_limiter(limit=10, window=3600, engine="sliding")
     ),  # 10 per hour
 ):
     """
@@ -2791,7 +2961,7 @@ async def enhance_chapter_text(
     data: dict = Body(default={}),
     current_user: Dict = Depends(get_current_user_from_session),
     rate_limit_info: Dict = Depends(
-        get_rate_limiter(limit=10, window=3600)
+        get_rate_limiter(limit=10, window=3600, engine="sliding")
     ),  # 10 per hour
 ):
     """
@@ -2801,8 +2971,9 @@ async def enhance_chapter_text(
     applies it and can revert by restoring the snapshot it held before applying.
     Dimensions: clarity, grammar, tone, vocabulary.
     """
-    # Verify book ownership.
-    book = await get_book_by_id(book_id)
+    # Verify book ownership. The text to enhance arrives in the request, so no
+    # chapter body is read.
+    book = await get_book_metadata_by_id(book_id)
     if not book:
         raise HTTPException(status_code=404, detail="Book not found")
     if book.get("owner_id") != current_user.get("auth_id"):
@@ -2813,19 +2984,7 @@ async def enhance_chapter_text(
 
     # Verify the chapter exists (matches the other chapter content endpoints),
     # so a stale/mistyped id can't consume the enhancement quota.
-    chapters = book.get("table_of_contents", {}).get("chapters", [])
-
-    def find_chapter(chapter_list):
-        for chapter in chapter_list:
-            if chapter.get("id") == chapter_id:
-                return chapter
-            if chapter.get("subchapters"):
-                found = find_chapter(chapter["subchapters"])
-                if found:
-                    return found
-        return None
-
-    if not find_chapter(chapters):
+    if chapter_id not in TocIndex.from_book(book):
         raise HTTPException(status_code=404, detail="Chapter not found")
 
     content = data.get("content", "")
@@ -2876,7 +3035,7 @@ async def enhance_chapter_transcription(
     data: dict = Body(default={}),
     current_user: Dict = Depends(get_current_user_from_session),
     rate_limit_info: Dict = Depends(
-        get_rate_limiter(limit=10, window=3600)
+        get_rate_limiter(limit=10, window=3600, engine="sliding")
     ),  # 10 per hour
 ):
     """
@@ -2886,8 +3045,9 @@ async def enhance_chapter_transcription(
     grammar/punctuation) without persisting. The caller applies it and can revert
     by restoring the snapshot it held before applying. Single cleanup mode.
     """
-    # Verify book ownership.
-    book = await get_book_by_id(book_id)
+    # Verify book ownership. The text to enhance arrives in the request, so no
+    # chapter body is read.
+    book = await get_book_metadata_by_id(book_id)
     if not book:
         raise HTTPException(status_code=404, detail="Book not found")
     if book.get("owner_id") != current_user.get("auth_id"):
@@ -2898,19 +3058,7 @@ async def enhance_chapter_transcription(
 
     # Verify the chapter exists (matches the other chapter content endpoints),
     # so a stale/mistyped id can't consume the cleanup quota.
-    chapters = book.get("table_of_contents", {}).get("chapters", [])
-
-    def find_chapter(chapter_list):
-        for chapter in chapter_list:
-            if chapter.get("id") == chapter_id:
-                return chapter
-            if chapter.get("subchapters"):
-                found = find_chapter(chapter["subchapters"])
-                if found:
-                    return found
-        return None
-
-    if not find_chapter(chapters):
+    if chapter_id not in TocIndex.from_book(book):
         raise HTTPException(status_code=404, detail="Chapter not found")
 
     content = data.get("content", "")
@@ -10,7 +10,7 @@ preserved so path matching is identical to the original single-file router.
 import logging
 from typing import Dict
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
 
 from app.core.security import get_current_user_from_session
 from app.schemas.book import (
@@ -19,18 +19,31 @@ from app.schemas.book import (
     ChapterMetadataResponse,
     TabStateRequest,
     BulkStatusUpdate,
+    BulkChapterCreate,
+    BulkChapterSubItem,
     ChapterMetadata,
     ChapterStatus,
 )
-from app.db.database import get_book_by_id, get_book_owner_id
+from app.db.database import (
+    get_book_by_id,
+    get_book_head,
+    get_book_metadata_by_id,
+    get_book_owner_id,
+    get_chapter_by_id,
+)
+from app.db.book_stats import book_stats
 from app.db.toc_transactions import (
     add_chapter_with_transaction,
+    add_chapters_with_transaction,
     update_chapter_with_transaction,
     delete_chapter_with_transaction,
     update_chapter_statuses_with_version_guard,
 )
 from app.services.chapter_access_service import chapter_access_service
 from app.services.chapter_status_service import chapter_status_service
+from app.schemas.errors import ErrorCode
+from app.utils.etag import book_etag, etag_matches, not_modified
+from app.utils.toc_index import TocIndex
 
 logger = logging.getLogger(__name__)
 
@@ -88,37 +101,174 @@ async def create_chapter(
             "message": "Chapter created successfully",
         }
     except ValueError as e:
-        # Check the specific parent-chapter message first: "Parent chapter not
-        # found" also matches the generic "not found" substring, so the generic
-        # branch would otherwise shadow this one (#158).
-        if "Version conflict" in str(e):
-            raise HTTPException(
-                status_code=409,
-                detail="The TOC has been modified by another user. Please refresh and try again.",
-            ) from e
-        elif "Parent chapter not found" in str(e):
-            raise HTTPException(
-                status_code=400, detail="Parent chapter not found"
-            ) from e
-        elif "not found" in str(e).lower():
-            raise HTTPException(status_code=404, detail="Book not found") from e
-        elif "not authorized" in str(e).lower():
-            raise HTTPException(
-                status_code=403, detail="Not authorized to modify this book's chapters"
-            ) from e
-        else:
-            raise HTTPException(status_code=400, detail=str(e)) from e
+        raise _chapter_create_error(e) from e
     except Exception:
         logger.error("Failed to create chapter", exc_info=True)
         raise HTTPException(status_code=500, detail="Failed to create chapter")
 
 
+def _chapter_create_error(e: ValueError) -> HTTPException:
+    """Map a chapter-create ``ValueError`` from ``toc_transactions`` to HTTP."""
+    # Check the specific parent-chapter message first: "Parent chapter not
+    # found" also matches the generic "not found" substring, so the generic
+    # branch would otherwise shadow this one (#158).
+    if "Version conflict" in str(e):
+        return HTTPException(
+            status_code=409,
+            detail="The TOC has been modified by another user. Please refresh and try again.",
+        )
+    elif "Parent chapter not found" in str(e):
+        return HTTPException(status_code=400, detail="Parent chapter not found")
+    elif "not found" in str(e).lower():
+        return HTTPException(status_code=404, detail="Book not found")
+    elif "not authorized" in str(e).lower():
+        return HTTPException(
+            status_code=403, detail="Not authorized to modify this book's chapters"
+        )
+    else:
+        return HTTPException(status_code=400, detail=str(e))
+
+
+def _new_chapter_dict(item: BulkChapterSubItem, level: int) -> Dict:
+    """A new TOC chapter, with the fields ``create_chapter`` starts one with."""
+    return {
+        "title": item.title.strip(),
+        "description": item.description or "",
+        "level": level,
+        "order": item.order,
+        "status": "draft",
+        "word_count": 0,
+        "estimated_reading_time": 0,
+        "is_active_tab": False,
+    }
+
+
+@router.post(
+    "/{book_id}/chapters/bulk", response_model=dict, status_code=status.HTTP_201_CREATED
+)
+async def create_chapters_bulk(
+    book_id: str,
+    bulk_data: BulkChapterCreate,
+    current_user: Dict = Depends(get_current_user_from_session),
+):
+    """
+    Create many chapters (with their subchapters) in one write.
+
+    Meant for importing an outline: instead of one ``POST .../chapters`` (and
+    one TOC read-modify-write) per chapter, the valid items are appended in
+    order with a single version-guarded ``$push``. ``results`` reports each
+    item by its index — its new ids, or why it was skipped.
+    """
+    # Check ownership before validating, so a caller who may not write to
+    # the book gets 403/404 rather than a per-item report on its chapters.
+    owner_id = await get_book_owner_id(book_id)
+    if owner_id is None:
+        raise HTTPException(status_code=404, detail="Book not found")
+    if owner_id != current_user.get("auth_id"):
+        raise HTTPException(
+            status_code=403, detail="Not authorized to modify this book's chapters"
+        )
+
+    level = 2 if bulk_data.parent_id else 1
+    results = []
+    valid = []  # (index, chapter dict)
+    for index, item in enumerate(bulk_data.chapters):
+        if not item.title.strip():
+            error = "Title must not be blank"
+        elif bulk_data.parent_id and item.subchapters:
+            error = "Subchapters cannot be nested under a subchapter"
+        elif any(not sub.title.strip() for sub in item.subchapters):
+            error = "Subchapter titles must not be blank"
+        else:
+            chapter = _new_chapter_dict(item, level)
+            chapter["subchapters"] = [
+                _new_chapter_dict(sub, level + 1) for sub in item.subchapters
+            ]
+            for position, sub in enumerate(chapter["subchapters"], start=1):
+                if sub["order"] is None:
+                    sub["order"] = position
+            valid.append((index, chapter))
+            continue
+        results.append({"index": index, "success": False, "error": error})
+
+    if not valid:
+        raise HTTPException(
+            status_code=400,
+            detail={
+                "message": "No valid chapters to create",
+                "error_code": ErrorCode.VALIDATION_FAILED.value,
+                "results": results,
+            },
+        )
+
+    try:
+        created = await add_chapters_with_transaction(
+            book_id=book_id,
+            chapters=[chapter for _, chapter in valid],
+            user_auth_id=current_user.get("auth_id"),
+            parent_chapter_id=bulk_data.parent_id,
+        )
+    except ValueError as e:
+        raise _chapter_create_error(e) from e
+    except Exception:
+        logger.error("Failed to bulk-create chapters", exc_info=True)
+        raise HTTPException(status_code=500, detail="Failed to create chapters")
+
+    for (index, _), chapter in zip(valid, created):
+        results.append(
+            {
+                "index": index,
+                "success": True,
+                "chapter_id": chapter["id"],
+                "subchapter_ids": [sub["id"] for sub in chapter["subchapters"]],
+            }
+        )
+    results.sort(key=lambda result: result["index"])
+
+    # The chapters have already been committed, so a logging failure must not
+    # turn a successful create into a failed request.
+    try:
+        for chapter in created:
+            await chapter_access_service.log_access(
+                user_id=current_user.get("auth_id"),
+                book_id=book_id,
+                chapter_id=chapter["id"],
+                access_type="create",
+                metadata={
+                    "chapter_title": chapter["title"],
+                    "level": level,
+                    "bulk_create": True,
+                },
+            )
+    except Exception:
+        logger.error("Failed to log bulk chapter create", exc_info=True)
+
+    return {
+        "book_id": book_id,
+        "chapters": created,
+        "results": results,
+        "created_count": len(created),
+        "success": True,
+        "message": f"Created {len(created)} chapters",
+    }
+
+
 # NOTE: literal sub-paths (/chapters/metadata, /chapters/tab-state) must be
 # registered BEFORE the parameterized /chapters/{chapter_id} route, otherwise
 # FastAPI matches them as chapter_id="metadata"/"tab-state" and they 404.
+async def _last_active_chapter(current_user: Dict, book_id: str):
+    """Head of the (user, book) recent-chapters document, or ``None``."""
+    recent_chapters = await chapter_access_service.get_user_recent_chapters(
+        current_user.get("auth_id"), book_id, limit=1
+    )
+    return recent_chapters[0]["_id"] if recent_chapters else None
+
+
 @router.get("/{book_id}/chapters/metadata", response_model=ChapterMetadataResponse)
 async def get_chapters_metadata(
     book_id: str,
+    request: Request,
+    response: Response,
     current_user: Dict = Depends(get_current_user_from_session),
     include_content_stats: bool = Query(
         False, description="Include word count and reading time"
@@ -127,10 +277,24 @@ async def get_chapters_metadata(
     """
     Get comprehensive metadata for all chapters in a book.
     Optimized for tab interface rendering.
+
+    Carries an ``ETag``; a matching ``If-None-Match`` gets a 304 after reading
+    only the book's version fields and the last active chapter.
     """
     try:
-        # Get the book and verify ownership
-        book = await get_book_by_id(book_id)
+        if_none_match = request.headers.get("if-none-match")
+        if if_none_match:
+            head = await get_book_head(book_id)
+            if head and head.get("owner_id") == current_user.get("auth_id"):
+                etag = book_etag(
+                    head, "metadata", await _last_active_chapter(current_user, book_id)
+                )
+                if etag_matches(if_none_match, etag):
+                    return not_modified(etag)
+
+        # Get the book and verify ownership. Metadata comes from the TOC's
+        # stats, so no chapter body is read.
+        book = await get_book_metadata_by_id(book_id)
         if not book:
             raise HTTPException(status_code=404, detail="Book not found")
         if book.get("owner_id") != current_user.get("auth_id"):
@@ -138,52 +302,37 @@ async def get_chapters_metadata(
                 status_code=403, detail="Not authorized to access this book's chapters"
             )
 
-        # Get current TOC
-        current_toc = book.get("table_of_contents", {})
-        chapters = current_toc.get("chapters", [])
-
-        # Convert chapters to metadata format
+        # Convert chapters to metadata format, in TOC order
         chapter_metadata_list = []
 
-        def process_chapters(chapter_list, level=1):
-            for chapter in chapter_list:
-                # Calculate reading time if word count exists
-                word_count = chapter.get("word_count", 0)
-                estimated_reading_time = chapter_status_service.calculate_reading_time(
-                    word_count
-                )
-
-                metadata = ChapterMetadata(
-                    id=chapter.get("id"),
-                    title=chapter.get("title"),
-                    status=chapter.get("status", ChapterStatus.DRAFT.value),
-                    word_count=word_count,
-                    last_modified=chapter.get("last_modified"),
-                    estimated_reading_time=estimated_reading_time,
-                    order=chapter.get("order", 0),
-                    level=chapter.get("level", level),
-                    has_content=word_count > 0,
-                    description=chapter.get("description"),
-                    parent_id=chapter.get("parent_id"),
-                )
-                chapter_metadata_list.append(metadata)
-
-                # Process subchapters
-                if chapter.get("subchapters"):
-                    process_chapters(chapter["subchapters"], level + 1)
+        for node in TocIndex.from_book(book).nodes():
+            chapter = node.chapter
+            # Calculate reading time if word count exists
+            word_count = chapter.get("word_count", 0)
+            estimated_reading_time = chapter_status_service.calculate_reading_time(
+                word_count
+            )
 
-        process_chapters(chapters)
+            metadata = ChapterMetadata(
+                id=chapter.get("id"),
+                title=chapter.get("title"),
+                status=chapter.get("status", ChapterStatus.DRAFT.value),
+                word_count=word_count,
+                last_modified=chapter.get("last_modified"),
+                estimated_reading_time=estimated_reading_time,
+                order=chapter.get("order", 0),
+                level=chapter.get("level", node.depth),
+                has_content=word_count > 0,
+                description=chapter.get("description"),
+                parent_id=chapter.get("parent_id", node.parent_id),
+            )
+            chapter_metadata_list.append(metadata)
 
-        # Calculate completion stats
-        completion_stats = chapter_status_service.get_completion_stats(
-            [chapter.dict() for chapter in chapter_metadata_list]
-        )
+        # Completion stats are kept on the book (app.db.book_stats)
+        completion_stats = book_stats(book)["status_counts"]
 
-        # Get last active chapter from recent access logs
-        recent_chapters = await chapter_access_service.get_user_recent_chapters(
-            current_user.get("auth_id"), book_id, limit=1
-        )
-        last_active_chapter = recent_chapters[0]["_id"] if recent_chapters else None
+        last_active_chapter = await _last_active_chapter(current_user, book_id)
+        response.headers["ETag"] = book_etag(book, "metadata", last_active_chapter)
 
         return ChapterMetadataResponse(
             book_id=book_id,
@@ -255,29 +404,16 @@ async def get_chapter(
     """
     Get a specific chapter by ID from the book's TOC.
     """
-    # Get the book and verify ownership
-    book = await get_book_by_id(book_id)
+    # Read only this chapter plus the owner, not the whole book.
+    book = await get_chapter_by_id(book_id, chapter_id)
     if not book:
         raise HTTPException(status_code=404, detail="Book not found")
     if book.get("owner_id") != current_user.get("auth_id"):
         raise HTTPException(
             status_code=403, detail="Not authorized to access this book's chapters"
-        )  # Get TOC and find the chapter
-    current_toc = book.get("table_of_contents", {})
-    chapters = current_toc.get("chapters", [])
+        )
 
-    def find_chapter(chapter_list):
-        for chapter in chapter_list:
-            if chapter.get("id") == chapter_id:
-                return chapter
-            # Recursively search subchapters
-            if chapter.get("subchapters"):
-                found = find_chapter(chapter["subchapters"])
-                if found:
-                    return found
-        return None
-
-    chapter = find_chapter(chapters)
+    chapter = book["chapter"]
     if not chapter:
         raise HTTPException(status_code=404, detail="Chapter not found")
 
@@ -449,24 +585,16 @@ async def list_chapters(
 
         if flat:
             # Return flat list of all chapters and subchapters
-            def flatten_chapters(chapter_list, result=None):
-                if result is None:
-                    result = []
-                for chapter in chapter_list:
-                    result.append(
-                        {
-                            "id": chapter.get("id"),
-                            "title": chapter.get("title"),
-                            "description": chapter.get("description", ""),
-                            "level": chapter.get("level", 1),
-                            "order": chapter.get("order", 0),
-                        }
-                    )
-                    if chapter.get("subchapters"):
-                        flatten_chapters(chapter["subchapters"], result)
-                return result
-
-            flat_chapters = flatten_chapters(chapters)
+            flat_chapters = [
+                {
+                    "id": chapter.get("id"),
+                    "title": chapter.get("title"),
+                    "description": chapter.get("description", ""),
+                    "level": chapter.get("level", 1),
+                    "order": chapter.get("order", 0),
+                }
+                for chapter in TocIndex(chapters)
+            ]
             return {
                 "book_id": book_id,
                 "chapters": flat_chapters,
@@ -497,14 +625,18 @@ async def list_chapters(
 async def update_chapter_status_bulk(
     book_id: str,
     update_data: BulkStatusUpdate,
+    request: Request,
     current_user: Dict = Depends(get_current_user_from_session),
 ):
     """
     Update status for multiple chapters simultaneously.
     Useful for tab operations like "Mark selected as completed".
+
+    An ``If-Match`` with the TOC's ETag (from ``GET /toc``) pins the write to
+    the version the client saw: a stale tag gets 412.
     """
-    # Get the book and verify ownership
-    book = await get_book_by_id(book_id)
+    # Get the book and verify ownership (statuses only; no chapter bodies)
+    book = await get_book_metadata_by_id(book_id)
     if not book:
         raise HTTPException(status_code=404, detail="Book not found")
     if book.get("owner_id") != current_user.get("auth_id"):
@@ -512,38 +644,42 @@ async def update_chapter_status_bulk(
             status_code=403, detail="Not authorized to modify this book's chapters"
         )
 
+    if_match = request.headers.get("if-match")
+    if if_match and not etag_matches(if_match, book_etag(book, "toc"), weak=False):
+        raise HTTPException(
+            status_code=status.HTTP_412_PRECONDITION_FAILED,
+            detail="The chapters have changed since they were read. Please refresh and try again.",
+        )
+
     # Get current TOC. The version read here is used as the optimistic-locking
     # baseline: the persist below only succeeds if the TOC hasn't changed since.
     current_toc = book.get("table_of_contents", {})
     chapters = current_toc.get("chapters", [])
     current_version = current_toc.get("version", 1)
 
-    # Collect current statuses and validate transitions up front (so an invalid
-    # transition still surfaces as a 400 before any write).
-    chapter_statuses = {}
-    updated_chapters = []
-
-    def collect_and_validate_statuses(chapter_list):
-        for chapter in chapter_list:
-            if chapter.get("id") in update_data.chapter_ids:
-                current_status = chapter.get("status", ChapterStatus.DRAFT.value)
-
-                if chapter_status_service.validate_status_transition(
-                    current_status, update_data.status.value
-                ):
-                    chapter_statuses[chapter["id"]] = current_status
-                    updated_chapters.append(chapter["id"])
-                else:
-                    raise HTTPException(
-                        status_code=400,
-                        detail=f"Invalid status transition for chapter {chapter['id']}: {current_status} -> {update_data.status.value}",
-                    )
-
-            # Process subchapters
-            if chapter.get("subchapters"):
-                collect_and_validate_statuses(chapter["subchapters"])
-
-    collect_and_validate_statuses(chapters)
+    # Validate every transition up front (so an invalid one still surfaces as
+    # a 400 before any write).
+    toc_index = TocIndex(chapters)
+    updates = [
+        {
+            "chapter_id": chapter_id,
+            "status": update_data.status.value,
+            "current_status": toc_index.get(chapter_id).get(
+                "status", ChapterStatus.DRAFT.value
+            ),
+        }
+        for chapter_id in dict.fromkeys(update_data.chapter_ids)
+        if chapter_id in toc_index
+    ]
+    validation = chapter_status_service.validate_bulk_update(updates)
+    if not validation["valid"]:
+        invalid = validation["invalid_updates"][0]["update"]
+        raise HTTPException(
+            status_code=400,
+            detail=f"Invalid status transition for chapter {invalid['chapter_id']}: {invalid['current_status']} -> {update_data.status.value}",
+        )
+    chapter_statuses = {u["chapter_id"]: u["current_status"] for u in updates}
+    updated_chapters = list(chapter_statuses)
 
     if not updated_chapters:
         raise HTTPException(status_code=404, detail="No matching chapters found")
@@ -631,8 +767,8 @@ async def save_tab_state(
                 status_code=403, detail="Not authorized to access this book"
             )
 
-        # Save tab state via access logging service
-        log_id = await chapter_access_service.save_tab_state(
+        # Upsert the (user, book) tab-state document
+        state_id = await chapter_access_service.save_tab_state(
             user_id=current_user.get("auth_id"),
             book_id=book_id,
             active_chapter_id=tab_state.active_chapter_id,
@@ -642,7 +778,7 @@ async def save_tab_state(
 
         return {
             "book_id": book_id,
-            "tab_state_id": log_id,
+            "tab_state_id": state_id,
             "success": True,
             "message": "Tab state saved successfully",
         }
@@ -8,7 +8,8 @@ from fastapi import APIRouter, Depends, HTTPException, Query, Response
 from fastapi.responses import StreamingResponse
 from app.api.dependencies import get_rate_limiter
 from app.core.security import get_current_user_from_session
-from app.db.book import get_book_by_id, get_book_owner_id
+from app.db.book import get_book_by_id, get_book_owner_id, get_book_stats
+from app.db.user import get_user_profile
 from app.services.export_service import (
     export_service,
     ExportUnavailableError,
@@ -33,11 +34,15 @@ router = APIRouter(
 logger = logging.getLogger(__name__)
 
 
+async def _owner_profile(current_user: Dict) -> Dict:
+    """Full profile of the verified owner; the auth user only carries AUTH_USER_FIELDS."""
+    return await get_user_profile(current_user.get("auth_id")) or current_user
+
+
 def _with_author_info(book: Dict, owner: Dict) -> Dict:
     """Merge the owner's profile author info into book_data for export.
 
-    ``owner`` is the verified book owner (current_user), so no extra DB lookup
-    is needed. Sets ``author_name`` (display_name, else "first last") and
+    ``owner`` is the verified book owner's profile (see _owner_profile). Sets ``author_name`` (display_name, else "first last") and
     ``author_bio`` so exports show the author's profile. Existing book values
     are only overridden when the profile supplies a value.
     """
@@ -127,7 +132,7 @@ async def export_book_pdf(
 
     try:
         # Generate PDF
-        book = _with_author_info(book, current_user)
+        book = _with_author_info(book, await _owner_profile(current_user))
         pdf_content = await export_service.export_book(
             book_data=book,
             format="pdf",
@@ -229,7 +234,7 @@ async def export_book_docx(
 
     try:
         # Generate DOCX
-        book = _with_author_info(book, current_user)
+        book = _with_author_info(book, await _owner_profile(current_user))
         docx_content = await export_service.export_book(
             book_data=book,
             format="docx",
@@ -321,7 +326,7 @@ async def export_book_epub(
 
     try:
         # Generate EPUB
-        book = _with_author_info(book, current_user)
+        book = _with_author_info(book, await _owner_profile(current_user))
         epub_content = await export_service.export_book(
             book_data=book,
             format="epub",
@@ -414,7 +419,7 @@ async def export_book_markdown(
 
     try:
         # Generate Markdown
-        book = _with_author_info(book, current_user)
+        book = _with_author_info(book, await _owner_profile(current_user))
         md_content = await export_service.export_book(
             book_data=book,
             format="markdown",
@@ -471,9 +476,10 @@ async def get_export_formats(
     """
     Get available export formats and their options.
     """
-    # Verify book exists and user has access
-    book = await get_book_by_id(book_id)
-    if not book:
+    # Verify book exists and user has access. Reads the owner and the stored
+    # stats only: no chapter structure or bodies.
+    book = await get_book_stats(book_id)
+    if book is None:
         raise HTTPException(status_code=404, detail="Book not found")
 
     if book.get("owner_id") != current_user.get("auth_id"):
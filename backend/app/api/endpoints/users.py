@@ -9,6 +9,7 @@ from app.core.security import get_current_user_from_session, SessionRoleChecker
 from app.schemas.user import UserUpdate, UserResponse
 from app.db.database import (
     get_user_by_auth_id,
+    get_user_profile,
     update_user,
     delete_user,
     delete_all_user_books,
@@ -58,6 +59,10 @@ async def read_users_me(
             target_id=current_user.get("auth_id", "unknown"),  # Use get() with default
         )
 
+        # The auth dependency only carries the slim auth projection
+        # (AUTH_USER_FIELDS); the profile fields come from the full record.
+        current_user = await get_user_profile(current_user.get("auth_id")) or current_user
+
         # Extract preferences or use defaults
         preferences = current_user.get("preferences", {})
         if not preferences:
@@ -216,6 +221,7 @@ async def delete_profile(
         action="account_delete",
         resource_type="user",
         target_id=current_user["auth_id"],
+        durable=True,
     )
 
     return {"message": "Account successfully deleted"}
@@ -236,6 +242,9 @@ async def upload_profile_picture(
     from app.services.file_upload_service import FileUploadService
 
     try:
+        # avatar_url is not on the slim auth-path user; read the one being replaced.
+        previous_profile = await get_user_profile(current_user["auth_id"])
+
         upload_service = FileUploadService()
         avatar_url = await upload_service.process_and_save_profile_picture(
             file, current_user["auth_id"]
@@ -262,7 +271,7 @@ async def upload_profile_picture(
                 status_code=status.HTTP_404_NOT_FOUND, detail="User not found"
             )
 
-        old_avatar = current_user.get("avatar_url")
+        old_avatar = (previous_profile or {}).get("avatar_url")
         if old_avatar and old_avatar != avatar_url:
             await upload_service.delete_profile_picture(old_avatar)
 
@@ -17,11 +17,12 @@ Better-auth stores sessions in the 'session' collection with the following schem
 """
 
 from typing import Optional, Dict, Any
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
 from fastapi import Request, HTTPException, status
 import logging
 
 from app.db.base import get_collection
+from app.db.user import AUTH_USER_FIELDS
 
 logger = logging.getLogger(__name__)
 
@@ -31,6 +32,11 @@ SESSION_COOKIE_NAMES = [
     "better-auth.session_token",            # Development (HTTP)
 ]
 
+# The resolver only rewrites a session's updatedAt when the stored value is at
+# least this old. It is a last-activity marker, not an expiry input, so
+# per-request precision buys nothing and costs a write round trip per request.
+SESSION_ACTIVITY_TOUCH_INTERVAL = timedelta(minutes=5)
+
 
 async def get_session_token_from_cookies(request: Request) -> Optional[str]:
     """Extract better-auth session token from request cookies.
@@ -61,6 +67,66 @@ async def get_session_token_from_cookies(request: Request) -> Optional[str]:
     return None
 
 
+def parse_session_date(value: Any) -> Optional[datetime]:
+    """Normalize a session date (``expiresAt``/``updatedAt``) to aware UTC.
+
+    better-auth writes a BSON date, but older/hand-written records carry an ISO
+    string or an epoch number. A naive datetime is taken as UTC. Returns None
+    for a value that cannot be read as a date.
+    """
+    if value is None:
+        return None
+    try:
+        # Handle both datetime objects and ISO strings
+        if isinstance(value, str):
+            value = datetime.fromisoformat(value.replace("Z", "+00:00"))
+        elif not isinstance(value, datetime):
+            # Try to convert from timestamp if it's a number
+            value = datetime.fromtimestamp(float(value), tz=timezone.utc)
+    except (ValueError, TypeError, OverflowError):
+        logger.error(f"Invalid session date format: {value}")
+        return None
+
+    # Make sure we're comparing timezone-aware datetimes
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return value
+
+
+async def _session_is_live(session: Dict[str, Any], session_collection) -> bool:
+    """True when ``session`` carries a readable, unexpired ``expiresAt``.
+
+    An expired session is deleted on the way out. Shared by the cookie
+    validator and the single-round-trip resolver so both reject the same
+    documents.
+    """
+    expires_at = session.get("expiresAt")
+    if not expires_at:
+        # Fail closed. `if expires_at:` meant a session document missing the
+        # field skipped the expiry check altogether and was treated as
+        # valid — an unexpirable session from a malformed or
+        # partially-written record (#352). A session we cannot date is a
+        # session we cannot trust.
+        logger.warning(
+            "Session %s has no expiresAt; rejecting as invalid",
+            session.get("_id"),
+        )
+        return False
+
+    expires_at = parse_session_date(expires_at)
+    if expires_at is None:
+        return False
+
+    now = datetime.now(timezone.utc)
+    if expires_at < now:
+        logger.info(f"Session expired at {expires_at} (current time: {now})")
+        # Optionally clean up expired session
+        await session_collection.delete_one({"_id": session["_id"]})
+        return False
+
+    return True
+
+
 async def validate_better_auth_session(request: Request) -> Optional[Dict[str, Any]]:
     """Validate better-auth session from cookies and return session data.
 
@@ -97,43 +163,9 @@ async def validate_better_auth_session(request: Request) -> Optional[Dict[str, A
             logger.warning("Session not found for provided token")
             return None
 
-        # Check if session has expired
-        expires_at = session.get("expiresAt")
-        if not expires_at:
-            # Fail closed. `if expires_at:` meant a session document missing the
-            # field skipped the expiry check altogether and was treated as
-            # valid — an unexpirable session from a malformed or
-            # partially-written record (#352). A session we cannot date is a
-            # session we cannot trust.
-            logger.warning(
-                "Session %s has no expiresAt; rejecting as invalid",
-                session.get("_id"),
-            )
+        if not await _session_is_live(session, session_collection):
             return None
 
-        if expires_at:
-            # Handle both datetime objects and ISO strings
-            if isinstance(expires_at, str):
-                expires_at = datetime.fromisoformat(expires_at.replace("Z", "+00:00"))
-            elif not isinstance(expires_at, datetime):
-                # Try to convert from timestamp if it's a number
-                try:
-                    expires_at = datetime.fromtimestamp(float(expires_at), tz=timezone.utc)
-                except (ValueError, TypeError):
-                    logger.error(f"Invalid expiresAt format: {expires_at}")
-                    return None
-
-            # Make sure we're comparing timezone-aware datetimes
-            now = datetime.now(timezone.utc)
-            if expires_at.tzinfo is None:
-                expires_at = expires_at.replace(tzinfo=timezone.utc)
-
-            if expires_at < now:
-                logger.info(f"Session expired at {expires_at} (current time: {now})")
-                # Optionally clean up expired session
-                await session_collection.delete_one({"_id": session["_id"]})
-                return None
-
         # Update last activity time
         await session_collection.update_one(
             {"_id": session["_id"]},
@@ -191,6 +223,106 @@ async def get_better_auth_user(user_id: str) -> Optional[Dict[str, Any]]:
         return None
 
 
+async def resolve_session_user(session_token: str) -> Optional[Dict[str, Any]]:
+    """Resolve a session token to its session and application user in one round trip.
+
+    The auth path used to pay three sequential round trips per request: the
+    session by token, the better-auth user, then the app ``users`` record. This
+    runs a single aggregation over the better-auth ``session`` collection that
+    ``$lookup``s both users, so a cold request costs one RTT.
+
+    The app user comes back as the fixed ``AUTH_USER_FIELDS`` projection, never
+    the whole profile. The better-auth user is only needed by the auto-create
+    branch (a valid session with no app record yet), so its email/name are
+    returned only when the app user is missing. Its lookup is by ``_id`` (better-auth's ObjectId
+    ``userId``); a deployment that stores string ids misses here and the caller
+    falls back to :func:`get_better_auth_user`, on that rare branch only.
+
+    Returns ``{"session", "user", "auth_user"}`` — ``user``/``auth_user`` may be
+    None — or None when there is no live session for the token. Expiry rules are
+    the cookie validator's (:func:`_session_is_live`). Database errors
+    propagate: the caller turns them into a 500 rather than signing the user out.
+    """
+    session_collection = await get_collection("session")
+    pipeline = [
+        {"$match": {"token": session_token}},
+        {"$limit": 1},
+        # users.auth_id is the string form of better-auth's ObjectId userId.
+        {"$addFields": {"_auth_id": {"$toString": "$userId"}}},
+        {
+            "$lookup": {
+                "from": "users",
+                "localField": "_auth_id",
+                "foreignField": "auth_id",
+                "as": "app_user",
+            }
+        },
+        {
+            "$lookup": {
+                "from": "user",
+                "localField": "userId",
+                "foreignField": "_id",
+                "as": "auth_user",
+            }
+        },
+        # Only the auth-path fields of the app user cross the wire.
+        {
+            "$project": {
+                "userId": 1,
+                "expiresAt": 1,
+                "updatedAt": 1,
+                "auth_user.email": 1,
+                "auth_user.name": 1,
+                **{f"app_user.{field}": 1 for field in AUTH_USER_FIELDS},
+            }
+        },
+        {
+            "$project": {
+                "userId": 1,
+                "expiresAt": 1,
+                "updatedAt": 1,
+                "user": {"$arrayElemAt": ["$app_user", 0]},
+                "auth_user": {
+                    "$cond": [
+                        {"$eq": [{"$size": "$app_user"}, 0]},
+                        {
+                            "email": {"$arrayElemAt": ["$auth_user.email", 0]},
+                            "name": {"$arrayElemAt": ["$auth_user.name", 0]},
+                        },
+                        "$$REMOVE",
+                    ]
+                },
+            }
+        },
+    ]
+    docs = await session_collection.aggregate(pipeline).to_list(length=1)
+    if not docs:
+        logger.warning("Session not found for provided token")
+        return None
+
+    doc = docs[0]
+    user = doc.pop("user", None)
+    auth_user = doc.pop("auth_user", None)
+    if auth_user is not None and not auth_user.get("email"):
+        # The _id lookup missed (or the record has no email); let the caller
+        # fall back to the id/_id search in get_better_auth_user.
+        auth_user = None
+
+    if not await _session_is_live(doc, session_collection):
+        return None
+
+    # Throttled last-activity marker; see SESSION_ACTIVITY_TOUCH_INTERVAL.
+    now = datetime.now(timezone.utc)
+    last_touch = parse_session_date(doc.get("updatedAt"))
+    if last_touch is None or now - last_touch >= SESSION_ACTIVITY_TOUCH_INTERVAL:
+        await session_collection.update_one(
+            {"_id": doc["_id"]}, {"$set": {"updatedAt": now}}
+        )
+
+    logger.debug(f"Session resolved for user: {doc.get('userId')}")
+    return {"session": doc, "user": user, "auth_user": auth_user}
+
+
 async def get_user_from_session(request: Request) -> Optional[Dict[str, Any]]:
     """Convenience function to get user data from session cookies.
 
@@ -112,9 +112,10 @@ class Settings(BaseSettings):
 
     # Per-user AI generation quota (cost control). Every AI generation endpoint
     # increments a per-user counter; at the cap the endpoint returns 429. Limits
-    # are configurable per environment; a limit <= 0 disables that window.
-    # Keys off the user's auth_id today; swap to plan/entitlement when P0.2 lands.
+    # are configurable per environment; a limit <= 0 disables that window. These
+    # are the defaults; app.core.entitlements.PLAN_AI_QUOTAS overrides per plan.
     AI_QUOTA_ENABLED: bool = True
+    AI_QUOTA_HOURLY_LIMIT: int = 0
     AI_QUOTA_DAILY_LIMIT: int = 50
     AI_QUOTA_MONTHLY_LIMIT: int = 500
 
@@ -124,6 +125,43 @@ class Settings(BaseSettings):
     # bypassed alongside BYPASS_AUTH in tests/E2E. Set False to disable the gate.
     PLAN_ENFORCEMENT_ENABLED: bool = True
 
+    # Per-worker session token -> user cache (app.core.session_cache). Entries
+    # live at most this long and never past the session's expiresAt. Sign-out
+    # happens in better-auth, which the backend never sees, so this is also how
+    # long a signed-out cookie can keep resolving on a worker — keep it short.
+    # 0 disables the cache (every request resolves against Mongo).
+    SESSION_CACHE_TTL_SECONDS: int = Field(default=60, ge=0)
+    SESSION_CACHE_MAX_ENTRIES: int = Field(default=10000, ge=1)
+
+    # Per-worker cache of content-free book documents (app.db.book_cache),
+    # revalidated against the book's TOC version and updated_at on every read.
+    # 0 disables the cache (every metadata read fetches the whole structure).
+    BOOK_CACHE_MAX_ENTRIES: int = Field(default=1000, ge=0)
+
+    # Endpoint rate limiter (app.core.rate_limit). Each worker admits requests
+    # from local counts and flushes them to usage_counters in one bulk write this
+    # often, reading back the other workers' totals. Longer intervals mean fewer
+    # writes but a larger cross-worker overshoot window.
+    RATE_LIMIT_SYNC_INTERVAL_SECONDS: float = Field(default=1.0, gt=0)
+
+    # Buffered audit log writer (app.db.audit_log). Entries are batched with
+    # insert_many once BATCH_SIZE are waiting or FLUSH_INTERVAL after the first,
+    # whichever is sooner. A full queue drops entries (counted) rather than
+    # blocking requests; account/plan/deletion records are always written inline.
+    AUDIT_LOG_QUEUE_SIZE: int = Field(default=10000, ge=1)
+    AUDIT_LOG_BATCH_SIZE: int = Field(default=200, ge=1)
+    AUDIT_LOG_FLUSH_INTERVAL_SECONDS: float = Field(default=1.0, gt=0)
+
+    # Chapter access log ingestion (app.services.chapter_access_service). Same
+    # write-behind batching as the audit log. SAMPLE_RATES keeps a fraction of
+    # chosen access types, e.g. "read_content=0.1,batch_read_content=0.1";
+    # unlisted types are kept in full. Avoid sampling "view"/"edit": recent
+    # chapters are derived from them.
+    CHAPTER_ACCESS_SAMPLE_RATES: str = ""
+    CHAPTER_ACCESS_QUEUE_SIZE: int = Field(default=20000, ge=1)
+    CHAPTER_ACCESS_BATCH_SIZE: int = Field(default=500, ge=1)
+    CHAPTER_ACCESS_FLUSH_INTERVAL_SECONDS: float = Field(default=2.0, gt=0)
+
     # Export Settings
     EXPORT_TIMEOUT_SECONDS: int = 120  # Hard cap on a single export's generation
     # Worker threads reserved for CPU-bound export builds (#345). Exports run on
@@ -38,6 +38,16 @@ PLAN_ENTITLEMENTS: dict[str, frozenset[str]] = {
 }
 
 
+# plan -> per-period AI generation caps (period: "hour" | "day" | "month").
+# A period missing here falls back to the AI_QUOTA_*_LIMIT setting; a value
+# <= 0 disables that window for the plan. Paid-tier caps are set here at
+# launch with no change to the quota dependency.
+PLAN_AI_QUOTAS: dict[str, dict[str, int]] = {
+    "free": {},
+    "pro": {},
+}
+
+
 def resolve_plan_for_price(price_id: Optional[str]) -> str:
     """Map a Stripe price id to an internal plan (issue #220).
 
@@ -62,3 +72,21 @@ def is_feature_allowed(plan: Optional[str], feature: str) -> bool:
     if allowed is None:
         return False
     return "*" in allowed or feature in allowed
+
+
+def ai_quota_limits(plan: Optional[str]) -> dict[str, int]:
+    """Return the AI generation caps for ``plan`` as ``{period: limit}``.
+
+    Settings supply the defaults for every period; the plan's PLAN_AI_QUOTAS
+    entry overrides them. A missing/unknown plan gets the defaults (whether it
+    may use AI at all is the entitlement gate's call, not the quota's).
+    """
+    from app.core.config import settings
+
+    limits = {
+        "hour": settings.AI_QUOTA_HOURLY_LIMIT,
+        "day": settings.AI_QUOTA_DAILY_LIMIT,
+        "month": settings.AI_QUOTA_MONTHLY_LIMIT,
+    }
+    limits.update(PLAN_AI_QUOTAS.get(plan or DEFAULT_PLAN, {}))
+    return limits
@@ -0,0 +1,233 @@
+"""Per-worker admission for the endpoint rate limiter, reconciled to Mongo in batches.
+
+The limiter (``app.api.dependencies.get_rate_limiter``) used to pay one
+``find_one_and_update`` on ``usage_counters`` per rate-limited request. Now each
+worker counts admissions locally and a background task flushes the
+accumulated deltas every ``RATE_LIMIT_SYNC_INTERVAL_SECONDS`` in one unordered
+bulk write, reading back the shared totals so each worker also sees what the
+others admitted.
+
+Buckets are the same epoch-aligned windows and the same counter documents
+(``<subject>:rl:<path>:<bucket_start>``) the per-request path used, so the
+``X-RateLimit-*`` headers keep their meaning and a rolling deploy shares counts
+with old workers. A bucket's local allowance is ``limit`` minus the last known
+shared count minus what this worker admitted since; it refills when the window
+rolls over.
+
+Fail closed: when a reconcile fails, the deltas are kept for the next attempt
+and the limiter rejects traffic (503) until a reconcile succeeds — an outage
+must not turn into unlimited admission.
+
+ponytail: limits are approximate across workers. Between two reconciles each
+worker only knows its own admissions, so N workers can overshoot a limit by at
+most what they admit within one sync interval.
+"""
+
+import asyncio
+import logging
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Callable, Dict, Optional, Tuple
+
+from app.core.config import settings
+from app.db.usage import bulk_increment_usage, usage_counter_id
+
+logger = logging.getLogger(__name__)
+
+# Expired buckets are swept at most this often, on the (rare) new-bucket path.
+_PRUNE_INTERVAL_SECONDS = 60
+
+
+@dataclass
+class _Bucket:
+    user_id: str
+    expires_at: float  # epoch seconds; the counter doc's TTL deadline
+    shared: int = 0  # total in Mongo as of the last reconcile (ours included)
+    pending: int = 0  # admitted here since the last flush
+
+
+class RateLimitStore:
+    """Local view of the shared fixed-window counters for one worker."""
+
+    def __init__(self, sync_interval: float):
+        self.sync_interval = sync_interval
+        self._buckets: Dict[str, _Bucket] = {}
+        self._task: Optional[asyncio.Task] = None
+        self._next_prune = 0.0
+        self.failed = False
+        self.reconciles = 0
+        self.reconcile_failures = 0
+
+    def hit(self, subject: str, period_key: str, now: float, ttl_seconds: int) -> int:
+        """Count one request against ``period_key`` and return the bucket's running total.
+
+        Like the per-request ``$inc`` it replaces, a rejected request still
+        counts: the counter tracks attempts.
+        """
+        counter_id = usage_counter_id(subject, period_key)
+        bucket = self._buckets.get(counter_id)
+        if bucket is None:
+            if now >= self._next_prune:
+                self._prune(now)
+                self._next_prune = now + _PRUNE_INTERVAL_SECONDS
+            bucket = self._buckets[counter_id] = _Bucket(subject, now + ttl_seconds)
+        bucket.pending += 1
+        return bucket.shared + bucket.pending
+
+    def peek(self, subject: str, period_key: str, now: float, ttl_seconds: int) -> int:
+        """Current total for ``period_key`` without counting a request.
+
+        The bucket is tracked from here on, so the next reconcile reads back
+        the shared total other workers have recorded for it.
+        """
+        counter_id = usage_counter_id(subject, period_key)
+        bucket = self._buckets.get(counter_id)
+        if bucket is None:
+            bucket = self._buckets[counter_id] = _Bucket(subject, now + ttl_seconds)
+        return bucket.shared + bucket.pending
+
+    async def reconcile(self) -> None:
+        """Flush pending deltas in one bulk write and refresh shared totals.
+
+        On failure the deltas are restored, ``failed`` is set (the limiter then
+        fails closed) and the error is re-raised.
+        """
+        flushed = {}
+        increments = []
+        for counter_id, bucket in self._buckets.items():
+            if bucket.pending:
+                flushed[counter_id] = bucket.pending
+                increments.append((
+                    counter_id,
+                    bucket.user_id,
+                    bucket.pending,
+                    datetime.fromtimestamp(bucket.expires_at, tz=timezone.utc),
+                ))
+                bucket.pending = 0
+
+        try:
+            totals = await bulk_increment_usage(increments, read_ids=list(self._buckets))
+        except Exception:
+            for counter_id, delta in flushed.items():
+                bucket = self._buckets.get(counter_id)
+                if bucket is not None:
+                    bucket.pending += delta
+            self.failed = True
+            self.reconcile_failures += 1
+            raise
+
+        for counter_id, count in totals.items():
+            bucket = self._buckets.get(counter_id)
+            if bucket is not None:
+                bucket.shared = count
+        self.failed = False
+        self.reconciles += 1
+
+    def start(self) -> None:
+        """Start the background reconcile loop on the running event loop."""
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Stop the loop and flush whatever is still pending."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        try:
+            await self.reconcile()
+        except Exception:
+            logger.error("Final rate limit reconcile failed", exc_info=True)
+
+    def clear(self) -> None:
+        self._buckets.clear()
+        self._next_prune = 0.0
+        self.failed = False
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "buckets": len(self._buckets),
+            "pending": sum(b.pending for b in self._buckets.values()),
+            "reconciles": self.reconciles,
+            "reconcile_failures": self.reconcile_failures,
+            "failed": int(self.failed),
+        }
+
+    async def _run(self) -> None:
+        while True:
+            await asyncio.sleep(self.sync_interval)
+            try:
+                await self.reconcile()
+            except Exception:
+                logger.error(
+                    "Rate limit reconcile failed; rejecting rate-limited requests "
+                    "until it succeeds",
+                    exc_info=True,
+                )
+
+    def _prune(self, now: float) -> None:
+        """Drop buckets whose counter has expired and has nothing left to flush."""
+        expired = [
+            counter_id
+            for counter_id, bucket in self._buckets.items()
+            if bucket.expires_at <= now and not bucket.pending
+        ]
+        for counter_id in expired:
+            del self._buckets[counter_id]
+
+
+# ---------------------------------------------------------------------------
+# Engines. Each counts one request for (subject, path) and returns
+# ``(count, reset_at)``: the value compared against the limit and the epoch
+# second reported as X-RateLimit-Reset. Routes pick one by name via
+# ``get_rate_limiter(..., engine=...)``. Both run purely against the local
+# store; the batched reconcile is what touches Mongo.
+# ---------------------------------------------------------------------------
+
+
+def fixed_window_count(
+    store: RateLimitStore, subject: str, path: str, now: float, window: int
+) -> Tuple[float, int]:
+    """Requests in the current epoch-aligned window.
+
+    Cheapest and most predictable, but a client can spend a full limit at the
+    end of one window and another at the start of the next: up to 2x in a
+    short burst across the boundary.
+    """
+    bucket_start = int(now // window) * window
+    # TTL of 2 windows: the bucket outlives its own window, then Mongo reaps it.
+    count = store.hit(subject, f"rl:{path}:{bucket_start}", now, ttl_seconds=window * 2)
+    return count, bucket_start + window
+
+
+def sliding_window_count(
+    store: RateLimitStore, subject: str, path: str, now: float, window: int
+) -> Tuple[float, int]:
+    """Weighted sliding-window counter.
+
+    Estimates the requests in the trailing ``window`` seconds as the current
+    window's count plus the previous window's count weighted by how much of
+    it still overlaps the trailing span. It reuses the fixed-window buckets
+    (the previous one is still alive: they keep a 2-window TTL), so it costs
+    no extra storage and no extra I/O, and caps a boundary burst at about
+    ``limit`` instead of 2x.
+    """
+    bucket_start = int(now // window) * window
+    current = store.hit(subject, f"rl:{path}:{bucket_start}", now, ttl_seconds=window * 2)
+    previous = store.peek(
+        subject, f"rl:{path}:{bucket_start - window}", now, ttl_seconds=window
+    )
+    overlap = 1 - (now - bucket_start) / window
+    return current + previous * overlap, bucket_start + window
+
+
+RATE_LIMIT_ENGINES: Dict[str, Callable[..., Tuple[float, int]]] = {
+    "fixed": fixed_window_count,
+    "sliding": sliding_window_count,
+}
+
+
+rate_limit_store = RateLimitStore(sync_interval=settings.RATE_LIMIT_SYNC_INTERVAL_SECONDS)
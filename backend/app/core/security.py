@@ -2,9 +2,12 @@ from pymongo.errors import DuplicateKeyError
 from typing import Optional, Dict, Any, List
 from fastapi import HTTPException, status, Request
 from app.core.better_auth_session import (
-    validate_better_auth_session,
+    get_session_token_from_cookies,
+    parse_session_date,
+    resolve_session_user,
     get_better_auth_user,
 )
+from app.core.session_cache import session_user_cache
 import logging
 
 logger = logging.getLogger(__name__)
@@ -98,16 +101,41 @@ async def get_current_user_from_session(request: Request) -> Dict:
             "metadata": {}
         }
 
-    # Validate session from cookies
-    session = await validate_better_auth_session(request)
+    # Hot path: a token this worker resolved recently costs no DB calls. The
+    # cache entry never outlives the session's expiresAt (see session_cache).
+    session_token = await get_session_token_from_cookies(request)
+    if session_token:
+        cached_user = session_user_cache.get(session_token)
+        if cached_user is not None:
+            return cached_user
 
-    if not session:
+    if not session_token:
         logger.warning("No valid session found in cookies")
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Not authenticated. Please sign in."
         )
 
+    # Cold path: session, app user and (only if the app user is missing) the
+    # better-auth user's email/name in a single aggregation round trip.
+    try:
+        resolved = await resolve_session_user(session_token)
+    except Exception as e:
+        logger.error(f"Error resolving session: {str(e)}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Error fetching user",
+        )
+
+    if not resolved:
+        logger.warning("No valid session found in cookies")
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Not authenticated. Please sign in."
+        )
+
+    session = resolved["session"]
+
     # Extract user ID from session
     user_id = session.get("userId")
     if not user_id:
@@ -120,23 +148,14 @@ async def get_current_user_from_session(request: Request) -> Dict:
     # Convert ObjectId to string (better-auth stores userId as ObjectId)
     user_id = str(user_id)
 
-    # Get better-auth user to extract email/name for auto-creation
-    better_auth_user = await get_better_auth_user(user_id)
-
-    # Try to find user in application database
-    try:
-        from app.db.user import get_user_by_auth_id
-
-        user = await get_user_by_auth_id(user_id)
-    except Exception as e:
-        logger.error(f"Error fetching user {user_id}: {str(e)}")
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Error fetching user",
-        )
+    user = resolved.get("user")
 
     # Auto-create user if they have a valid session but no backend record
     if not user:
+        # Only this branch needs the better-auth user. The resolver returns its
+        # email/name when its _id lookup hit; otherwise fall back to the id/_id
+        # search (string-id deployments).
+        better_auth_user = resolved.get("auth_user") or await get_better_auth_user(user_id)
         if not better_auth_user:
             logger.error(f"User {user_id} not found in better-auth or application database")
             raise HTTPException(
@@ -194,9 +213,9 @@ async def get_current_user_from_session(request: Request) -> Dict:
             logger.info(
                 f"Concurrent auto-create race for {user_id}; using the existing record"
             )
-            from app.db.user import get_user_by_auth_id
+            from app.db.user import get_auth_user_by_auth_id
 
-            user = await get_user_by_auth_id(user_id)
+            user = await get_auth_user_by_auth_id(user_id)
             if user is None:
                 raise HTTPException(
                     status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -209,6 +228,11 @@ async def get_current_user_from_session(request: Request) -> Dict:
                 detail="Failed to create user account. Please try signing in again or contact support."
             )
 
+    if session_token:
+        session_user_cache.put(
+            session_token, user, parse_session_date(session.get("expiresAt"))
+        )
+
     return user
 
 
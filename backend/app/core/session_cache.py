@@ -0,0 +1,125 @@
+"""Per-worker cache of session token -> application user.
+
+Every authenticated request used to resolve its cookie with three sequential
+Mongo round trips (session, better-auth user, app user). The editor's 3s
+autosave and tab loads pay that on every call, for an answer that almost never
+changes between two requests. This bounded LRU+TTL map lets the hot path
+resolve the user with zero DB calls.
+
+An entry lives for at most ``SESSION_CACHE_TTL_SECONDS`` and never past the
+session's own ``expiresAt``. Sign-out happens in better-auth (TypeScript) and
+the backend never sees it, so the TTL is also the upper bound on how long a
+signed-out cookie keeps resolving on a worker that had it cached — keep it
+short. Writes to the user record (plan change, profile edit, deactivation) go
+through ``app.db.user`` and evict every token for that user immediately.
+
+ponytail: per-process, not shared. Each uvicorn worker warms its own copy; a
+write on one worker only evicts that worker's entries, the others age out on
+the TTL. No awaits inside, so no locking is needed on one event loop.
+"""
+
+import time
+from collections import OrderedDict
+from datetime import datetime
+from typing import Dict, Optional, Set, Tuple
+
+from app.core.config import settings
+
+
+class SessionUserCache:
+    """Bounded LRU of session token -> user dict with a per-entry deadline."""
+
+    def __init__(self, max_entries: int, ttl_seconds: int):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._entries: "OrderedDict[str, Tuple[Dict, float]]" = OrderedDict()
+        self._tokens_by_user: Dict[str, Set[str]] = {}
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self.ttl_seconds > 0
+
+    def get(self, token: str) -> Optional[Dict]:
+        """Return a copy of the cached user for ``token``, or None on a miss.
+
+        A copy, because handlers treat ``current_user`` as their own dict; a
+        caller mutating it must not leak into the next request's user.
+        """
+        if not self.enabled:
+            return None
+        entry = self._entries.get(token)
+        if entry is None:
+            self.misses += 1
+            return None
+        user, deadline = entry
+        if deadline <= time.time():
+            self._remove(token)
+            self.misses += 1
+            return None
+        self._entries.move_to_end(token)
+        self.hits += 1
+        return dict(user)
+
+    def put(
+        self, token: str, user: Dict, session_expires_at: Optional[datetime] = None
+    ) -> None:
+        """Cache ``user`` for ``token`` until the TTL or the session expiry, whichever is first."""
+        if not self.enabled or not token or not user:
+            return
+        deadline = time.time() + self.ttl_seconds
+        if session_expires_at is not None:
+            deadline = min(deadline, session_expires_at.timestamp())
+        if deadline <= time.time():
+            return
+
+        self._remove(token)
+        self._entries[token] = (dict(user), deadline)
+        auth_id = user.get("auth_id")
+        if auth_id:
+            self._tokens_by_user.setdefault(auth_id, set()).add(token)
+
+        while len(self._entries) > self.max_entries:
+            oldest = next(iter(self._entries))
+            self._remove(oldest)
+            self.evictions += 1
+
+    def invalidate_token(self, token: str) -> None:
+        self._remove(token)
+
+    def invalidate_user(self, auth_id: str) -> None:
+        """Drop every cached session for ``auth_id`` (plan change, profile edit, deletion)."""
+        for token in list(self._tokens_by_user.get(auth_id, ())):
+            self._remove(token)
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._tokens_by_user.clear()
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "size": len(self._entries),
+            "max_entries": self.max_entries,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+        }
+
+    def _remove(self, token: str) -> None:
+        entry = self._entries.pop(token, None)
+        if entry is None:
+            return
+        auth_id = entry[0].get("auth_id")
+        tokens = self._tokens_by_user.get(auth_id)
+        if tokens is not None:
+            tokens.discard(token)
+            if not tokens:
+                del self._tokens_by_user[auth_id]
+
+
+session_user_cache = SessionUserCache(
+    max_entries=settings.SESSION_CACHE_MAX_ENTRIES,
+    ttl_seconds=settings.SESSION_CACHE_TTL_SECONDS,
+)
@@ -1,12 +1,50 @@
 # backend/app/db/audit_log.py
+"""Audit log writes, buffered off the request path.
+
+``create_audit_log`` used to ``insert_one`` inline, so every mutation paid an
+extra round trip for a row nobody reads on that request. While the app is
+running (the lifespan in ``app.main`` starts ``audit_log_writer``) entries go
+to a write-behind ``BatchWriter`` (``app.db.batch_writer``) instead, flushed
+every ``AUDIT_LOG_BATCH_SIZE`` entries or ``AUDIT_LOG_FLUSH_INTERVAL_SECONDS``.
+Shutdown drains the queue.
+
+Writes stay inline (durable before the caller continues) when:
+- the caller passes ``durable=True`` — account, plan and deletion records;
+- the caller passes a transaction ``session`` — the row belongs to it;
+- the writer is not running (scripts, tests that never start the lifespan).
+
+A full queue drops the entry (counted in ``stats()["dropped"]``) rather than
+blocking the request, and a failed batch is not retried; anything that cannot
+tolerate that is written with ``durable=True``.
+"""
 
-from .base import audit_logs_collection
 from datetime import datetime, timezone
-from typing import Dict
+from typing import Dict, List
+
+from app.core.config import settings
+from .base import audit_logs_collection
+from .batch_writer import BatchWriter
+
+
+class AuditLogWriter(BatchWriter):
+    """Batches audit entries into ``audit_logs``."""
+
+    name = "audit_log"
+
+    async def insert_many(self, batch: List[Dict]) -> None:
+        await audit_logs_collection.insert_many(batch, ordered=False)
+
+
+audit_log_writer = AuditLogWriter(
+    max_queue=settings.AUDIT_LOG_QUEUE_SIZE,
+    batch_size=settings.AUDIT_LOG_BATCH_SIZE,
+    flush_interval=settings.AUDIT_LOG_FLUSH_INTERVAL_SECONDS,
+)
 
 
 async def create_audit_log(
-    action: str, actor_id: str, target_id: str, resource_type: str, details: Dict = None, session=None
+    action: str, actor_id: str, target_id: str, resource_type: str, details: Dict = None,
+    session=None, durable: bool = False,
 ) -> Dict:
     log_data = {
         "action": action,
@@ -17,5 +55,8 @@ async def create_audit_log(
         "timestamp": datetime.now(timezone.utc),
         "ip_address": None,
     }
-    await audit_logs_collection.insert_one(log_data, session=session)
+    if durable or session is not None or not audit_log_writer.running:
+        await audit_logs_collection.insert_one(log_data, session=session)
+    else:
+        audit_log_writer.enqueue(log_data)
     return log_data
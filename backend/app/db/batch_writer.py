@@ -0,0 +1,137 @@
+# backend/app/db/batch_writer.py
+"""Write-behind batching for append-only collections.
+
+A ``BatchWriter`` holds a bounded in-process queue of documents that one
+background task writes with unordered ``insert_many``: as soon as
+``batch_size`` documents are waiting, or ``flush_interval`` seconds after the
+first one, whichever comes first. The app lifespan (``app.main``) starts the
+writers and drains them on shutdown. Subclasses only say where the batch goes.
+
+Producers never wait on Mongo. ``enqueue`` drops (and counts) a document when
+the queue is full; a ``sheddable`` document is already dropped once the queue
+is past half full, so low-value traffic backs off first when Mongo is slow.
+
+ponytail: per worker, in memory. Whatever is still queued when a worker dies
+without a clean shutdown is lost, and a failed batch is logged and counted,
+not retried.
+"""
+
+import abc
+import asyncio
+import logging
+import time
+from typing import Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+# Queued by stop() behind every pending document; the writer exits on reaching it.
+_STOP = object()
+
+
+class BatchWriter(abc.ABC):
+    """Bounded queue drained in batches by one background task."""
+
+    name = "batch"
+
+    def __init__(self, max_queue: int, batch_size: int, flush_interval: float):
+        self.max_queue = max_queue
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self._queue: Optional[asyncio.Queue] = None
+        self._task: Optional[asyncio.Task] = None
+        self.enqueued = 0
+        self.written = 0
+        self.dropped = 0
+        self.shed = 0
+        self.write_failures = 0
+        self.flushes = 0
+        self.last_flush_ms = 0.0
+        self.max_flush_ms = 0.0
+
+    @abc.abstractmethod
+    async def insert_many(self, batch: List[Dict]) -> None:
+        """Write one batch to its collection."""
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    def start(self) -> None:
+        """Start the background writer on the running event loop."""
+        if self.running:
+            return
+        self._queue = asyncio.Queue(maxsize=self.max_queue)
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Write every queued document, then stop the background writer."""
+        if not self.running:
+            return
+        await self._queue.put(_STOP)
+        await self._task
+        self._task = None
+        self._queue = None
+
+    def enqueue(self, doc: Dict, sheddable: bool = False) -> bool:
+        """Queue ``doc`` for the next batch; False (and counted) if it was dropped."""
+        if sheddable and self._queue.qsize() * 2 >= self.max_queue:
+            self.shed += 1
+            return False
+        try:
+            self._queue.put_nowait(doc)
+        except asyncio.QueueFull:
+            self.dropped += 1
+            logger.error("%s queue full (%s); dropped a document", self.name, self.max_queue)
+            return False
+        self.enqueued += 1
+        return True
+
+    def stats(self) -> Dict[str, float]:
+        return {
+            "queue_depth": self._queue.qsize() if self._queue is not None else 0,
+            "enqueued": self.enqueued,
+            "written": self.written,
+            "dropped": self.dropped,
+            "shed": self.shed,
+            "write_failures": self.write_failures,
+            "flushes": self.flushes,
+            "last_flush_ms": self.last_flush_ms,
+            "max_flush_ms": self.max_flush_ms,
+        }
+
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+        stopping = False
+        while not stopping:
+            first = await self._queue.get()
+            if first is _STOP:
+                break
+            batch = [first]
+            deadline = loop.time() + self.flush_interval
+            while len(batch) < self.batch_size:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    doc = await asyncio.wait_for(self._queue.get(), timeout)
+                except asyncio.TimeoutError:
+                    break
+                if doc is _STOP:
+                    stopping = True
+                    break
+                batch.append(doc)
+            await self._write(batch)
+
+    async def _write(self, batch: List[Dict]) -> None:
+        started = time.perf_counter()
+        try:
+            await self.insert_many(batch)
+        except Exception:
+            self.write_failures += 1
+            logger.error("Failed to write %s %s documents", len(batch), self.name, exc_info=True)
+            return
+        elapsed_ms = (time.perf_counter() - started) * 1000
+        self.written += len(batch)
+        self.flushes += 1
+        self.last_flush_ms = elapsed_ms
+        self.max_flush_ms = max(self.max_flush_ms, elapsed_ms)
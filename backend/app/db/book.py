@@ -1,13 +1,30 @@
 # backend/app/db/book.py
 
+import base64
+import json
 import logging
 
-from .base import books_collection, users_collection, _client, get_collection
+from .base import books_collection, _client, get_collection
 from bson.objectid import ObjectId
 from datetime import datetime, timezone
-from typing import Optional, List, Dict
+from typing import Optional, List, Dict, Tuple
 from motor.motor_asyncio import AsyncIOMotorClientSession
+from pymongo import ReturnDocument
 from .audit_log import create_audit_log
+from .book_cache import VALIDATOR_PROJECTION, book_cache, book_validator
+from .book_stats import chapter_stats_delta, compute_book_stats
+from .toc_op_log import push_toc_op
+from .chapter_content import (
+    discard_inserted_chapter_content,
+    get_chapter_contents,
+    hydrate_chapter_contents,
+    insert_chapter_content,
+    prune_chapter_contents,
+    removed_chapter_ids,
+    set_chapter_content,
+    split_chapter_contents,
+    store_chapter_contents,
+)
 from app.models.book import BookDB
 
 logger = logging.getLogger(__name__)
@@ -25,6 +42,9 @@ async def create_book(book_data: Dict, user_auth_id: str) -> Dict:
 
         # 3) serialize to a Mongo-ready dict, with _id alias and timestamps
         payload = book_obj.model_dump(by_alias=True)
+        # A new book has no TOC yet; start its stats at zero so the autosave
+        # path can $inc them from the first save.
+        payload["stats"] = compute_book_stats(payload.get("table_of_contents"))
 
         # 4) Insert the new book
         result = await books_collection.insert_one(payload)
@@ -32,10 +52,8 @@ async def create_book(book_data: Dict, user_auth_id: str) -> Dict:
         # 5) patch the real ObjectId back onto the model
         book_obj.id = result.inserted_id
 
-        # Associate the book with the user
-        await users_collection.update_one(
-            {"auth_id": user_auth_id}, {"$push": {"book_ids": str(book_obj.id)}}
-        )
+        # Ownership is owner_id on the book; the user document is not touched
+        # (the legacy users.book_ids array is no longer maintained).
 
         # Create audit log entry
         await create_audit_log(
@@ -51,13 +69,17 @@ async def create_book(book_data: Dict, user_auth_id: str) -> Dict:
         raise
 
 
-# Drops the per-chapter draft HTML (top-level chapters and one level of
-# subchapters) while leaving ids, titles, nesting, status and all top-level book
-# metadata intact. Chapter bodies are the only unbounded field on a book, so
-# excluding them turns a multi-KB→MB read into a small one (#344).
+# Drops any legacy inline per-chapter draft HTML (top-level chapters and one
+# level of subchapters) while leaving ids, titles, nesting, status and all
+# top-level book metadata intact. Chapter bodies are the only unbounded field on
+# a book, so excluding them turns a multi-KB→MB read into a small one (#344).
+# Bodies now live in chapter_contents (app.db.chapter_content); this only
+# matters for books the migration has not reached yet. The TOC op log
+# (app.db.toc_op_log) is write-path bookkeeping no reader needs either.
 CONTENT_EXCLUDING_PROJECTION = {
     "table_of_contents.chapters.content": 0,
     "table_of_contents.chapters.subchapters.content": 0,
+    "toc_ops": 0,
 }
 
 
@@ -66,13 +88,16 @@ async def get_book_by_id(book_id: str) -> Optional[Dict]:
 
     Prefer :func:`get_book_owner_id` when only ownership matters, or
     :func:`get_book_metadata_by_id` when the chapter bodies are not read — this
-    one pulls the entire document (#344).
+    one reads the book and then every chapter body from ``chapter_contents``
+    (#344).
     """
     try:
         book = await books_collection.find_one({"_id": ObjectId(book_id)})
-        return book
     except Exception:
         return None
+    if book:
+        await hydrate_chapter_contents(book)
+    return book
 
 
 async def get_book_owner_id(book_id: str) -> Optional[str]:
@@ -92,25 +117,205 @@ async def get_book_owner_id(book_id: str) -> Optional[str]:
         return None
 
 
+async def get_book_head(book_id: str) -> Optional[Dict]:
+    """Return the owner and version fields of a book, for a conditional request.
+
+    ``{"_id", "owner_id", "table_of_contents": {"version"}, "updated_at"}`` —
+    enough to check ownership and compute the book's ETag without reading its
+    structure. ``None`` for a missing book and a malformed id.
+    """
+    try:
+        return await books_collection.find_one(
+            {"_id": ObjectId(book_id)}, {"owner_id": 1, **VALIDATOR_PROJECTION}
+        )
+    except Exception:
+        return None
+
+
 async def get_book_metadata_by_id(book_id: str) -> Optional[Dict]:
     """Get a book without any chapter draft HTML.
 
     For callers that need the book's metadata or its chapter *structure* —
     ids, nesting, titles, status — but never a chapter body.
+
+    Served from the per-worker :data:`~app.db.book_cache.book_cache` when its
+    copy is current: a repeat read fetches only the book's version and
+    ``updated_at``, and re-reads the structure only if they changed.
     """
     try:
+        book_oid = ObjectId(book_id)
+        if book_cache.has(book_id):
+            head = await books_collection.find_one(
+                {"_id": book_oid}, VALIDATOR_PROJECTION
+            )
+            if head is None:
+                book_cache.invalidate(book_id)
+                return None
+            cached = book_cache.get(book_id, book_validator(head))
+            if cached is not None:
+                return cached
         book = await books_collection.find_one(
-            {"_id": ObjectId(book_id)}, CONTENT_EXCLUDING_PROJECTION
+            {"_id": book_oid}, CONTENT_EXCLUDING_PROJECTION
         )
-        return book
     except Exception:
         return None
+    if book:
+        book_cache.put(book_id, book)
+    return book
+
+
+async def get_book_stats(book_id: str) -> Optional[Dict]:
+    """Return ``{"_id", "owner_id", "stats"}`` for a book, reading only those.
+
+    A book whose stats were never stored (written before they existed) has
+    them computed from its TOC structure instead. ``None`` for a missing book
+    and a malformed id, like :func:`get_book_owner_id`.
+    """
+    try:
+        book = await books_collection.find_one(
+            {"_id": ObjectId(book_id)}, {"owner_id": 1, "stats": 1}
+        )
+    except Exception:
+        return None
+    if book and not book.get("stats"):
+        book = await get_book_metadata_by_id(book_id)
+        if book:
+            book = {
+                "_id": book["_id"],
+                "owner_id": book.get("owner_id"),
+                "stats": compute_book_stats(book.get("table_of_contents")),
+            }
+    return book
+
+
+# Every chapter of the TOC as one flat array: top-level chapters, then their
+# subchapters (the data model's max depth).
+_ALL_CHAPTERS_EXPR = {
+    "$concatArrays": [
+        {"$ifNull": ["$table_of_contents.chapters", []]},
+        {
+            "$reduce": {
+                "input": {"$ifNull": ["$table_of_contents.chapters", []]},
+                "initialValue": [],
+                "in": {
+                    "$concatArrays": [
+                        "$$value",
+                        {"$ifNull": ["$$this.subchapters", []]},
+                    ]
+                },
+            }
+        },
+    ]
+}
+
+
+async def _find_chapters(book_id: str, chapter_ids: List[str]) -> Optional[Dict]:
+    """Owner/metadata plus ``chapters``: the TOC chapters whose id is requested.
+
+    The ``$filter`` runs server-side, so only the requested chapters leave
+    Mongo. ``None`` for a missing book; a malformed id raises.
+    """
+    pipeline = [
+        {"$match": {"_id": ObjectId(book_id)}},
+        {
+            "$project": {
+                "owner_id": 1,
+                "title": 1,
+                "genre": 1,
+                "target_audience": 1,
+                "chapters": {
+                    "$filter": {
+                        "input": _ALL_CHAPTERS_EXPR,
+                        "as": "ch",
+                        # $literal: an id starting with "$" is a field path otherwise.
+                        "cond": {"$in": ["$$ch.id", {"$literal": chapter_ids}]},
+                    }
+                },
+            }
+        },
+    ]
+    docs = await books_collection.aggregate(pipeline).to_list(length=1)
+    return docs[0] if docs else None
+
+
+async def get_chapters_by_ids(
+    book_id: str, chapter_ids: List[str], include_content: bool = True
+) -> Optional[Dict]:
+    """Get the requested chapters plus the book's owner and metadata.
+
+    Returns ``{"_id", "owner_id", "title", "genre", "target_audience",
+    "chapters"}`` where ``chapters`` maps each requested id that exists to its
+    chapter; missing ids are simply absent. Returns ``None`` for a missing book
+    and a malformed id, like :func:`get_book_by_id`.
+
+    The chapters are picked server-side with ``$filter`` over the top-level
+    chapters and their subchapters, and only their bodies are read from
+    ``chapter_contents``, so the cost follows the number of chapters asked for
+    rather than the size of the book. Pass ``include_content=False`` when no
+    body is needed.
+    """
+    chapter_ids = list(dict.fromkeys(chapter_ids))
+    try:
+        book = await _find_chapters(book_id, chapter_ids)
+    except Exception:
+        return None
+    if book is None:
+        return None
+
+    chapters = {}
+    for chapter in book.get("chapters") or []:
+        # First match wins, as a pre-order walk of the TOC would pick.
+        chapters.setdefault(chapter.get("id"), chapter)
+    book["chapters"] = chapters
+
+    if include_content:
+        if chapters:
+            contents = await get_chapter_contents(book_id, list(chapters))
+            for chapter_id, chapter in chapters.items():
+                if chapter_id in contents:
+                    chapter["content"] = contents[chapter_id]
+    else:
+        for chapter in chapters.values():
+            chapter.pop("content", None)
+    return book
+
+
+async def get_chapter_by_id(
+    book_id: str, chapter_id: str, include_content: bool = True
+) -> Optional[Dict]:
+    """Get one chapter plus the book's owner and metadata, nothing else.
+
+    Returns ``{"_id", "owner_id", "title", "genre", "target_audience",
+    "chapter"}``; ``chapter`` is ``None`` when the book has no such chapter.
+    Returns ``None`` for a missing book and a malformed id. See
+    :func:`get_chapters_by_ids`.
+    """
+    book = await get_chapters_by_ids(book_id, [chapter_id], include_content)
+    if book is None:
+        return None
+    book["chapter"] = book.pop("chapters").get(chapter_id)
+    return book
+
+
+def encode_books_cursor(book: Dict) -> str:
+    """Opaque keyset cursor positioned just after ``book`` in the dashboard order."""
+    raw = json.dumps([book["updated_at"].isoformat(), str(book["_id"])])
+    return base64.urlsafe_b64encode(raw.encode()).decode()
+
+
+def decode_books_cursor(cursor: str) -> Tuple[datetime, ObjectId]:
+    """Inverse of :func:`encode_books_cursor`; raises ``ValueError`` if malformed."""
+    try:
+        updated_at, book_id = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+        return datetime.fromisoformat(updated_at), ObjectId(book_id)
+    except Exception as e:
+        raise ValueError("Invalid cursor") from e
 
 
 async def get_books_by_user(
-    user_auth_id: str, skip: int = 0, limit: int = 100
+    user_auth_id: str, skip: int = 0, limit: int = 100, cursor: Optional[str] = None
 ) -> List[Dict]:
-    """Get all books owned by a user.
+    """Get all books owned by a user, newest first.
 
     Projects out the heavy per-chapter ``content`` HTML from ``table_of_contents``
     (top-level chapters and one level of subchapters). The dashboard list endpoint
@@ -118,43 +323,88 @@ async def get_books_by_user(
     ``table_of_contents`` body — so fetching every chapter's draft here is pure
     overfetch (a book with long chapters sends KBs of unused HTML per row).
     Titles/structure/``toc_items`` are untouched.
+
+    Pass ``cursor`` (from :func:`encode_books_cursor` on the last book of the
+    previous page) for keyset paging: the page starts at an index seek, so page
+    N costs what page 1 does. ``skip`` is the offset mode kept for existing
+    callers; Mongo walks and discards ``skip`` index entries for it. A
+    malformed cursor raises ``ValueError``.
     """
-    cursor = (
-        books_collection.find({"owner_id": user_auth_id}, CONTENT_EXCLUDING_PROJECTION)
+    query: Dict = {"owner_id": user_auth_id}
+    if cursor is not None:
+        updated_at, last_id = decode_books_cursor(cursor)
+        query["$or"] = [
+            {"updated_at": {"$lt": updated_at}},
+            {"updated_at": updated_at, "_id": {"$lt": last_id}},
+        ]
+        skip = 0
+    find = (
+        books_collection.find(query, CONTENT_EXCLUDING_PROJECTION)
         # Newest first. Without an explicit sort Mongo returns natural (roughly
         # insertion) order, so once a user passes the endpoint's 100-row page size
         # the dashboard shows their OLDEST 100 forever and a newly created book is
         # never visible — it sits past the end of page one. On staging (#488) that
         # account had 2,649 books and the dashboard's newest card was months old.
         #
-        # Sort on updated_at ALONE, deliberately. The collection already carries
-        # owner_updated_idx (owner_id, updated_at DESC), and this exact shape uses
-        # it: explain() reports LIMIT -> FETCH -> IXSCAN. Adding an _id tiebreaker
-        # for tie determinism looks harmless but measured as
-        # SORT -> FETCH -> IXSCAN — a blocking in-memory sort on every dashboard
-        # load, which is what hits Mongo's 32MB sort cap as a library grows.
-        # Ties within one second are rare and not worth that.
-        .sort("updated_at", -1)
+        # The _id tiebreaker makes the order total, which keyset paging needs.
+        # It must match owner_updated_id_idx (owner_id, updated_at DESC, _id
+        # DESC) exactly: against the older (owner_id, updated_at) index the same
+        # sort measured as SORT -> FETCH -> IXSCAN, a blocking in-memory sort that
+        # hits Mongo's 32MB cap as a library grows.
+        .sort([("updated_at", -1), ("_id", -1)])
         .skip(skip)
         .limit(limit)
     )
-    books = await cursor.to_list(length=limit)
+    books = await find.to_list(length=limit)
     return books
 
 
 async def update_book(
     book_id: str, book_data: Dict, user_auth_id: str
 ) -> Optional[Dict]:
-    """Update an existing book"""
+    """Update an existing book.
+
+    A replaced ``table_of_contents`` is stored without chapter bodies: any it
+    carries are written to ``chapter_contents`` where they differ from the
+    stored ones, and bodies of chapters it drops are deleted.
+    """
     # Add updated_at timestamp
     book_data["updated_at"] = datetime.now(timezone.utc)
 
+    new_toc = book_data.get("table_of_contents")
+    contents = {}
+    previous = None
+    if new_toc is not None:
+        # The chapter ids this write replaces, to prune only the ones it drops.
+        # ponytail: read before the (unguarded) write, so a chapter added in
+        # between and dropped by it keeps an unreachable body — an orphan
+        # that goes with the book, never a lost body.
+        previous = await books_collection.find_one(
+            {"_id": ObjectId(book_id), "owner_id": user_auth_id},
+            {"table_of_contents.chapters.id": 1, "table_of_contents.chapters.subchapters.id": 1},
+        )
+        book_data["table_of_contents"], contents = split_chapter_contents(new_toc)
+        book_data["stats"] = compute_book_stats(new_toc)
+        # A replaced TOC is not rebased across (app.db.toc_op_log).
+        book_data["toc_ops"] = []
+
     # Update the book
     updated_book = await books_collection.find_one_and_update(
         {"_id": ObjectId(book_id), "owner_id": user_auth_id},  # Only owner can update
         {"$set": book_data},
         return_document=True,
     )
+    book_cache.invalidate(book_id)
+
+    if updated_book and new_toc is not None:
+        # Only once the owner-scoped write matched. It is not version-guarded,
+        # so neither are its bodies: as for the rest of the TOC, the last
+        # writer wins.
+        await store_chapter_contents(book_id, contents)
+        await prune_chapter_contents(
+            book_id,
+            removed_chapter_ids((previous or {}).get("table_of_contents"), new_toc),
+        )
 
     # Create audit log entry if book was found and updated
     if updated_book:
@@ -169,12 +419,36 @@ async def update_book(
     return updated_book
 
 
+# What apply_chapter_content_update reads back of the book as it was just
+# before its write: the version, whether stats are stored, and each chapter's
+# stats inputs.
+_CONTENT_UPDATE_PREIMAGE = {
+    "table_of_contents.version": 1,
+    "stats.total_chapters": 1,
+    **{
+        f"table_of_contents.chapters.{path}{field}": 1
+        for path in ("", "subchapters.")
+        for field in ("id", "word_count", "status")
+    },
+}
+
+
+def _preimage_chapter(book: Dict, parent_chapter_id: Optional[str], chapter_id: str) -> Optional[Dict]:
+    chapters = (book.get("table_of_contents") or {}).get("chapters") or []
+    if parent_chapter_id:
+        parent = next((c for c in chapters if c.get("id") == parent_chapter_id), None)
+        chapters = (parent or {}).get("subchapters") or []
+    return next((c for c in chapters if c.get("id") == chapter_id), None)
+
+
 async def apply_chapter_content_update(
     book_id: str,
     chapter_id: str,
     parent_chapter_id: Optional[str],
     chapter_fields: Dict,
     user_auth_id: str,
+    previous: Optional[Dict] = None,
+    stats_stored: bool = False,
 ) -> bool:
     """Concurrency-safe, targeted update of a SINGLE chapter's fields.
 
@@ -183,8 +457,8 @@ async def apply_chapter_content_update(
     *different* chapter (or a reorder) silently clobbered this one — the #177
     lost update. This positional ``$set`` (via ``array_filters``) touches only
     the target chapter's fields and bumps the TOC version atomically with
-    ``$inc``, so concurrent saves to different chapters no longer collide and no
-    version guard / 409 round-trip is needed.
+    ``$inc``, so concurrent saves no longer collide and no version guard / 409
+    round-trip is needed.
 
     ponytail: supports a top-level chapter or one level of subchapter — the data
     model's max depth (matches ``add_chapter_with_transaction``). Deeper nesting
@@ -194,9 +468,34 @@ async def apply_chapter_content_update(
     to still exist, so a chapter deleted/moved since the caller's read is a clean
     no-match rather than a false success that only bumps the version. Returns
     True when the update matched (and thus applied), False otherwise.
+
+    A ``content`` field goes to ``chapter_contents``; the TOC only receives
+    the stats, and the chapter's legacy inline copy is unset. Before that, the
+    body is inserted if the chapter has no stored one yet, so a failure later
+    on can't leave the inline copy as the only, and removed, one; the insert is
+    taken back if the TOC write misses. After the TOC write, the body is
+    written guarded on the version that write produced, so of two racing saves
+    to one chapter the body kept is the one whose stats the TOC holds.
+
+    ``previous`` is the chapter as the caller read it, and ``stats_stored``
+    whether that read of the book carried ``stats``. The write moves the stats
+    with ``$inc`` by the difference between ``previous`` and the new fields, and
+    reads back the chapter as it was just before the write. If a concurrent
+    save had changed it, a second ``$inc`` corrects by the difference, so the
+    stats end exact without the write ever failing over it.
+
+    ponytail: a whole-TOC write landing between the write and its correction
+    recomputes stats that already include this change, and the correction
+    then skews them until the next TOC write recomputes them.
     """
     now = datetime.now(timezone.utc)
-    query = {"_id": ObjectId(book_id), "owner_id": user_auth_id}
+    object_id = ObjectId(book_id)
+    query = {"_id": object_id, "owner_id": user_auth_id}
+    update = {"$inc": {"table_of_contents.version": 1}}
+
+    stats_delta = chapter_stats_delta(previous, chapter_fields) if previous and stats_stored else {}
+    update["$inc"].update(stats_delta)
+
     if parent_chapter_id:
         prefix = "table_of_contents.chapters.$[p].subchapters.$[c]."
         array_filters = [{"p.id": parent_chapter_id}, {"c.id": chapter_id}]
@@ -211,17 +510,76 @@ async def apply_chapter_content_update(
         array_filters = [{"c.id": chapter_id}]
         query["table_of_contents.chapters.id"] = chapter_id
 
+    chapter_fields = dict(chapter_fields)
+    content = chapter_fields.pop("content", None)
+    inserted = False
+    if content is not None:
+        inserted = await insert_chapter_content(book_id, chapter_id, content)
+        update["$unset"] = {prefix + "content": ""}
+
     set_doc = {prefix + key: value for key, value in chapter_fields.items()}
     set_doc["table_of_contents.updated_at"] = now.isoformat()
     set_doc["table_of_contents.status"] = "edited"
     set_doc["updated_at"] = now
+    update["$set"] = set_doc
+    # Log the version bump, so a stale TOC write to another chapter rebases
+    # over this save instead of failing.
+    push_toc_op(update, [chapter_id])
 
-    result = await books_collection.update_one(
+    before = await books_collection.find_one_and_update(
         query,
-        {"$set": set_doc, "$inc": {"table_of_contents.version": 1}},
+        update,
+        projection=_CONTENT_UPDATE_PREIMAGE,
         array_filters=array_filters,
+        return_document=ReturnDocument.BEFORE,
+    )
+    # Also on a miss: the caller's read was out of date and its retry must not
+    # be served the same copy.
+    book_cache.invalidate(book_id)
+    if before is None:
+        if inserted:
+            await discard_inserted_chapter_content(book_id, chapter_id)
+        return False
+
+    await _correct_chapter_stats(
+        object_id, before, parent_chapter_id, chapter_id, chapter_fields, stats_delta
     )
-    return result.matched_count > 0
+    if content is not None:
+        version = ((before.get("table_of_contents") or {}).get("version") or 0) + 1
+        await set_chapter_content(book_id, chapter_id, content, toc_version=version)
+    return True
+
+
+async def _correct_chapter_stats(
+    object_id: ObjectId,
+    before: Dict,
+    parent_chapter_id: Optional[str],
+    chapter_id: str,
+    chapter_fields: Dict,
+    applied: Dict[str, int],
+) -> None:
+    """Fix up the stats ``$inc`` an autosave applied from its caller's read.
+
+    ``before`` is the book as it was just before the write; the exact delta is
+    the one from its copy of the chapter.
+    """
+    if "stats" not in before:
+        if applied:
+            # The read saw stats the book no longer has; don't leave a partial
+            # document behind (book_stats computes them meanwhile).
+            await books_collection.update_one({"_id": object_id}, {"$unset": {"stats": ""}})
+        return
+    actual = _preimage_chapter(before, parent_chapter_id, chapter_id) or {}
+    exact = chapter_stats_delta(actual, chapter_fields)
+    correction = {
+        key: exact.get(key, 0) - applied.get(key, 0)
+        for key in set(exact) | set(applied)
+        if exact.get(key, 0) != applied.get(key, 0)
+    }
+    if correction:
+        await books_collection.update_one(
+            {"_id": object_id, "stats": {"$exists": True}}, {"$inc": correction}
+        )
 
 
 async def update_book_summary_atomic(
@@ -282,6 +640,7 @@ async def update_book_summary_atomic(
         update,
         return_document=True,
     )
+    book_cache.invalidate(book_id)
 
     if updated_book:
         await create_audit_log(
@@ -301,8 +660,8 @@ async def delete_book(book_id: str, user_auth_id: str) -> bool:
     Removes (atomically when MongoDB supports transactions via a replica set,
     and with a safe children-first ordering otherwise):
     - chapter access logs, questions, question responses, question ratings
+    - chapter bodies (``chapter_contents``)
     - the book document
-    - the book association on the user
 
     Mirrors the conditional-transaction pattern in ``toc_transactions``. On a
     non-transactional deployment a mid-cascade failure leaves the book document
@@ -336,6 +695,8 @@ async def delete_book(book_id: str, user_auth_id: str) -> bool:
         # children-first ordering (the book document is deleted last).
         logger.error("Cascade delete failed for book %s", book_id, exc_info=True)
         raise
+    finally:
+        book_cache.invalidate(book_id)
 
     # The book vanished between the ownership check and the delete.
     if counts is None:
@@ -348,6 +709,7 @@ async def delete_book(book_id: str, user_auth_id: str) -> bool:
         target_id=book_id,
         resource_type="book",
         details={"title": book.get("title", "Untitled"), "cascade_deleted": counts},
+        durable=True,
     )
     return True
 
@@ -384,12 +746,16 @@ async def _delete_book_internal(
 ) -> Optional[Dict[str, int]]:
     """Run the cascade deletes, optionally inside a transaction ``session``.
 
-    Children are deleted first and the book document + user association last, so
+    Children are deleted first and the book document last, so
     a non-transactional partial failure leaves the book discoverable. Returns
     per-collection delete counts, or ``None`` if the book document was already
     gone (deleted between the ownership check and here).
     """
     chapter_access_logs = await get_collection("chapter_access_logs")
+    tab_states = await get_collection("chapter_tab_states")
+    access_rollups = await get_collection("chapter_access_daily")
+    recent_chapters = await get_collection("chapter_recent")
+    chapter_contents = await get_collection("chapter_contents")
     questions_collection = await get_collection("questions")
     responses_collection = await get_collection("question_responses")
     ratings_collection = await get_collection("question_ratings")
@@ -397,6 +763,18 @@ async def _delete_book_internal(
     access_logs_result = await chapter_access_logs.delete_many(
         {"book_id": book_id}, session=session
     )
+    tab_states_result = await tab_states.delete_many(
+        {"book_id": book_id}, session=session
+    )
+    rollups_result = await access_rollups.delete_many(
+        {"book_id": book_id}, session=session
+    )
+    recent_result = await recent_chapters.delete_many(
+        {"book_id": book_id}, session=session
+    )
+    contents_result = await chapter_contents.delete_many(
+        {"book_id": book_id}, session=session
+    )
 
     questions = await questions_collection.find(
         {"book_id": book_id, "user_id": user_auth_id}, session=session
@@ -421,19 +799,19 @@ async def _delete_book_internal(
         {"book_id": book_id, "user_id": user_auth_id}, session=session
     )
 
-    # Parent last: book document, then the user's book_ids association.
+    # Parent last: the book document.
     result = await books_collection.delete_one(
         {"_id": ObjectId(book_id)}, session=session
     )
     if result.deleted_count == 0:
         return None
 
-    await users_collection.update_one(
-        {"auth_id": user_auth_id}, {"$pull": {"book_ids": book_id}}, session=session
-    )
-
     return {
         "chapter_access_logs": access_logs_result.deleted_count,
+        "chapter_tab_states": tab_states_result.deleted_count,
+        "chapter_access_daily": rollups_result.deleted_count,
+        "chapter_recent": recent_result.deleted_count,
+        "chapter_contents": contents_result.deleted_count,
         "questions": questions_result.deleted_count,
         "question_responses": responses_deleted,
         "question_ratings": ratings_deleted,
@@ -0,0 +1,111 @@
+"""Per-worker cache of content-free book documents, keyed by version.
+
+``get_book_metadata_by_id`` runs on nearly every editor interaction (tab
+loads, chapter metadata, the TOC view, autosave), and re-reading the whole
+TOC structure each time is wasted transfer when it has not changed. This
+bounded LRU keeps the last read of each book together with its *validator* —
+``table_of_contents.version`` plus ``updated_at`` — and a repeat read first
+fetches only those two fields. A match serves the cached copy; a mismatch
+drops the entry and the caller re-reads the book.
+
+``updated_at`` is part of the validator because metadata writes (title,
+summary, settings) do not bump the TOC version; every book writer in
+``app.db`` sets it. Writes made through ``app.db.book`` and
+``app.db.toc_transactions`` also evict the entry directly, so this worker
+never spends a validation on a book it just changed.
+
+ponytail: per-process, not shared. A write on another worker is caught by the
+validator, not by eviction. No awaits inside, so no locking is needed on one
+event loop.
+"""
+
+import copy
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+
+from app.core.config import settings
+
+# What a revalidation reads instead of the book.
+VALIDATOR_PROJECTION = {"table_of_contents.version": 1, "updated_at": 1}
+
+
+def book_validator(book: Dict) -> Tuple[Any, Any]:
+    """The (TOC version, updated_at) pair a cached copy is checked against."""
+    return ((book.get("table_of_contents") or {}).get("version"), book.get("updated_at"))
+
+
+class BookCache:
+    """Bounded LRU of book id -> (book dict, validator)."""
+
+    def __init__(self, max_entries: int):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, Tuple[Dict, Tuple[Any, Any]]]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.stale = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_entries > 0
+
+    def has(self, book_id: str) -> bool:
+        """Whether a copy is cached and worth revalidating; a miss if not."""
+        if book_id in self._entries:
+            return True
+        if self.enabled:
+            self.misses += 1
+        return False
+
+    def get(self, book_id: str, validator: Tuple[Any, Any]) -> Optional[Dict]:
+        """Return a copy of the cached book if it still matches ``validator``.
+
+        A copy, because handlers mutate the TOC they read (``TocIndex`` hands
+        out the chapter dicts themselves).
+        """
+        entry = self._entries.get(book_id)
+        if entry is None:
+            self.misses += 1
+            return None
+        book, cached_validator = entry
+        if cached_validator != validator:
+            del self._entries[book_id]
+            self.stale += 1
+            self.misses += 1
+            return None
+        self._entries.move_to_end(book_id)
+        self.hits += 1
+        return copy.deepcopy(book)
+
+    def put(self, book_id: str, book: Dict) -> None:
+        if not self.enabled or not book:
+            return
+        self._entries.pop(book_id, None)
+        self._entries[book_id] = (copy.deepcopy(book), book_validator(book))
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def invalidate(self, book_id: str) -> None:
+        if self._entries.pop(book_id, None) is not None:
+            self.invalidations += 1
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        lookups = self.hits + self.misses
+        return {
+            "size": len(self._entries),
+            "max_entries": self.max_entries,
+            "hits": self.hits,
+            "misses": self.misses,
+            "stale": self.stale,
+            "evictions": self.evictions,
+            "invalidations": self.invalidations,
+            "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+        }
+
+
+book_cache = BookCache(max_entries=settings.BOOK_CACHE_MAX_ENTRIES)
@@ -0,0 +1,102 @@
+# backend/app/db/book_stats.py
+"""Book-level statistics stored on the book as ``stats``.
+
+Dashboard, export-preview and chapter-metadata reads used to recompute these
+from every chapter (the export preview ran html2text over the manuscript).
+They are now kept on the book document and maintained by its writers:
+
+- whole-TOC writes (``_update_toc_internal``, ``update_book``) ``$set``
+  stats recomputed from the TOC they write;
+- targeted chapter writes in ``toc_transactions`` (add, update, delete, bulk
+  status) ``$inc`` the change's delta in the same version-guarded update, or
+  ``$set`` recomputed stats on a book that has none yet;
+- the autosave path (``apply_chapter_content_update``) applies the delta
+  between the chapter it read and the fields it writes with ``$inc``, then
+  corrects it from the chapter as the write found it, so a concurrent save
+  to the same chapter never makes the autosave fail.
+
+Counts derive from each chapter's ``word_count`` and ``status`` in the TOC.
+A book written before stats existed has none until its next TOC write;
+:func:`book_stats` computes them from the TOC structure meanwhile, and the
+autosave path leaves them absent rather than ``$inc`` a partial document.
+"""
+
+from typing import Dict, List, Optional
+
+from app.schemas.book import ChapterStatus
+from app.utils.toc_index import TocIndex
+
+CHAPTER_STATUSES = [status.value for status in ChapterStatus]
+
+
+def _word_count(chapter: Optional[Dict]) -> int:
+    return int((chapter or {}).get("word_count") or 0)
+
+
+def _status(chapter: Optional[Dict]) -> str:
+    return (chapter or {}).get("status") or ChapterStatus.DRAFT.value
+
+
+def compute_book_stats(toc: Optional[Dict]) -> Dict:
+    """Stats for a TOC (every nesting level), from its chapters' stored counts."""
+    stats = {
+        "total_chapters": 0,
+        "chapters_with_content": 0,
+        "total_word_count": 0,
+        "status_counts": {status: 0 for status in CHAPTER_STATUSES},
+    }
+    for chapter in TocIndex((toc or {}).get("chapters")):
+        words = _word_count(chapter)
+        stats["total_chapters"] += 1
+        stats["total_word_count"] += words
+        if words > 0:
+            stats["chapters_with_content"] += 1
+        status = _status(chapter)
+        if status in stats["status_counts"]:
+            stats["status_counts"][status] += 1
+    return stats
+
+
+def book_stats(book: Dict) -> Dict:
+    """The book's stored stats, or ones computed from its TOC if it has none yet."""
+    return book.get("stats") or compute_book_stats(book.get("table_of_contents"))
+
+
+def chapter_stats_delta(previous: Dict, fields: Dict) -> Dict[str, int]:
+    """``$inc`` document moving ``stats`` from chapter ``previous`` to ``previous | fields``.
+
+    Empty when ``fields`` changes nothing the stats count.
+    """
+    before_words, before_status = _word_count(previous), _status(previous)
+    after_words = _word_count(fields) if "word_count" in fields else before_words
+    after_status = fields.get("status") or before_status
+
+    inc = {}
+    if after_words != before_words:
+        inc["stats.total_word_count"] = after_words - before_words
+        with_content = int(after_words > 0) - int(before_words > 0)
+        if with_content:
+            inc["stats.chapters_with_content"] = with_content
+    if after_status != before_status:
+        if before_status in CHAPTER_STATUSES:
+            inc[f"stats.status_counts.{before_status}"] = -1
+        if after_status in CHAPTER_STATUSES:
+            inc[f"stats.status_counts.{after_status}"] = 1
+    return inc
+
+
+def chapters_stats_delta(chapters: List[Dict], sign: int = 1) -> Dict[str, int]:
+    """``$inc`` document adding (``sign=1``) or removing (``-1``) ``chapters``.
+
+    Subchapters count too, as they do in :func:`compute_book_stats`.
+    """
+    stats = compute_book_stats({"chapters": chapters})
+    inc = {
+        f"stats.{key}": sign * stats[key]
+        for key in ("total_chapters", "chapters_with_content", "total_word_count")
+        if stats[key]
+    }
+    for status, count in stats["status_counts"].items():
+        if count:
+            inc[f"stats.status_counts.{status}"] = sign * count
+    return inc
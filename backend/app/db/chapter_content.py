@@ -0,0 +1,315 @@
+# backend/app/db/chapter_content.py
+"""Chapter bodies, stored one document per chapter outside the book.
+
+Chapter HTML used to live inline at ``table_of_contents.chapters[].content``
+(and ``...subchapters[].content``), so every full book read shipped the whole
+manuscript, every TOC compare-and-swap rewrote it, and the 16 MB document cap
+bounded book length. Bodies now live in ``chapter_contents`` keyed by
+``<book_id>:<chapter_id>``; the TOC keeps structure and stats only.
+
+Migration is online (dual read):
+- reads (:func:`hydrate_chapter_contents`) prefer the ``chapter_contents``
+  document and fall back to a legacy inline ``content`` — an external document
+  is only ever written after (or instead of) the inline copy, so it is never
+  the stale one;
+- the content endpoint makes sure an external document exists before it
+  unsets the inline copy, then writes the body (:func:`set_chapter_content`)
+  guarded on the TOC version its write produced;
+- every whole-TOC write strips inline bodies (:func:`split_chapter_contents`),
+  stores any a chapter has no body for yet before it writes
+  (:func:`migrate_chapter_contents`), and once it has committed writes the
+  ones that changed (:func:`store_chapter_contents`), guarded on its TOC
+  version so it never replaces a body stored by a later write;
+  single-chapter TOC writes are targeted and leave other chapters' inline
+  copies where they are;
+- ``app/scripts/migration_chapter_contents.py`` moves the rest in bulk.
+"""
+
+import copy
+import hashlib
+import logging
+from datetime import datetime, timezone
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from pymongo import UpdateOne
+from pymongo.errors import BulkWriteError, DuplicateKeyError
+
+from .base import get_collection
+
+logger = logging.getLogger(__name__)
+
+CHAPTER_CONTENTS_COLLECTION = "chapter_contents"
+
+
+def chapter_content_id(book_id: str, chapter_id: str) -> str:
+    return f"{book_id}:{chapter_id}"
+
+
+def content_hash(content: str) -> str:
+    """Digest of a chapter body, stored beside it as ``content_hash``."""
+    return hashlib.sha256((content or "").encode("utf-8")).hexdigest()
+
+
+def iter_chapters(chapters: Iterable[Dict]) -> Iterable[Dict]:
+    """Every chapter in a TOC chapter list, subchapters included (pre-order)."""
+    for chapter in chapters or []:
+        yield chapter
+        yield from iter_chapters(chapter.get("subchapters"))
+
+
+def split_chapter_contents(toc: Dict) -> Tuple[Dict, Dict[str, str]]:
+    """Return ``(toc without bodies, {chapter_id: inline body})``.
+
+    The input is not modified: callers keep handing their TOC (bodies
+    included) back to the API.
+    """
+    if not any("content" in chapter for chapter in iter_chapters(toc.get("chapters"))):
+        return toc, {}
+    stripped = copy.deepcopy(toc)
+    contents = {}
+    for chapter in iter_chapters(stripped.get("chapters")):
+        if "content" in chapter:
+            body = chapter.pop("content")
+            if chapter.get("id") and body:
+                contents[chapter["id"]] = body
+    return stripped, contents
+
+
+async def ensure_chapter_content_indexes() -> None:
+    """Index ``chapter_contents`` by book for hydration and cascade deletes."""
+    try:
+        collection = await get_collection(CHAPTER_CONTENTS_COLLECTION)
+        await collection.create_index(
+            [("book_id", 1), ("chapter_id", 1)], name="book_chapter_idx"
+        )
+    except Exception:
+        logger.error("Failed to create chapter_contents index", exc_info=True)
+
+
+async def get_chapter_contents(
+    book_id: str, chapter_ids: Optional[List[str]] = None
+) -> Dict[str, str]:
+    """``{chapter_id: body}`` for the book's stored bodies (or just ``chapter_ids``)."""
+    query = {"book_id": book_id}
+    if chapter_ids is not None:
+        query = {"_id": {"$in": [chapter_content_id(book_id, cid) for cid in chapter_ids]}}
+    collection = await get_collection(CHAPTER_CONTENTS_COLLECTION)
+    return {
+        doc["chapter_id"]: doc.get("content", "")
+        async for doc in collection.find(query, {"chapter_id": 1, "content": 1})
+    }
+
+
+async def hydrate_chapter_contents(
+    book: Dict, chapter_ids: Optional[List[str]] = None
+) -> Dict:
+    """Fill ``content`` on the book's TOC chapters, in place (dual read).
+
+    A stored ``chapter_contents`` body wins over a legacy inline one.
+    ``chapter_ids`` limits which chapters are looked up.
+    """
+    chapters = list(iter_chapters((book.get("table_of_contents") or {}).get("chapters")))
+    if not chapters or chapter_ids == []:
+        return book
+    contents = await get_chapter_contents(str(book["_id"]), chapter_ids)
+    for chapter in chapters:
+        body = contents.get(chapter.get("id"))
+        if body is not None:
+            chapter["content"] = body
+    return book
+
+
+async def set_chapter_content(
+    book_id: str, chapter_id: str, content: str, toc_version: Optional[int] = None
+) -> bool:
+    """Write a chapter's body (the explicit, user-initiated path).
+
+    With ``toc_version`` — the TOC version the caller's own write produced —
+    the body is only written over one stored by an older TOC write, so two
+    saves racing on one chapter end with the body of the one whose TOC write
+    (and stats) landed last. Returns False when a newer body was kept.
+    """
+    key = {"_id": chapter_content_id(book_id, chapter_id)}
+    fields = {
+        "book_id": book_id,
+        "chapter_id": chapter_id,
+        "content": content,
+        "content_hash": content_hash(content),
+        "updated_at": datetime.now(timezone.utc),
+    }
+    if toc_version is not None:
+        key["$or"] = [
+            {"toc_version": {"$lt": toc_version}},
+            {"toc_version": {"$exists": False}},
+        ]
+        fields["toc_version"] = toc_version
+    collection = await get_collection(CHAPTER_CONTENTS_COLLECTION)
+    try:
+        await collection.update_one(key, {"$set": fields}, upsert=True)
+    except DuplicateKeyError:
+        # The guard excluded a body written by a newer TOC write.
+        return False
+    return True
+
+
+async def insert_chapter_content(book_id: str, chapter_id: str, content: str) -> bool:
+    """Store ``content`` only if the chapter has no external body yet.
+
+    Run before a write that drops the inline copy, so that copy is never the
+    only one. True when this inserted the document.
+    """
+    collection = await get_collection(CHAPTER_CONTENTS_COLLECTION)
+    result = await collection.update_one(
+        {"_id": chapter_content_id(book_id, chapter_id)},
+        {
+            "$setOnInsert": {
+                "book_id": book_id,
+                "chapter_id": chapter_id,
+                "content": content,
+                "content_hash": content_hash(content),
+                "updated_at": datetime.now(timezone.utc),
+            }
+        },
+        upsert=True,
+    )
+    return result.upserted_id is not None
+
+
+async def discard_inserted_chapter_content(book_id: str, chapter_id: str) -> None:
+    """Undo :func:`insert_chapter_content` after the TOC write it prepared missed."""
+    collection = await get_collection(CHAPTER_CONTENTS_COLLECTION)
+    await collection.delete_one(
+        {"_id": chapter_content_id(book_id, chapter_id), "toc_version": {"$exists": False}}
+    )
+
+
+async def get_chapter_content_hashes(book_id: str) -> Dict[str, Optional[str]]:
+    """``{chapter_id: content_hash}`` of the book's stored bodies, without the bodies."""
+    collection = await get_collection(CHAPTER_CONTENTS_COLLECTION)
+    return {
+        doc["chapter_id"]: doc.get("content_hash")
+        async for doc in collection.find(
+            {"book_id": book_id}, {"chapter_id": 1, "content_hash": 1}
+        )
+    }
+
+
+async def get_chapter_content_hash(book_id: str, chapter_id: str) -> Optional[str]:
+    """The stored body's ``content_hash``, without reading the body.
+
+    ``None`` when the chapter has no stored body or it predates the hash.
+    """
+    collection = await get_collection(CHAPTER_CONTENTS_COLLECTION)
+    doc = await collection.find_one(
+        {"_id": chapter_content_id(book_id, chapter_id)}, {"content_hash": 1}
+    )
+    return (doc or {}).get("content_hash")
+
+
+async def get_stored_chapter_content(book_id: str, chapter_id: str) -> Optional[Dict]:
+    """The chapter's stored ``content`` and ``content_hash`` in one read, or ``None``."""
+    collection = await get_collection(CHAPTER_CONTENTS_COLLECTION)
+    return await collection.find_one(
+        {"_id": chapter_content_id(book_id, chapter_id)},
+        {"content": 1, "content_hash": 1},
+    )
+
+
+async def migrate_chapter_contents(book_id: str, contents: Dict[str, str], session=None) -> None:
+    """Move inline bodies out without overwriting any already stored externally."""
+    if not contents:
+        return
+    now = datetime.now(timezone.utc)
+    ops = [
+        UpdateOne(
+            {"_id": chapter_content_id(book_id, chapter_id)},
+            {
+                "$setOnInsert": {
+                    "book_id": book_id,
+                    "chapter_id": chapter_id,
+                    "content": body,
+                    "content_hash": content_hash(body),
+                    "updated_at": now,
+                }
+            },
+            upsert=True,
+        )
+        for chapter_id, body in contents.items()
+    ]
+    collection = await get_collection(CHAPTER_CONTENTS_COLLECTION)
+    await collection.bulk_write(ops, ordered=False, session=session)
+
+
+async def store_chapter_contents(
+    book_id: str, contents: Dict[str, str], toc_version: Optional[int] = None
+) -> None:
+    """Write the bodies a whole-TOC write carried, where they changed.
+
+    Run after that write committed, with the TOC version it produced, so a
+    body is only replaced by a newer TOC write than the one that stored it
+    (the guard :func:`set_chapter_content` uses); bodies equal to the stored
+    ones are left alone. Without ``toc_version`` — an unguarded TOC write —
+    changed bodies are written unconditionally.
+    """
+    if not contents:
+        return
+    stored = await get_chapter_content_hashes(book_id)
+    now = datetime.now(timezone.utc)
+    ops = []
+    for chapter_id, body in contents.items():
+        digest = content_hash(body)
+        if stored.get(chapter_id) == digest:
+            continue
+        key = {"_id": chapter_content_id(book_id, chapter_id)}
+        fields = {
+            "book_id": book_id,
+            "chapter_id": chapter_id,
+            "content": body,
+            "content_hash": digest,
+            "updated_at": now,
+        }
+        if toc_version is not None:
+            key["$or"] = [
+                {"toc_version": {"$lt": toc_version}},
+                {"toc_version": {"$exists": False}},
+            ]
+            fields["toc_version"] = toc_version
+        ops.append(UpdateOne(key, {"$set": fields}, upsert=True))
+    if not ops:
+        return
+    collection = await get_collection(CHAPTER_CONTENTS_COLLECTION)
+    try:
+        await collection.bulk_write(ops, ordered=False)
+    except BulkWriteError as e:
+        # A duplicate key is a body kept because a newer TOC write stored it.
+        if any(error.get("code") != 11000 for error in e.details.get("writeErrors", [])):
+            raise
+
+
+def removed_chapter_ids(old_toc: Optional[Dict], new_toc: Optional[Dict]) -> List[str]:
+    """Ids of the chapters in ``old_toc`` that ``new_toc`` no longer has."""
+    kept = {c.get("id") for c in iter_chapters((new_toc or {}).get("chapters"))}
+    return [
+        c["id"]
+        for c in iter_chapters((old_toc or {}).get("chapters"))
+        if c.get("id") and c["id"] not in kept
+    ]
+
+
+async def prune_chapter_contents(book_id: str, chapter_ids: Iterable[str]) -> None:
+    """Delete the stored bodies of ``chapter_ids``, chapters a write just removed.
+
+    Only ever the ids that write removed, never "everything not in the TOC it
+    saw": a chapter added (and autosaved) by another request after that TOC
+    was read would otherwise lose its body. Called after a committed TOC
+    write, so a failure is logged, not raised: the orphans are unreachable
+    and go with the book.
+    """
+    keys = [chapter_content_id(book_id, chapter_id) for chapter_id in chapter_ids]
+    if not keys:
+        return
+    try:
+        collection = await get_collection(CHAPTER_CONTENTS_COLLECTION)
+        await collection.delete_many({"_id": {"$in": keys}})
+    except Exception:
+        logger.error("Failed to prune chapter contents for book %s", book_id, exc_info=True)
@@ -24,6 +24,8 @@ __all__ = [
 
 from .user import (
     get_user_by_auth_id,
+    get_auth_user_by_auth_id,
+    get_user_profile,
     get_user_by_id,
     get_user_by_email,
     create_user,
@@ -38,8 +40,13 @@ from .book import (
     create_book,
     get_book_by_id,
     get_book_owner_id,
+    get_book_head,
+    get_book_stats,
     get_book_metadata_by_id,
+    get_chapter_by_id,
+    get_chapters_by_ids,
     get_books_by_user,
+    encode_books_cursor,
     update_book,
     apply_chapter_content_update,
     update_book_summary_atomic,
@@ -49,7 +56,7 @@ from .book import (
 
 from .audit_log import create_audit_log
 
-from .usage import increment_usage
+from .usage import increment_usage, increment_usage_windows, bulk_increment_usage
 
 from .questions import (
     create_question,
@@ -69,6 +76,7 @@ from .questions import (
 from .toc_transactions import (
     update_toc_with_transaction,
     add_chapter_with_transaction,
+    add_chapters_with_transaction,
     update_chapter_with_transaction,
     delete_chapter_with_transaction,
     reorder_chapters_with_transaction,
@@ -77,6 +85,8 @@ from .toc_transactions import (
 __all__ += [
     # User DAOs
     "get_user_by_auth_id",
+    "get_auth_user_by_auth_id",
+    "get_user_profile",
     "get_user_by_id",
     "get_user_by_email",
     "create_user",
@@ -87,8 +97,13 @@ __all__ += [
     "create_book",
     "get_book_by_id",
     "get_book_owner_id",
+    "get_book_head",
+    "get_book_stats",
     "get_book_metadata_by_id",
+    "get_chapter_by_id",
+    "get_chapters_by_ids",
     "get_books_by_user",
+    "encode_books_cursor",
     "update_book",
     "delete_book",
     "delete_all_user_books",
@@ -96,6 +111,8 @@ __all__ += [
     "create_audit_log",
     # Usage counter DAOs
     "increment_usage",
+    "increment_usage_windows",
+    "bulk_increment_usage",
     # Question DAOs
     "create_question",
     "create_questions_batch",
@@ -112,6 +129,7 @@ __all__ += [
     # TOC transaction DAOs
     "update_toc_with_transaction",
     "add_chapter_with_transaction",
+    "add_chapters_with_transaction",
     "update_chapter_with_transaction",
     "delete_chapter_with_transaction",
     "reorder_chapters_with_transaction",
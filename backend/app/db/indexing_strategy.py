@@ -45,13 +45,8 @@ class ChapterTabIndexManager:
                 "name": "user_access_type_timestamp_idx",
                 "background": True,
             },
-            # Index for tab state queries
-            {
-                "keys": [("user_id", 1), ("book_id", 1), ("access_type", 1)],
-                "name": "user_book_access_type_idx",
-                "background": True,
-                "partialFilterExpression": {"access_type": "tab_state"},
-            },
+            # No tab-state index: tab state moved to chapter_tab_states, one
+            # document per (user, book) looked up by _id.
             # TTL index for automatic cleanup of old logs (optional)
             {
                 "keys": [("timestamp", 1)],
@@ -61,6 +56,46 @@ class ChapterTabIndexManager:
             },
         ]
 
+        # Drop the partial tab_state index an earlier version created.
+        try:
+            await collection.drop_index("user_book_access_type_idx")
+            logger.info("Dropped stale index: user_book_access_type_idx")
+        except Exception:
+            pass  # index doesn't exist (the normal case)
+
+        for index_spec in indexes:
+            try:
+                keys = index_spec.pop("keys")
+                await collection.create_index(keys, **index_spec)
+                logger.info(f"Created index: {index_spec.get('name', 'unnamed')}")
+            except Exception as e:
+                logger.error(
+                    f"Failed to create index {index_spec.get('name', 'unnamed')}: {e}"
+                )
+
+    async def create_chapter_access_rollup_indexes(self):
+        """
+        Create indexes for the per-day chapter analytics rollups.
+        Documents are keyed by _id for ingestion; analytics read by book/chapter/day.
+        """
+        collection = self.database.chapter_access_daily
+
+        indexes = [
+            {
+                "keys": [("book_id", 1), ("chapter_id", 1), ("day", -1)],
+                "name": "book_chapter_day_idx",
+                "background": True,
+            },
+            # Rollups outlive the raw logs (the analytics route reaches back
+            # 365 days); expire them after that.
+            {
+                "keys": [("day", 1)],
+                "name": "access_daily_ttl_idx",
+                "background": True,
+                "expireAfterSeconds": 60 * 60 * 24 * 400,  # 400 days
+            },
+        ]
+
         for index_spec in indexes:
             try:
                 keys = index_spec.pop("keys")
@@ -85,10 +120,12 @@ class ChapterTabIndexManager:
                 "name": "owner_book_id_idx",
                 "background": True,
             },
-            # Index for book metadata queries
+            # Dashboard list: newest first with an _id tiebreaker, so offset
+            # and keyset pages are both served by an index walk (no blocking
+            # sort). Its (owner_id, updated_at) prefix replaces owner_updated_idx.
             {
-                "keys": [("owner_id", 1), ("updated_at", -1)],
-                "name": "owner_updated_idx",
+                "keys": [("owner_id", 1), ("updated_at", -1), ("_id", -1)],
+                "name": "owner_updated_id_idx",
                 "background": True,
             },
             # No text index: nothing queries $text, and indexing full chapter
@@ -103,16 +140,31 @@ class ChapterTabIndexManager:
         except Exception:
             pass  # index doesn't exist (the normal case)
 
+        # Stale index -> its replacement. The stale one is dropped only once
+        # the replacement exists, so the dashboard query always has an index.
+        superseded = {"owner_updated_idx": "owner_updated_id_idx"}
+        created = set()
+
         for index_spec in indexes:
             try:
                 keys = index_spec.pop("keys")
                 await collection.create_index(keys, **index_spec)
+                created.add(index_spec.get("name"))
                 logger.info(f"Created index: {index_spec.get('name', 'unnamed')}")
             except Exception as e:
                 logger.error(
                     f"Failed to create index {index_spec.get('name', 'unnamed')}: {e}"
                 )
 
+        for name, replacement in superseded.items():
+            if replacement not in created:
+                continue
+            try:
+                await collection.drop_index(name)
+                logger.info(f"Dropped stale index: {name}")
+            except Exception:
+                pass  # index doesn't exist (the normal case)
+
     async def optimize_existing_indexes(self):
         """
         Analyze and optimize existing indexes for better performance.
@@ -163,6 +215,7 @@ class ChapterTabIndexManager:
 
         try:
             await self.create_chapter_access_indexes()
+            await self.create_chapter_access_rollup_indexes()
             await self.create_book_toc_indexes()
 
             # Generate optimization report
@@ -218,36 +271,24 @@ class ChapterTabIndexManager:
 # Query optimization patterns for common chapter tab operations
 OPTIMIZED_QUERIES = {
     "get_user_tab_state": {
-        "description": "Optimized query for retrieving user's current tab state",
-        "query": {
-            "user_id": "USER_ID",
-            "book_id": "BOOK_ID",
-            "access_type": "tab_state",
-        },
-        "sort": {"timestamp": -1},
-        "limit": 1,
-        "indexes_used": ["user_book_access_type_idx"],
+        "description": "Point lookup of user's current tab state (chapter_tab_states)",
+        "query": {"_id": "USER_ID:BOOK_ID"},
+        "indexes_used": ["_id_"],
     },
     "get_recent_chapters": {
-        "description": "Get recently accessed chapters for a user",
-        "query": {
-            "user_id": "USER_ID",
-            "book_id": "BOOK_ID",
-            "access_type": {"$in": ["read_content", "update_content", "view"]},
-        },
-        "sort": {"timestamp": -1},
-        "limit": 10,
-        "indexes_used": ["user_book_timestamp_idx"],
+        "description": "Point lookup of user's recent chapters (chapter_recent)",
+        "query": {"_id": "USER_ID:BOOK_ID"},
+        "projection": {"chapters": {"$slice": "LIMIT"}},
+        "indexes_used": ["_id_"],
     },
     "get_chapter_analytics": {
-        "description": "Get analytics data for a specific chapter",
+        "description": "Sum the per-day rollups for a chapter (chapter_access_daily)",
         "query": {
             "book_id": "BOOK_ID",
             "chapter_id": "CHAPTER_ID",
-            "timestamp": {"$gte": "DATE_RANGE_START"},
+            "day": {"$gte": "DATE_RANGE_START"},
         },
-        "sort": {"timestamp": -1},
-        "indexes_used": ["book_chapter_timestamp_idx"],
+        "indexes_used": ["book_chapter_day_idx"],
     },
     "get_book_with_chapters": {
         "description": "Optimized book retrieval with chapter metadata",
@@ -255,6 +296,18 @@ OPTIMIZED_QUERIES = {
         "projection": {"table_of_contents": 1, "title": 1, "updated_at": 1},
         "indexes_used": ["owner_book_id_idx"],
     },
+    "get_books_by_user_page": {
+        "description": "Keyset page of a user's books, newest first",
+        "query": {
+            "owner_id": "USER_ID",
+            "$or": [
+                {"updated_at": {"$lt": "CURSOR_UPDATED_AT"}},
+                {"updated_at": "CURSOR_UPDATED_AT", "_id": {"$lt": "CURSOR_ID"}},
+            ],
+        },
+        "sort": {"updated_at": -1, "_id": -1},
+        "indexes_used": ["owner_updated_id_idx"],
+    },
 }
 
 
@@ -4,7 +4,7 @@ from typing import List, Optional, Dict, Any, Iterable
 from datetime import datetime, timezone
 from bson import ObjectId
 from bson.errors import InvalidId
-from pymongo import ReturnDocument
+from pymongo import ReturnDocument, UpdateOne
 import logging
 import math
 
@@ -28,6 +28,29 @@ logger = logging.getLogger(__name__)
 RESPONSE_STATUS_FILTERS = frozenset({"completed", "draft", "not_answered"})
 
 
+def response_summary_fields(response: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+    """The response summary kept on the question document itself.
+
+    ``response_status``/``has_response``/``word_count`` mirror the user's
+    response in ``question_responses`` so the chapter-question list can filter,
+    count and paginate by status on the ``questions`` collection alone. ``None``
+    means unanswered. Questions written before the summary was kept get it from
+    ``app/scripts/backfill_question_response_status.py``; until then the reads
+    count a question without it as not answered.
+    """
+    if not response:
+        return {"response_status": "not_answered", "has_response": False, "word_count": 0}
+    status = response.get("status") or "draft"
+    word_count = response.get("word_count")
+    if word_count is None:
+        word_count = len((response.get("response_text") or "").split())
+    return {
+        "response_status": getattr(status, "value", status),
+        "has_response": True,
+        "word_count": word_count,
+    }
+
+
 def serialize_datetime(obj: Any) -> Any:
     """Convert datetime objects to ISO format strings for JSON serialization."""
     if isinstance(obj, datetime):
@@ -45,6 +68,11 @@ _QUESTION_INDEXES = [
     # get_chapter_question_progress, delete_questions_for_chapter.
     ("questions", [("book_id", 1), ("chapter_id", 1), ("user_id", 1)],
      "book_chapter_user_idx", False),
+    # Status-filtered chapter list: filter, count and page (sorted by order) in
+    # one index walk over the denormalized response_status.
+    ("questions", [("book_id", 1), ("chapter_id", 1), ("user_id", 1),
+                   ("response_status", 1), ("order", 1)],
+     "chapter_status_order_idx", False),
     # User question history (chronological) — analytics, activity tracking.
     ("questions", [("user_id", 1), ("created_at", -1)], "user_created_idx", False),
     # Sorting by order within a chapter.
@@ -111,6 +139,7 @@ async def create_question(question_data: QuestionCreate, user_id: str) -> Dict[s
         "user_id": user_id,
         "created_at": datetime.now(timezone.utc),
         "updated_at": datetime.now(timezone.utc),
+        **response_summary_fields(None),
     })
 
     # Insert the question
@@ -156,6 +185,7 @@ async def create_questions_batch(
             "user_id": user_id,
             "created_at": now,
             "updated_at": now,
+            **response_summary_fields(None),
         })
         question_dicts.append(question_dict)
 
@@ -200,7 +230,6 @@ async def get_questions_for_chapter(
     client can page a filtered list to completion.
     """
     questions_collection = await get_collection("questions")
-    responses_collection = await get_collection("question_responses")
 
     # Build query
     query = {
@@ -214,31 +243,15 @@ async def get_questions_for_chapter(
     if question_type:
         query["question_type"] = question_type
 
-    # A question's response status lives in a separate collection, so `status`
-    # cannot be expressed in the query above. Resolve the matching ids FIRST and
-    # fold them into the query, so skip/limit/count all operate on the filtered
-    # set (#336). Filtering the page afterwards let pagination walk documents
-    # that don't match, which made matches on later pages unreachable, returned
-    # short (sometimes empty) pages, and left every count field describing a
-    # different set. The id list is bounded by the chapter's question count.
-    statuses_by_qid: Optional[Dict[str, str]] = None
-    if status in RESPONSE_STATUS_FILTERS:
-        chapter_qids = [
-            str(doc["_id"])
-            async for doc in questions_collection.find(query, {"_id": 1})
-        ]
-        statuses_by_qid = {
-            r["question_id"]: r.get("status", "draft")
-            async for r in responses_collection.find({
-                "question_id": {"$in": chapter_qids},
-                "user_id": user_id,
-            })
-        }
-        if status == "not_answered":
-            matching = [q for q in chapter_qids if q not in statuses_by_qid]
-        else:
-            matching = [q for q in chapter_qids if statuses_by_qid.get(q) == status]
-        query["_id"] = {"$in": [ObjectId(q) for q in matching]}
+    # The status filter is part of the query, so skip/limit/count all operate on
+    # the filtered set (#336). It matches the response summary denormalized onto
+    # each question (see response_summary_fields), which chapter_status_order_idx
+    # serves together with the ``order`` sort — no pass over question_responses.
+    if status == "not_answered":
+        # A null match also takes legacy questions not yet backfilled.
+        query["response_status"] = {"$in": ["not_answered", None]}
+    elif status in RESPONSE_STATUS_FILTERS:
+        query["response_status"] = status
 
     # Calculate pagination
     skip = (page - 1) * limit
@@ -250,36 +263,18 @@ async def get_questions_for_chapter(
     # Get total count
     total = await questions_collection.count_documents(query)
 
+    unanswered = response_summary_fields(None)
     for question in questions:
         question["id"] = str(question.pop("_id"))
-
-    # Attach response status. A status filter already resolved the map for the
-    # whole chapter; otherwise do one batched lookup for the page, keyed by
-    # question_id instead of a find_one per question (N+1).
-    if statuses_by_qid is None:
-        statuses_by_qid = {
-            r["question_id"]: r.get("status", "draft")
-            async for r in responses_collection.find({
-                "question_id": {"$in": [q["id"] for q in questions]},
-                "user_id": user_id,
-            })
-        }
-
-    processed_questions = []
-    for question in questions:
-        has_response = question["id"] in statuses_by_qid
-        question["has_response"] = has_response
-        question["response_status"] = (
-            statuses_by_qid[question["id"]] if has_response else "not_answered"
-        )
-        processed_questions.append(question)
+        for key, value in unanswered.items():
+            question.setdefault(key, value)  # legacy, not yet backfilled
 
     # Calculate total pages
     pages = math.ceil(total / limit) if limit > 0 else 1
     has_more = page < pages
 
     return QuestionListResponse(
-        questions=processed_questions,
+        questions=questions,
         total=total,
         page=page,
         pages=pages,
@@ -287,12 +282,41 @@ async def get_questions_for_chapter(
     )
 
 
+async def _sync_question_response_fields(question_id: str, user_id: str, response: Dict[str, Any]) -> None:
+    """Copy a just-saved response's summary onto its question document.
+
+    The response is already saved by the time this runs, so a failure is logged
+    rather than raised — the save must not be reported as failed.
+    """
+    try:
+        object_id = ObjectId(question_id)
+    except (InvalidId, TypeError):
+        return
+    try:
+        questions_collection = await get_collection("questions")
+        await questions_collection.update_one(
+            {"_id": object_id, "user_id": user_id},
+            {"$set": response_summary_fields(response)},
+        )
+    except Exception:
+        logger.exception("Failed to update response status on question %s", question_id)
+
+
 async def save_question_response(
     question_id: str,
     response_data: QuestionResponseCreate,
     user_id: str
 ) -> Dict[str, Any]:
-    """Save or update a question response."""
+    """Save or update a question response.
+
+    The response summary on the question document is updated right after the
+    response itself.
+
+    ponytail: two single-document writes, not one transaction (standalone Mongo
+    has none). A failure of the second is logged, not raised, and leaves the
+    question showing the previous status until the next save; the response
+    itself is never lost.
+    """
     responses_collection = await get_collection("question_responses")
 
     # Check if response already exists
@@ -330,6 +354,7 @@ async def save_question_response(
             {"_id": existing_response["_id"]},
             {"$set": response_dict}
         )
+        await _sync_question_response_fields(question_id, user_id, response_dict)
 
         response_dict["id"] = str(existing_response["_id"])
         return response_dict
@@ -342,6 +367,7 @@ async def save_question_response(
         })
 
         result = await responses_collection.insert_one(response_dict)
+        await _sync_question_response_fields(question_id, user_id, response_dict)
         response_dict["id"] = str(result.inserted_id)
         response_dict.pop("_id", None)
 
@@ -458,36 +484,29 @@ async def get_chapter_question_progress(
 ) -> QuestionProgressResponse:
     """Get question progress for a chapter."""
     questions_collection = await get_collection("questions")
-    responses_collection = await get_collection("question_responses")
 
-    # Get all questions for the chapter
-    questions = await questions_collection.find({
+    query = {
         "book_id": book_id,
         "chapter_id": chapter_id,
         "user_id": user_id
-    }).to_list(length=None)
-
-    total = len(questions)
-    completed = 0
-    in_progress = 0
+    }
 
-    # One batched lookup keyed by question_id instead of a find_one per question (N+1).
-    responses_by_qid = {
-        r["question_id"]: r
-        async for r in responses_collection.find({
-            "question_id": {"$in": [str(q["_id"]) for q in questions]},
-            "user_id": user_id,
-        })
+    # Tally the denormalized response status in the database; no question or
+    # response documents are shipped back.
+    counts = {
+        doc["_id"]: doc["count"]
+        async for doc in questions_collection.aggregate([
+            {"$match": query},
+            {"$group": {"_id": "$response_status", "count": {"$sum": 1}}},
+        ])
     }
 
-    # Tally response status for each question
-    for question in questions:
-        response = responses_by_qid.get(str(question["_id"]))
-        if response:
-            if response.get("status") == "completed":
-                completed += 1
-            else:
-                in_progress += 1
+    total = sum(counts.values())
+    completed = counts.get("completed", 0)
+    # Any answered status short of completed (i.e. draft) is in progress; a
+    # legacy question not yet backfilled (grouped under None) is not answered.
+    not_answered = counts.get("not_answered", 0) + counts.get(None, 0)
+    in_progress = total - completed - not_answered
 
     # Calculate progress
     progress = float(completed) / total if total > 0 else 0.0
@@ -556,23 +575,10 @@ async def count_questions_without_responses(
     exists), so it can't be derived from a delete's return value (#234).
     """
     questions_collection = await get_collection("questions")
-    responses_collection = await get_collection("question_responses")
 
-    question_ids = [
-        str(q["_id"])
-        for q in await questions_collection.find(
-            {"book_id": book_id, "chapter_id": chapter_id, "user_id": user_id},
-            {"_id": 1},
-        ).to_list(length=None)
-    ]
-    if not question_ids:
-        return 0
-
-    answered = await responses_collection.distinct(
-        "question_id",
-        {"question_id": {"$in": question_ids}, "user_id": user_id},
-    )
-    return len(question_ids) - len(set(answered))
+    query = {"book_id": book_id, "chapter_id": chapter_id, "user_id": user_id}
+    # $ne also counts legacy questions not yet backfilled, as unanswered.
+    return await questions_collection.count_documents({**query, "has_response": {"$ne": True}})
 
 
 async def delete_questions_for_chapter(
@@ -693,9 +699,14 @@ async def replace_question_in_place(
             "regeneration_count": expected_regeneration_count,
         }
 
+    # The response is deleted below, so the question goes back to unanswered.
     updated = await questions_collection.find_one_and_update(
         query,
-        {"$set": {**new_fields, "updated_at": datetime.now(timezone.utc)}},
+        {"$set": {
+            **new_fields,
+            **response_summary_fields(None),
+            "updated_at": datetime.now(timezone.utc),
+        }},
         return_document=ReturnDocument.AFTER,
     )
     if not updated:
@@ -931,6 +942,7 @@ async def save_question_responses_batch(
 
     # Execute bulk operations
     saved_count = 0
+    saved_ops = []
     for op in successful_ops:
         try:
             if op.get("is_update"):
@@ -940,6 +952,7 @@ async def save_question_responses_batch(
                 )
             else:
                 await responses_collection.insert_one(op["insert"])
+            saved_ops.append(op)
 
             for idx in op["indexes"]:
                 results.append({
@@ -964,6 +977,28 @@ async def save_question_responses_batch(
                     "error": f"Database error: {str(e)}"
                 })
 
+    # Every saved response's summary onto its question, in one round trip. Same
+    # two-write ponytail as save_question_response: a failure here leaves those
+    # questions showing their previous status until the next save.
+    if saved_ops:
+        try:
+            await questions_collection.bulk_write(
+                [
+                    UpdateOne(
+                        {"_id": ObjectId(op["question_id"]), "user_id": user_id},
+                        {"$set": response_summary_fields(
+                            op["update"]["$set"] if op["is_update"] else op["insert"]
+                        )},
+                    )
+                    for op in saved_ops
+                ],
+                ordered=False,
+            )
+        except Exception:
+            logger.exception(
+                "Failed to update response status on %d questions", len(saved_ops)
+            )
+
     # Validation failures are appended during prep and writes during execution, so
     # results accumulate out of order; hand them back in request order.
     results.sort(key=lambda r: r["index"])
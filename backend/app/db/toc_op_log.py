@@ -0,0 +1,65 @@
+# backend/app/db/toc_op_log.py
+"""Short per-book log of recent TOC edits, for server-side rebase.
+
+Every TOC writer bumps ``table_of_contents.version``, and the guarded ones
+(``toc_transactions``) fail when the version moved between their read and
+their write. Most such misses are not real conflicts: an autosave to one
+chapter and a rename of another touch disjoint chapters, yet the rename came
+back as a 409 and the client re-read and retried — under multi-tab editing,
+over and over.
+
+So each targeted write also records which chapter ids it touched, in
+``toc_ops`` on the book, in the same update that bumps the version:
+
+- ``$push`` one entry ``{"chapters": [...]}`` per version bump, capped at
+  :data:`TOC_OP_LOG_LENGTH` with ``$slice``; entries are in version order, so
+  the last one is the current version's;
+- a write that replaces the whole TOC resets the log to ``[]``, since it
+  touched everything and older entries no longer line up with versions.
+
+A stale write whose own chapter ids overlap none of the entries since the
+version it read (:func:`can_rebase`) is re-run against the current TOC
+instead of failing. Anything the log cannot vouch for — a gap, a whole-TOC
+write, an overlap — stays a version conflict.
+"""
+
+from typing import Any, Dict, Iterable, List, Optional
+
+# Versions a stale write can lag behind and still be rebased.
+TOC_OP_LOG_LENGTH = 32
+
+
+def push_toc_op(update: Dict[str, Any], chapter_ids: Iterable[str]) -> None:
+    """Add the log entry for a write touching ``chapter_ids`` to ``update``."""
+    entry = {"chapters": sorted({str(cid) for cid in chapter_ids if cid})}
+    update.setdefault("$push", {})["toc_ops"] = {
+        "$each": [entry],
+        "$slice": -TOC_OP_LOG_LENGTH,
+    }
+
+
+def toc_ops_since(book: Dict, version: Optional[int]) -> Optional[List[Dict]]:
+    """The log entries for the versions after ``version``, oldest first.
+
+    ``None`` when the log cannot account for every one of them.
+    """
+    current = (book.get("table_of_contents") or {}).get("version")
+    if not isinstance(version, int) or not isinstance(current, int):
+        return None
+    behind = current - version
+    ops = book.get("toc_ops") or []
+    if behind <= 0 or behind > len(ops):
+        return None
+    return ops[-behind:]
+
+
+def can_rebase(book: Dict, version: Optional[int], chapter_ids: Iterable[str]) -> bool:
+    """Whether a write of ``chapter_ids`` read at ``version`` can be re-applied.
+
+    True only when every version since was a logged edit of other chapters.
+    """
+    ours = set(chapter_ids)
+    ops = toc_ops_since(book, version)
+    if not ours or ops is None:
+        return False
+    return all(op.get("chapters") and not ours.intersection(op["chapters"]) for op in ops)
@@ -3,15 +3,38 @@ Transaction-based TOC (Table of Contents) operations for MongoDB.
 Ensures atomic updates to prevent race conditions and maintain data consistency.
 """
 
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Tuple
 from datetime import datetime, timezone
 from bson.objectid import ObjectId
+import copy
 import logging
 import uuid
 from motor.motor_asyncio import AsyncIOMotorClientSession
 
 from .base import books_collection, ObjectId
 from .audit_log import create_audit_log
+from app.utils.toc_index import TocIndex, TocNode
+from .book import CONTENT_EXCLUDING_PROJECTION
+from .book_cache import book_cache
+from .book_stats import chapter_stats_delta, chapters_stats_delta, compute_book_stats
+from .toc_op_log import can_rebase, push_toc_op
+from .chapter_content import (
+    migrate_chapter_contents,
+    prune_chapter_contents,
+    removed_chapter_ids,
+    split_chapter_contents,
+    store_chapter_contents,
+)
+
+logger = logging.getLogger(__name__)
+
+# Times a targeted write is re-run on the current TOC after its version guard
+# missed on edits to other chapters, before it is reported as a conflict.
+TOC_REBASE_ATTEMPTS = 3
+
+
+class _RebaseNeeded(Exception):
+    """A guarded write missed only because of edits to other chapters."""
 
 
 def _version_guard(current_toc: Dict[str, Any]) -> Any:
@@ -28,58 +51,187 @@ def _version_guard(current_toc: Dict[str, Any]) -> Any:
     return current_toc["version"] if "version" in current_toc else {"$exists": False}
 
 
-async def _set_toc_guarded(
+async def _raise_guard_miss(
     book_oid: ObjectId,
     user_auth_id: str,
-    updated_toc: Dict[str, Any],
+    session: Optional[AsyncIOMotorClientSession] = None,
+    read_version: Optional[int] = None,
+    chapter_ids: Optional[List[str]] = None,
+) -> None:
+    """Raise the right error for a guarded TOC write whose filter missed.
+
+    "Someone bumped the version" is only one of three reasons. Re-read to
+    distinguish, so the API can answer 404/403 instead of a misleading
+    "modified by another user" 409. This mirrors the re-read
+    `_update_toc_internal` already does, and only costs a read on the failure
+    path.
+
+    A targeted write passes the version it read and the chapters it touches;
+    if the op log shows every write since touched other chapters, this raises
+    :class:`_RebaseNeeded` instead and :func:`_rebasing` re-runs it.
+    """
+    current = await books_collection.find_one(
+        {"_id": book_oid},
+        {"owner_id": 1, "table_of_contents.version": 1, "toc_ops": 1},
+        session=session,
+    )
+    if not current:
+        raise ValueError("Book not found")
+    if current.get("owner_id") != user_auth_id:
+        raise ValueError("Not authorized to modify this book")
+    if chapter_ids and can_rebase(current, read_version, chapter_ids):
+        raise _RebaseNeeded()
+    raise ValueError("Version conflict: TOC was updated by another process")
+
+
+async def _rebasing(operation, *args) -> Any:
+    """Run a targeted TOC ``operation``, re-running it while it needs a rebase.
+
+    Each run re-reads the TOC, so a re-run is the same edit applied on top of
+    the writes that beat it. Bounded, so a chapter list that never settles
+    still ends in a 409.
+    """
+    for attempt in range(TOC_REBASE_ATTEMPTS):
+        try:
+            return await operation(*args)
+        except _RebaseNeeded:
+            logger.info(
+                "Rebasing %s onto concurrent TOC edits (attempt %d)",
+                operation.__name__,
+                attempt + 1,
+            )
+    raise ValueError("Version conflict: TOC was updated by another process")
+
+
+async def _read_book(
+    book_id: str,
+    user_auth_id: str,
+    session: Optional[AsyncIOMotorClientSession] = None,
+) -> Dict[str, Any]:
+    """The owner's book without inline bodies, for a targeted write."""
+    book = await books_collection.find_one(
+        {"_id": ObjectId(book_id), "owner_id": user_auth_id},
+        CONTENT_EXCLUDING_PROJECTION,
+        session=session,
+    )
+    if not book:
+        raise ValueError("Book not found or not authorized")
+    book.setdefault("table_of_contents", {})
+    return book
+
+
+async def _read_toc(
+    book_id: str,
+    user_auth_id: str,
+    session: Optional[AsyncIOMotorClientSession] = None,
+) -> Dict[str, Any]:
+    """The owner's TOC structure (no inline bodies), for a targeted write."""
+    return (await _read_book(book_id, user_auth_id, session))["table_of_contents"]
+
+
+def _move_stats(
+    update: Dict[str, Any], book: Dict[str, Any], toc: Dict[str, Any], delta: Dict[str, int]
+) -> None:
+    """``$inc`` the stats by ``delta``; on a book with none yet, ``$set`` them from ``toc``.
+
+    Exact because every targeted write is guarded on the version it read.
+    """
+    if "stats" not in book:
+        update.setdefault("$set", {})["stats"] = compute_book_stats(toc)
+        return
+    inc = update.setdefault("$inc", {})
+    for key, value in delta.items():
+        inc[key] = inc.get(key, 0) + value
+
+
+def _ancestor_ids(node: TocNode) -> List[str]:
+    """Chapter ids from the top level down to ``node``."""
+    ids = []
+    while node is not None:
+        ids.append(node.id)
+        node = node.parent
+    return ids[::-1]
+
+
+def _chapter_path(node: TocNode) -> Tuple[str, List[Dict[str, str]]]:
+    """Positional path to ``node``'s chapter and the ``array_filters`` it needs.
+
+    One filter per nesting level, each matching that level's chapter id, so
+    the path stays valid however the chapter's siblings have moved.
+    """
+    path, array_filters = "table_of_contents.chapters", []
+    for depth, chapter_id in enumerate(_ancestor_ids(node)):
+        if depth:
+            path += ".subchapters"
+        path += f".$[c{depth}]"
+        array_filters.append({f"c{depth}.id": chapter_id})
+    return path, array_filters
+
+
+def _bump_version(toc: Dict[str, Any], update: Dict[str, Any]) -> None:
+    """Add the version bump and timestamps to ``update``; mirror them on ``toc``.
+
+    A legacy TOC without a ``version`` counts as version 1 (as
+    :func:`_version_guard` matches it), so it is set to 2 rather than
+    incremented from nothing.
+    """
+    now = datetime.now(timezone.utc)
+    set_doc = update.setdefault("$set", {})
+    if "version" in toc:
+        update.setdefault("$inc", {})["table_of_contents.version"] = 1
+    else:
+        set_doc["table_of_contents.version"] = 2
+    set_doc["table_of_contents.updated_at"] = now.isoformat()
+    set_doc["updated_at"] = now
+    toc["version"] = toc.get("version", 1) + 1
+    toc["updated_at"] = now.isoformat()
+
+
+async def _update_toc_targeted(
+    book_oid: ObjectId,
+    user_auth_id: str,
+    update: Any,
     version_guard: Any,
+    chapter_ids: List[str],
+    array_filters: Optional[List[Dict[str, Any]]] = None,
     session: Optional[AsyncIOMotorClientSession] = None,
 ) -> None:
-    """Compare-and-swap the whole ``table_of_contents`` under an optimistic lock.
+    """Apply a targeted ``$push``/``$pull``/positional ``$set`` to the TOC.
 
-    Every caller here reads the TOC, mutates it in memory, and writes it back
-    whole. Filtering that write on the version we read makes it a no-op if
-    another writer (e.g. the autosave path) committed in between, so concurrent
-    edits raise instead of silently clobbering each other. This holds on
-    standalone Mongo too, where ``session`` is ``None`` and there is no
-    transaction to abort (#337).
+    Filtered on the owner and the version the caller read, so it is a no-op
+    if another writer (e.g. the autosave path) committed in between, and
+    concurrent edits raise (or rebase) instead of silently clobbering each
+    other. This holds on standalone Mongo too, where ``session`` is ``None``
+    and there is no transaction to abort (#337). Only the changed chapters
+    go over the wire and into the update, not the whole TOC.
 
     ``version_guard`` comes from :func:`_version_guard`, captured before the
-    caller mutated the TOC.
+    caller mutated the TOC. ``modified_count`` (rather than
+    ``matched_count``) is a sufficient miss signal only because every update
+    bumps ``version`` — a matched-but-unmodified result is impossible.
 
-    ``modified_count`` (rather than ``matched_count``) is a sufficient conflict
-    signal only because every caller increments ``version`` — the document can
-    never be written identically, so a matched-but-unmodified result is
-    impossible. An idempotent write added here later would need
-    ``matched_count``.
+    ``chapter_ids`` (what the write touches) goes into the op log with the
+    write; on a miss it decides between a rebase and a conflict. ``update``
+    is an operator document, or a pipeline whose last stage logs itself.
     """
+    if isinstance(update, dict):
+        push_toc_op(update, chapter_ids)
     result = await books_collection.update_one(
         {
             "_id": book_oid,
             "owner_id": user_auth_id,
             "table_of_contents.version": version_guard,
         },
-        {
-            "$set": {
-                "table_of_contents": updated_toc,
-                "updated_at": datetime.now(timezone.utc),
-            }
-        },
+        update,
+        array_filters=array_filters,
         session=session,
     )
-
+    book_cache.invalidate(str(book_oid))
     if result.modified_count == 0:
-        # The filter missed — but "someone bumped the version" is only one of
-        # three reasons. Re-read to distinguish, so the API can answer 404/403
-        # instead of a misleading "modified by another user" 409. This mirrors
-        # the re-read `_update_toc_internal` already does, and only costs a read
-        # on the failure path.
-        current = await books_collection.find_one({"_id": book_oid}, session=session)
-        if not current:
-            raise ValueError("Book not found")
-        if current.get("owner_id") != user_auth_id:
-            raise ValueError("Not authorized to modify this book")
-        raise ValueError("Version conflict: TOC was updated by another process")
+        read_version = version_guard if isinstance(version_guard, int) else None
+        await _raise_guard_miss(
+            book_oid, user_auth_id, session, read_version, chapter_ids
+        )
 
 
 async def update_toc_with_transaction(
@@ -180,16 +332,25 @@ async def _update_toc_internal(
     if current_toc:
         update_query["table_of_contents.version"] = current_version
 
+    # Bodies never go back into the book; any carried inline are stored
+    # before the write for chapters that have none yet, and the changed ones
+    # replace their stored bodies once it has committed (below).
+    stored_toc, contents = split_chapter_contents(updated_toc)
+    await migrate_chapter_contents(book_id, contents, session=session)
+
     update_result = await books_collection.update_one(
         update_query,
         {
             "$set": {
-                "table_of_contents": updated_toc,
+                "table_of_contents": stored_toc,
+                "stats": compute_book_stats(stored_toc),
+                "toc_ops": [],
                 "updated_at": datetime.now(timezone.utc)
             }
         },
         session=session
     )
+    book_cache.invalidate(book_id)
 
     if update_result.modified_count == 0:
         # Check if it was a version conflict
@@ -203,6 +364,9 @@ async def _update_toc_internal(
                 raise ValueError(f"Version conflict: TOC was updated by another process")
         raise ValueError("Failed to update TOC")
 
+    await store_chapter_contents(book_id, contents, toc_version=updated_toc["version"])
+    await prune_chapter_contents(book_id, removed_chapter_ids(current_toc, updated_toc))
+
     # Best-effort audit, explicitly. The TOC write above has already committed,
     # so raising here would report failure for an edit that succeeded — and the
     # client's retry would then hit a version conflict on its own change (#369).
@@ -258,7 +422,7 @@ async def add_chapter_with_transaction(
     ``update_chapter_statuses_with_version_guard`` (#159) already took this
     route for the same reason.
     """
-    return await _add_chapter_internal(book_id, chapter_data, user_auth_id, parent_chapter_id, None)
+    return await _rebasing(_add_chapter_internal, book_id, chapter_data, user_auth_id, parent_chapter_id, None)
 
 
 async def _add_chapter_internal(
@@ -269,55 +433,93 @@ async def _add_chapter_internal(
     session: Optional[AsyncIOMotorClientSession]
 ) -> Dict[str, Any]:
     """Internal function to add chapter with or without transaction"""
-    # Get the book
-    book = await books_collection.find_one(
-        {"_id": ObjectId(book_id), "owner_id": user_auth_id},
-        session=session
+    [chapter] = await _add_chapters_internal(
+        book_id, [chapter_data], user_auth_id, parent_chapter_id, session
     )
-    if not book:
-        raise ValueError("Book not found or not authorized")
+    return chapter
 
-    toc = book.get("table_of_contents", {})
-    version_guard = _version_guard(toc)  # snapshot before mutating `toc`
-    chapters = toc.get("chapters", [])
 
-    # Generate chapter ID if not provided
-    if not chapter_data.get("id"):
-        chapter_data["id"] = str(uuid.uuid4())
+async def add_chapters_with_transaction(
+    book_id: str,
+    chapters: List[Dict[str, Any]],
+    user_auth_id: str,
+    parent_chapter_id: Optional[str] = None
+) -> List[Dict[str, Any]]:
+    """
+    Append several chapters at once (e.g. an imported outline).
+
+    Each chapter may carry ``subchapters``; with ``parent_chapter_id`` they
+    are all appended under that top-level chapter instead. One read and one
+    guarded ``$push`` with ``$each``, the same compare-and-swap (and rebase)
+    as :func:`add_chapter_with_transaction`, so N chapters cost one write
+    rather than N read-modify-write cycles. Returns the chapters as stored
+    (ids, timestamps and default ``order`` filled in).
+    """
+    return await _rebasing(
+        _add_chapters_internal, book_id, chapters, user_auth_id, parent_chapter_id, None
+    )
+
 
-    # Add timestamps
-    now = datetime.now(timezone.utc).isoformat()
-    chapter_data["created_at"] = now
-    chapter_data["updated_at"] = now
+async def _add_chapters_internal(
+    book_id: str,
+    new_chapters: List[Dict[str, Any]],
+    user_auth_id: str,
+    parent_chapter_id: Optional[str],
+    session: Optional[AsyncIOMotorClientSession]
+) -> List[Dict[str, Any]]:
+    """Internal function to append chapters with or without transaction"""
+    # Ids go on the caller's dicts so a rebased re-run keeps them (and any
+    # bodies already stored under them); everything derived from the TOC —
+    # the default ``order`` above all — is filled in on a fresh copy each
+    # run, or a re-run would keep the order worked out from the stale read.
+    for chapter in TocIndex(new_chapters):
+        if not chapter.get("id"):
+            chapter["id"] = str(uuid.uuid4())
+    new_chapters = copy.deepcopy(new_chapters)
+
+    book = await _read_book(book_id, user_auth_id, session)
+    toc = book["table_of_contents"]
+    version_guard = _version_guard(toc)  # snapshot before mutating `toc`
+    chapters = toc.setdefault("chapters", [])
 
     if parent_chapter_id:
-        # Adding a subchapter
-        parent_found = False
-        for chapter in chapters:
-            if chapter.get("id") == parent_chapter_id:
-                if "subchapters" not in chapter:
-                    chapter["subchapters"] = []
-                chapter["subchapters"].append(chapter_data)
-                parent_found = True
-                break
-
-        if not parent_found:
+        # Adding subchapters; parents are top-level chapters only.
+        parent = TocIndex(chapters).node(parent_chapter_id)
+        if not parent or parent.parent is not None:
             raise ValueError("Parent chapter not found")
+        path, array_filters = _chapter_path(parent)
+        path += ".subchapters"
+        siblings = parent.chapter.setdefault("subchapters", [])
+        touched = [parent_chapter_id]
     else:
-        # Adding a top-level chapter
-        chapters.append(chapter_data)
+        # Adding top-level chapters
+        path, array_filters = "table_of_contents.chapters", None
+        siblings = chapters
+        touched = []
 
-    # Update TOC version
-    toc["chapters"] = chapters
-    toc["version"] = toc.get("version", 1) + 1
-    toc["updated_at"] = now
-
-    # Update the book
-    await _set_toc_guarded(
-        ObjectId(book_id), user_auth_id, toc, version_guard, session
+    now = datetime.now(timezone.utc).isoformat()
+    for chapter_data in new_chapters:
+        for chapter in TocIndex([chapter_data]):
+            chapter["created_at"] = now
+            chapter["updated_at"] = now
+            touched.append(chapter["id"])
+        if chapter_data.get("order") is None:
+            chapter_data["order"] = len(siblings) + 1
+        siblings.append(chapter_data)
+
+    # Push only the new chapters; any bodies they carry go to chapter_contents.
+    stripped, contents = split_chapter_contents({"chapters": new_chapters})
+    await migrate_chapter_contents(book_id, contents, session=session)
+    update = {"$push": {path: {"$each": stripped["chapters"]}}}
+    _move_stats(update, book, toc, chapters_stats_delta(new_chapters))
+    _bump_version(toc, update)
+
+    await _update_toc_targeted(
+        ObjectId(book_id), user_auth_id, update, version_guard, touched,
+        array_filters, session,
     )
 
-    return chapter_data
+    return new_chapters
 
 
 async def update_chapter_with_transaction(
@@ -344,7 +546,7 @@ async def update_chapter_with_transaction(
     ``update_chapter_statuses_with_version_guard`` (#159) already took this
     route for the same reason.
     """
-    return await _update_chapter_internal(book_id, chapter_id, chapter_updates, user_auth_id, None)
+    return await _rebasing(_update_chapter_internal, book_id, chapter_id, chapter_updates, user_auth_id, None)
 
 
 async def _update_chapter_internal(
@@ -355,52 +557,36 @@ async def _update_chapter_internal(
     session: Optional[AsyncIOMotorClientSession]
 ) -> Dict[str, Any]:
     """Internal function to update chapter with or without transaction"""
-    # Get the book
-    book = await books_collection.find_one(
-        {"_id": ObjectId(book_id), "owner_id": user_auth_id},
-        session=session
-    )
-    if not book:
-        raise ValueError("Book not found or not authorized")
-
-    toc = book.get("table_of_contents", {})
+    book = await _read_book(book_id, user_auth_id, session)
+    toc = book["table_of_contents"]
     version_guard = _version_guard(toc)  # snapshot before mutating `toc`
-    chapters = toc.get("chapters", [])
 
-    # Find and update the chapter
-    chapter_found = False
-    updated_chapter = None
-
-    def update_chapter_recursive(chapters_list):
-        nonlocal chapter_found, updated_chapter
-        for i, chapter in enumerate(chapters_list):
-            if chapter.get("id") == chapter_id:
-                # Update the chapter
-                chapters_list[i] = {**chapter, **chapter_updates}
-                chapters_list[i]["updated_at"] = datetime.now(timezone.utc).isoformat()
-                chapter_found = True
-                updated_chapter = chapters_list[i]
-                return
-            # Check subchapters
-            if "subchapters" in chapter:
-                update_chapter_recursive(chapter["subchapters"])
-
-    update_chapter_recursive(chapters)
-
-    if not chapter_found:
+    node = TocIndex(toc.get("chapters")).node(chapter_id)
+    if not node:
         raise ValueError("Chapter not found")
 
-    # Update TOC version
-    toc["chapters"] = chapters
-    toc["version"] = toc.get("version", 1) + 1
-    toc["updated_at"] = datetime.now(timezone.utc).isoformat()
-
-    # Update the book
-    await _set_toc_guarded(
-        ObjectId(book_id), user_auth_id, toc, version_guard, session
+    chapter_updates = dict(chapter_updates)
+    chapter_updates["updated_at"] = datetime.now(timezone.utc).isoformat()
+    # A body never goes into the TOC; as with a whole-TOC write, it is stored
+    # only if the chapter has none yet.
+    content = chapter_updates.pop("content", None)
+    if content:
+        await migrate_chapter_contents(book_id, {chapter_id: content}, session=session)
+    stats_delta = chapter_stats_delta(node.chapter, chapter_updates)
+    node.chapter.update(chapter_updates)
+
+    # $set only this chapter's changed fields.
+    path, array_filters = _chapter_path(node)
+    update = {"$set": {f"{path}.{key}": value for key, value in chapter_updates.items()}}
+    _move_stats(update, book, toc, stats_delta)
+    _bump_version(toc, update)
+
+    await _update_toc_targeted(
+        ObjectId(book_id), user_auth_id, update, version_guard, [chapter_id],
+        array_filters, session,
     )
 
-    return updated_chapter
+    return node.chapter
 
 
 async def delete_chapter_with_transaction(
@@ -426,7 +612,7 @@ async def delete_chapter_with_transaction(
     ``update_chapter_statuses_with_version_guard`` (#159) already took this
     route for the same reason.
     """
-    return await _delete_chapter_internal(book_id, chapter_id, user_auth_id, None)
+    return await _rebasing(_delete_chapter_internal, book_id, chapter_id, user_auth_id, None)
 
 
 async def _delete_chapter_internal(
@@ -436,47 +622,39 @@ async def _delete_chapter_internal(
     session: Optional[AsyncIOMotorClientSession]
 ) -> bool:
     """Internal function to delete chapter with or without transaction"""
-    # Get the book
-    book = await books_collection.find_one(
-        {"_id": ObjectId(book_id), "owner_id": user_auth_id},
-        session=session
-    )
-    if not book:
-        raise ValueError("Book not found or not authorized")
-
-    toc = book.get("table_of_contents", {})
+    book = await _read_book(book_id, user_auth_id, session)
+    toc = book["table_of_contents"]
     version_guard = _version_guard(toc)  # snapshot before mutating `toc`
-    chapters = toc.get("chapters", [])
 
-    # Find and delete the chapter
-    chapter_found = False
-
-    def delete_chapter_recursive(chapters_list):
-        nonlocal chapter_found
-        for i, chapter in enumerate(chapters_list):
-            if chapter.get("id") == chapter_id:
-                chapters_list.pop(i)
-                chapter_found = True
-                return
-            # Check subchapters
-            if "subchapters" in chapter:
-                delete_chapter_recursive(chapter["subchapters"])
-
-    delete_chapter_recursive(chapters)
-
-    if not chapter_found:
+    node = TocIndex(toc.get("chapters")).node(chapter_id)
+    if not node:
         raise ValueError("Chapter not found")
+    # The chapter, its subchapters, and the parent whose list it leaves.
+    removed = [c.get("id") for c in TocIndex([node.chapter])]
+    touched = removed + [node.parent_id]
+
+    # $pull it from the array that holds it (its subchapters go with it).
+    if node.parent:
+        path, array_filters = _chapter_path(node.parent)
+        path += ".subchapters"
+        siblings = node.parent.chapter["subchapters"]
+    else:
+        path, array_filters = "table_of_contents.chapters", None
+        siblings = toc["chapters"]
+    siblings[:] = [c for c in siblings if c.get("id") != chapter_id]
 
-    # Update TOC version
-    toc["chapters"] = chapters
-    toc["version"] = toc.get("version", 1) + 1
-    toc["updated_at"] = datetime.now(timezone.utc).isoformat()
+    update = {"$pull": {path: {"id": chapter_id}}}
+    _move_stats(update, book, toc, chapters_stats_delta([node.chapter], sign=-1))
+    _bump_version(toc, update)
 
-    # Update the book
-    await _set_toc_guarded(
-        ObjectId(book_id), user_auth_id, toc, version_guard, session
+    await _update_toc_targeted(
+        ObjectId(book_id), user_auth_id, update, version_guard, touched,
+        array_filters, session,
     )
 
+    # Drop the bodies of the deleted chapter and its subchapters.
+    await prune_chapter_contents(book_id, removed)
+
     return True
 
 
@@ -491,67 +669,31 @@ async def update_chapter_statuses_with_version_guard(
     """
     Bulk-update chapter statuses under an optimistic-concurrency guard.
 
-    A bulk status change touches a single book document, so a single
-    compare-and-swap ``update_one`` (filtered on ``table_of_contents.version``,
-    the same guard ``_update_toc_internal`` uses) is atomic on its own — no
-    multi-document transaction needed. If a concurrent TOC edit bumps the
-    version between the read and the write, ``modified_count`` is 0 and we raise
-    a ``Version conflict`` instead of silently clobbering the other write. This
-    holds on both replica-set and standalone deployments (unlike a transaction,
-    which would surface a concurrent commit as a WriteConflict).
-
-    ``expected_version`` is the version the caller validated against.
+    One targeted ``update_one``: a positional ``$set`` of each chapter's
+    ``status`` (and ``last_modified``) through ``array_filters``, the matching
+    ``stats.status_counts`` ``$inc`` and the version bump, filtered on
+    ``table_of_contents.version`` like every other TOC write here. The write
+    is the size of the change, not of the TOC. It is atomic on its own — no
+    multi-document transaction needed, on replica-set and standalone alike
+    (a transaction would surface a concurrent commit as a WriteConflict).
+
+    ``expected_version`` is the version the caller validated against. If
+    it is stale but every write since touched other chapters, the update is
+    applied to the current TOC instead of failing.
     """
-    book_oid = ObjectId(book_id)
-    book = await books_collection.find_one({"_id": book_oid, "owner_id": user_auth_id})
-    if not book:
-        if await books_collection.find_one({"_id": book_oid}):
-            raise ValueError("Not authorized to update this book")
-        raise ValueError("Book not found")
-
-    current_toc = book.get("table_of_contents", {})
-    current_version = current_toc.get("version", 1)
-    if current_version != expected_version:
-        raise ValueError(
-            f"Version conflict: expected {expected_version}, current {current_version}"
-        )
-
-    chapters = current_toc.get("chapters", [])
-    id_set = set(chapter_ids)
-    updated_chapters: List[str] = []
-
-    def apply_statuses(chapter_list):
-        for chapter in chapter_list:
-            if chapter.get("id") in id_set:
-                chapter["status"] = new_status
-                if update_timestamp:
-                    chapter["last_modified"] = datetime.now(timezone.utc)
-                updated_chapters.append(chapter["id"])
-            if chapter.get("subchapters"):
-                apply_statuses(chapter["subchapters"])
-
-    apply_statuses(chapters)
-
-    if not updated_chapters:
-        raise ValueError("No matching chapters found")
-
-    updated_toc = {
-        **current_toc,
-        "chapters": chapters,
-        "updated_at": datetime.now(timezone.utc).isoformat(),
-        "status": "edited",
-        "version": current_version + 1,
-    }
-
-    # Compare-and-swap: the version filter makes this a no-op if another writer
-    # bumped the TOC since we read it, so concurrent edits can't clobber.
-    await _set_toc_guarded(
-        book_oid, user_auth_id, updated_toc, _version_guard(current_toc)
+    updated_chapters = await _rebasing(
+        _update_chapter_statuses_internal,
+        book_id,
+        chapter_ids,
+        new_status,
+        user_auth_id,
+        expected_version,
+        update_timestamp,
     )
 
     # Preserve the book-level audit entry the previous update_book() path emitted.
-    # Best-effort for the same reason as above: the guarded write has committed,
-    # so an audit failure must not turn a successful edit into an error.
+    # Best-effort: the guarded write has committed, so an audit failure must not
+    # turn a successful edit into an error.
     try:
         await create_audit_log(
             action="book_update",
@@ -571,6 +713,83 @@ async def update_chapter_statuses_with_version_guard(
     return {"updated_chapters": updated_chapters}
 
 
+async def _update_chapter_statuses_internal(
+    book_id: str,
+    chapter_ids: List[str],
+    new_status: str,
+    user_auth_id: str,
+    expected_version: int,
+    update_timestamp: bool,
+) -> List[str]:
+    """Internal function to bulk-update chapter statuses"""
+    book_oid = ObjectId(book_id)
+    book = await books_collection.find_one({"_id": book_oid}, CONTENT_EXCLUDING_PROJECTION)
+    if not book:
+        raise ValueError("Book not found")
+    if book.get("owner_id") != user_auth_id:
+        raise ValueError("Not authorized to update this book")
+
+    current_toc = book.get("table_of_contents", {})
+    version_guard = _version_guard(current_toc)  # snapshot before mutating
+    current_version = current_toc.get("version", 1)
+    if current_version != expected_version:
+        # Only a conflict if the writes since touched these chapters.
+        log = await books_collection.find_one(
+            {"_id": book_oid}, {"table_of_contents.version": 1, "toc_ops": 1}
+        )
+        if not can_rebase(log or {}, expected_version, chapter_ids):
+            raise ValueError(
+                f"Version conflict: expected {expected_version}, current {current_version}"
+            )
+
+    toc_index = TocIndex(current_toc.get("chapters"))
+    nodes = [toc_index.node(cid) for cid in dict.fromkeys(chapter_ids)]
+    nodes = [node for node in nodes if node is not None]
+    if not nodes:
+        raise ValueError("No matching chapters found")
+
+    now = datetime.now(timezone.utc)
+    update: Dict[str, Any] = {"$set": {"table_of_contents.status": "edited"}}
+    stats_delta: Dict[str, int] = {}
+    for node in nodes:
+        for key, value in chapter_stats_delta(node.chapter, {"status": new_status}).items():
+            stats_delta[key] = stats_delta.get(key, 0) + value
+        node.chapter["status"] = new_status
+        if update_timestamp:
+            node.chapter["last_modified"] = now
+    _move_stats(update, book, current_toc, stats_delta)
+
+    # One path per nesting depth, each level's filter matching the ids of the
+    # targets (or their ancestors) at that level. Chapter ids are unique, so
+    # $in per level selects exactly the targets.
+    # ponytail: a duplicated id is updated at every position it occupies,
+    # where TocIndex would pick the first.
+    array_filters = []
+    by_depth: Dict[int, List[TocNode]] = {}
+    for node in nodes:
+        by_depth.setdefault(node.depth, []).append(node)
+    for depth, group in sorted(by_depth.items()):
+        chains = [_ancestor_ids(node) for node in group]
+        path = "table_of_contents.chapters"
+        for level in range(depth):
+            name = f"d{depth}l{level}"
+            if level:
+                path += ".subchapters"
+            path += f".$[{name}]"
+            ids = sorted({chain[level] for chain in chains})
+            array_filters.append({f"{name}.id": {"$in": ids}})
+        update["$set"][f"{path}.status"] = new_status
+        if update_timestamp:
+            update["$set"][f"{path}.last_modified"] = now
+    _bump_version(current_toc, update)
+
+    updated_chapters = [node.id for node in nodes]
+    await _update_toc_targeted(
+        book_oid, user_auth_id, update, version_guard, updated_chapters, array_filters
+    )
+    return updated_chapters
+
+
 async def reorder_chapters_with_transaction(
     book_id: str,
     chapter_orders: List[Dict[str, Any]],
@@ -595,7 +814,7 @@ async def reorder_chapters_with_transaction(
     ``update_chapter_statuses_with_version_guard`` (#159) already took this
     route for the same reason.
     """
-    return await _reorder_chapters_internal(book_id, chapter_orders, user_auth_id, None)
+    return await _rebasing(_reorder_chapters_internal, book_id, chapter_orders, user_auth_id, None)
 
 
 async def _reorder_chapters_internal(
@@ -605,45 +824,70 @@ async def _reorder_chapters_internal(
     session: Optional[AsyncIOMotorClientSession]
 ) -> Dict[str, Any]:
     """Internal function to reorder chapters with or without transaction"""
-    # Get the book
-    book = await books_collection.find_one(
-        {"_id": ObjectId(book_id), "owner_id": user_auth_id},
-        session=session
-    )
-    if not book:
-        raise ValueError("Book not found or not authorized")
-
-    toc = book.get("table_of_contents", {})
+    toc = await _read_toc(book_id, user_auth_id, session)
     version_guard = _version_guard(toc)  # snapshot before mutating `toc`
     chapters = toc.get("chapters", [])
 
-    # Create a map of chapter IDs to chapters
-    chapter_map = {}
-    for chapter in chapters:
-        chapter_map[chapter.get("id")] = chapter
+    # Create a map of chapter IDs to their positions
+    positions = {}
+    for i, chapter in enumerate(chapters):
+        positions[chapter.get("id")] = i
 
-    # Reorder chapters based on provided order
+    # Reorder chapters based on provided order. Each entry of the new array
+    # is the stored chapter at its read position (plus its new ``order``),
+    # so the write carries positions, not chapters; the version guard keeps
+    # those positions valid.
     new_chapters = []
+    new_array = []
     for order_item in sorted(chapter_orders, key=lambda x: x["order"]):
         chapter_id = order_item["id"]
-        if chapter_id in chapter_map:
-            chapter = chapter_map[chapter_id]
+        if chapter_id in positions:
+            i = positions[chapter_id]
+            chapter = chapters[i]
             chapter["order"] = order_item["order"]
             new_chapters.append(chapter)
+            new_array.append(
+                {
+                    "$mergeObjects": [
+                        {"$arrayElemAt": ["$table_of_contents.chapters", i]},
+                        {"order": {"$literal": order_item["order"]}},
+                    ]
+                }
+            )
 
     # Add any chapters that weren't in the order list at the end
-    for chapter in chapters:
-        if chapter.get("id") not in [o["id"] for o in chapter_orders]:
+    ordered_ids = {o["id"] for o in chapter_orders}
+    for i, chapter in enumerate(chapters):
+        if chapter.get("id") not in ordered_ids:
             new_chapters.append(chapter)
+            new_array.append({"$arrayElemAt": ["$table_of_contents.chapters", i]})
 
-    # Update TOC
+    # Every top-level chapter may move.
+    touched = [chapter.get("id") for chapter in chapters]
     toc["chapters"] = new_chapters
-    toc["version"] = toc.get("version", 1) + 1
-    toc["updated_at"] = datetime.now(timezone.utc).isoformat()
+    update = {}
+    _bump_version(toc, update)
+    push_toc_op(update, touched)
+    log = update["$push"]["toc_ops"]
+    # A permutation cannot be expressed with $push/$pull, so this one is an
+    # update pipeline; it takes the version, timestamps and op-log entry
+    # prepared above.
+    stage = {
+        "table_of_contents.chapters": new_array,
+        "table_of_contents.version": toc["version"],
+        "table_of_contents.updated_at": toc["updated_at"],
+        "toc_ops": {
+            "$slice": [
+                {"$concatArrays": [{"$ifNull": ["$toc_ops", []]}, {"$literal": log["$each"]}]},
+                log["$slice"],
+            ]
+        },
+        "updated_at": update["$set"]["updated_at"],
+    }
 
-    # Update the book
-    await _set_toc_guarded(
-        ObjectId(book_id), user_auth_id, toc, version_guard, session
+    await _update_toc_targeted(
+        ObjectId(book_id), user_auth_id, [{"$set": stage}], version_guard, touched,
+        None, session,
     )
 
     return toc
@@ -7,7 +7,9 @@ A TTL index on `expires_at` reaps stale buckets so the collection stays bounded.
 """
 
 from datetime import datetime, timezone
-from pymongo import ReturnDocument
+from typing import Dict, Iterable, List, Tuple
+
+from pymongo import ReturnDocument, UpdateOne
 
 from .base import get_collection
 
@@ -26,6 +28,10 @@ async def _usage_collection():
     return coll
 
 
+def usage_counter_id(user_id: str, period_key: str) -> str:
+    return f"{user_id}:{period_key}"
+
+
 async def increment_usage(user_id: str, period_key: str, ttl_seconds: int) -> int:
     """Atomically bump the counter for ``user_id`` in ``period_key`` and return the new total.
 
@@ -36,7 +42,7 @@ async def increment_usage(user_id: str, period_key: str, ttl_seconds: int) -> in
     now = datetime.now(timezone.utc)
     expires_at = datetime.fromtimestamp(now.timestamp() + ttl_seconds, tz=timezone.utc)
     doc = await coll.find_one_and_update(
-        {"_id": f"{user_id}:{period_key}"},
+        {"_id": usage_counter_id(user_id, period_key)},
         {
             "$inc": {"count": 1},
             "$setOnInsert": {"user_id": user_id, "expires_at": expires_at},
@@ -45,3 +51,79 @@ async def increment_usage(user_id: str, period_key: str, ttl_seconds: int) -> in
         return_document=ReturnDocument.AFTER,
     )
     return doc["count"]
+
+
+async def bulk_increment_usage(
+    increments: List[Tuple[str, str, int, datetime]],
+    read_ids: Iterable[str] = (),
+) -> Dict[str, int]:
+    """Apply many counter increments in one write and read back current totals.
+
+    ``increments`` holds ``(counter_id, user_id, delta, expires_at)`` tuples; each
+    becomes an ``$inc`` upsert in a single unordered ``bulk_write``. Returns
+    ``{counter_id: count}`` for every id in ``increments`` and ``read_ids`` that
+    exists, so a caller can refresh its view of counters other processes bump.
+    Errors propagate.
+    """
+    coll = await _usage_collection()
+    if increments:
+        await coll.bulk_write(
+            [
+                UpdateOne(
+                    {"_id": counter_id},
+                    {
+                        "$inc": {"count": delta},
+                        "$setOnInsert": {"user_id": user_id, "expires_at": expires_at},
+                    },
+                    upsert=True,
+                )
+                for counter_id, user_id, delta, expires_at in increments
+            ],
+            ordered=False,
+        )
+    ids = {counter_id for counter_id, _, _, _ in increments}
+    ids.update(read_ids)
+    if not ids:
+        return {}
+    cursor = coll.find({"_id": {"$in": list(ids)}}, {"count": 1})
+    return {doc["_id"]: doc.get("count", 0) async for doc in cursor}
+
+
+async def increment_usage_windows(
+    user_id: str, buckets: Dict[str, str], ttl_seconds: int
+) -> Dict[str, int]:
+    """Bump every period in ``buckets`` for ``user_id`` in one atomic update.
+
+    ``buckets`` maps a period name to its current bucket (e.g. ``{"day":
+    "2026-07-03", "month": "2026-07"}``). All periods live in one document,
+    ``<user_id>:ai_quota``, as ``periods.<name> = {bucket, count}``; a period
+    whose stored bucket differs from the current one restarts at 1, so windows
+    roll over inside the same update. Returns ``{period: count}``. The document
+    expires ``ttl_seconds`` after the latest write. Counts kept by the older
+    per-window documents are carried over by
+    ``app/scripts/migration_ai_quota_counters.py``.
+    """
+    coll = await _usage_collection()
+    now = datetime.now(timezone.utc)
+    expires_at = datetime.fromtimestamp(now.timestamp() + ttl_seconds, tz=timezone.utc)
+    rolled = {
+        f"periods.{period}": {
+            "$cond": [
+                {"$eq": [f"$periods.{period}.bucket", {"$literal": bucket}]},
+                {
+                    "bucket": {"$literal": bucket},
+                    "count": {"$add": [f"$periods.{period}.count", 1]},
+                },
+                {"bucket": {"$literal": bucket}, "count": 1},
+            ]
+        }
+        for period, bucket in buckets.items()
+    }
+    doc = await coll.find_one_and_update(
+        {"_id": usage_counter_id(user_id, "ai_quota")},
+        [{"$set": {"user_id": user_id, "expires_at": expires_at, **rolled}}],
+        upsert=True,
+        return_document=ReturnDocument.AFTER,
+    )
+    periods = doc.get("periods", {})
+    return {period: periods[period]["count"] for period in buckets}
@@ -7,6 +7,7 @@ from bson.objectid import ObjectId
 from datetime import datetime, timezone
 from typing import Optional, Dict, List
 from .audit_log import create_audit_log
+from app.core.session_cache import session_user_cache
 
 logger = logging.getLogger(__name__)
 
@@ -55,6 +56,28 @@ async def ensure_user_indexes() -> None:
         )
 
 
+# The only user fields the per-request auth path (and the dependencies behind
+# it: rate limiter, AI quota, entitlement gate, audit, billing) ever read. Every
+# authenticated request loads the user, so it must not drag profile text or the
+# legacy ``book_ids`` array (thousands of ids on heavy accounts, #488) along.
+# Profile-only fields are read through get_user_profile.
+AUTH_USER_FIELDS = (
+    "_id",
+    "auth_id",
+    "email",
+    "role",
+    "plan",
+    "is_active",
+    "stripe_customer_id",
+    "stripe_subscription_id",
+)
+AUTH_USER_PROJECTION = {field: 1 for field in AUTH_USER_FIELDS}
+
+# Full profile minus the legacy book_ids array: nothing reads it (owner_id
+# indexes answer "which books are mine"), see migration_drop_user_book_ids.
+PROFILE_PROJECTION = {"book_ids": 0}
+
+
 # User-related database operations
 async def get_user_by_auth_id(auth_id: str) -> Optional[Dict]:
     """Get a user by their better-auth ID"""
@@ -62,6 +85,16 @@ async def get_user_by_auth_id(auth_id: str) -> Optional[Dict]:
     return user
 
 
+async def get_auth_user_by_auth_id(auth_id: str) -> Optional[Dict]:
+    """Get only the auth-path fields (AUTH_USER_FIELDS) of a user."""
+    return await users_collection.find_one({"auth_id": auth_id}, AUTH_USER_PROJECTION)
+
+
+async def get_user_profile(auth_id: str) -> Optional[Dict]:
+    """Get a user's full profile for ``/users/me`` (everything but ``book_ids``)."""
+    return await users_collection.find_one({"auth_id": auth_id}, PROFILE_PROJECTION)
+
+
 async def get_user_by_id(user_id: str) -> Optional[Dict]:
     """Get a user by their database ID"""
     user = await users_collection.find_one({"_id": ObjectId(user_id)})
@@ -115,6 +148,10 @@ async def update_user(
     updated_user = await users_collection.find_one_and_update(
         query, {"$set": user_data}, return_document=True
     )
+    # Cached sessions hold a snapshot of this record (plan, role, profile);
+    # drop them so the next request re-reads the change.
+    if updated_user:
+        session_user_cache.invalidate_user(auth_id)
 
     # Log the change if user was found and updated
     if updated_user and actor_id:
@@ -124,6 +161,7 @@ async def update_user(
             target_id=auth_id,
             resource_type="user",
             details={"updated_fields": list(user_data.keys())},
+            durable=True,
         )
 
     return updated_user
@@ -147,6 +185,7 @@ async def delete_user(
 
     # Log the deletion
     if success:
+        session_user_cache.invalidate_user(auth_id)
         await create_audit_log(
             action="user_delete",
             actor_id=actor_id
@@ -154,6 +193,7 @@ async def delete_user(
             target_id=auth_id,
             resource_type="user",
             details={"soft_delete": soft_delete},
+            durable=True,
         )
         return True
     return False
@@ -197,6 +237,7 @@ async def delete_user_books(user_id: str, book_ids: List[str] = None) -> bool:
             target_id=user_id,
             resource_type="books",
             details={"deleted_count": result.deleted_count},
+            durable=True,
         )
 
         return result.deleted_count > 0
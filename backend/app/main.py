@@ -109,6 +109,7 @@ async def lifespan(app: FastAPI):
 
     # Import here to avoid circular dependencies
     from app.db.base import get_database
+    from app.db.chapter_content import ensure_chapter_content_indexes
     from app.db.indexing_strategy import ChapterTabIndexManager
     from app.db.questions import ensure_question_indexes
     from app.db.user import ensure_user_indexes
@@ -119,6 +120,9 @@ async def lifespan(app: FastAPI):
     # Create unique indexes guarding against duplicate user records (issue #178)
     await ensure_user_indexes()
 
+    # Chapter bodies, one document per chapter, looked up by book
+    await ensure_chapter_content_indexes()
+
     # Book owner_id indexes + chapter_access_logs indexes and 90-day TTL
     # (issue #183). Idempotent; per-index errors are logged, never fatal —
     # the app must still boot (queries work unindexed, just slower).
@@ -126,12 +130,36 @@ async def lifespan(app: FastAPI):
     if not result.get("success"):
         logger.error(f"Startup index creation failed: {result.get('message')}")
 
+    # Batched reconcile of the endpoint rate limiter's local counts.
+    from app.core.rate_limit import rate_limit_store
+
+    rate_limit_store.start()
+
+    # Audit entries are queued and batch-written from here until shutdown.
+    from app.db.audit_log import audit_log_writer
+
+    audit_log_writer.start()
+
+    # Chapter access analytics are batch-written the same way.
+    from app.services.chapter_access_service import chapter_access_writer
+
+    chapter_access_writer.start()
+
     logger.info("Startup tasks completed")
 
     # Application runs here
     yield
 
     # Shutdown tasks
+    await rate_limit_store.stop()
+    await audit_log_writer.stop()
+    logger.info(f"Audit log writer drained: {audit_log_writer.stats()}")
+    await chapter_access_writer.stop()
+    logger.info(f"Chapter access writer drained: {chapter_access_writer.stats()}")
+    from app.db.book_cache import book_cache
+
+    logger.info(f"Book cache: {book_cache.stats()}")
+
     # Drop any export builds still queued on the dedicated pool (#345).
     # wait=False so shutdown isn't held hostage by an in-flight build — a
     # running thread cannot be cancelled, only waited on.
@@ -156,6 +184,9 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    # Let cross-origin clients read the dashboard's keyset-paging cursor and
+    # the ETags they send back in If-None-Match / If-Match.
+    expose_headers=["X-Next-Cursor", "ETag"],
 )
 
 # Add custom request validation middleware
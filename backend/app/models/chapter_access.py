@@ -13,11 +13,12 @@ class ChapterAccessLog(BaseModel):
     user_id: str  # Clerk user ID
     book_id: str
     chapter_id: str
-    access_type: str  # "view", "edit", "create", "delete", "tab_state"
+    access_type: str  # "view", "edit", "create", "delete", ... (tab state: chapter_tab_states)
     timestamp: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
     session_id: Optional[str] = None
     tab_order: Optional[int] = None  # For tab ordering persistence
     metadata: Dict[str, Any] = Field(default_factory=dict)
+    sample_rate: float = 1.0  # Fraction of this access_type kept; weight = 1 / sample_rate
 
     model_config = ConfigDict(
         from_attributes=True,
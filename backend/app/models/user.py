@@ -77,7 +77,7 @@ class UserDB(UserBase):
     updated_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
     book_ids: List[str] = Field(
         default_factory=list
-    )  # Store book IDs instead of direct references
+    )  # Deprecated: no longer maintained; books are found by owner_id
     is_active: bool = True
 
     model_config = ConfigDict(
@@ -231,6 +231,15 @@ class CollaboratorSchema(BaseModel):
     added_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
 
 
+class BookStats(BaseModel):
+    """Aggregate chapter statistics kept on the book"""
+
+    total_chapters: int = 0
+    chapters_with_content: int = 0
+    total_word_count: int = 0
+    status_counts: Dict[str, int] = Field(default_factory=dict)
+
+
 class BookResponse(BookBase):
     """Schema for book data returned from API"""
 
@@ -241,6 +250,7 @@ class BookResponse(BookBase):
     toc_items: List[TocItemSchema] = []
     published: bool = False
     collaborators: List[Dict[str, Any]] = []
+    stats: Optional[BookStats] = None
 
     model_config = ConfigDict(
         from_attributes=True,
@@ -333,6 +343,48 @@ class BulkStatusUpdate(BaseModel):
     update_timestamp: bool = True
 
 
+# Chapters plus subchapters one bulk create may add: they all go into the book
+# document in a single write, so the two per-list caps alone (200 x 200) would
+# let one request push the book past Mongo's 16 MB document limit.
+BULK_CHAPTER_NODE_LIMIT = 500
+
+
+class BulkChapterSubItem(BaseModel):
+    """A subchapter in a bulk chapter create"""
+
+    title: str
+    description: Optional[str] = None
+    order: Optional[int] = None  # defaults to the end of its list
+
+
+class BulkChapterItem(BulkChapterSubItem):
+    """A chapter in a bulk chapter create, with its subchapters"""
+
+    subchapters: List[BulkChapterSubItem] = Field(default_factory=list, max_length=200)
+
+
+class BulkChapterCreate(BaseModel):
+    """Schema for creating many chapters at once (e.g. an imported outline).
+
+    With ``parent_id`` every item becomes a subchapter of that top-level
+    chapter (and may not carry subchapters of its own).
+    """
+
+    parent_id: Optional[str] = None
+    chapters: List[BulkChapterItem] = Field(..., min_length=1, max_length=200)
+
+    @model_validator(mode="after")
+    def validate_node_count(self):
+        """Cap the chapters and subchapters created together."""
+        nodes = sum(1 + len(chapter.subchapters) for chapter in self.chapters)
+        if nodes > BULK_CHAPTER_NODE_LIMIT:
+            raise ValueError(
+                f"A bulk create may add at most {BULK_CHAPTER_NODE_LIMIT} "
+                f"chapters and subchapters in total, got {nodes}"
+            )
+        return self
+
+
 # --- Question API Request/Response Schemas ---
 
 class GenerateQuestionsRequest(BaseModel):
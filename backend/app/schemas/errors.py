@@ -45,6 +45,10 @@ class ErrorCode(str, Enum):
     RATING_SAVE_FAILED = "RATING_SAVE_FAILED"
     INVALID_RATING_VALUE = "INVALID_RATING_VALUE"
 
+    # Delta autosave — the patch's base is not the stored body, or it did not
+    # produce the declared result; the client must send the full content
+    CONTENT_PATCH_MISMATCH = "CONTENT_PATCH_MISMATCH"
+
     # Database errors
     DATABASE_ERROR = "DATABASE_ERROR"
     DATABASE_CONNECTION_FAILED = "DATABASE_CONNECTION_FAILED"
@@ -49,7 +49,7 @@ class UserResponse(UserBase):
     # the Stripe webhook. Deliberately NOT mirrored into UserUpdate.
     stripe_customer_id: Optional[str] = None
     stripe_subscription_id: Optional[str] = None
-    book_ids: List[str] = []
+    book_ids: List[str] = []  # Deprecated: no longer populated; books are found by owner_id
     preferences: Optional[UserPreferences] = Field(default_factory=UserPreferences)
 
     model_config = ConfigDict(
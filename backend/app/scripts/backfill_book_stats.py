@@ -0,0 +1,158 @@
+#!/usr/bin/env python3
+"""
+Database Migration Script: Book Stats Backfill
+==============================================
+
+Stores ``stats`` (chapter counts, word count, status counts) on books written
+before the app kept them. The app reads such books' stats by walking their TOC
+and sets them on the next TOC write; this script does it for books nobody
+edits, so every dashboard and export-preview read is a stored-field read.
+
+Per book, stats are computed from the TOC and set under the same version
+compare-and-swap the app's TOC writes use (and only while the book still has
+no stats). A book edited concurrently is skipped and picked up by the next
+run. Safe to re-run.
+
+Usage:
+    python backfill_book_stats.py [--dry-run] [--batch-size=100] [--force]
+
+Options:
+    --dry-run       Report how many books lack stats without changing anything
+    --batch-size    Number of books to read per batch (default: 100)
+    --force         Skip confirmation prompts
+"""
+
+import asyncio
+import argparse
+import logging
+from datetime import datetime, timezone
+import sys
+import os
+
+# Add the parent directory to path to import app modules
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.db.base import _db as database
+from app.db.book import CONTENT_EXCLUDING_PROJECTION
+from app.db.book_stats import compute_book_stats
+
+# Configure logging
+logging.basicConfig(
+    level=logging.INFO,
+    format="%(asctime)s - %(levelname)s - %(message)s",
+    handlers=[
+        logging.FileHandler("backfill_book_stats.log"),
+        logging.StreamHandler(),
+    ],
+)
+logger = logging.getLogger(__name__)
+
+MISSING_STATS_FILTER = {"stats": {"$exists": False}}
+
+
+class BookStatsBackfill:
+    """Sets ``stats`` on books that have none."""
+
+    def __init__(self, dry_run: bool = False, batch_size: int = 100):
+        self.dry_run = dry_run
+        self.batch_size = batch_size
+        self.migration_stats = {
+            "books_found": 0,
+            "books_updated": 0,
+            "books_skipped_conflict": 0,
+            "start_time": None,
+            "end_time": None,
+        }
+
+    async def run_migration(self):
+        """Run the backfill."""
+        self.migration_stats["start_time"] = datetime.now(timezone.utc)
+        logger.info("Starting book stats backfill")
+        logger.info(f"Mode: {'DRY RUN' if self.dry_run else 'LIVE MIGRATION'}")
+
+        try:
+            cursor = database.books.find(
+                MISSING_STATS_FILTER, CONTENT_EXCLUDING_PROJECTION
+            ).batch_size(self.batch_size)
+            async for book in cursor:
+                self.migration_stats["books_found"] += 1
+                if not self.dry_run:
+                    await self._backfill_book(book)
+
+        except Exception as e:
+            logger.error(f"Migration failed: {e}")
+            raise
+
+        finally:
+            self.migration_stats["end_time"] = datetime.now(timezone.utc)
+            self._print_migration_summary()
+
+    async def _backfill_book(self, book: dict):
+        toc = book.get("table_of_contents") or {}
+        # Same guard as the app's TOC writes: a legacy TOC without a version
+        # is matched on its absence.
+        version_guard = toc["version"] if "version" in toc else {"$exists": False}
+        result = await database.books.update_one(
+            {
+                "_id": book["_id"],
+                "table_of_contents.version": version_guard,
+                **MISSING_STATS_FILTER,
+            },
+            {"$set": {"stats": compute_book_stats(toc)}},
+        )
+        if result.modified_count:
+            self.migration_stats["books_updated"] += 1
+        else:
+            # Edited since we read it; the next run picks it up if that write
+            # did not already set its stats.
+            self.migration_stats["books_skipped_conflict"] += 1
+            logger.warning(f"Book {book['_id']} changed during backfill; skipped")
+
+    def _print_migration_summary(self):
+        """Print migration summary statistics."""
+        stats = self.migration_stats
+        duration = stats["end_time"] - stats["start_time"]
+
+        logger.info("=" * 50)
+        logger.info("MIGRATION SUMMARY")
+        logger.info("=" * 50)
+        logger.info(f"Mode: {'DRY RUN' if self.dry_run else 'LIVE MIGRATION'}")
+        logger.info(f"Duration: {duration}")
+        logger.info(f"Books without stats: {stats['books_found']}")
+        logger.info(f"Books updated: {stats['books_updated']}")
+        logger.info(f"Books skipped (concurrent edit): {stats['books_skipped_conflict']}")
+        logger.info("=" * 50)
+
+
+async def main():
+    """Main migration function."""
+    parser = argparse.ArgumentParser(
+        description="Store stats on books written before they were kept"
+    )
+    parser.add_argument(
+        "--dry-run", action="store_true", help="Show changes without applying them"
+    )
+    parser.add_argument(
+        "--batch-size", type=int, default=100, help="Number of books to read per batch"
+    )
+    parser.add_argument(
+        "--force", action="store_true", help="Skip confirmation prompts"
+    )
+
+    args = parser.parse_args()
+
+    # Confirmation prompt
+    if not args.force and not args.dry_run:
+        print("WARNING: This will modify your database.")
+        print("Make sure you have a backup before proceeding.")
+        response = input("Continue? (yes/no): ")
+        if response.lower() != "yes":
+            print("Migration cancelled.")
+            return
+
+    migration = BookStatsBackfill(dry_run=args.dry_run, batch_size=args.batch_size)
+    await migration.run_migration()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
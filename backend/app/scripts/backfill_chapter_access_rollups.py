@@ -0,0 +1,195 @@
+#!/usr/bin/env python3
+"""
+Database Migration Script: Backfill Chapter Access Rollups
+==========================================================
+
+Chapter analytics read per-(book, chapter, access_type, UTC day) counters from
+``chapter_access_daily``, which ingestion maintains from the moment it was
+deployed. This script rebuilds those counters from the raw
+``chapter_access_logs`` for every day before ``--until`` (default: today, UTC)
+so history recorded earlier shows up too.
+
+Each rollup is recomputed from the raw rows and written with ``$max``, never
+lowered: raw logs expire after 90 days while rollups are kept for 400, so on
+a re-run the oldest day's raw rows may be partly gone and their count short.
+With ``$max`` a re-run leaves such a day as it was, which makes the script
+safe to re-run. Today is excluded by default because live ingestion is still
+incrementing it. Days whose raw logs have fully expired are not touched.
+
+Usage:
+    python backfill_chapter_access_rollups.py [--dry-run] [--force] [--until=YYYY-MM-DD]
+
+Options:
+    --dry-run       Report how many rollups would be written without changing anything
+    --force         Skip confirmation prompts
+    --until         Rebuild days strictly before this UTC date (default: today)
+"""
+
+import asyncio
+import argparse
+import logging
+from datetime import datetime, timezone
+import sys
+import os
+
+# Add the parent directory to path to import app modules
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from pymongo import UpdateOne
+
+from app.db.base import _db as database
+from app.services.chapter_access_service import daily_rollup_id
+
+# Configure logging
+logging.basicConfig(
+    level=logging.INFO,
+    format="%(asctime)s - %(levelname)s - %(message)s",
+    handlers=[
+        logging.FileHandler("backfill_chapter_access_rollups.log"),
+        logging.StreamHandler(),
+    ],
+)
+logger = logging.getLogger(__name__)
+
+
+class ChapterAccessRollupBackfill:
+    """Recomputes daily rollups from raw chapter access logs."""
+
+    def __init__(self, until: datetime, dry_run: bool = False, batch_size: int = 500):
+        self.until = until
+        self.dry_run = dry_run
+        self.batch_size = batch_size
+        self.migration_stats = {
+            "rollups_computed": 0,
+            "rollups_written": 0,
+            "start_time": None,
+            "end_time": None,
+        }
+
+    async def run_migration(self):
+        """Run the backfill."""
+        self.migration_stats["start_time"] = datetime.now(timezone.utc)
+        logger.info(f"Starting chapter access rollup backfill (days before {self.until.date()})")
+        logger.info(f"Mode: {'DRY RUN' if self.dry_run else 'LIVE MIGRATION'}")
+
+        pipeline = [
+            {
+                "$match": {
+                    "timestamp": {"$lt": self.until},
+                    "chapter_id": {"$exists": True},
+                    # Legacy rows; tab state is not analytics.
+                    "access_type": {"$ne": "tab_state"},
+                }
+            },
+            {
+                "$group": {
+                    "_id": {
+                        "book_id": "$book_id",
+                        "chapter_id": "$chapter_id",
+                        "access_type": "$access_type",
+                        "day": {"$dateToString": {"format": "%Y-%m-%d", "date": "$timestamp"}},
+                    },
+                    "count": {"$sum": {"$divide": [1, {"$ifNull": ["$sample_rate", 1]}]}},
+                    "last_access": {"$max": "$timestamp"},
+                }
+            },
+        ]
+
+        try:
+            ops = []
+            async for group in database.chapter_access_logs.aggregate(pipeline, allowDiskUse=True):
+                self.migration_stats["rollups_computed"] += 1
+                ops.append(self._rollup_op(group))
+                if len(ops) >= self.batch_size:
+                    await self._flush(ops)
+                    ops = []
+            if ops:
+                await self._flush(ops)
+
+        except Exception as e:
+            logger.error(f"Backfill failed: {e}")
+            raise
+
+        finally:
+            self.migration_stats["end_time"] = datetime.now(timezone.utc)
+            self._print_migration_summary()
+
+    @staticmethod
+    def _rollup_op(group: dict) -> UpdateOne:
+        key = group["_id"]
+        day = datetime.strptime(key["day"], "%Y-%m-%d").replace(tzinfo=timezone.utc)
+        return UpdateOne(
+            {"_id": daily_rollup_id(key["book_id"], key["chapter_id"], key["access_type"], key["day"])},
+            {
+                "$setOnInsert": {
+                    "book_id": key["book_id"],
+                    "chapter_id": key["chapter_id"],
+                    "access_type": key["access_type"],
+                    "day": day,
+                },
+                # Never lower a stored count: the raw rows may have partly expired.
+                "$max": {"count": group["count"], "last_access": group["last_access"]},
+            },
+            upsert=True,
+        )
+
+    async def _flush(self, ops):
+        if self.dry_run:
+            return
+        await database.chapter_access_daily.bulk_write(ops, ordered=False)
+        self.migration_stats["rollups_written"] += len(ops)
+
+    def _print_migration_summary(self):
+        """Print migration summary statistics."""
+        stats = self.migration_stats
+        duration = stats["end_time"] - stats["start_time"]
+
+        logger.info("=" * 50)
+        logger.info("BACKFILL SUMMARY")
+        logger.info("=" * 50)
+        logger.info(f"Mode: {'DRY RUN' if self.dry_run else 'LIVE MIGRATION'}")
+        logger.info(f"Duration: {duration}")
+        logger.info(f"Rollups computed: {stats['rollups_computed']}")
+        logger.info(f"Rollups written: {stats['rollups_written']}")
+        logger.info("=" * 50)
+
+
+async def main():
+    """Main backfill function."""
+    parser = argparse.ArgumentParser(
+        description="Rebuild daily chapter access rollups from raw access logs"
+    )
+    parser.add_argument(
+        "--dry-run", action="store_true", help="Show changes without applying them"
+    )
+    parser.add_argument(
+        "--force", action="store_true", help="Skip confirmation prompts"
+    )
+    parser.add_argument(
+        "--until",
+        type=lambda value: datetime.strptime(value, "%Y-%m-%d").replace(tzinfo=timezone.utc),
+        default=None,
+        help="Rebuild days strictly before this UTC date (default: today)",
+    )
+
+    args = parser.parse_args()
+    until = args.until
+    if until is None:
+        today = datetime.now(timezone.utc).date()
+        until = datetime(today.year, today.month, today.day, tzinfo=timezone.utc)
+
+    # Confirmation prompt
+    if not args.force and not args.dry_run:
+        print("WARNING: This will modify your database.")
+        print("Make sure you have a backup before proceeding.")
+        response = input("Continue? (yes/no): ")
+        if response.lower() != "yes":
+            print("Backfill cancelled.")
+            return
+
+    backfill = ChapterAccessRollupBackfill(until=until, dry_run=args.dry_run)
+    await backfill.run_migration()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
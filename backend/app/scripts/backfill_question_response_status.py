@@ -0,0 +1,171 @@
+#!/usr/bin/env python3
+"""
+Database Migration Script: Question Response Status Backfill
+============================================================
+
+Sets the response summary (``response_status``, ``has_response``,
+``word_count``) on questions written before the app kept it. The chapter
+question list, its progress tally and the regenerate count filter on those
+fields, so until this has run a legacy question reads as if it had none.
+
+Per batch of questions, the owners' responses are looked up in one ``$in``
+query and each question's summary is set only while it is still missing, so a
+response saved during the run is never overwritten with the older state. Safe
+to re-run.
+
+Usage:
+    python backfill_question_response_status.py [--dry-run] [--batch-size=500] [--force]
+
+Options:
+    --dry-run       Report how many questions lack the summary without changing anything
+    --batch-size    Number of questions to update per batch (default: 500)
+    --force         Skip confirmation prompts
+"""
+
+import asyncio
+import argparse
+import logging
+from datetime import datetime, timezone
+import sys
+import os
+
+# Add the parent directory to path to import app modules
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from pymongo import UpdateOne
+
+from app.db.base import _db as database
+from app.db.questions import response_summary_fields
+
+# Configure logging
+logging.basicConfig(
+    level=logging.INFO,
+    format="%(asctime)s - %(levelname)s - %(message)s",
+    handlers=[
+        logging.FileHandler("backfill_question_response_status.log"),
+        logging.StreamHandler(),
+    ],
+)
+logger = logging.getLogger(__name__)
+
+MISSING_STATUS_FILTER = {"response_status": {"$exists": False}}
+
+
+class QuestionResponseStatusBackfill:
+    """Sets the response summary on questions that have none."""
+
+    def __init__(self, dry_run: bool = False, batch_size: int = 500):
+        self.dry_run = dry_run
+        self.batch_size = batch_size
+        self.migration_stats = {
+            "questions_found": 0,
+            "questions_updated": 0,
+            "questions_answered": 0,
+            "start_time": None,
+            "end_time": None,
+        }
+
+    async def run_migration(self):
+        """Run the backfill."""
+        self.migration_stats["start_time"] = datetime.now(timezone.utc)
+        logger.info("Starting question response status backfill")
+        logger.info(f"Mode: {'DRY RUN' if self.dry_run else 'LIVE MIGRATION'}")
+
+        try:
+            cursor = database.questions.find(
+                MISSING_STATUS_FILTER, {"_id": 1, "user_id": 1}
+            ).batch_size(self.batch_size)
+            batch = []
+            async for question in cursor:
+                self.migration_stats["questions_found"] += 1
+                batch.append(question)
+                if len(batch) >= self.batch_size:
+                    await self._backfill_batch(batch)
+                    batch = []
+            if batch:
+                await self._backfill_batch(batch)
+
+        except Exception as e:
+            logger.error(f"Migration failed: {e}")
+            raise
+
+        finally:
+            self.migration_stats["end_time"] = datetime.now(timezone.utc)
+            self._print_migration_summary()
+
+    async def _backfill_batch(self, questions: list):
+        if self.dry_run:
+            return
+        # A response belongs to the question's owner; keying on both keeps
+        # another user's response on the same question id out of the summary.
+        responses = {
+            (r["question_id"], r["user_id"]): r
+            async for r in database.question_responses.find(
+                {"question_id": {"$in": [str(q["_id"]) for q in questions]}},
+                {"question_id": 1, "user_id": 1, "status": 1, "word_count": 1, "response_text": 1},
+            )
+        }
+        ops = []
+        for question in questions:
+            response = responses.get((str(question["_id"]), question.get("user_id")))
+            if response:
+                self.migration_stats["questions_answered"] += 1
+            ops.append(
+                UpdateOne(
+                    {"_id": question["_id"], **MISSING_STATUS_FILTER},
+                    {"$set": response_summary_fields(response)},
+                )
+            )
+        result = await database.questions.bulk_write(ops, ordered=False)
+        self.migration_stats["questions_updated"] += result.modified_count
+
+    def _print_migration_summary(self):
+        """Print migration summary statistics."""
+        stats = self.migration_stats
+        duration = stats["end_time"] - stats["start_time"]
+
+        logger.info("=" * 50)
+        logger.info("MIGRATION SUMMARY")
+        logger.info("=" * 50)
+        logger.info(f"Mode: {'DRY RUN' if self.dry_run else 'LIVE MIGRATION'}")
+        logger.info(f"Duration: {duration}")
+        logger.info(f"Questions without a response summary: {stats['questions_found']}")
+        logger.info(f"Questions updated: {stats['questions_updated']}")
+        logger.info(f"  of which answered: {stats['questions_answered']}")
+        logger.info("=" * 50)
+
+
+async def main():
+    """Main migration function."""
+    parser = argparse.ArgumentParser(
+        description="Set the response summary on questions written before it was kept"
+    )
+    parser.add_argument(
+        "--dry-run", action="store_true", help="Show changes without applying them"
+    )
+    parser.add_argument(
+        "--batch-size", type=int, default=500, help="Number of questions to update per batch"
+    )
+    parser.add_argument(
+        "--force", action="store_true", help="Skip confirmation prompts"
+    )
+
+    args = parser.parse_args()
+
+    # Confirmation prompt
+    if not args.force and not args.dry_run:
+        print("WARNING: This will modify your database.")
+        print("Make sure you have a backup before proceeding.")
+        response = input("Continue? (yes/no): ")
+        if response.lower() != "yes":
+            print("Migration cancelled.")
+            return
+
+    migration = QuestionResponseStatusBackfill(
+        dry_run=args.dry_run, batch_size=args.batch_size
+    )
+    await migration.run_migration()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
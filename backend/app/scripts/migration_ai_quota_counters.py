@@ -0,0 +1,194 @@
+#!/usr/bin/env python3
+"""
+Database Migration Script: AI Quota Counters
+============================================
+
+The AI usage quota used to keep one ``usage_counters`` document per window,
+``<auth_id>:day:<YYYY-MM-DD>`` and ``<auth_id>:month:<YYYY-MM>``; it now keeps
+every window in one ``<auth_id>:ai_quota`` document
+(``app.db.usage.increment_usage_windows``). Without a carry-over every user's
+current day and month restart from zero on deploy.
+
+Run right after the deploy. For each user with a legacy counter for the
+current UTC day or month, this adds that count into the same period of the
+new document (creating it if the user has not generated since), so the
+current windows count calls from before and after the deploy. Only the
+current buckets matter: older ones are already past their window. A seeded
+document is marked, so re-running never adds a count twice. Safe to re-run.
+
+Usage:
+    python migration_ai_quota_counters.py [--dry-run] [--force]
+
+Options:
+    --dry-run       Report the counters that would be carried over without changing anything
+    --force         Skip confirmation prompts
+"""
+
+import asyncio
+import argparse
+import logging
+from collections import defaultdict
+from datetime import datetime, timezone
+import sys
+import os
+
+# Add the parent directory to path to import app modules
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from pymongo.errors import DuplicateKeyError
+
+from app.db.base import _db as database
+from app.db.usage import usage_counter_id
+
+# Configure logging
+logging.basicConfig(
+    level=logging.INFO,
+    format="%(asctime)s - %(levelname)s - %(message)s",
+    handlers=[
+        logging.FileHandler("migration_ai_quota_counters.log"),
+        logging.StreamHandler(),
+    ],
+)
+logger = logging.getLogger(__name__)
+
+# (period, bucket strftime format) of the per-window counters, as
+# app.api.dependencies.AI_QUOTA_WINDOWS names them; the hourly window is new.
+LEGACY_WINDOWS = (("day", "%Y-%m-%d"), ("month", "%Y-%m"))
+# The quota document's TTL: its widest window's, the month's.
+QUOTA_TTL_SECONDS = 40 * 86400
+
+
+class AIQuotaCounterMigration:
+    """Carries the current day and month counts into the per-user quota document."""
+
+    def __init__(self, dry_run: bool = False):
+        self.dry_run = dry_run
+        self.migration_stats = {
+            "legacy_counters_found": 0,
+            "users_found": 0,
+            "users_seeded": 0,
+            "users_already_seeded": 0,
+            "start_time": None,
+            "end_time": None,
+        }
+
+    async def run_migration(self):
+        """Run the migration."""
+        self.migration_stats["start_time"] = datetime.now(timezone.utc)
+        logger.info("Starting AI quota counter migration")
+        logger.info(f"Mode: {'DRY RUN' if self.dry_run else 'LIVE MIGRATION'}")
+
+        now = datetime.now(timezone.utc)
+        buckets = {period: now.strftime(fmt) for period, fmt in LEGACY_WINDOWS}
+        expires_at = datetime.fromtimestamp(
+            now.timestamp() + QUOTA_TTL_SECONDS, tz=timezone.utc
+        )
+
+        try:
+            # {user_id: {period: count}} for the current buckets.
+            counts = defaultdict(dict)
+            pattern = "|".join(f"{period}:{bucket}" for period, bucket in buckets.items())
+            cursor = database.usage_counters.find(
+                {"_id": {"$regex": f":({pattern})$"}}, {"user_id": 1, "count": 1}
+            )
+            async for counter in cursor:
+                self.migration_stats["legacy_counters_found"] += 1
+                period = counter["_id"].rsplit(":", 2)[-2]
+                counts[counter["user_id"]][period] = counter.get("count", 0)
+            self.migration_stats["users_found"] = len(counts)
+
+            if not self.dry_run:
+                for user_id, legacy in counts.items():
+                    await self._seed_user(user_id, legacy, buckets, expires_at)
+
+        except Exception as e:
+            logger.error(f"Migration failed: {e}")
+            raise
+
+        finally:
+            self.migration_stats["end_time"] = datetime.now(timezone.utc)
+            self._print_migration_summary()
+
+    async def _seed_user(self, user_id: str, legacy: dict, buckets: dict, expires_at: datetime):
+        # Same roll-over as increment_usage_windows: a period still on the
+        # current bucket gains the legacy count, any other restarts from it.
+        seeded = {
+            f"periods.{period}": {
+                "$cond": [
+                    {"$eq": [f"$periods.{period}.bucket", {"$literal": buckets[period]}]},
+                    {
+                        "bucket": {"$literal": buckets[period]},
+                        "count": {"$add": [f"$periods.{period}.count", count]},
+                    },
+                    {"bucket": {"$literal": buckets[period]}, "count": count},
+                ]
+            }
+            for period, count in legacy.items()
+        }
+        try:
+            await database.usage_counters.update_one(
+                {"_id": usage_counter_id(user_id, "ai_quota"), "legacy_seeded": {"$ne": True}},
+                [
+                    {
+                        "$set": {
+                            "user_id": user_id,
+                            "expires_at": {"$ifNull": ["$expires_at", expires_at]},
+                            "legacy_seeded": True,
+                            **seeded,
+                        }
+                    }
+                ],
+                upsert=True,
+            )
+        except DuplicateKeyError:
+            # The document exists and was seeded by an earlier run.
+            self.migration_stats["users_already_seeded"] += 1
+            return
+        self.migration_stats["users_seeded"] += 1
+
+    def _print_migration_summary(self):
+        """Print migration summary statistics."""
+        stats = self.migration_stats
+        duration = stats["end_time"] - stats["start_time"]
+
+        logger.info("=" * 50)
+        logger.info("MIGRATION SUMMARY")
+        logger.info("=" * 50)
+        logger.info(f"Mode: {'DRY RUN' if self.dry_run else 'LIVE MIGRATION'}")
+        logger.info(f"Duration: {duration}")
+        logger.info(f"Current-window legacy counters: {stats['legacy_counters_found']}")
+        logger.info(f"Users with legacy counts: {stats['users_found']}")
+        logger.info(f"Users seeded: {stats['users_seeded']}")
+        logger.info(f"Users already seeded: {stats['users_already_seeded']}")
+        logger.info("=" * 50)
+
+
+async def main():
+    """Main migration function."""
+    parser = argparse.ArgumentParser(
+        description="Carry per-window AI quota counts into the per-user quota document"
+    )
+    parser.add_argument(
+        "--dry-run", action="store_true", help="Show changes without applying them"
+    )
+    parser.add_argument(
+        "--force", action="store_true", help="Skip confirmation prompts"
+    )
+
+    args = parser.parse_args()
+
+    # Confirmation prompt
+    if not args.force and not args.dry_run:
+        print("WARNING: This will modify your database.")
+        print("Make sure you have a backup before proceeding.")
+        response = input("Continue? (yes/no): ")
+        if response.lower() != "yes":
+            print("Migration cancelled.")
+            return
+
+    migration = AIQuotaCounterMigration(dry_run=args.dry_run)
+    await migration.run_migration()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,168 @@
+#!/usr/bin/env python3
+"""
+Database Migration Script: Chapter Contents
+===========================================
+
+Moves chapter bodies out of ``books.table_of_contents`` into the
+``chapter_contents`` collection (one document per chapter, keyed by
+``<book_id>:<chapter_id>``). The app already reads both places and moves a
+book's bodies the first time its TOC is written; this script finishes the job
+for books nobody edits.
+
+Per book: inline bodies are copied with ``$setOnInsert`` (a body the app has
+already stored externally is newer and is kept), then the TOC is rewritten
+without them under the same version compare-and-swap the app uses. A book
+edited concurrently is skipped and picked up by the next run. Safe to re-run.
+
+Usage:
+    python migration_chapter_contents.py [--dry-run] [--batch-size=100] [--force]
+
+Options:
+    --dry-run       Report how many books and bodies would move without changing anything
+    --batch-size    Number of books to read per batch (default: 100)
+    --force         Skip confirmation prompts
+"""
+
+import asyncio
+import argparse
+import logging
+from datetime import datetime, timezone
+import sys
+import os
+
+# Add the parent directory to path to import app modules
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.db.base import _db as database
+from app.db.chapter_content import migrate_chapter_contents, split_chapter_contents
+
+# Configure logging
+logging.basicConfig(
+    level=logging.INFO,
+    format="%(asctime)s - %(levelname)s - %(message)s",
+    handlers=[
+        logging.FileHandler("migration_chapter_contents.log"),
+        logging.StreamHandler(),
+    ],
+)
+logger = logging.getLogger(__name__)
+
+LEGACY_FILTER = {
+    "$or": [
+        {"table_of_contents.chapters.content": {"$exists": True}},
+        {"table_of_contents.chapters.subchapters.content": {"$exists": True}},
+    ]
+}
+
+
+class ChapterContentsMigration:
+    """Moves inline chapter bodies into ``chapter_contents``."""
+
+    def __init__(self, dry_run: bool = False, batch_size: int = 100):
+        self.dry_run = dry_run
+        self.batch_size = batch_size
+        self.migration_stats = {
+            "books_found": 0,
+            "books_migrated": 0,
+            "books_skipped_conflict": 0,
+            "bodies_moved": 0,
+            "start_time": None,
+            "end_time": None,
+        }
+
+    async def run_migration(self):
+        """Run the migration."""
+        self.migration_stats["start_time"] = datetime.now(timezone.utc)
+        logger.info("Starting chapter contents migration")
+        logger.info(f"Mode: {'DRY RUN' if self.dry_run else 'LIVE MIGRATION'}")
+
+        try:
+            cursor = database.books.find(
+                LEGACY_FILTER, {"table_of_contents": 1}
+            ).batch_size(self.batch_size)
+            async for book in cursor:
+                self.migration_stats["books_found"] += 1
+                await self._migrate_book(book)
+
+        except Exception as e:
+            logger.error(f"Migration failed: {e}")
+            raise
+
+        finally:
+            self.migration_stats["end_time"] = datetime.now(timezone.utc)
+            self._print_migration_summary()
+
+    async def _migrate_book(self, book: dict):
+        book_id = str(book["_id"])
+        toc = book.get("table_of_contents") or {}
+        stripped, contents = split_chapter_contents(toc)
+        self.migration_stats["bodies_moved"] += len(contents)
+        if self.dry_run:
+            return
+
+        await migrate_chapter_contents(book_id, contents)
+
+        # Same guard as the app's TOC writes: a legacy TOC without a version
+        # is matched on its absence.
+        version_guard = toc["version"] if "version" in toc else {"$exists": False}
+        result = await database.books.update_one(
+            {"_id": book["_id"], "table_of_contents.version": version_guard},
+            {"$set": {"table_of_contents": stripped}},
+        )
+        if result.modified_count:
+            self.migration_stats["books_migrated"] += 1
+        else:
+            # Edited since we read it; that write already moved its bodies or
+            # the next run will.
+            self.migration_stats["books_skipped_conflict"] += 1
+            logger.warning(f"Book {book_id} changed during migration; skipped")
+
+    def _print_migration_summary(self):
+        """Print migration summary statistics."""
+        stats = self.migration_stats
+        duration = stats["end_time"] - stats["start_time"]
+
+        logger.info("=" * 50)
+        logger.info("MIGRATION SUMMARY")
+        logger.info("=" * 50)
+        logger.info(f"Mode: {'DRY RUN' if self.dry_run else 'LIVE MIGRATION'}")
+        logger.info(f"Duration: {duration}")
+        logger.info(f"Books with inline bodies: {stats['books_found']}")
+        logger.info(f"Books migrated: {stats['books_migrated']}")
+        logger.info(f"Books skipped (concurrent edit): {stats['books_skipped_conflict']}")
+        logger.info(f"Chapter bodies moved: {stats['bodies_moved']}")
+        logger.info("=" * 50)
+
+
+async def main():
+    """Main migration function."""
+    parser = argparse.ArgumentParser(
+        description="Move inline chapter bodies into the chapter_contents collection"
+    )
+    parser.add_argument(
+        "--dry-run", action="store_true", help="Show changes without applying them"
+    )
+    parser.add_argument(
+        "--batch-size", type=int, default=100, help="Number of books to read per batch"
+    )
+    parser.add_argument(
+        "--force", action="store_true", help="Skip confirmation prompts"
+    )
+
+    args = parser.parse_args()
+
+    # Confirmation prompt
+    if not args.force and not args.dry_run:
+        print("WARNING: This will modify your database.")
+        print("Make sure you have a backup before proceeding.")
+        response = input("Continue? (yes/no): ")
+        if response.lower() != "yes":
+            print("Migration cancelled.")
+            return
+
+    migration = ChapterContentsMigration(dry_run=args.dry_run, batch_size=args.batch_size)
+    await migration.run_migration()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+"""
+Database Migration Script: Drop users.book_ids
+==============================================
+
+``users.book_ids`` duplicated ``books.owner_id`` and grew without bound on
+heavy accounts, inflating every read of the user document. Nothing reads it
+any more and create/delete no longer maintain it; this script removes the
+field from existing user documents.
+
+Usage:
+    python migration_drop_user_book_ids.py [--dry-run] [--force]
+
+Options:
+    --dry-run       Report how many users carry the field without changing anything
+    --force         Skip confirmation prompts
+"""
+
+import asyncio
+import argparse
+import logging
+from datetime import datetime, timezone
+import sys
+import os
+
+# Add the parent directory to path to import app modules
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.db.base import _db as database
+
+# Configure logging
+logging.basicConfig(
+    level=logging.INFO,
+    format="%(asctime)s - %(levelname)s - %(message)s",
+    handlers=[
+        logging.FileHandler("migration_drop_user_book_ids.log"),
+        logging.StreamHandler(),
+    ],
+)
+logger = logging.getLogger(__name__)
+
+LEGACY_FILTER = {"book_ids": {"$exists": True}}
+
+
+class DropUserBookIdsMigration:
+    """Removes the legacy ``book_ids`` array from user documents."""
+
+    def __init__(self, dry_run: bool = False):
+        self.dry_run = dry_run
+        self.migration_stats = {
+            "users_with_field": 0,
+            "users_updated": 0,
+            "start_time": None,
+            "end_time": None,
+        }
+
+    async def run_migration(self):
+        """Run the migration (a single server-side ``$unset``)."""
+        self.migration_stats["start_time"] = datetime.now(timezone.utc)
+        logger.info("Starting users.book_ids removal")
+        logger.info(f"Mode: {'DRY RUN' if self.dry_run else 'LIVE MIGRATION'}")
+
+        try:
+            count = await database.users.count_documents(LEGACY_FILTER)
+            self.migration_stats["users_with_field"] = count
+            logger.info(f"Users carrying book_ids: {count}")
+
+            if count and not self.dry_run:
+                result = await database.users.update_many(
+                    LEGACY_FILTER, {"$unset": {"book_ids": ""}}
+                )
+                self.migration_stats["users_updated"] = result.modified_count
+
+        except Exception as e:
+            logger.error(f"Migration failed: {e}")
+            raise
+
+        finally:
+            self.migration_stats["end_time"] = datetime.now(timezone.utc)
+            self._print_migration_summary()
+
+    def _print_migration_summary(self):
+        """Print migration summary statistics."""
+        stats = self.migration_stats
+        duration = stats["end_time"] - stats["start_time"]
+
+        logger.info("=" * 50)
+        logger.info("MIGRATION SUMMARY")
+        logger.info("=" * 50)
+        logger.info(f"Mode: {'DRY RUN' if self.dry_run else 'LIVE MIGRATION'}")
+        logger.info(f"Duration: {duration}")
+        logger.info(f"Users carrying book_ids: {stats['users_with_field']}")
+        logger.info(f"Users updated: {stats['users_updated']}")
+        logger.info("=" * 50)
+
+
+async def main():
+    """Main migration function."""
+    parser = argparse.ArgumentParser(
+        description="Remove the legacy book_ids array from user documents"
+    )
+    parser.add_argument(
+        "--dry-run", action="store_true", help="Show changes without applying them"
+    )
+    parser.add_argument(
+        "--force", action="store_true", help="Skip confirmation prompts"
+    )
+
+    args = parser.parse_args()
+
+    # Confirmation prompt
+    if not args.force and not args.dry_run:
+        print("WARNING: This will modify your database.")
+        print("Make sure you have a backup before proceeding.")
+        response = input("Continue? (yes/no): ")
+        if response.lower() != "yes":
+            print("Migration cancelled.")
+            return
+
+    migration = DropUserBookIdsMigration(dry_run=args.dry_run)
+    await migration.run_migration()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
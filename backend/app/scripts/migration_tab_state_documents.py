@@ -0,0 +1,178 @@
+#!/usr/bin/env python3
+"""
+Database Migration Script: Tab State Documents
+==============================================
+
+Tab state used to be appended to ``chapter_access_logs`` as an
+``access_type: "tab_state"`` row on every save, and restoring it meant sorting
+those rows by timestamp. It now lives in ``chapter_tab_states``, one document
+per (user, book) keyed by ``<user_id>:<book_id>``. This script copies the
+latest legacy row per (user, book) into the new collection (without
+overwriting a document the app has already saved since) and then deletes the
+legacy rows from the access log.
+
+Usage:
+    python migration_tab_state_documents.py [--dry-run] [--force]
+
+Options:
+    --dry-run       Report what would be moved without changing anything
+    --force         Skip confirmation prompts
+"""
+
+import asyncio
+import argparse
+import logging
+from datetime import datetime, timezone
+import sys
+import os
+
+# Add the parent directory to path to import app modules
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from pymongo import UpdateOne
+
+from app.db.base import _db as database
+from app.services.chapter_access_service import tab_state_id
+
+# Configure logging
+logging.basicConfig(
+    level=logging.INFO,
+    format="%(asctime)s - %(levelname)s - %(message)s",
+    handlers=[
+        logging.FileHandler("migration_tab_state_documents.log"),
+        logging.StreamHandler(),
+    ],
+)
+logger = logging.getLogger(__name__)
+
+LEGACY_FILTER = {"access_type": "tab_state"}
+
+
+class TabStateDocumentsMigration:
+    """Moves legacy ``tab_state`` access-log rows into ``chapter_tab_states``."""
+
+    def __init__(self, dry_run: bool = False, batch_size: int = 500):
+        self.dry_run = dry_run
+        self.batch_size = batch_size
+        self.migration_stats = {
+            "legacy_rows": 0,
+            "states_found": 0,
+            "states_written": 0,
+            "legacy_rows_deleted": 0,
+            "start_time": None,
+            "end_time": None,
+        }
+
+    async def run_migration(self):
+        """Run the migration."""
+        self.migration_stats["start_time"] = datetime.now(timezone.utc)
+        logger.info("Starting tab state migration")
+        logger.info(f"Mode: {'DRY RUN' if self.dry_run else 'LIVE MIGRATION'}")
+
+        try:
+            logs = database.chapter_access_logs
+            self.migration_stats["legacy_rows"] = await logs.count_documents(LEGACY_FILTER)
+            logger.info(f"Legacy tab_state rows: {self.migration_stats['legacy_rows']}")
+
+            pipeline = [
+                {"$match": LEGACY_FILTER},
+                {"$sort": {"timestamp": -1}},
+                {
+                    "$group": {
+                        "_id": {"user_id": "$user_id", "book_id": "$book_id"},
+                        "latest": {"$first": "$$ROOT"},
+                    }
+                },
+            ]
+            ops = []
+            async for group in logs.aggregate(pipeline, allowDiskUse=True):
+                self.migration_stats["states_found"] += 1
+                ops.append(self._upsert_op(group["latest"]))
+                if len(ops) >= self.batch_size:
+                    await self._flush(ops)
+                    ops = []
+            if ops:
+                await self._flush(ops)
+
+            if not self.dry_run:
+                result = await logs.delete_many(LEGACY_FILTER)
+                self.migration_stats["legacy_rows_deleted"] = result.deleted_count
+
+        except Exception as e:
+            logger.error(f"Migration failed: {e}")
+            raise
+
+        finally:
+            self.migration_stats["end_time"] = datetime.now(timezone.utc)
+            self._print_migration_summary()
+
+    @staticmethod
+    def _upsert_op(row: dict) -> UpdateOne:
+        # $setOnInsert: a state saved through the new path is newer than any
+        # legacy row, so it wins.
+        return UpdateOne(
+            {"_id": tab_state_id(row["user_id"], row["book_id"])},
+            {
+                "$setOnInsert": {
+                    "user_id": row["user_id"],
+                    "book_id": row["book_id"],
+                    "metadata": row.get("metadata", {}),
+                    "session_id": row.get("session_id"),
+                    "timestamp": row.get("timestamp"),
+                }
+            },
+            upsert=True,
+        )
+
+    async def _flush(self, ops):
+        if self.dry_run:
+            return
+        result = await database.chapter_tab_states.bulk_write(ops, ordered=False)
+        self.migration_stats["states_written"] += result.upserted_count
+
+    def _print_migration_summary(self):
+        """Print migration summary statistics."""
+        stats = self.migration_stats
+        duration = stats["end_time"] - stats["start_time"]
+
+        logger.info("=" * 50)
+        logger.info("MIGRATION SUMMARY")
+        logger.info("=" * 50)
+        logger.info(f"Mode: {'DRY RUN' if self.dry_run else 'LIVE MIGRATION'}")
+        logger.info(f"Duration: {duration}")
+        logger.info(f"Legacy tab_state rows: {stats['legacy_rows']}")
+        logger.info(f"(user, book) states found: {stats['states_found']}")
+        logger.info(f"Tab state documents written: {stats['states_written']}")
+        logger.info(f"Legacy rows deleted: {stats['legacy_rows_deleted']}")
+        logger.info("=" * 50)
+
+
+async def main():
+    """Main migration function."""
+    parser = argparse.ArgumentParser(
+        description="Move legacy tab_state access-log rows into chapter_tab_states"
+    )
+    parser.add_argument(
+        "--dry-run", action="store_true", help="Show changes without applying them"
+    )
+    parser.add_argument(
+        "--force", action="store_true", help="Skip confirmation prompts"
+    )
+
+    args = parser.parse_args()
+
+    # Confirmation prompt
+    if not args.force and not args.dry_run:
+        print("WARNING: This will modify your database.")
+        print("Make sure you have a backup before proceeding.")
+        response = input("Continue? (yes/no): ")
+        if response.lower() != "yes":
+            print("Migration cancelled.")
+            return
+
+    migration = TabStateDocumentsMigration(dry_run=args.dry_run)
+    await migration.run_migration()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -1,11 +1,311 @@
-"""Chapter access logging service for analytics and tab persistence"""
+"""Chapter access logging service for analytics and tab persistence
 
+Access events are analytics: nothing on the request that produces them reads
+them back. While the app runs they go to a write-behind ``BatchWriter``
+(flushed with unordered ``insert_many``), so chapter reads, autosaves and
+exports no longer wait on an insert. ``CHAPTER_ACCESS_SAMPLE_RATES`` keeps
+only a fraction of chosen access types; each kept event records its
+``sample_rate`` so counts can be re-weighted (1 / rate). Sampled types are
+shed first when the queue backs up.
+
+Every kept event also bumps a per-(book, chapter, access_type, UTC day)
+counter in ``chapter_access_daily`` (weighted count plus last access), written
+with ``$inc`` upserts alongside the raw insert: one upsert per distinct key in
+a batch. ``get_chapter_analytics`` reads those rollups, so its cost is bounded
+by ``days`` small documents per chapter instead of raw log volume. Rollups for
+history recorded before they existed are rebuilt by
+``app/scripts/backfill_chapter_access_rollups.py``.
+
+``view``/``edit`` events likewise maintain ``chapter_recent``: one document per
+(user, book) holding the ``RECENT_CHAPTERS_LIMIT`` most recently accessed
+chapters, most recent first, so the tab strip's "last active chapter" is a
+point lookup instead of a sort+group over the whole access history. Its
+``access_count`` counts accesses since the chapter last entered the list.
+
+Tab state is state, not analytics: it lives in ``chapter_tab_states``, one
+upserted document per (user, book) keyed by ``_id``, so a save is idempotent
+and a restore is a point lookup. Legacy ``tab_state`` rows in the access log
+are moved over by ``app/scripts/migration_tab_state_documents.py``.
+"""
+
+import logging
+import random
 from datetime import datetime, timezone, timedelta
+from functools import lru_cache
 from typing import Dict, List, Optional, Any
 from bson import ObjectId
+from pymongo import UpdateOne
+from app.core.config import settings
 from app.models.chapter_access import ChapterAccessLog, ChapterAccessCreate
+from app.db.batch_writer import BatchWriter
 from app.db.database import get_collection
 
+logger = logging.getLogger(__name__)
+
+TAB_STATES_COLLECTION = "chapter_tab_states"
+DAILY_ROLLUPS_COLLECTION = "chapter_access_daily"
+RECENT_CHAPTERS_COLLECTION = "chapter_recent"
+
+# Access types that count as "working on this chapter" for the recent list.
+RECENT_ACCESS_TYPES = frozenset({"view", "edit"})
+RECENT_CHAPTERS_LIMIT = 10
+
+
+def tab_state_id(user_id: str, book_id: str) -> str:
+    """``_id`` of the single tab-state document for (user, book)."""
+    return f"{user_id}:{book_id}"
+
+
+@lru_cache(maxsize=8)
+def _parse_sample_rates(raw: str) -> Dict[str, float]:
+    """Parse ``"read_content=0.1,batch_read_content=0.25"`` into ``{type: rate}``."""
+    rates = {}
+    for item in raw.split(","):
+        if not item.strip():
+            continue
+        access_type, _, value = item.partition("=")
+        try:
+            rate = float(value)
+        except ValueError:
+            logger.error(f"Ignoring malformed CHAPTER_ACCESS_SAMPLE_RATES entry: {item!r}")
+            continue
+        rates[access_type.strip()] = min(1.0, max(0.0, rate))
+    return rates
+
+
+def sample_rate_for(access_type: str) -> float:
+    """Fraction of ``access_type`` events to keep (1.0 unless configured)."""
+    return _parse_sample_rates(settings.CHAPTER_ACCESS_SAMPLE_RATES).get(access_type, 1.0)
+
+
+def daily_rollup_id(book_id: str, chapter_id: str, access_type: str, day: str) -> str:
+    return f"{book_id}:{chapter_id}:{access_type}:{day}"
+
+
+def daily_rollup_ops(docs: List[Dict]) -> List[UpdateOne]:
+    """``$inc`` upserts folding access events into their daily rollups.
+
+    Events sharing a (book, chapter, access_type, day) key collapse into one
+    operation. Counts are weighted by ``1 / sample_rate``.
+    """
+    rollups: Dict[str, Dict] = {}
+    for doc in docs:
+        timestamp = doc["timestamp"]
+        if timestamp.tzinfo is None:  # read back from Mongo: naive UTC
+            timestamp = timestamp.replace(tzinfo=timezone.utc)
+        day = timestamp.astimezone(timezone.utc).date()
+        key = daily_rollup_id(doc["book_id"], doc["chapter_id"], doc["access_type"], day.isoformat())
+        rollup = rollups.get(key)
+        if rollup is None:
+            rollup = rollups[key] = {
+                "book_id": doc["book_id"],
+                "chapter_id": doc["chapter_id"],
+                "access_type": doc["access_type"],
+                "day": datetime(day.year, day.month, day.day, tzinfo=timezone.utc),
+                "count": 0.0,
+                "last_access": timestamp,
+            }
+        rollup["count"] += 1 / doc.get("sample_rate", 1.0)
+        rollup["last_access"] = max(rollup["last_access"], timestamp)
+
+    return [
+        UpdateOne(
+            {"_id": key},
+            {
+                "$inc": {"count": rollup.pop("count")},
+                "$max": {"last_access": rollup.pop("last_access")},
+                "$setOnInsert": rollup,
+            },
+            upsert=True,
+        )
+        for key, rollup in rollups.items()
+    ]
+
+
+async def record_daily_rollups(docs: List[Dict]) -> None:
+    """Fold ``docs`` into ``chapter_access_daily`` with one unordered bulk write."""
+    ops = daily_rollup_ops(docs)
+    if ops:
+        collection = await get_collection(DAILY_ROLLUPS_COLLECTION)
+        await collection.bulk_write(ops, ordered=False)
+
+
+def recent_chapters_id(user_id: str, book_id: str) -> str:
+    """``_id`` of the recent-chapters document for (user, book)."""
+    return f"{user_id}:{book_id}"
+
+
+def recent_chapter_ops(docs: List[Dict]) -> List[UpdateOne]:
+    """Upserts moving the chapters touched in ``docs`` to the front of their lists.
+
+    One pipeline update per (user, book): touched chapters go first (most
+    recent first, carrying their previous ``access_count`` forward), the rest
+    of the stored list follows, and the result is capped at
+    ``RECENT_CHAPTERS_LIMIT``.
+    """
+    touched: Dict[tuple, Dict[str, Dict]] = {}
+    for doc in docs:
+        if doc["access_type"] not in RECENT_ACCESS_TYPES:
+            continue
+        entries = touched.setdefault((doc["user_id"], doc["book_id"]), {})
+        entry = entries.get(doc["chapter_id"])
+        if entry is None:
+            entries[doc["chapter_id"]] = {
+                "chapter_id": doc["chapter_id"],
+                "last_access": doc["timestamp"],
+                "access_count": 1,
+            }
+        else:
+            entry["last_access"] = max(entry["last_access"], doc["timestamp"])
+            entry["access_count"] += 1
+
+    ops = []
+    for (user_id, book_id), entries in touched.items():
+        fresh = sorted(entries.values(), key=lambda e: e["last_access"], reverse=True)
+        fresh_ids = [e["chapter_id"] for e in fresh]
+        previous_count = {
+            "$sum": {
+                "$map": {
+                    "input": {
+                        "$filter": {
+                            "input": "$$old",
+                            "as": "o",
+                            "cond": {"$eq": ["$$o.chapter_id", "$$n.chapter_id"]},
+                        }
+                    },
+                    "as": "o",
+                    "in": "$$o.access_count",
+                }
+            }
+        }
+        chapters = {
+            "$let": {
+                "vars": {"old": {"$ifNull": ["$chapters", []]}},
+                "in": {
+                    "$slice": [
+                        {
+                            "$concatArrays": [
+                                {
+                                    "$map": {
+                                        "input": {"$literal": fresh},
+                                        "as": "n",
+                                        "in": {
+                                            "chapter_id": "$$n.chapter_id",
+                                            "last_access": "$$n.last_access",
+                                            "access_count": {
+                                                "$add": ["$$n.access_count", previous_count]
+                                            },
+                                        },
+                                    }
+                                },
+                                {
+                                    "$filter": {
+                                        "input": "$$old",
+                                        "as": "o",
+                                        "cond": {
+                                            "$not": [
+                                                {"$in": ["$$o.chapter_id", {"$literal": fresh_ids}]}
+                                            ]
+                                        },
+                                    }
+                                },
+                            ]
+                        },
+                        RECENT_CHAPTERS_LIMIT,
+                    ]
+                },
+            }
+        }
+        ops.append(
+            UpdateOne(
+                {"_id": recent_chapters_id(user_id, book_id)},
+                [
+                    {
+                        "$set": {
+                            "user_id": user_id,
+                            "book_id": book_id,
+                            "chapters": chapters,
+                            "updated_at": fresh[0]["last_access"],
+                        }
+                    }
+                ],
+                upsert=True,
+            )
+        )
+    return ops
+
+
+async def record_recent_chapters(docs: List[Dict]) -> None:
+    """Fold ``docs`` into ``chapter_recent`` with one unordered bulk write."""
+    ops = recent_chapter_ops(docs)
+    if ops:
+        collection = await get_collection(RECENT_CHAPTERS_COLLECTION)
+        await collection.bulk_write(ops, ordered=False)
+
+
+async def live_book_events(docs: List[Dict]) -> List[Dict]:
+    """``docs`` minus events for books that no longer exist.
+
+    A book's cascade delete removes its logs, rollups and recent lists, but
+    events still queued at that point would be flushed afterwards and the
+    upserts would recreate them. One ``_id`` lookup per batch.
+    """
+    object_ids = []
+    for book_id in {doc["book_id"] for doc in docs}:
+        try:
+            object_ids.append(ObjectId(book_id))
+        except Exception:
+            continue
+    books = await get_collection("books")
+    live = {
+        str(doc["_id"])
+        async for doc in books.find({"_id": {"$in": object_ids}}, {"_id": 1})
+    }
+    return [doc for doc in docs if doc["book_id"] in live]
+
+
+class ChapterAccessWriter(BatchWriter):
+    """Batches access events into ``chapter_access_logs`` and the views derived from them.
+
+    ponytail: a book deleted between the liveness check and the writes still
+    gets that one batch's rows back; the window is one flush, not the queue.
+    """
+
+    name = "chapter_access_log"
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.deleted_book_events = 0
+        self.rollup_failures = 0
+
+    async def insert_many(self, batch: List[Dict]) -> None:
+        live = await live_book_events(batch)
+        self.deleted_book_events += len(batch) - len(live)
+        if not live:
+            return
+        collection = await get_collection("chapter_access_logs")
+        await collection.insert_many(live, ordered=False)
+        # The raw rows have landed; a derived-view failure is not a write failure.
+        try:
+            await record_daily_rollups(live)
+            await record_recent_chapters(live)
+        except Exception:
+            self.rollup_failures += 1
+            logger.error("Failed to update access rollups for %s events", len(live), exc_info=True)
+
+    def stats(self) -> Dict[str, float]:
+        stats = super().stats()
+        stats["deleted_book_events"] = self.deleted_book_events
+        stats["rollup_failures"] = self.rollup_failures
+        return stats
+
+
+chapter_access_writer = ChapterAccessWriter(
+    max_queue=settings.CHAPTER_ACCESS_QUEUE_SIZE,
+    batch_size=settings.CHAPTER_ACCESS_BATCH_SIZE,
+    flush_interval=settings.CHAPTER_ACCESS_FLUSH_INTERVAL_SECONDS,
+)
+
 
 class ChapterAccessService:
     """Service for managing chapter access logs"""
@@ -25,8 +325,16 @@ class ChapterAccessService:
         session_id: Optional[str] = None,
         tab_order: Optional[int] = None,
         metadata: Optional[Dict[str, Any]] = None,
-    ) -> str:
-        """Log chapter access for analytics and tab persistence"""
+    ) -> Optional[str]:
+        """Log chapter access for analytics.
+
+        Returns the log id, or None when the event was sampled out or shed.
+        A buffered event's id is assigned client-side and exists in Mongo
+        once its batch is flushed.
+        """
+        rate = sample_rate_for(access_type)
+        if rate < 1.0 and random.random() >= rate:
+            return None
 
         log_entry = ChapterAccessLog(
             user_id=user_id,
@@ -36,39 +344,52 @@ class ChapterAccessService:
             session_id=session_id,
             tab_order=tab_order,
             metadata=metadata or {},
+            sample_rate=rate,
         )
+        doc = log_entry.model_dump(by_alias=True)
+
+        if not chapter_access_writer.running:
+            collection = await self._get_collection()
+            result = await collection.insert_one(doc)
+            await record_daily_rollups([doc])
+            await record_recent_chapters([doc])
+            return str(result.inserted_id)
 
-        collection = await self._get_collection()
-        result = await collection.insert_one(log_entry.model_dump(by_alias=True))
-        return str(result.inserted_id)
+        if not chapter_access_writer.enqueue(doc, sheddable=rate < 1.0):
+            return None
+        return str(doc["_id"])
 
     async def get_user_tab_state(self, user_id: str, book_id: str) -> Optional[Dict]:
-        """Retrieve latest tab state for user and book"""
+        """Retrieve the saved tab state for user and book"""
 
-        collection = await self._get_collection()
-        cursor = (
-            collection.find(
-                {"user_id": user_id, "book_id": book_id, "access_type": "tab_state"}
-            )
-            .sort("timestamp", -1)
-            .limit(1)
-        )
+        collection = await get_collection(TAB_STATES_COLLECTION)
+        return await collection.find_one({"_id": tab_state_id(user_id, book_id)})
+
+    async def get_chapter_analytics(
+        self, book_id: str, days: int = 30, chapter_id: Optional[str] = None
+    ) -> List[Dict]:
+        """Get chapter access analytics for the past N days (today included).
 
-        result = await cursor.to_list(length=1)
-        return result[0] if result else None
+        Sums the daily rollups per (chapter, access_type); ``chapter_id``
+        narrows the read to one chapter.
+        """
 
-    async def get_chapter_analytics(self, book_id: str, days: int = 30) -> List[Dict]:
-        """Get chapter access analytics for the past N days"""
+        today = datetime.now(timezone.utc).date()
+        since_day = datetime(today.year, today.month, today.day, tzinfo=timezone.utc) - timedelta(
+            days=days - 1
+        )
+        match = {"book_id": book_id, "day": {"$gte": since_day}}
+        if chapter_id is not None:
+            match["chapter_id"] = chapter_id
 
-        since_date = datetime.now(timezone.utc) - timedelta(days=days)
-        collection = await self._get_collection()
+        collection = await get_collection(DAILY_ROLLUPS_COLLECTION)
         pipeline = [
-            {"$match": {"book_id": book_id, "timestamp": {"$gte": since_date}}},
+            {"$match": match},
             {
                 "$group": {
                     "_id": {"chapter_id": "$chapter_id", "access_type": "$access_type"},
-                    "count": {"$sum": 1},
-                    "last_access": {"$max": "$timestamp"},
+                    "count": {"$sum": "$count"},
+                    "last_access": {"$max": "$last_access"},
                 }
             },
         ]
@@ -78,31 +399,25 @@ class ChapterAccessService:
     async def get_user_recent_chapters(
         self, user_id: str, book_id: str, limit: int = 10
     ) -> List[Dict]:
-        """Get recently accessed chapters for a user"""
+        """Get recently accessed chapters for a user, most recent first.
 
-        collection = await self._get_collection()
-        pipeline = [
-            {
-                "$match": {
-                    "user_id": user_id,
-                    "book_id": book_id,
-                    "access_type": {"$in": ["view", "edit"]},
-                }
-            },
-            {"$sort": {"timestamp": -1}},
+        At most ``RECENT_CHAPTERS_LIMIT`` are kept.
+        """
+
+        collection = await get_collection(RECENT_CHAPTERS_COLLECTION)
+        doc = await collection.find_one(
+            {"_id": recent_chapters_id(user_id, book_id)},
+            {"chapters": {"$slice": limit}},
+        )
+        return [
             {
-                "$group": {
-                    "_id": "$chapter_id",
-                    "last_access": {"$first": "$timestamp"},
-                    "access_count": {"$sum": 1},
-                }
-            },
-            {"$sort": {"last_access": -1}},
-            {"$limit": limit},
+                "_id": entry["chapter_id"],
+                "last_access": entry["last_access"],
+                "access_count": entry["access_count"],
+            }
+            for entry in (doc or {}).get("chapters", [])
         ]
 
-        return await collection.aggregate(pipeline).to_list(None)
-
     async def save_tab_state(
         self,
         user_id: str,
@@ -112,22 +427,31 @@ class ChapterAccessService:
         tab_order: List[str],
         session_id: Optional[str] = None,
     ) -> str:
-        """Save tab state for persistence across sessions"""
+        """Save tab state for persistence across sessions.
 
-        tab_state_metadata = {
-            "active_chapter_id": active_chapter_id,
-            "open_tab_ids": open_tab_ids,
-            "tab_order": tab_order,
-        }
+        Overwrites the (user, book) document in place; returns its ``_id``.
+        """
 
-        return await self.log_access(
-            user_id=user_id,
-            book_id=book_id,
-            chapter_id=active_chapter_id,
-            access_type="tab_state",
-            session_id=session_id,
-            metadata=tab_state_metadata,
+        state_id = tab_state_id(user_id, book_id)
+        collection = await get_collection(TAB_STATES_COLLECTION)
+        await collection.update_one(
+            {"_id": state_id},
+            {
+                "$set": {
+                    "user_id": user_id,
+                    "book_id": book_id,
+                    "metadata": {
+                        "active_chapter_id": active_chapter_id,
+                        "open_tab_ids": open_tab_ids,
+                        "tab_order": tab_order,
+                    },
+                    "session_id": session_id,
+                    "timestamp": datetime.now(timezone.utc),
+                }
+            },
+            upsert=True,
         )
+        return state_id
 
 
 # Create service instance
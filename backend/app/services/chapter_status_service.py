@@ -101,7 +101,11 @@ class ChapterStatusService:
 
     @classmethod
     def validate_bulk_update(cls, updates: List[Dict]) -> Dict[str, Any]:
-        """Validate bulk update data structure and transitions"""
+        """Validate bulk update data structure and transitions.
+
+        An update carrying ``current_status`` is also checked for an allowed
+        transition from it.
+        """
         invalid_updates = []
         valid_count = 0
 
@@ -126,6 +130,14 @@ class ChapterStatusService:
                     cls.validate_status_data(update["status"])
                     status_value = update["status"]
 
+                current_status = update.get("current_status")
+                if current_status is not None and not cls.validate_status_transition(
+                    current_status, status_value
+                ):
+                    raise ValueError(
+                        f"Invalid status transition: {current_status} -> {status_value}"
+                    )
+
                 valid_count += 1
 
             except ValueError as e:
@@ -944,7 +944,21 @@ class ExportService:
             )
 
     def book_stats(self, book_data: Dict) -> Dict:
-        """Compute export statistics (counts, word count, estimated pages)."""
+        """Export statistics (counts, word count, estimated pages).
+
+        Uses the book's stored ``stats`` when present (an O(1) read); otherwise
+        counts the words of each chapter body.
+        """
+        stored = book_data.get('stats')
+        if stored:
+            word_count = stored.get('total_word_count', 0)
+            return {
+                "total_chapters": stored.get('total_chapters', 0),
+                "chapters_with_content": stored.get('chapters_with_content', 0),
+                "total_word_count": word_count,
+                "estimated_pages": self._estimated_pages(word_count),
+            }
+
         all_chapters = self._flatten_chapters(
             book_data.get('table_of_contents', {}).get('chapters', [])
         )
@@ -953,15 +967,18 @@ class ExportService:
             len(self._clean_html_content(c.get('content', '')).split())
             for c in with_content
         )
-        # ponytail: ~300 words/page is a fine rough estimate for a UI hint.
-        estimated_pages = max(1, -(-word_count // 300)) if word_count else 0
         return {
             "total_chapters": len(all_chapters),
             "chapters_with_content": len(with_content),
             "total_word_count": word_count,
-            "estimated_pages": estimated_pages,
+            "estimated_pages": self._estimated_pages(word_count),
         }
 
+    @staticmethod
+    def _estimated_pages(word_count: int) -> int:
+        # ponytail: ~300 words/page is a fine rough estimate for a UI hint.
+        return max(1, -(-word_count // 300)) if word_count else 0
+
     async def export_book(
         self,
         book_data: Dict,
@@ -33,7 +33,7 @@ from app.db.database import (
     count_questions_without_responses,
     replace_question_in_place,
     get_question_by_id,
-    get_book_by_id,
+    get_chapter_by_id,
 )
 
 logger = logging.getLogger(__name__)
@@ -61,27 +61,14 @@ class QuestionGenerationService:
 
         Raises ValueError if the book does not exist.
         """
-        book = await get_book_by_id(book_id)
+        book = await get_chapter_by_id(book_id, chapter_id)
         if not book:
             raise ValueError("Book not found")
 
         chapter_title = "Chapter"
         chapter_content = ""
 
-        def find_chapter(chapters):
-            for ch in chapters:
-                if ch.get("id") == chapter_id:
-                    return ch
-                if ch.get("subchapters"):
-                    found = find_chapter(ch["subchapters"])
-                    if found:
-                        return found
-            return None
-
-        toc = book.get("table_of_contents", {})
-        chapters = toc.get("chapters", [])
-        chapter = find_chapter(chapters)
-
+        chapter = book.get("chapter")
         if chapter:
             chapter_title = chapter.get("title", "Chapter")
             chapter_content = chapter.get("content", "")
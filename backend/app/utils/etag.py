@@ -0,0 +1,57 @@
+"""
+Entity tags for conditional requests (``If-None-Match`` / ``If-Match``).
+
+The editor polls the book, its TOC, the chapter metadata and open chapters'
+content. Each of those has a cheap validator — the TOC ``version`` plus the
+book's ``updated_at``, or a chapter's stored ``content_hash`` — so an endpoint
+can compare the client's tag against a projected read and answer 304 without
+loading or serializing the body.
+
+Tags are strong and opaque: a hash of the validator parts, quoted.
+"""
+import hashlib
+from typing import Any, Dict, Optional
+
+from fastapi import Response
+
+
+def make_etag(*parts: Any) -> str:
+    """Strong ETag over ``parts`` (their ``repr``, so order and type matter)."""
+    digest = hashlib.sha256(repr(parts).encode("utf-8")).hexdigest()[:32]
+    return f'"{digest}"'
+
+
+def book_etag(book: Dict, *extra: Any) -> str:
+    """ETag for a representation derived from the book document.
+
+    Every TOC write bumps ``table_of_contents.version`` and every book write
+    sets ``updated_at``; ``extra`` covers inputs that live outside the book
+    (query parameters, per-user state).
+    """
+    version = (book.get("table_of_contents") or {}).get("version")
+    return make_etag(version, book.get("updated_at"), *extra)
+
+
+def etag_matches(header: Optional[str], etag: str, weak: bool = True) -> bool:
+    """Whether a conditional header's tag list matches ``etag``.
+
+    ``weak`` comparison (ignoring ``W/``) is what ``If-None-Match`` uses;
+    ``If-Match`` requires ``weak=False``.
+    """
+    if not header:
+        return False
+    for tag in header.split(","):
+        tag = tag.strip()
+        if tag == "*":
+            return True
+        if tag.startswith("W/"):
+            if not weak:
+                continue
+            tag = tag[2:]
+        if tag == etag:
+            return True
+    return False
+
+
+def not_modified(etag: str) -> Response:
+    return Response(status_code=304, headers={"ETag": etag})
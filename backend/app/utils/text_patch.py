@@ -0,0 +1,44 @@
+"""
+Text patches for delta autosave.
+
+A patch is a list of ops walked left to right over the base text:
+
+- ``{"retain": n}`` keeps the next ``n`` characters,
+- ``{"delete": n}`` drops the next ``n`` characters,
+- ``{"insert": "text"}`` inserts ``text`` at the current position.
+
+Whatever follows the last op is kept. Counts are Unicode code points (not
+UTF-16 units); a client that counts differently produces a result whose hash
+does not match, and the save falls back to sending the full content.
+"""
+from typing import Any, Dict, List
+
+
+class TextPatchError(ValueError):
+    """The patch is malformed or does not fit its base text."""
+
+
+def apply_text_patch(base: str, ops: List[Dict[str, Any]]) -> str:
+    """Apply ``ops`` to ``base`` and return the new text."""
+    parts: List[str] = []
+    cursor = 0
+    for op in ops:
+        if not isinstance(op, dict) or len(op) != 1:
+            raise TextPatchError(f"Invalid patch op: {op!r}")
+        (kind, value), = op.items()
+        if kind == "insert":
+            if not isinstance(value, str):
+                raise TextPatchError("insert takes a string")
+            parts.append(value)
+            continue
+        if kind not in ("retain", "delete"):
+            raise TextPatchError(f"Unknown patch op: {kind!r}")
+        if not isinstance(value, int) or isinstance(value, bool) or value < 0:
+            raise TextPatchError(f"{kind} takes a non-negative integer")
+        if cursor + value > len(base):
+            raise TextPatchError(f"{kind} runs past the end of the base text")
+        if kind == "retain":
+            parts.append(base[cursor:cursor + value])
+        cursor += value
+    parts.append(base[cursor:])
+    return "".join(parts)
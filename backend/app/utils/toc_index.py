@@ -0,0 +1,82 @@
+"""
+Index over a book's table of contents.
+
+A TOC is a nested list of chapter dicts (``table_of_contents.chapters``, each
+with optional ``subchapters``). Handlers used to answer "which chapter has this
+id / who is its parent / give me the flat list" with their own recursive walk
+each. ``TocIndex`` walks the tree once and answers those in O(1).
+
+The index points at the chapter dicts it was built from (no copies), so
+mutating ``index[chapter_id]`` mutates the TOC.
+"""
+from typing import Dict, Iterator, List, Optional
+
+
+class TocNode:
+    """One chapter in the index: the chapter dict plus its place in the tree."""
+
+    __slots__ = ("chapter", "parent", "depth", "position")
+
+    def __init__(self, chapter: Dict, parent: Optional["TocNode"], depth: int, position: int):
+        self.chapter = chapter
+        self.parent = parent
+        self.depth = depth  # 1 for a top-level chapter, like the TOC's ``level``
+        self.position = position  # index in the pre-order flattening
+
+    @property
+    def id(self) -> Optional[str]:
+        return self.chapter.get("id")
+
+    @property
+    def parent_id(self) -> Optional[str]:
+        return self.parent.id if self.parent else None
+
+
+class TocIndex:
+    """id -> node map and pre-order flattening of a TOC chapter list."""
+
+    __slots__ = ("_nodes", "_order")
+
+    def __init__(self, chapters: Optional[List[Dict]]):
+        self._nodes: Dict[str, TocNode] = {}
+        self._order: List[TocNode] = []
+        stack = [(chapter, None, 1) for chapter in reversed(chapters or [])]
+        while stack:
+            chapter, parent, depth = stack.pop()
+            node = TocNode(chapter, parent, depth, len(self._order))
+            self._order.append(node)
+            # A duplicated id resolves to its first occurrence in TOC order.
+            if node.id is not None:
+                self._nodes.setdefault(node.id, node)
+            for child in reversed(chapter.get("subchapters") or []):
+                stack.append((child, node, depth + 1))
+
+    @classmethod
+    def from_book(cls, book: Dict) -> "TocIndex":
+        return cls((book.get("table_of_contents") or {}).get("chapters"))
+
+    def node(self, chapter_id: str) -> Optional[TocNode]:
+        return self._nodes.get(chapter_id)
+
+    def get(self, chapter_id: str) -> Optional[Dict]:
+        """The chapter dict with this id, or ``None``."""
+        node = self._nodes.get(chapter_id)
+        return node.chapter if node else None
+
+    def parent_id(self, chapter_id: str) -> Optional[str]:
+        node = self._nodes.get(chapter_id)
+        return node.parent_id if node else None
+
+    def nodes(self) -> List[TocNode]:
+        """Every node, pre-order (a chapter, then its subchapters)."""
+        return self._order
+
+    def __contains__(self, chapter_id: object) -> bool:
+        return chapter_id in self._nodes
+
+    def __iter__(self) -> Iterator[Dict]:
+        """Every chapter dict, pre-order."""
+        return (node.chapter for node in self._order)
+
+    def __len__(self) -> int:
+        return len(self._order)
@@ -51,10 +51,10 @@ async def noop_rate_limiter(request: Request):
     return {"limit": float("inf"), "remaining": float("inf"), "reset": None}
 
 
-def fake_get_rate_limiter(limit: int = 10, window: int = 60):
+def fake_get_rate_limiter(limit: int = 10, window: int = 60, engine: str = "fixed"):
     """
     Fake rate limiter factory that bypasses rate limiting in tests.
-    Returns the shared noop_rate_limiter regardless of limit/window.
+    Returns the shared noop_rate_limiter regardless of limit/window/engine.
     """
     return noop_rate_limiter
 
@@ -92,6 +92,39 @@ deps.get_ai_usage_quota = fake_get_ai_usage_quota
 import pytest, pytest_asyncio
 
 
+@pytest.fixture(autouse=True)
+def _reset_session_user_cache():
+    """Start every test with an empty per-worker session cache, so a user
+    resolved in one test can never answer for a token in the next."""
+    from app.core.session_cache import session_user_cache
+
+    session_user_cache.clear()
+    yield
+    session_user_cache.clear()
+
+
+@pytest.fixture(autouse=True)
+def _reset_book_cache():
+    """Start every test with an empty per-worker book cache; tests seed books
+    with direct writes that bypass the DAO's own invalidation."""
+    from app.db.book_cache import book_cache
+
+    book_cache.clear()
+    yield
+    book_cache.clear()
+
+
+@pytest.fixture(autouse=True)
+def _reset_rate_limit_store():
+    """Start every test with no local rate-limit counts and a healthy store, so
+    one test's admissions (or simulated outage) never leak into the next."""
+    from app.core.rate_limit import rate_limit_store
+
+    rate_limit_store.clear()
+    yield
+    rate_limit_store.clear()
+
+
 @pytest.fixture
 def real_rate_limiter():
     """The genuine get_rate_limiter, for tests that exercise real rate limiting
@@ -130,9 +163,9 @@ def arm_real_rate_limiter():
     Every route captured the shared noop_rate_limiter at import time, so one
     dependency_overrides entry swaps in a genuine limiter closure with a small
     test cap. BYPASS_AUTH is forced off so the limiter actually counts.
-    Yields arm(limit, window=3600); if the target route no longer declares
-    Depends(get_rate_limiter(...)), the override never fires and the test's
-    expected 429 fails RED — the #199 test-trust guarantee.
+    Yields arm(limit, window=3600, engine="fixed"); if the target route no
+    longer declares Depends(get_rate_limiter(...)), the override never fires
+    and the test's expected 429 fails RED — the #199 test-trust guarantee.
     """
     _bypass_off = _mock_patch.object(deps.settings, "BYPASS_AUTH", False)
     _bypass_off.start()
@@ -144,9 +177,9 @@ def arm_real_rate_limiter():
     _clock = _mock_patch.object(deps.time, "time", return_value=_frozen_now)
     _clock.start()
 
-    def arm(limit: int, window: int = 3600):
+    def arm(limit: int, window: int = 3600, engine: str = "fixed"):
         app.dependency_overrides[noop_rate_limiter] = real_get_rate_limiter(
-            limit=limit, window=window
+            limit=limit, window=window, engine=engine
         )
 
     yield arm
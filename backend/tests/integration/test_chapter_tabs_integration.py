@@ -89,6 +89,51 @@ async def test_access_logging_and_recent_chapters(access_service, test_book):
     assert any(entry["_id"] == "ch-1" for entry in recent)
 
 
+@pytest.mark.asyncio
+async def test_recent_chapters_most_recent_first_and_capped(access_service, test_book):
+    """Recent chapters are kept most-recent-first, deduplicated and capped."""
+    from app.services.chapter_access_service import RECENT_CHAPTERS_LIMIT
+
+    for i in range(RECENT_CHAPTERS_LIMIT + 2):
+        await access_service.log_access(
+            user_id=USER_ID, book_id=test_book, chapter_id=f"ch-{i}", access_type="view",
+        )
+    await access_service.log_access(
+        user_id=USER_ID, book_id=test_book, chapter_id="ch-5", access_type="edit",
+    )
+
+    recent = await access_service.get_user_recent_chapters(
+        user_id=USER_ID, book_id=test_book, limit=RECENT_CHAPTERS_LIMIT
+    )
+    ids = [entry["_id"] for entry in recent]
+    assert len(ids) == RECENT_CHAPTERS_LIMIT
+    assert ids[0] == "ch-5"
+    assert recent[0]["access_count"] == 2
+    assert ids[1] == f"ch-{RECENT_CHAPTERS_LIMIT + 1}"
+    assert "ch-0" not in ids
+    assert ids.count("ch-5") == 1
+
+
+@pytest.mark.asyncio
+async def test_analytics_read_daily_rollups(access_service, test_book, database):
+    """Logged events are folded into one rollup per (chapter, type, day)."""
+    for _ in range(3):
+        await access_service.log_access(
+            user_id=USER_ID, book_id=test_book, chapter_id="ch-1", access_type="view",
+        )
+    await access_service.log_access(
+        user_id=USER_ID, book_id=test_book, chapter_id="ch-2", access_type="view",
+    )
+
+    assert await database.chapter_access_daily.count_documents({"book_id": test_book}) == 2
+    analytics = await access_service.get_chapter_analytics(
+        book_id=test_book, days=7, chapter_id="ch-1"
+    )
+    assert len(analytics) == 1
+    assert analytics[0]["_id"] == {"chapter_id": "ch-1", "access_type": "view"}
+    assert analytics[0]["count"] == 3
+
+
 @pytest.mark.asyncio
 async def test_tab_state_save_and_restore(access_service, test_book):
     """Tab state round-trips through the database."""
@@ -104,6 +149,22 @@ async def test_tab_state_save_and_restore(access_service, test_book):
     assert state["metadata"]["open_tab_ids"] == ["ch-1", "ch-2"]
 
 
+@pytest.mark.asyncio
+async def test_tab_state_save_overwrites_single_document(access_service, test_book, database):
+    """Saving again replaces the (user, book) document instead of appending."""
+    for active in ("ch-1", "ch-2"):
+        await access_service.save_tab_state(
+            user_id=USER_ID, book_id=test_book,
+            active_chapter_id=active, open_tab_ids=["ch-1", "ch-2"],
+            tab_order=["ch-1", "ch-2"],
+        )
+
+    assert await database.chapter_tab_states.count_documents({"book_id": test_book}) == 1
+    assert await database.chapter_access_logs.count_documents({"access_type": "tab_state"}) == 0
+    state = await access_service.get_user_tab_state(user_id=USER_ID, book_id=test_book)
+    assert state["metadata"]["active_chapter_id"] == "ch-2"
+
+
 # --- Status validation (pure logic) ------------------------------------------
 
 @pytest.mark.asyncio
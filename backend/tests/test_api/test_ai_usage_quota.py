@@ -5,7 +5,7 @@ from unittest.mock import patch
 from fastapi import HTTPException
 
 import app.api.dependencies as deps
-from app.db.usage import increment_usage
+from app.db.usage import increment_usage, increment_usage_windows
 
 
 # --- DAO: atomic counter -------------------------------------------------
@@ -37,6 +37,32 @@ async def test_increment_usage_sets_ttl(motor_reinit_db):
     assert doc["expires_at"] is not None
 
 
+@pytest.mark.asyncio
+async def test_increment_usage_windows_one_doc_for_all_periods(motor_reinit_db):
+    """Every period is bumped in the same document and each count comes back."""
+    from app.db.base import get_collection
+
+    buckets = {"hour": "2026-07-03T10", "day": "2026-07-03", "month": "2026-07"}
+    assert await increment_usage_windows("user-a", buckets, 3600) == {
+        "hour": 1, "day": 1, "month": 1,
+    }
+    assert await increment_usage_windows("user-a", buckets, 3600) == {
+        "hour": 2, "day": 2, "month": 2,
+    }
+    coll = await get_collection("usage_counters")
+    assert await coll.count_documents({"user_id": "user-a"}) == 1
+
+
+@pytest.mark.asyncio
+async def test_increment_usage_windows_rolls_over_per_period(motor_reinit_db):
+    """A new bucket restarts that period only; the others keep counting."""
+    await increment_usage_windows("user-a", {"day": "2026-07-03", "month": "2026-07"}, 3600)
+    counts = await increment_usage_windows(
+        "user-a", {"day": "2026-07-04", "month": "2026-07"}, 3600
+    )
+    assert counts == {"day": 1, "month": 2}
+
+
 # --- Dependency: 429 at the cap (the AC) ---------------------------------
 
 @pytest.mark.asyncio
@@ -165,11 +191,48 @@ async def test_quota_monthly_window_enforced(motor_reinit_db, real_ai_quota):
     assert exc.value.headers["X-AI-Quota-Period"] == "month"
 
 
+@pytest.mark.asyncio
+async def test_quota_hourly_window_enforced(motor_reinit_db, real_ai_quota):
+    """A configured hourly window is checked in the same single update."""
+    with patch.object(deps.settings, "BYPASS_AUTH", False), \
+         patch.object(deps.settings, "AI_QUOTA_ENABLED", True), \
+         patch.object(deps.settings, "AI_QUOTA_HOURLY_LIMIT", 1), \
+         patch.object(deps.settings, "AI_QUOTA_DAILY_LIMIT", 100), \
+         patch.object(deps.settings, "AI_QUOTA_MONTHLY_LIMIT", 100), \
+         patch.object(deps, "increment_usage_windows", wraps=deps.increment_usage_windows) as bump:
+        checker = real_ai_quota()
+        await checker(current_user={"auth_id": "h"})
+        with pytest.raises(HTTPException) as exc:
+            await checker(current_user={"auth_id": "h"})
+    assert exc.value.headers["X-AI-Quota-Period"] == "hour"
+    assert bump.await_count == 2  # one round trip per check, three windows each
+
+
+@pytest.mark.asyncio
+async def test_quota_uses_plan_limits(motor_reinit_db, real_ai_quota):
+    """PLAN_AI_QUOTAS overrides the settings default for that plan only."""
+    from app.core import entitlements
+
+    with patch.object(deps.settings, "BYPASS_AUTH", False), \
+         patch.object(deps.settings, "AI_QUOTA_ENABLED", True), \
+         patch.object(deps.settings, "AI_QUOTA_DAILY_LIMIT", 1), \
+         patch.object(deps.settings, "AI_QUOTA_MONTHLY_LIMIT", 0), \
+         patch.dict(entitlements.PLAN_AI_QUOTAS, {"pro": {"day": 3}}):
+        checker = real_ai_quota()
+        for _ in range(3):
+            await checker(current_user={"auth_id": "p", "plan": "pro"})
+        await checker(current_user={"auth_id": "f", "plan": "free"})
+        with pytest.raises(HTTPException) as exc:
+            await checker(current_user={"auth_id": "f", "plan": "free"})
+    assert exc.value.headers["X-AI-Quota-Limit"] == "1"
+
+
 # --- Config defaults ------------------------------------------------------
 
 def test_quota_settings_defaults():
     from app.core.config import settings
 
     assert settings.AI_QUOTA_ENABLED is True
+    assert settings.AI_QUOTA_HOURLY_LIMIT == 0
     assert settings.AI_QUOTA_DAILY_LIMIT == 50
     assert settings.AI_QUOTA_MONTHLY_LIMIT == 500
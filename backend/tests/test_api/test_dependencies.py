@@ -286,18 +286,67 @@ class TestRateLimiting:
                 result = await limiter(request, current_user=USER_A)
         assert result["remaining"] == 0
 
-    async def test_mongo_failure_fails_closed(self, real_rate_limiter):
-        """A store failure propagates (fail-closed) rather than waving traffic
-        through — auth on rate-limited endpoints already requires the same
-        Mongo, so this adds no new availability dependency."""
+    async def test_sliding_engine_blocks_boundary_burst(
+        self, motor_reinit_db, real_rate_limiter
+    ):
+        """A full limit spent just before a window boundary still counts just
+        after it under the sliding engine; the fixed engine would reset."""
+        sliding = real_rate_limiter(limit=3, window=60, engine="sliding")
+        fixed = real_rate_limiter(limit=3, window=60)
+
+        with patch.object(deps.settings, "BYPASS_AUTH", False):
+            # 999_960 is a window start; spend the limit 10s before it.
+            with patch.object(deps.time, "time", return_value=999_950.0):
+                for _ in range(3):
+                    await sliding(_mock_request("/api/sliding"), current_user=USER_A)
+                    await fixed(_mock_request("/api/fixed"), current_user=USER_A)
+
+            with patch.object(deps.time, "time", return_value=999_965.0):
+                assert (
+                    await fixed(_mock_request("/api/fixed"), current_user=USER_A)
+                )["remaining"] == 2
+                with pytest.raises(HTTPException) as exc_info:
+                    await sliding(_mock_request("/api/sliding"), current_user=USER_A)
+            assert exc_info.value.status_code == 429
+
+            # Near the end of the window the previous burst has mostly aged out.
+            with patch.object(deps.time, "time", return_value=1_000_015.0):
+                result = await sliding(_mock_request("/api/sliding"), current_user=USER_A)
+        assert result["remaining"] == 0
+
+    def test_unknown_engine_rejected_at_declaration(self, real_rate_limiter):
+        with pytest.raises(ValueError):
+            real_rate_limiter(limit=1, window=60, engine="leaky")
+
+    async def test_mongo_failure_fails_closed(
+        self, motor_reinit_db, real_rate_limiter
+    ):
+        """A failed reconcile rejects traffic (fail-closed, 503) rather than
+        waving it through on stale local counts — auth on rate-limited
+        endpoints already requires the same Mongo, so this adds no new
+        availability dependency. The next successful reconcile re-opens it
+        without losing the counts admitted before the outage."""
+        from app.core import rate_limit
+
         limiter = real_rate_limiter(limit=5, window=60)
         request = _mock_request("/api/mongo-down")
 
-        with patch.object(deps.settings, "BYPASS_AUTH", False), patch.object(
-            deps, "increment_usage", side_effect=RuntimeError("mongo down")
-        ):
-            with pytest.raises(RuntimeError):
+        with patch.object(deps.settings, "BYPASS_AUTH", False):
+            await limiter(request, current_user=USER_A)
+            with patch.object(
+                rate_limit, "bulk_increment_usage", side_effect=RuntimeError("mongo down")
+            ):
+                with pytest.raises(RuntimeError):
+                    await rate_limit.rate_limit_store.reconcile()
+
+            with pytest.raises(HTTPException) as exc_info:
                 await limiter(request, current_user=USER_A)
+            assert exc_info.value.status_code == 503
+            assert "Retry-After" in exc_info.value.headers
+
+            await rate_limit.rate_limit_store.reconcile()
+            result = await limiter(request, current_user=USER_A)
+        assert result["remaining"] == 3
 
     async def test_dependency_wiring_resolves_user_via_http(
         self, motor_reinit_db, real_rate_limiter
@@ -15,19 +15,13 @@ async def test_generate_chapter_draft_with_mock_book(auth_client_factory):
         "_id": "test_book_id",
         "owner_id": "test-auth-id-123",
         "title": "Test Book",
-        "table_of_contents": {
-            "chapters": [
-                {
-                    "id": "ch1",
-                    "title": "Introduction to Testing",
-                    "description": "Learn the basics of testing",
-                    "level": 1,
-                    "order": 1,
-                    "subchapters": []
-                }
-            ],
-            "total_chapters": 1,
-            "version": 1
+        "chapter": {
+            "id": "ch1",
+            "title": "Introduction to Testing",
+            "description": "Learn the basics of testing",
+            "level": 1,
+            "order": 1,
+            "subchapters": []
         }
     }
 
@@ -47,7 +41,7 @@ async def test_generate_chapter_draft_with_mock_book(auth_client_factory):
         "suggestions": ["Add more examples", "Consider breaking into sections"]
     }
 
-    with patch('app.api.endpoints.books.get_book_by_id', AsyncMock(return_value=mock_book)):
+    with patch('app.api.endpoints.books.get_chapter_by_id', AsyncMock(return_value=mock_book)):
         with patch('app.api.endpoints.books.ai_service.generate_chapter_draft',
                    AsyncMock(return_value=mock_ai_result)):
             # Generate draft
@@ -91,12 +85,10 @@ async def test_generate_draft_validates_responses(auth_client_factory):
         "_id": "test_book_id",
         "owner_id": "test-auth-id-123",
         "title": "Test Book",
-        "table_of_contents": {
-            "chapters": [{"id": "ch1", "title": "Chapter 1"}]
-        }
+        "chapter": {"id": "ch1", "title": "Chapter 1"}
     }
 
-    with patch('app.api.endpoints.books.get_book_by_id', AsyncMock(return_value=mock_book)):
+    with patch('app.api.endpoints.books.get_chapter_by_id', AsyncMock(return_value=mock_book)):
         # Try with empty responses
         response = await client.post(
             "/api/v1/books/test_book_id/chapters/ch1/generate-draft",
@@ -116,13 +108,11 @@ async def test_generate_draft_handles_ai_errors(auth_client_factory):
         "_id": "test_book_id",
         "owner_id": "test-auth-id-123",
         "title": "Test Book",
-        "table_of_contents": {
-            "chapters": [{"id": "ch1", "title": "Chapter 1"}]
-        }
+        "chapter": {"id": "ch1", "title": "Chapter 1"}
     }
 
     # Mock AI service to raise an error
-    with patch('app.api.endpoints.books.get_book_by_id', AsyncMock(return_value=mock_book)):
+    with patch('app.api.endpoints.books.get_chapter_by_id', AsyncMock(return_value=mock_book)):
         with patch('app.api.endpoints.books.ai_service.generate_chapter_draft',
                    AsyncMock(side_effect=Exception("AI service unavailable"))):
 
@@ -36,6 +36,7 @@ import pytest
 from bson import ObjectId
 
 from app.db import base
+from app.db.chapter_content import content_hash, set_chapter_content
 
 API = "/api/v1/books"
 MISSING_BOOK_ID = str(ObjectId())  # valid ObjectId, but never created
@@ -96,7 +97,7 @@ async def test_save_tab_state_success(auth_client_factory):
     body = r.json()
     assert body["success"] is True
     assert body["book_id"] == book_id
-    assert body["tab_state_id"]  # a real inserted log id
+    assert body["tab_state_id"]  # the (user, book) tab-state document id
     assert body["message"] == "Tab state saved successfully"
 
 
@@ -341,6 +342,32 @@ async def test_get_chapter_content_wrong_owner(auth_client_factory):
     assert "Not authorized" in r.json()["detail"]
 
 
+@pytest.mark.asyncio
+async def test_get_chapter_content_conditional_get(auth_client_factory):
+    api = await auth_client_factory()
+    book_id = await _create_book(api)
+    # A legacy inline body: no stored content_hash yet.
+    await _seed_toc(api, book_id, [_chapter("ch1", content="old body", word_count=2)])
+    url = f"{API}/{book_id}/chapters/ch1/content"
+
+    first = await api.get(url)
+    etag = first.headers["ETag"]
+    assert (await api.get(url, headers={"If-None-Match": etag})).status_code == 304
+
+    r = await api.patch(url, json={"content": "new body", "auto_update_metadata": True})
+    assert r.status_code == 200, r.text
+
+    changed = await api.get(url, headers={"If-None-Match": etag})
+    assert changed.status_code == 200
+    assert changed.json()["content"] == "new body"
+    new_etag = changed.headers["ETag"]
+    assert new_etag != etag
+    # Stored body with a hash now: the 304 is answered without reading it.
+    unchanged = await api.get(url, headers={"If-None-Match": new_etag})
+    assert unchanged.status_code == 304
+    assert unchanged.headers["ETag"] == new_etag
+
+
 # --------------------------------------------------------------------------- #
 # update_chapter_content  (PATCH /{book_id}/chapters/{chapter_id}/content)
 # --------------------------------------------------------------------------- #
@@ -418,6 +445,106 @@ async def test_update_chapter_content_no_auto_metadata(auth_client_factory):
     assert body["metadata"]["status"] == "draft"
 
 
+@pytest.mark.asyncio
+async def test_update_chapter_content_delta(auth_client_factory):
+    api = await auth_client_factory()
+    book_id = await _create_book(api)
+    await _seed_toc(api, book_id, [_chapter("ch1", word_count=0, status="draft")])
+    url = f"{API}/{book_id}/chapters/ch1/content"
+
+    full = await api.patch(url, json={"content": "Hello world"})
+    assert full.status_code == 200, full.text
+    base_hash = full.json()["content_hash"]
+
+    expected = "Hello there world"
+    r = await api.patch(
+        url,
+        json={
+            "patch": [{"retain": 6}, {"insert": "there "}],
+            "base_hash": base_hash,
+            "result_hash": content_hash(expected),
+        },
+    )
+    assert r.status_code == 200, r.text
+    assert r.json()["content_hash"] == content_hash(expected)
+
+    g = await api.get(url)
+    assert g.json()["content"] == expected
+    assert g.json()["metadata"]["word_count"] == 3
+
+
+@pytest.mark.asyncio
+async def test_update_chapter_content_delta_mismatch_requires_full_save(auth_client_factory):
+    api = await auth_client_factory()
+    book_id = await _create_book(api)
+    await _seed_toc(api, book_id, [_chapter("ch1")])
+    url = f"{API}/{book_id}/chapters/ch1/content"
+    base_hash = (await api.patch(url, json={"content": "abc"})).json()["content_hash"]
+
+    stale_base = await api.patch(
+        url,
+        json={
+            "patch": [{"insert": "x"}],
+            "base_hash": content_hash("something else"),
+            "result_hash": content_hash("xabc"),
+        },
+    )
+    wrong_result = await api.patch(
+        url,
+        json={
+            "patch": [{"insert": "x"}],
+            "base_hash": base_hash,
+            "result_hash": content_hash("yabc"),
+        },
+    )
+    past_end = await api.patch(
+        url,
+        json={
+            "patch": [{"delete": 9}],
+            "base_hash": base_hash,
+            "result_hash": content_hash(""),
+        },
+    )
+
+    for r in (stale_base, wrong_result, past_end):
+        assert r.status_code == 409
+        assert r.json()["detail"]["error_code"] == "CONTENT_PATCH_MISMATCH"
+    assert (await api.get(url)).json()["content"] == "abc"
+
+
+@pytest.mark.asyncio
+async def test_get_book_etag_follows_chapter_bodies(auth_client_factory):
+    """A body written apart from the TOC (the autosave's last step) must change
+    the book's ETag, or a read taken in between pins the old body."""
+    api = await auth_client_factory()
+    book_id = await _create_book(api)
+    await _seed_toc(api, book_id, [_chapter("ch1")])
+    await api.patch(f"{API}/{book_id}/chapters/ch1/content", json={"content": "first"})
+    url = f"{API}/{book_id}"
+
+    etag = (await api.get(url)).headers["ETag"]
+    assert (await api.get(url, headers={"If-None-Match": etag})).status_code == 304
+
+    await set_chapter_content(book_id, "ch1", "second")
+    r = await api.get(url, headers={"If-None-Match": etag})
+    assert r.status_code == 200
+    assert r.json()["table_of_contents"]["chapters"][0]["content"] == "second"
+
+
+@pytest.mark.asyncio
+async def test_update_chapter_content_requires_content_or_patch(auth_client_factory):
+    api = await auth_client_factory()
+    book_id = await _create_book(api)
+    await _seed_toc(api, book_id, [_chapter("ch1")])
+    url = f"{API}/{book_id}/chapters/ch1/content"
+
+    assert (await api.patch(url, json={"auto_update_metadata": True})).status_code == 422
+    both = await api.patch(url, json={"content": "a", "patch": [{"insert": "a"}]})
+    assert both.status_code == 422
+    no_hashes = await api.patch(url, json={"patch": [{"insert": "a"}]})
+    assert no_hashes.status_code == 422
+
+
 @pytest.mark.asyncio
 async def test_update_chapter_content_book_not_found(auth_client_factory):
     api = await auth_client_factory()
@@ -4,6 +4,7 @@ endpoints in ``app/api/endpoints/books.py``.
 
 Endpoints exercised (all under ``/api/v1/books/{book_id}/...``):
     POST   /{book_id}/chapters                       create_chapter
+    POST   /{book_id}/chapters/bulk                  create_chapters_bulk
     GET    /{book_id}/chapters/{chapter_id}          get_chapter
     PUT    /{book_id}/chapters/{chapter_id}          update_chapter
     DELETE /{book_id}/chapters/{chapter_id}          delete_chapter
@@ -184,6 +185,97 @@ async def test_create_chapter_missing_required_fields_returns_422(auth_client_fa
     assert resp.status_code == 422
 
 
+# --------------------------------------------------------------------------- #
+# create_chapters_bulk  (POST /{book_id}/chapters/bulk)
+# --------------------------------------------------------------------------- #
+
+
+@pytest.mark.asyncio
+async def test_create_chapters_bulk_outline(auth_client_factory):
+    api = await auth_client_factory()
+    book_id = await create_book(api)
+    await add_chapter(api, book_id, title="Existing")
+
+    resp = await api.post(
+        f"/api/v1/books/{book_id}/chapters/bulk",
+        json={"chapters": [
+            {"title": "Part One", "subchapters": [{"title": "1.1"}, {"title": "1.2"}]},
+            {"title": "   "},
+            {"title": "Part Two", "order": 9},
+        ]},
+    )
+
+    assert resp.status_code == 201, resp.text
+    body = resp.json()
+    assert body["created_count"] == 2
+    results = body["results"]
+    assert [r["index"] for r in results] == [0, 1, 2]
+    assert results[1] == {"index": 1, "success": False, "error": "Title must not be blank"}
+    assert len(results[0]["subchapter_ids"]) == 2
+
+    listed = (await api.get(f"/api/v1/books/{book_id}/toc")).json()["toc"]["chapters"]
+    assert [c["title"] for c in listed] == ["Existing", "Part One", "Part Two"]
+    assert [c["order"] for c in listed[1:]] == [2, 9]
+    assert [s["title"] for s in listed[1]["subchapters"]] == ["1.1", "1.2"]
+    assert listed[1]["id"] == results[0]["chapter_id"]
+
+
+@pytest.mark.asyncio
+async def test_create_chapters_bulk_under_parent(auth_client_factory):
+    api = await auth_client_factory()
+    book_id = await create_book(api)
+    parent_id = await add_chapter(api, book_id, title="Parent")
+
+    resp = await api.post(
+        f"/api/v1/books/{book_id}/chapters/bulk",
+        json={"parent_id": parent_id, "chapters": [
+            {"title": "A"},
+            {"title": "B", "subchapters": [{"title": "too deep"}]},
+        ]},
+    )
+
+    assert resp.status_code == 201, resp.text
+    assert [r["success"] for r in resp.json()["results"]] == [True, False]
+    got = await api.get(f"/api/v1/books/{book_id}/chapters/{parent_id}")
+    assert [s["title"] for s in got.json()["chapter"]["subchapters"]] == ["A"]
+
+
+@pytest.mark.asyncio
+async def test_create_chapters_bulk_errors(auth_client_factory):
+    api = await auth_client_factory()
+    book_id = await create_book(api)
+    url = f"/api/v1/books/{book_id}/chapters/bulk"
+
+    nothing_valid = await api.post(url, json={"chapters": [{"title": " "}]})
+    assert nothing_valid.status_code == 400
+    assert nothing_valid.json()["detail"]["results"][0]["success"] is False
+
+    bad_parent = await api.post(url, json={"parent_id": "ghost", "chapters": [{"title": "A"}]})
+    assert bad_parent.status_code == 400
+    assert bad_parent.json()["detail"] == "Parent chapter not found"
+
+    assert (await api.post(url, json={"chapters": []})).status_code == 422
+    missing = await api.post(
+        f"/api/v1/books/{ObjectId()}/chapters/bulk", json={"chapters": [{"title": "A"}]}
+    )
+    assert missing.status_code == 404
+
+    subchapters = [{"title": "S"}] * 201
+    too_many = await api.post(url, json={"chapters": [{"title": "A", "subchapters": subchapters}]})
+    assert too_many.status_code == 422
+    # Within both per-list caps, but over the total for one write.
+    outline = [{"title": f"C{i}", "subchapters": [{"title": "S"}] * 9} for i in range(60)]
+    too_big = await api.post(url, json={"chapters": outline})
+    assert too_big.status_code == 422
+
+    # Ownership is checked before the items are: a non-owner never sees the
+    # per-item report, even when nothing in the request is valid.
+    other = await make_other_user(auth_client_factory)
+    forbidden = await other.post(url, json={"chapters": [{"title": " "}]})
+    assert forbidden.status_code == 403
+    assert "Not authorized" in forbidden.json()["detail"]
+
+
 # --------------------------------------------------------------------------- #
 # get_chapter  (GET /{book_id}/chapters/{chapter_id})
 # --------------------------------------------------------------------------- #
@@ -91,6 +91,42 @@ async def test_list_user_books_pagination(auth_client_factory, test_book):
     assert len(resp.json()) == 1
 
 
+@pytest.mark.asyncio
+async def test_list_user_books_cursor_pagination(auth_client_factory, test_book):
+    api = await auth_client_factory()
+    created = [await _create_book(api, test_book) for _ in range(3)]
+
+    first = await api.get("/api/v1/books/?limit=2")
+    assert first.status_code == 200
+    cursor = first.headers["X-Next-Cursor"]
+
+    second = await api.get("/api/v1/books/", params={"limit": 2, "cursor": cursor})
+    assert second.status_code == 200
+    assert "X-Next-Cursor" not in second.headers  # short page: nothing after it
+
+    ids = [b["id"] for b in first.json() + second.json()]
+    assert sorted(ids) == sorted(created)
+
+
+@pytest.mark.asyncio
+async def test_list_user_books_invalid_cursor_400(auth_client_factory):
+    api = await auth_client_factory()
+    resp = await api.get("/api/v1/books/?cursor=garbage")
+    assert resp.status_code == 400
+
+
+@pytest.mark.asyncio
+async def test_list_user_books_includes_stats(auth_client_factory, test_book):
+    api = await auth_client_factory()
+    await _create_book(api, test_book)
+
+    resp = await api.get("/api/v1/books/")
+    assert resp.status_code == 200
+    stats = resp.json()[0]["stats"]
+    assert stats["total_chapters"] == 0
+    assert stats["status_counts"]["draft"] == 0
+
+
 @pytest.mark.asyncio
 async def test_list_user_books_only_owner_books(auth_client_factory, test_book):
     owner = await auth_client_factory()
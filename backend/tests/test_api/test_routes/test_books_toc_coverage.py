@@ -431,6 +431,22 @@ class TestGetToc:
         assert resp.status_code == 403
         assert "Not authorized" in resp.json()["detail"]
 
+    @pytest.mark.asyncio
+    async def test_matching_if_none_match_returns_304(self, auth_client_factory):
+        api = await auth_client_factory()
+        book_id = await _create_book(api)
+        url = f"/api/v1/books/{book_id}/toc"
+
+        etag = (await api.get(url)).headers["ETag"]
+        resp = await api.get(url, headers={"If-None-Match": etag})
+        assert resp.status_code == 304
+        assert resp.headers["ETag"] == etag
+
+        await api.put(url, json={"toc": {"chapters": [{"title": "New"}]}})
+        resp = await api.get(url, headers={"If-None-Match": etag})
+        assert resp.status_code == 200
+        assert resp.headers["ETag"] != etag
+
 
 # --------------------------------------------------------------------------- #
 # PUT /{book_id}/toc
@@ -464,6 +480,26 @@ class TestUpdateToc:
         get_resp = await api.get(f"/api/v1/books/{book_id}/toc")
         assert get_resp.json()["status"] == "edited"
 
+    @pytest.mark.asyncio
+    async def test_if_match_guards_the_write(self, auth_client_factory):
+        api = await auth_client_factory()
+        book_id = await _create_book(api)
+        url = f"/api/v1/books/{book_id}/toc"
+        etag = (await api.get(url)).headers["ETag"]
+
+        first = await api.put(
+            url, json={"toc": {"chapters": [{"title": "A"}]}}, headers={"If-Match": etag}
+        )
+        assert first.status_code == 200, first.text
+
+        # The tag now names a superseded version.
+        stale = await api.put(
+            url, json={"toc": {"chapters": [{"title": "B"}]}}, headers={"If-Match": etag}
+        )
+        assert stale.status_code == status.HTTP_412_PRECONDITION_FAILED
+        titles = [c["title"] for c in (await api.get(url)).json()["toc"]["chapters"]]
+        assert titles == ["A"]
+
     @pytest.mark.asyncio
     async def test_unwrapped_payload_is_rejected_and_preserves_toc(
         self, auth_client_factory
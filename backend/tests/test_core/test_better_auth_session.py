@@ -173,3 +173,72 @@ class TestGetUserFromSession:
              patch.object(bas, "get_better_auth_user", AsyncMock(return_value={"id": "u1", "email": "e@f.com"})):
             user = await bas.get_user_from_session(req)
         assert user["email"] == "e@f.com"
+
+
+def _aggregating_collection(docs):
+    """A session collection whose aggregate() yields ``docs`` in one round trip."""
+    coll = AsyncMock()
+    cursor = Mock()
+    cursor.to_list = AsyncMock(return_value=docs)
+    coll.aggregate = Mock(return_value=cursor)
+    return coll
+
+
+@pytest.mark.asyncio
+class TestResolveSessionUser:
+    async def test_unknown_token_returns_none(self):
+        coll = _aggregating_collection([])
+        with patch.object(bas, "get_collection", AsyncMock(return_value=coll)):
+            assert await bas.resolve_session_user("tok") is None
+
+    async def test_one_aggregation_returns_session_and_app_user(self):
+        now = datetime.now(timezone.utc)
+        coll = _aggregating_collection([{
+            "_id": "s1", "userId": "u1", "expiresAt": now + timedelta(hours=1),
+            "updatedAt": now, "user": {"auth_id": "u1", "email": "a@b.com"},
+        }])
+        with patch.object(bas, "get_collection", AsyncMock(return_value=coll)):
+            result = await bas.resolve_session_user("tok")
+        assert result["user"]["auth_id"] == "u1"
+        assert result["auth_user"] is None
+        assert result["session"]["userId"] == "u1"
+        coll.aggregate.assert_called_once()
+        # Activity was touched moments ago: no write round trip.
+        coll.update_one.assert_not_awaited()
+
+    async def test_stale_activity_is_touched(self):
+        now = datetime.now(timezone.utc)
+        coll = _aggregating_collection([{
+            "_id": "s1", "userId": "u1", "expiresAt": now + timedelta(hours=1),
+            "updatedAt": now - timedelta(hours=1), "user": {"auth_id": "u1"},
+        }])
+        with patch.object(bas, "get_collection", AsyncMock(return_value=coll)):
+            await bas.resolve_session_user("tok")
+        coll.update_one.assert_awaited_once()
+
+    async def test_better_auth_user_only_when_app_user_missing(self):
+        coll = _aggregating_collection([{
+            "_id": "s1", "userId": "u1",
+            "expiresAt": datetime.now(timezone.utc) + timedelta(hours=1),
+            "auth_user": {"email": "new@b.com", "name": "New User"},
+        }])
+        with patch.object(bas, "get_collection", AsyncMock(return_value=coll)):
+            result = await bas.resolve_session_user("tok")
+        assert result["user"] is None
+        assert result["auth_user"]["email"] == "new@b.com"
+
+    async def test_expired_session_deleted_and_rejected(self):
+        coll = _aggregating_collection([{
+            "_id": "s1", "userId": "u1",
+            "expiresAt": datetime.now(timezone.utc) - timedelta(hours=1),
+            "user": {"auth_id": "u1"},
+        }])
+        with patch.object(bas, "get_collection", AsyncMock(return_value=coll)):
+            assert await bas.resolve_session_user("tok") is None
+        coll.delete_one.assert_awaited_once()
+
+    async def test_undated_session_rejected(self):
+        coll = _aggregating_collection([{"_id": "s1", "userId": "u1", "user": {"auth_id": "u1"}}])
+        with patch.object(bas, "get_collection", AsyncMock(return_value=coll)):
+            assert await bas.resolve_session_user("tok") is None
+        coll.update_one.assert_not_awaited()
@@ -3,7 +3,9 @@
 from app.core.entitlements import (
     AI_FEATURES,
     DEFAULT_PLAN,
+    PLAN_AI_QUOTAS,
     PLAN_ENTITLEMENTS,
+    ai_quota_limits,
     is_feature_allowed,
 )
 
@@ -67,3 +69,23 @@ class TestStripePricePlanResolution:
         assert PLAN_ENTITLEMENTS["pro"] == frozenset({"*"})
         for feature in AI_FEATURES:
             assert is_feature_allowed("pro", feature) is True
+
+
+def test_ai_quota_limits_default_to_settings():
+    from app.core.config import settings
+
+    assert ai_quota_limits(None) == {
+        "hour": settings.AI_QUOTA_HOURLY_LIMIT,
+        "day": settings.AI_QUOTA_DAILY_LIMIT,
+        "month": settings.AI_QUOTA_MONTHLY_LIMIT,
+    }
+
+
+def test_ai_quota_limits_plan_override_is_partial():
+    from unittest.mock import patch
+    from app.core.config import settings
+
+    with patch.dict(PLAN_AI_QUOTAS, {"pro": {"day": 999}}):
+        limits = ai_quota_limits("pro")
+    assert limits["day"] == 999
+    assert limits["month"] == settings.AI_QUOTA_MONTHLY_LIMIT
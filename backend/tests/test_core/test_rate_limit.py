@@ -0,0 +1,87 @@
+"""Tests for the per-worker rate-limit store and its batched Mongo reconcile (app/core/rate_limit.py)."""
+
+import pytest
+from unittest.mock import AsyncMock, patch
+
+from app.core import rate_limit
+from app.core.rate_limit import RateLimitStore, sliding_window_count
+from app.db.base import get_collection
+
+NOW = 1_000_000.0
+
+
+def test_hit_counts_locally_without_io():
+    store = RateLimitStore(sync_interval=1)
+    with patch.object(rate_limit, "bulk_increment_usage", AsyncMock()) as bulk:
+        counts = [store.hit("u1", "rl:/p:0", NOW, 120) for _ in range(3)]
+    assert counts == [1, 2, 3]
+    bulk.assert_not_called()
+    assert store.stats()["pending"] == 3
+
+
+def test_expired_buckets_are_pruned():
+    store = RateLimitStore(sync_interval=1)
+    store.hit("u1", "rl:/p:0", NOW, 120)
+    store._buckets["u1:rl:/p:0"].pending = 0  # as if flushed
+    store.hit("u1", "rl:/p:60", NOW + 600, 120)
+    assert store.stats()["buckets"] == 1
+
+
+def test_sliding_window_weights_previous_window():
+    store = RateLimitStore(sync_interval=1)
+    for _ in range(4):
+        store.hit("u1", "rl:/p:0", 30.0, 120)
+    # 15s into [60, 120): the previous window still overlaps by 3/4.
+    count, reset_at = sliding_window_count(store, "u1", "/p", 75.0, 60)
+    assert count == 1 + 4 * 0.75
+    assert reset_at == 120
+
+
+@pytest.mark.asyncio
+async def test_reconcile_flushes_in_one_bulk_write(motor_reinit_db):
+    store = RateLimitStore(sync_interval=1)
+    for _ in range(3):
+        store.hit("u1", "rl:/p:0", NOW, 120)
+    store.hit("u2", "rl:/p:0", NOW, 120)
+
+    await store.reconcile()
+
+    coll = await get_collection("usage_counters")
+    assert (await coll.find_one({"_id": "u1:rl:/p:0"}))["count"] == 3
+    assert (await coll.find_one({"_id": "u2:rl:/p:0"}))["count"] == 1
+    assert store.stats()["pending"] == 0
+    # The flushed admissions still count locally, now as the shared total.
+    assert store.hit("u1", "rl:/p:0", NOW, 120) == 4
+
+
+@pytest.mark.asyncio
+async def test_reconcile_learns_other_workers_counts(motor_reinit_db):
+    worker1 = RateLimitStore(sync_interval=1)
+    worker2 = RateLimitStore(sync_interval=1)
+    worker1.hit("u1", "rl:/p:0", NOW, 120)
+    worker1.hit("u1", "rl:/p:0", NOW, 120)
+    worker2.hit("u1", "rl:/p:0", NOW, 120)
+
+    await worker1.reconcile()
+    await worker2.reconcile()
+
+    assert worker2.hit("u1", "rl:/p:0", NOW, 120) == 4
+
+
+@pytest.mark.asyncio
+async def test_failed_reconcile_keeps_deltas_and_fails_closed():
+    store = RateLimitStore(sync_interval=1)
+    store.hit("u1", "rl:/p:0", NOW, 120)
+    with patch.object(
+        rate_limit, "bulk_increment_usage", AsyncMock(side_effect=RuntimeError("down"))
+    ):
+        with pytest.raises(RuntimeError):
+            await store.reconcile()
+    assert store.failed
+    assert store.stats()["pending"] == 1
+
+    with patch.object(rate_limit, "bulk_increment_usage", AsyncMock(return_value={"u1:rl:/p:0": 1})) as bulk:
+        await store.reconcile()
+    assert not store.failed
+    (increments,), _ = bulk.call_args
+    assert [(i[0], i[2]) for i in increments] == [("u1:rl:/p:0", 1)]
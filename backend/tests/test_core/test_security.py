@@ -8,6 +8,7 @@ that used to live here had no production callers and were removed with #342.
 """
 
 import pytest
+from datetime import datetime, timedelta, timezone
 from unittest.mock import Mock, patch, PropertyMock
 from fastapi import HTTPException, Request
 
@@ -18,6 +19,14 @@ from app.core.security import (
 )
 
 
+def _session_request(cookies: dict = None) -> Mock:
+    """A Request stand-in with a real cookie mapping (the auth path reads the
+    session token from it before anything else)."""
+    req = Mock(spec=Request)
+    req.cookies = cookies or {}
+    return req
+
+
 @pytest.mark.asyncio
 class TestSessionRoleChecker:
     """Test session-based role access control"""
@@ -70,6 +79,17 @@ class TestSessionRoleChecker:
         assert result["auth_id"] == "test-auth-id"
 
 
+def _resolved(user=None, auth_user=None, **session):
+    """A resolve_session_user result: one aggregation's worth of session + users."""
+    session.setdefault("_id", "s1")
+    session.setdefault("userId", "user_123")
+    session.setdefault("expiresAt", datetime.now(timezone.utc) + timedelta(hours=1))
+    return {"session": session, "user": user, "auth_user": auth_user}
+
+
+_SIGNED_IN = {"better-auth.session_token": "tok"}
+
+
 @pytest.mark.asyncio
 class TestGetCurrentUserFromSession:
     """Test get_current_user_from_session authentication function"""
@@ -86,14 +106,27 @@ class TestGetCurrentUserFromSession:
         assert result["email"] == "test@example.com"
         assert result["role"] == "user"
 
-    @patch("app.core.security.validate_better_auth_session")
+    @patch("app.core.security.resolve_session_user")
     @patch("app.core.config.settings")
-    async def test_get_current_user_from_session_no_session(self, mock_settings, mock_validate):
+    async def test_get_current_user_from_session_no_cookie(self, mock_settings, mock_resolve):
+        """No session cookie is a 401 without touching the database."""
+        mock_settings.BYPASS_AUTH = False
+
+        with pytest.raises(HTTPException) as exc_info:
+            await get_current_user_from_session(_session_request())
+
+        assert exc_info.value.status_code == 401
+        assert "Not authenticated" in exc_info.value.detail
+        mock_resolve.assert_not_awaited()
+
+    @patch("app.core.security.resolve_session_user")
+    @patch("app.core.config.settings")
+    async def test_get_current_user_from_session_no_session(self, mock_settings, mock_resolve):
         """Test get_current_user_from_session without valid session"""
         mock_settings.BYPASS_AUTH = False
-        mock_validate.return_value = None
+        mock_resolve.return_value = None
 
-        mock_request = Mock(spec=Request)
+        mock_request = _session_request(_SIGNED_IN)
 
         with pytest.raises(HTTPException) as exc_info:
             await get_current_user_from_session(mock_request)
@@ -101,41 +134,38 @@ class TestGetCurrentUserFromSession:
         assert exc_info.value.status_code == 401
         assert "Not authenticated" in exc_info.value.detail
 
-    @patch("app.core.security.validate_better_auth_session")
     @patch("app.core.security.get_better_auth_user")
-    @patch("app.db.user.get_user_by_auth_id")
+    @patch("app.core.security.resolve_session_user")
     @patch("app.core.config.settings")
     async def test_get_current_user_from_session_valid_session(
-        self, mock_settings, mock_get_user, mock_get_auth_user, mock_validate
+        self, mock_settings, mock_resolve, mock_get_auth_user
     ):
-        """Test get_current_user_from_session with valid session"""
+        """A known user resolves in the single aggregation; the better-auth
+        user is never fetched separately."""
         mock_settings.BYPASS_AUTH = False
-        mock_validate.return_value = {"userId": "user_123"}
-        mock_get_auth_user.return_value = {"id": "user_123", "email": "test@example.com"}
-        mock_get_user.return_value = {
-            "auth_id": "user_123",
-            "email": "test@example.com",
-            "role": "user"
-        }
+        mock_resolve.return_value = _resolved(
+            user={"auth_id": "user_123", "email": "test@example.com", "role": "user"}
+        )
 
-        mock_request = Mock(spec=Request)
+        mock_request = _session_request({"better-auth.session_token": "tok.signature"})
 
         result = await get_current_user_from_session(mock_request)
 
         assert result["auth_id"] == "user_123"
         assert result["email"] == "test@example.com"
+        mock_resolve.assert_awaited_once_with("tok")
+        mock_get_auth_user.assert_not_awaited()
 
-    @patch("app.core.security.validate_better_auth_session")
+    @patch("app.core.security.resolve_session_user")
     @patch("app.core.config.settings")
     async def test_get_current_user_from_session_no_user_id_in_session(
-        self, mock_settings, mock_validate
+        self, mock_settings, mock_resolve
     ):
         """Test get_current_user_from_session when session has no userId"""
         mock_settings.BYPASS_AUTH = False
-        # Return a truthy session dict but without userId
-        mock_validate.return_value = {"token": "some-token", "expiresAt": "2025-12-25"}
+        mock_resolve.return_value = _resolved(userId=None)
 
-        mock_request = Mock(spec=Request)
+        mock_request = _session_request(_SIGNED_IN)
 
         with pytest.raises(HTTPException) as exc_info:
             await get_current_user_from_session(mock_request)
@@ -143,23 +173,18 @@ class TestGetCurrentUserFromSession:
         assert exc_info.value.status_code == 401
         assert "Invalid session" in exc_info.value.detail
 
-    @patch("app.core.security.validate_better_auth_session")
     @patch("app.core.security.get_better_auth_user")
-    @patch("app.db.user.get_user_by_auth_id")
+    @patch("app.core.security.resolve_session_user")
     @patch("app.db.user.create_user")
     @patch("app.core.config.settings")
     async def test_get_current_user_from_session_auto_creates_user(
-        self, mock_settings, mock_create_user, mock_get_user, mock_get_auth_user, mock_validate
+        self, mock_settings, mock_create_user, mock_resolve, mock_get_auth_user
     ):
         """Test get_current_user_from_session auto-creates user when not in database"""
         mock_settings.BYPASS_AUTH = False
-        mock_validate.return_value = {"userId": "user_123"}
-        mock_get_auth_user.return_value = {
-            "id": "user_123",
-            "email": "test@example.com",
-            "name": "Test User"
-        }
-        mock_get_user.return_value = None  # User not in backend database
+        mock_resolve.return_value = _resolved(
+            user=None, auth_user={"email": "test@example.com", "name": "Test User"}
+        )
         created_user = {
             "id": "new_user_id",
             "auth_id": "user_123",
@@ -169,102 +194,107 @@ class TestGetCurrentUserFromSession:
         }
         mock_create_user.return_value = created_user
 
-        mock_request = Mock(spec=Request)
+        mock_request = _session_request(_SIGNED_IN)
 
         result = await get_current_user_from_session(mock_request)
 
         assert result == created_user
         mock_create_user.assert_called_once()
+        assert mock_create_user.call_args.args[0]["first_name"] == "Test"
+        # The aggregation already carried the better-auth email/name.
+        mock_get_auth_user.assert_not_awaited()
 
-    @patch("app.core.security.validate_better_auth_session")
     @patch("app.core.security.get_better_auth_user")
-    @patch("app.db.user.get_user_by_auth_id")
+    @patch("app.core.security.resolve_session_user")
+    @patch("app.db.user.create_user")
     @patch("app.core.config.settings")
-    async def test_get_current_user_from_session_db_error(
-        self, mock_settings, mock_get_user, mock_get_auth_user, mock_validate
+    async def test_auto_create_falls_back_to_better_auth_user_lookup(
+        self, mock_settings, mock_create_user, mock_resolve, mock_get_auth_user
     ):
-        """DB error while fetching the application user surfaces as a 500."""
+        """String-id better-auth deployments miss the aggregation's _id lookup;
+        only then does the auto-create branch fetch the better-auth user."""
         mock_settings.BYPASS_AUTH = False
-        mock_validate.return_value = {"userId": "user_123"}
+        mock_resolve.return_value = _resolved(user=None, auth_user=None)
         mock_get_auth_user.return_value = {"id": "user_123", "email": "test@example.com"}
-        mock_get_user.side_effect = Exception("connection lost")
+        mock_create_user.return_value = {"auth_id": "user_123", "email": "test@example.com"}
+
+        result = await get_current_user_from_session(_session_request(_SIGNED_IN))
+
+        assert result["auth_id"] == "user_123"
+        mock_get_auth_user.assert_awaited_once_with("user_123")
+
+    @patch("app.core.security.resolve_session_user")
+    @patch("app.core.config.settings")
+    async def test_get_current_user_from_session_db_error(self, mock_settings, mock_resolve):
+        """DB error while resolving the session surfaces as a 500."""
+        mock_settings.BYPASS_AUTH = False
+        mock_resolve.side_effect = Exception("connection lost")
 
         with pytest.raises(HTTPException) as exc_info:
-            await get_current_user_from_session(Mock(spec=Request))
+            await get_current_user_from_session(_session_request(_SIGNED_IN))
 
         assert exc_info.value.status_code == 500
         assert "Error fetching user" in exc_info.value.detail
 
-    @patch("app.core.security.validate_better_auth_session")
     @patch("app.core.security.get_better_auth_user")
-    @patch("app.db.user.get_user_by_auth_id")
+    @patch("app.core.security.resolve_session_user")
     @patch("app.core.config.settings")
     async def test_get_current_user_from_session_unknown_user(
-        self, mock_settings, mock_get_user, mock_get_auth_user, mock_validate
+        self, mock_settings, mock_resolve, mock_get_auth_user
     ):
         """Valid session but user missing from both backend and better-auth -> 401."""
         mock_settings.BYPASS_AUTH = False
-        mock_validate.return_value = {"userId": "user_123"}
-        mock_get_user.return_value = None
+        mock_resolve.return_value = _resolved(user=None, auth_user=None)
         mock_get_auth_user.return_value = None
 
         with pytest.raises(HTTPException) as exc_info:
-            await get_current_user_from_session(Mock(spec=Request))
+            await get_current_user_from_session(_session_request(_SIGNED_IN))
 
         assert exc_info.value.status_code == 401
         assert "User not found" in exc_info.value.detail
 
-    @patch("app.core.security.validate_better_auth_session")
     @patch("app.core.security.get_better_auth_user")
-    @patch("app.db.user.get_user_by_auth_id")
+    @patch("app.core.security.resolve_session_user")
     @patch("app.core.config.settings")
     async def test_get_current_user_from_session_auto_create_missing_email(
-        self, mock_settings, mock_get_user, mock_get_auth_user, mock_validate
+        self, mock_settings, mock_resolve, mock_get_auth_user
     ):
         """Auto-create aborts with 400 when better-auth user has no email."""
         mock_settings.BYPASS_AUTH = False
-        mock_validate.return_value = {"userId": "user_123"}
-        mock_get_user.return_value = None
+        mock_resolve.return_value = _resolved(user=None, auth_user=None)
         mock_get_auth_user.return_value = {"id": "user_123", "name": "No Email"}
 
         with pytest.raises(HTTPException) as exc_info:
-            await get_current_user_from_session(Mock(spec=Request))
+            await get_current_user_from_session(_session_request(_SIGNED_IN))
 
         assert exc_info.value.status_code == 400
         assert "missing email" in exc_info.value.detail
 
-    @patch("app.core.security.validate_better_auth_session")
-    @patch("app.core.security.get_better_auth_user")
-    @patch("app.db.user.get_user_by_auth_id")
+    @patch("app.core.security.resolve_session_user")
     @patch("app.db.user.create_user")
     @patch("app.core.config.settings")
     async def test_get_current_user_from_session_auto_create_failure(
-        self, mock_settings, mock_create_user, mock_get_user, mock_get_auth_user, mock_validate
+        self, mock_settings, mock_create_user, mock_resolve
     ):
         """A failure during auto-create surfaces as a 500."""
         mock_settings.BYPASS_AUTH = False
-        mock_validate.return_value = {"userId": "user_123"}
-        mock_get_user.return_value = None
-        mock_get_auth_user.return_value = {
-            "id": "user_123",
-            "email": "test@example.com",
-            "name": "Test User",
-        }
+        mock_resolve.return_value = _resolved(
+            user=None, auth_user={"email": "test@example.com", "name": "Test User"}
+        )
         mock_create_user.side_effect = Exception("insert failed")
 
         with pytest.raises(HTTPException) as exc_info:
-            await get_current_user_from_session(Mock(spec=Request))
+            await get_current_user_from_session(_session_request(_SIGNED_IN))
 
         assert exc_info.value.status_code == 500
         assert "Failed to create user account" in exc_info.value.detail
 
-    @patch("app.core.security.validate_better_auth_session")
-    @patch("app.core.security.get_better_auth_user")
-    @patch("app.db.user.get_user_by_auth_id")
+    @patch("app.core.security.resolve_session_user")
+    @patch("app.db.user.get_auth_user_by_auth_id")
     @patch("app.db.user.create_user")
     @patch("app.core.config.settings")
     async def test_get_current_user_from_session_auto_create_race_reuses_winner(
-        self, mock_settings, mock_create_user, mock_get_user, mock_get_auth_user, mock_validate
+        self, mock_settings, mock_create_user, mock_get_user, mock_resolve
     ):
         """Concurrent first-load race (issue #178): create_user raises
         DuplicateKeyError because a parallel request already inserted; the path
@@ -278,49 +308,99 @@ class TestGetCurrentUserFromSession:
             "first_name": "Test",
         }
         mock_settings.BYPASS_AUTH = False
-        mock_validate.return_value = {"userId": "user_123"}
-        mock_get_auth_user.return_value = {
-            "id": "user_123",
-            "email": "test@example.com",
-            "name": "Test User",
-        }
-        # First call (pre-check) finds nothing; re-fetch after the race returns the winner.
-        mock_get_user.side_effect = [None, winner]
+        # The aggregation found no app user; the re-fetch after the race returns the winner.
+        mock_resolve.return_value = _resolved(
+            user=None, auth_user={"email": "test@example.com", "name": "Test User"}
+        )
+        mock_get_user.return_value = winner
         mock_create_user.side_effect = DuplicateKeyError("dup auth_id")
 
-        result = await get_current_user_from_session(Mock(spec=Request))
+        result = await get_current_user_from_session(_session_request(_SIGNED_IN))
 
         assert result == winner
 
-    @patch("app.core.security.validate_better_auth_session")
-    @patch("app.core.security.get_better_auth_user")
-    @patch("app.db.user.get_user_by_auth_id")
+    @patch("app.core.security.resolve_session_user")
+    @patch("app.db.user.get_auth_user_by_auth_id")
     @patch("app.db.user.create_user")
     @patch("app.core.config.settings")
     async def test_get_current_user_from_session_auto_create_race_missing_winner(
-        self, mock_settings, mock_create_user, mock_get_user, mock_get_auth_user, mock_validate
+        self, mock_settings, mock_create_user, mock_get_user, mock_resolve
     ):
         """If the duplicate was on some other key (no auth_id winner to re-fetch),
         the race handler surfaces a 500 rather than returning None."""
         from pymongo.errors import DuplicateKeyError
 
         mock_settings.BYPASS_AUTH = False
-        mock_validate.return_value = {"userId": "user_123"}
-        mock_get_auth_user.return_value = {
-            "id": "user_123",
-            "email": "test@example.com",
-            "name": "Test User",
-        }
-        mock_get_user.side_effect = [None, None]  # pre-check + re-fetch both empty
+        mock_resolve.return_value = _resolved(
+            user=None, auth_user={"email": "test@example.com", "name": "Test User"}
+        )
+        mock_get_user.return_value = None  # re-fetch finds nothing either
         mock_create_user.side_effect = DuplicateKeyError("dup email")
 
         with pytest.raises(HTTPException) as exc_info:
-            await get_current_user_from_session(Mock(spec=Request))
+            await get_current_user_from_session(_session_request(_SIGNED_IN))
 
         assert exc_info.value.status_code == 500
         assert "Failed to create user account" in exc_info.value.detail
 
 
+@pytest.mark.asyncio
+class TestSessionUserCacheOnAuthPath:
+    """The session token -> user cache (app.core.session_cache) on the auth path."""
+
+    @pytest.fixture(autouse=True)
+    def _fresh_cache(self):
+        from app.core.session_cache import session_user_cache
+
+        session_user_cache.clear()
+        yield session_user_cache
+        session_user_cache.clear()
+
+    @patch("app.core.security.resolve_session_user")
+    @patch("app.core.config.settings")
+    async def test_second_request_resolves_with_no_db_calls(self, mock_settings, mock_resolve):
+        mock_settings.BYPASS_AUTH = False
+        mock_resolve.return_value = _resolved(
+            user={"auth_id": "user_123", "email": "test@example.com"}
+        )
+        request = _session_request({"better-auth.session_token": "tok.sig"})
+
+        first = await get_current_user_from_session(request)
+        second = await get_current_user_from_session(request)
+
+        assert first == second
+        assert mock_resolve.await_count == 1
+
+    @patch("app.core.security.resolve_session_user")
+    @patch("app.core.config.settings")
+    async def test_invalidate_user_forces_a_fresh_lookup(
+        self, mock_settings, mock_resolve, _fresh_cache
+    ):
+        """A plan change evicts the user, so the next request sees the new plan."""
+        mock_settings.BYPASS_AUTH = False
+        mock_resolve.side_effect = [
+            _resolved(user={"auth_id": "user_123", "plan": "free"}),
+            _resolved(user={"auth_id": "user_123", "plan": "pro"}),
+        ]
+        request = _session_request(_SIGNED_IN)
+
+        assert (await get_current_user_from_session(request))["plan"] == "free"
+        _fresh_cache.invalidate_user("user_123")
+        assert (await get_current_user_from_session(request))["plan"] == "pro"
+
+    @patch("app.core.security.resolve_session_user")
+    @patch("app.core.config.settings")
+    async def test_rejected_session_is_not_cached(self, mock_settings, mock_resolve, _fresh_cache):
+        mock_settings.BYPASS_AUTH = False
+        mock_resolve.return_value = None
+        request = _session_request(_SIGNED_IN)
+
+        with pytest.raises(HTTPException):
+            await get_current_user_from_session(request)
+
+        assert _fresh_cache.stats()["size"] == 0
+
+
 @pytest.mark.asyncio
 class TestOptionalSessionSecurity:
     """Test optional session security dependency"""
@@ -0,0 +1,82 @@
+"""Tests for the per-worker session token -> user cache (app/core/session_cache.py)."""
+
+from datetime import datetime, timedelta, timezone
+from unittest.mock import patch
+
+from app.core import session_cache
+from app.core.session_cache import SessionUserCache
+
+
+def _user(auth_id="u1", **extra):
+    return {"auth_id": auth_id, "email": f"{auth_id}@example.com", "plan": "free", **extra}
+
+
+def test_miss_then_hit_counts():
+    cache = SessionUserCache(max_entries=10, ttl_seconds=60)
+    assert cache.get("tok") is None
+    cache.put("tok", _user())
+    assert cache.get("tok")["auth_id"] == "u1"
+    assert cache.stats()["hits"] == 1
+    assert cache.stats()["misses"] == 1
+
+
+def test_get_returns_a_copy():
+    """A handler mutating current_user must not leak into the next request."""
+    cache = SessionUserCache(max_entries=10, ttl_seconds=60)
+    cache.put("tok", _user())
+    cache.get("tok")["plan"] = "pro"
+    assert cache.get("tok")["plan"] == "free"
+
+
+def test_entry_expires_after_ttl():
+    cache = SessionUserCache(max_entries=10, ttl_seconds=60)
+    with patch.object(session_cache.time, "time", return_value=1000.0):
+        cache.put("tok", _user())
+    with patch.object(session_cache.time, "time", return_value=1061.0):
+        assert cache.get("tok") is None
+    assert cache.stats()["size"] == 0
+
+
+def test_entry_never_outlives_the_session():
+    cache = SessionUserCache(max_entries=10, ttl_seconds=3600)
+    expires = datetime.now(timezone.utc) + timedelta(seconds=5)
+    cache.put("tok", _user(), session_expires_at=expires)
+    later = expires.timestamp() + 1
+    with patch.object(session_cache.time, "time", return_value=later):
+        assert cache.get("tok") is None
+
+
+def test_already_expired_session_is_not_cached():
+    cache = SessionUserCache(max_entries=10, ttl_seconds=60)
+    cache.put("tok", _user(), datetime.now(timezone.utc) - timedelta(seconds=1))
+    assert cache.stats()["size"] == 0
+
+
+def test_lru_eviction_at_capacity():
+    cache = SessionUserCache(max_entries=2, ttl_seconds=60)
+    cache.put("a", _user("ua"))
+    cache.put("b", _user("ub"))
+    cache.get("a")  # a is now most recently used
+    cache.put("c", _user("uc"))
+    assert cache.get("b") is None
+    assert cache.get("a") is not None
+    assert cache.get("c") is not None
+    assert cache.stats()["evictions"] == 1
+
+
+def test_invalidate_user_drops_every_token_for_that_user():
+    cache = SessionUserCache(max_entries=10, ttl_seconds=60)
+    cache.put("laptop", _user("u1"))
+    cache.put("phone", _user("u1"))
+    cache.put("other", _user("u2"))
+    cache.invalidate_user("u1")
+    assert cache.get("laptop") is None
+    assert cache.get("phone") is None
+    assert cache.get("other") is not None
+
+
+def test_zero_ttl_disables_cache():
+    cache = SessionUserCache(max_entries=10, ttl_seconds=0)
+    cache.put("tok", _user())
+    assert cache.get("tok") is None
+    assert cache.stats()["size"] == 0
@@ -1,5 +1,7 @@
 """Test audit log functionality"""
 
+import asyncio
+
 import pytest
 from app.db.audit_log import create_audit_log
 from unittest.mock import AsyncMock, patch
@@ -51,3 +53,82 @@ async def test_create_audit_log():
 
         # Verify insert_one was called twice
         assert mock_collection.insert_one.call_count == 2
+
+
+def _writer(**kwargs):
+    from app.db.audit_log import AuditLogWriter
+
+    opts = {"max_queue": 100, "batch_size": 50, "flush_interval": 60}
+    opts.update(kwargs)
+    return AuditLogWriter(**opts)
+
+
+def _log(action="book_update"):
+    return {"action": action, "actor_id": "u1", "target_id": "b1", "resource_type": "book"}
+
+
+@pytest.mark.asyncio
+class TestAuditLogWriter:
+    async def test_running_writer_queues_instead_of_inserting(self):
+        mock_collection = AsyncMock()
+        writer = _writer()
+        with patch("app.db.audit_log.audit_logs_collection", mock_collection), \
+             patch("app.db.audit_log.audit_log_writer", writer):
+            writer.start()
+            for _ in range(3):
+                await create_audit_log(**_log())
+            mock_collection.insert_one.assert_not_called()
+            assert writer.stats()["queue_depth"] == 3
+
+            await writer.stop()  # drains
+
+        mock_collection.insert_many.assert_awaited_once()
+        assert len(mock_collection.insert_many.call_args.args[0]) == 3
+        assert writer.stats()["written"] == 3
+
+    async def test_flushes_when_batch_is_full(self):
+        mock_collection = AsyncMock()
+        writer = _writer(batch_size=2)
+        with patch("app.db.audit_log.audit_logs_collection", mock_collection), \
+             patch("app.db.audit_log.audit_log_writer", writer):
+            writer.start()
+            await create_audit_log(**_log())
+            await create_audit_log(**_log())
+            for _ in range(20):
+                await asyncio.sleep(0)
+            mock_collection.insert_many.assert_awaited_once()
+            await writer.stop()
+
+    async def test_durable_and_session_writes_stay_inline(self):
+        mock_collection = AsyncMock()
+        writer = _writer()
+        with patch("app.db.audit_log.audit_logs_collection", mock_collection), \
+             patch("app.db.audit_log.audit_log_writer", writer):
+            writer.start()
+            await create_audit_log(**_log("user_delete"), durable=True)
+            await create_audit_log(**_log(), session=object())
+            assert mock_collection.insert_one.await_count == 2
+            assert writer.stats()["enqueued"] == 0
+            await writer.stop()
+
+    async def test_full_queue_drops_and_counts(self):
+        writer = _writer(max_queue=1)
+        with patch("app.db.audit_log.audit_logs_collection", AsyncMock()), \
+             patch("app.db.audit_log.audit_log_writer", writer):
+            writer.start()
+            await create_audit_log(**_log())
+            await create_audit_log(**_log())
+            assert writer.stats()["dropped"] == 1
+            await writer.stop()
+
+    async def test_failed_batch_is_counted_not_raised(self):
+        mock_collection = AsyncMock()
+        mock_collection.insert_many.side_effect = RuntimeError("mongo down")
+        writer = _writer()
+        with patch("app.db.audit_log.audit_logs_collection", mock_collection), \
+             patch("app.db.audit_log.audit_log_writer", writer):
+            writer.start()
+            await create_audit_log(**_log())
+            await writer.stop()
+        assert writer.stats()["write_failures"] == 1
+        assert writer.stats()["written"] == 0
@@ -0,0 +1,148 @@
+"""Tests for the per-worker book metadata cache (app/db/book_cache.py).
+
+The ``BookCache`` unit tests run without a database. The read-through tests use
+a real local MongoDB (via ``motor_reinit_db``) and watch which projection each
+``find_one`` asks for, to tell a revalidation from a full structure read.
+"""
+
+from datetime import datetime, timezone
+
+import pytest
+from bson import ObjectId
+
+import app.db.book as bookdao
+import app.db.toc_transactions as tx
+from app.db.book_cache import VALIDATOR_PROJECTION, BookCache, book_cache
+
+OWNER = "owner-auth-cache"
+
+
+def _book(version=1, updated_at="t1"):
+    return {
+        "_id": "b",
+        "title": "T",
+        "updated_at": updated_at,
+        "table_of_contents": {"version": version, "chapters": [{"id": "c1"}]},
+    }
+
+
+def test_hit_requires_matching_validator():
+    cache = BookCache(max_entries=10)
+    cache.put("b", _book())
+
+    assert cache.get("b", (1, "t1"))["title"] == "T"
+    assert cache.get("b", (2, "t1")) is None  # version moved on
+    assert not cache.has("b")  # the stale copy was dropped
+    assert cache.stats()["hits"] == 1
+    assert cache.stats()["stale"] == 1
+    assert cache.stats()["misses"] == 2
+
+
+def test_get_returns_a_copy():
+    """Handlers mutate the TOC they read; that must not reach the cache."""
+    cache = BookCache(max_entries=10)
+    cache.put("b", _book())
+
+    cache.get("b", (1, "t1"))["table_of_contents"]["chapters"][0]["status"] = "x"
+
+    assert "status" not in cache.get("b", (1, "t1"))["table_of_contents"]["chapters"][0]
+
+
+def test_lru_eviction_at_capacity():
+    cache = BookCache(max_entries=2)
+    cache.put("a", _book())
+    cache.put("b", _book())
+    cache.get("a", (1, "t1"))  # a is now most recently used
+    cache.put("c", _book())
+
+    assert cache.has("a") and cache.has("c")
+    assert not cache.has("b")
+    assert cache.stats()["evictions"] == 1
+
+
+def test_zero_entries_disables_cache():
+    cache = BookCache(max_entries=0)
+    cache.put("b", _book())
+
+    assert not cache.has("b")
+    assert cache.stats()["size"] == 0
+
+
+async def _seed():
+    doc = {
+        "_id": ObjectId(),
+        "owner_id": OWNER,
+        "title": "T",
+        "updated_at": datetime.now(timezone.utc),
+        "table_of_contents": {"version": 1, "chapters": [{"id": "c1", "title": "C1"}]},
+    }
+    await bookdao.books_collection.insert_one(doc)
+    return str(doc["_id"])
+
+
+@pytest.fixture
+def find_one_projections(monkeypatch):
+    projections = []
+    real_find_one = bookdao.books_collection.find_one
+
+    async def recording_find_one(filter, projection=None, *args, **kwargs):
+        projections.append(projection)
+        return await real_find_one(filter, projection, *args, **kwargs)
+
+    monkeypatch.setattr(bookdao.books_collection, "find_one", recording_find_one)
+    return projections
+
+
+@pytest.mark.asyncio
+async def test_repeat_read_only_revalidates(motor_reinit_db, find_one_projections):
+    book_id = await _seed()
+
+    first = await bookdao.get_book_metadata_by_id(book_id)
+    second = await bookdao.get_book_metadata_by_id(book_id)
+
+    assert second == first
+    assert find_one_projections == [
+        bookdao.CONTENT_EXCLUDING_PROJECTION,
+        VALIDATOR_PROJECTION,
+    ]
+    assert book_cache.stats()["hits"] == 1
+
+
+@pytest.mark.asyncio
+async def test_change_by_another_writer_is_reread(motor_reinit_db):
+    book_id = await _seed()
+    await bookdao.get_book_metadata_by_id(book_id)
+
+    # A write this worker did not make (another worker, a script) — only the
+    # validator can notice it.
+    await bookdao.books_collection.update_one(
+        {"_id": ObjectId(book_id)},
+        {"$set": {"title": "Renamed", "updated_at": datetime.now(timezone.utc)}},
+    )
+
+    book = await bookdao.get_book_metadata_by_id(book_id)
+    assert book["title"] == "Renamed"
+    assert book_cache.stats()["stale"] == 1
+
+
+@pytest.mark.asyncio
+async def test_own_writes_invalidate(motor_reinit_db):
+    book_id = await _seed()
+    await bookdao.get_book_metadata_by_id(book_id)
+
+    await tx.add_chapter_with_transaction(book_id, {"title": "C2"}, OWNER)
+
+    assert not book_cache.has(book_id)
+    book = await bookdao.get_book_metadata_by_id(book_id)
+    assert [c["title"] for c in book["table_of_contents"]["chapters"]] == ["C1", "C2"]
+
+
+@pytest.mark.asyncio
+async def test_deleted_book_is_not_served(motor_reinit_db):
+    book_id = await _seed()
+    await bookdao.get_book_metadata_by_id(book_id)
+
+    await bookdao.books_collection.delete_one({"_id": ObjectId(book_id)})
+
+    assert await bookdao.get_book_metadata_by_id(book_id) is None
+    assert not book_cache.has(book_id)
@@ -0,0 +1,167 @@
+"""
+Tests for the book-level ``stats`` (app/db/book_stats.py).
+
+The pure helpers are checked directly. The write paths run against a real
+local MongoDB (via ``motor_reinit_db``): whole-TOC writes set stats computed
+from the TOC they write, and the autosave path moves them by an exact
+``$inc`` guarded on the chapter it read.
+"""
+
+import pytest
+from bson import ObjectId
+
+import app.db.book as bookdao
+import app.db.toc_transactions as tx
+from app.db.book_stats import book_stats, chapter_stats_delta, compute_book_stats
+
+OWNER = "owner-auth-stats"
+
+TOC = {
+    "version": 1,
+    "chapters": [
+        {
+            "id": "a",
+            "title": "A",
+            "status": "completed",
+            "word_count": 120,
+            "subchapters": [{"id": "a1", "title": "A1", "word_count": 30}],
+        },
+        {"id": "b", "title": "B", "status": "in-progress", "word_count": 0},
+    ],
+}
+
+
+def test_compute_book_stats_counts_every_level():
+    stats = compute_book_stats(TOC)
+
+    assert stats == {
+        "total_chapters": 3,
+        "chapters_with_content": 2,
+        "total_word_count": 150,
+        "status_counts": {
+            "draft": 1,
+            "in-progress": 1,
+            "completed": 1,
+            "published": 0,
+        },
+    }
+    assert compute_book_stats(None)["total_chapters"] == 0
+
+
+def test_book_stats_prefers_stored_stats():
+    stored = {"total_chapters": 9}
+
+    assert book_stats({"stats": stored, "table_of_contents": TOC}) is stored
+    assert book_stats({"table_of_contents": TOC})["total_chapters"] == 3
+
+
+def test_chapter_stats_delta():
+    previous = {"word_count": 0, "status": "draft"}
+
+    assert chapter_stats_delta(previous, {"word_count": 150, "status": "in-progress"}) == {
+        "stats.total_word_count": 150,
+        "stats.chapters_with_content": 1,
+        "stats.status_counts.draft": -1,
+        "stats.status_counts.in-progress": 1,
+    }
+    assert chapter_stats_delta(previous, {"content": "<p></p>"}) == {}
+    assert chapter_stats_delta({"word_count": 40}, {"word_count": 10}) == {
+        "stats.total_word_count": -30
+    }
+
+
+async def _seed(stats=True):
+    doc = {"_id": ObjectId(), "owner_id": OWNER, "title": "T", "table_of_contents": TOC}
+    if stats:
+        doc["stats"] = compute_book_stats(TOC)
+    await bookdao.books_collection.insert_one(doc)
+    return str(doc["_id"])
+
+
+async def _stats(book_id):
+    book = await bookdao.books_collection.find_one({"_id": ObjectId(book_id)})
+    return book.get("stats")
+
+
+@pytest.mark.asyncio
+async def test_autosave_increments_stats(motor_reinit_db):
+    book_id = await _seed()
+    previous = TOC["chapters"][0]["subchapters"][0]
+
+    matched = await bookdao.apply_chapter_content_update(
+        book_id,
+        "a1",
+        "a",
+        {"content": "<p>x</p>", "word_count": 130, "status": "in-progress"},
+        OWNER,
+        previous=previous,
+        stats_stored=True,
+    )
+
+    assert matched is True
+    stats = await _stats(book_id)
+    assert stats["total_word_count"] == 250
+    assert stats["status_counts"]["draft"] == 0
+    assert stats["status_counts"]["in-progress"] == 2
+    assert stats == compute_book_stats(
+        (await bookdao.get_book_metadata_by_id(book_id))["table_of_contents"]
+    )
+
+
+@pytest.mark.asyncio
+async def test_autosave_from_stale_read_still_applies_exact_stats(motor_reinit_db):
+    """A delta computed from values the chapter no longer holds is corrected
+    from the chapter as the write found it; the save itself never fails."""
+    book_id = await _seed()
+    stale = {"id": "b", "status": "in-progress", "word_count": 55}
+
+    matched = await bookdao.apply_chapter_content_update(
+        book_id,
+        "b",
+        None,
+        {"word_count": 600, "status": "completed"},
+        OWNER,
+        previous=stale,
+        stats_stored=True,
+    )
+
+    assert matched is True
+    assert await _stats(book_id) == compute_book_stats(
+        (await bookdao.get_book_metadata_by_id(book_id))["table_of_contents"]
+    )
+
+
+@pytest.mark.asyncio
+async def test_autosave_leaves_legacy_book_without_stats(motor_reinit_db):
+    book_id = await _seed(stats=False)
+
+    matched = await bookdao.apply_chapter_content_update(
+        book_id,
+        "b",
+        None,
+        {"word_count": 10},
+        OWNER,
+        previous=TOC["chapters"][1],
+        stats_stored=False,
+    )
+
+    assert matched is True
+    assert await _stats(book_id) is None
+
+
+@pytest.mark.asyncio
+async def test_toc_writes_set_recomputed_stats(motor_reinit_db):
+    book_id = await _seed(stats=False)
+
+    await tx.add_chapter_with_transaction(
+        book_id, {"title": "C", "word_count": 5, "status": "published"}, OWNER
+    )
+
+    stats = await _stats(book_id)
+    assert stats["total_chapters"] == 4
+    assert stats["total_word_count"] == 155
+    assert stats["status_counts"]["published"] == 1
+
+    await tx.update_toc_with_transaction(book_id, {"chapters": []}, OWNER)
+
+    assert (await _stats(book_id))["total_chapters"] == 0
@@ -1,8 +1,9 @@
 """Tests for atomic / safely-ordered cascade book deletion (Plan 008).
 
 The live delete path is ``app.db.book.delete_book``. It removes a book plus its
-chapter access logs, questions, question responses and question ratings, then
-pulls the book from the owner's ``book_ids``. Deletes run inside a MongoDB
+chapter access logs, questions, question responses and question ratings. The
+owner's user document is not touched (``book_ids`` is no longer maintained).
+Deletes run inside a MongoDB
 transaction when a replica set is available; otherwise children are deleted
 first and the book document last so a partial failure leaves the book
 discoverable rather than orphaned.
@@ -50,7 +51,7 @@ async def _seed_book_with_children(owner_id: str) -> str:
 
 @pytest.mark.asyncio
 async def test_delete_book_removes_all_related_data(motor_reinit_db):
-    """Happy path: book and every child collection are emptied, user updated."""
+    """Happy path: book and every child collection are emptied, user untouched."""
     owner = "owner-1"
     book_id = await _seed_book_with_children(owner)
 
@@ -69,8 +70,9 @@ async def test_delete_book_removes_all_related_data(motor_reinit_db):
     assert await ratings.count_documents({}) == 0
     assert await access_logs.count_documents({"book_id": book_id}) == 0
 
+    # Legacy association is left alone; owner_id was the source of truth.
     user = await users.find_one({"auth_id": owner})
-    assert book_id not in user["book_ids"]
+    assert user["book_ids"] == [book_id]
 
 
 @pytest.mark.asyncio
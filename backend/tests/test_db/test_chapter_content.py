@@ -0,0 +1,221 @@
+"""
+Tests for chapter bodies stored outside the book (app/db/chapter_content.py).
+
+Bodies live one document per chapter in ``chapter_contents``; the TOC keeps
+structure and stats. Legacy books still carry inline ``content`` until the
+migration reaches them, so reads merge both (a stored body wins) and every TOC
+write moves inline bodies out without overwriting a newer stored one.
+"""
+
+import pytest
+from bson import ObjectId
+
+import app.db.book as bookdao
+import app.db.toc_transactions as tx
+from app.db.base import get_collection
+from app.db.chapter_content import (
+    content_hash,
+    get_chapter_content_hash,
+    get_chapter_contents,
+    set_chapter_content,
+    split_chapter_contents,
+)
+
+OWNER = "owner-contents"
+
+
+async def _seed(chapters):
+    doc = {
+        "_id": ObjectId(),
+        "owner_id": OWNER,
+        "title": "T",
+        "table_of_contents": {"version": 1, "chapters": chapters},
+    }
+    await bookdao.books_collection.insert_one(doc)
+    return str(doc["_id"])
+
+
+async def _raw_chapters(book_id):
+    book = await bookdao.books_collection.find_one({"_id": ObjectId(book_id)})
+    return book["table_of_contents"]["chapters"]
+
+
+def test_split_strips_bodies_without_touching_input():
+    toc = {
+        "version": 3,
+        "chapters": [
+            {"id": "a", "content": "A", "subchapters": [{"id": "a1", "content": "A1"}]},
+            {"id": "b", "content": ""},
+        ],
+    }
+
+    stripped, contents = split_chapter_contents(toc)
+
+    assert contents == {"a": "A", "a1": "A1"}
+    assert "content" not in stripped["chapters"][0]
+    assert "content" not in stripped["chapters"][0]["subchapters"][0]
+    assert "content" not in stripped["chapters"][1]
+    assert toc["chapters"][0]["content"] == "A"  # caller's copy intact
+
+
+@pytest.mark.asyncio
+async def test_get_book_reads_stored_bodies_and_falls_back_to_inline(motor_reinit_db):
+    book_id = await _seed([
+        {"id": "a", "content": "legacy-a"},
+        {"id": "b", "content": "legacy-b"},
+    ])
+    await set_chapter_content(book_id, "a", "stored-a")
+
+    chapters = (await bookdao.get_book_by_id(book_id))["table_of_contents"]["chapters"]
+
+    assert chapters[0]["content"] == "stored-a"
+    assert chapters[1]["content"] == "legacy-b"
+
+
+@pytest.mark.asyncio
+async def test_content_update_stores_body_outside_the_book(motor_reinit_db):
+    book_id = await _seed([{"id": "a", "content": "legacy-a"}])
+
+    matched = await bookdao.apply_chapter_content_update(
+        book_id, "a", None, {"content": "new-a", "word_count": 1}, OWNER
+    )
+
+    assert matched is True
+    chapter = (await _raw_chapters(book_id))[0]
+    assert "content" not in chapter
+    assert chapter["word_count"] == 1
+    assert await get_chapter_contents(book_id) == {"a": "new-a"}
+
+
+@pytest.mark.asyncio
+async def test_unmatched_content_update_stores_nothing(motor_reinit_db):
+    book_id = await _seed([{"id": "a", "content": "legacy-a"}])
+
+    matched = await bookdao.apply_chapter_content_update(
+        book_id, "a", None, {"content": "hijack"}, "someone-else"
+    )
+
+    assert matched is False
+    assert await get_chapter_contents(book_id) == {}
+
+
+@pytest.mark.asyncio
+async def test_failed_body_write_keeps_a_stored_copy(motor_reinit_db, monkeypatch):
+    """The inline copy is only unset once a stored body exists, so a failure in
+    the final body write can't lose the chapter."""
+    book_id = await _seed([{"id": "a", "content": "legacy-a"}])
+
+    async def failing_write(*args, **kwargs):
+        raise RuntimeError("write failed")
+
+    monkeypatch.setattr(bookdao, "set_chapter_content", failing_write)
+    with pytest.raises(RuntimeError):
+        await bookdao.apply_chapter_content_update(
+            book_id, "a", None, {"content": "new-a"}, OWNER
+        )
+
+    assert "content" not in (await _raw_chapters(book_id))[0]
+    assert await get_chapter_contents(book_id) == {"a": "new-a"}
+
+
+@pytest.mark.asyncio
+async def test_body_write_never_replaces_a_newer_saves_body(motor_reinit_db):
+    """Racing saves end with the body of the one whose TOC write landed last."""
+    book_id = await _seed([{"id": "a"}])
+
+    assert await set_chapter_content(book_id, "a", "from-v3", toc_version=3)
+    assert not await set_chapter_content(book_id, "a", "from-v2", toc_version=2)
+    assert await get_chapter_contents(book_id) == {"a": "from-v3"}
+
+    assert await bookdao.apply_chapter_content_update(
+        book_id, "a", None, {"content": "from-v2-toc"}, OWNER
+    )
+    # The TOC was at version 1, so this save's write produced version 2.
+    assert await get_chapter_contents(book_id) == {"a": "from-v3"}
+
+
+@pytest.mark.asyncio
+async def test_toc_write_moves_inline_bodies_without_overwriting_newer_stored(motor_reinit_db):
+    book_id = await _seed([
+        {"id": "a", "title": "A", "content": "legacy-a"},
+        {"id": "b", "title": "B", "content": "stale-b"},
+    ])
+    # Stored by a later TOC write than the one below (which produces v2).
+    await set_chapter_content(book_id, "b", "newer-b", toc_version=5)
+
+    # A whole-TOC write, carrying the bodies the client read.
+    await tx.update_toc_with_transaction(
+        book_id,
+        {"chapters": [
+            {"id": "a", "title": "A2", "content": "legacy-a"},
+            {"id": "b", "title": "B", "content": "stale-b"},
+        ]},
+        OWNER,
+    )
+
+    chapters = await _raw_chapters(book_id)
+    assert all("content" not in chapter for chapter in chapters)
+    assert chapters[0]["title"] == "A2"
+    assert await get_chapter_contents(book_id) == {"a": "legacy-a", "b": "newer-b"}
+    # Bodies are stored with the hash conditional reads compare against.
+    assert await get_chapter_content_hash(book_id, "a") == content_hash("legacy-a")
+    assert await get_chapter_content_hash(book_id, "b") == content_hash("newer-b")
+    assert await get_chapter_content_hash(book_id, "missing") is None
+
+
+@pytest.mark.asyncio
+async def test_toc_writes_replace_a_stored_body_they_change(motor_reinit_db):
+    book_id = await _seed([{"id": "a", "title": "A"}])
+    await set_chapter_content(book_id, "a", "old-a")
+
+    await tx.update_toc_with_transaction(
+        book_id, {"chapters": [{"id": "a", "title": "A", "content": "edited-a"}]}, OWNER
+    )
+    assert await get_chapter_contents(book_id) == {"a": "edited-a"}
+
+    await bookdao.update_book(
+        book_id,
+        {"table_of_contents": {"chapters": [{"id": "a", "title": "A", "content": "again-a"}]}},
+        OWNER,
+    )
+    assert await get_chapter_contents(book_id) == {"a": "again-a"}
+
+
+@pytest.mark.asyncio
+async def test_delete_chapter_drops_its_bodies(motor_reinit_db):
+    book_id = await _seed([
+        {"id": "a", "subchapters": [{"id": "a1"}]},
+        {"id": "b"},
+    ])
+    for chapter_id in ("a", "a1", "b"):
+        await set_chapter_content(book_id, chapter_id, f"body-{chapter_id}")
+
+    await tx.delete_chapter_with_transaction(book_id, "a", OWNER)
+
+    assert await get_chapter_contents(book_id) == {"b": "body-b"}
+
+
+@pytest.mark.asyncio
+async def test_toc_writes_prune_only_the_chapters_they_remove(motor_reinit_db):
+    book_id = await _seed([{"id": "a"}, {"id": "b"}])
+    # "c" stands for a chapter another request added (and autosaved) after
+    # these writes read the TOC; its body must survive them.
+    for chapter_id in ("a", "b", "c"):
+        await set_chapter_content(book_id, chapter_id, f"body-{chapter_id}")
+
+    await tx.update_toc_with_transaction(book_id, {"chapters": [{"id": "a"}]}, OWNER)
+    assert await get_chapter_contents(book_id) == {"a": "body-a", "c": "body-c"}
+
+    await bookdao.update_book(book_id, {"table_of_contents": {"chapters": []}}, OWNER)
+    assert await get_chapter_contents(book_id) == {"c": "body-c"}
+
+
+@pytest.mark.asyncio
+async def test_book_delete_cascades_to_bodies(motor_reinit_db):
+    book_id = await _seed([{"id": "a"}])
+    await set_chapter_content(book_id, "a", "body")
+
+    assert await bookdao.delete_book(book_id, OWNER) is True
+
+    contents = await get_collection("chapter_contents")
+    assert await contents.count_documents({"book_id": book_id}) == 0
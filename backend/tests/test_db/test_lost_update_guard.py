@@ -37,7 +37,8 @@ async def _seed(toc=None, summary=None, summary_history=None, owner_id=OWNER):
 
 
 async def _book(book_id):
-    return await bookdao.books_collection.find_one({"_id": ObjectId(book_id)})
+    # Chapter bodies live in chapter_contents; read the book as callers see it.
+    return await bookdao.get_book_by_id(book_id)
 
 
 def _chapters(book):
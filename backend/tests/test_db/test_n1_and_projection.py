@@ -22,12 +22,17 @@ from app.db.questions import (
     get_questions_for_chapter,
     get_ratings_for_chapter,
     get_chapter_question_progress,
+    response_summary_fields,
 )
 from app.db.book import (
+    encode_books_cursor,
     get_books_by_user,
     get_book_owner_id,
     get_book_metadata_by_id,
+    get_chapter_by_id,
+    get_chapters_by_ids,
 )
+from app.db.chapter_content import set_chapter_content
 
 pytestmark = pytest.mark.asyncio
 
@@ -50,18 +55,25 @@ async def _seed_question(order: int) -> str:
         "category": "general",
         "order": order,
         "metadata": {"suggested_response_length": "short"},
+        **response_summary_fields(None),
     })
     return str(qid)
 
 
 async def _seed_response(question_id: str, status: str = "completed") -> None:
-    coll = await get_collection("question_responses")
-    await coll.insert_one({
+    """Insert a response and mirror its summary onto the question, as a save does."""
+    response = {
         "question_id": question_id,
         "user_id": USER,
         "response_text": "an answer",
         "status": status,
-    })
+    }
+    coll = await get_collection("question_responses")
+    await coll.insert_one(response)
+    questions = await get_collection("questions")
+    await questions.update_one(
+        {"_id": ObjectId(question_id)}, {"$set": response_summary_fields(response)}
+    )
 
 
 async def _seed_rating(question_id: str, rating: int) -> None:
@@ -289,6 +301,85 @@ async def test_get_book_metadata_by_id_returns_none_for_missing_and_malformed_id
     assert await get_book_metadata_by_id("not-an-object-id") is None
 
 
+async def test_get_chapter_by_id_returns_one_chapter_and_book_metadata(motor_reinit_db):
+    book_id = await _seed_book_with_heavy_chapters()
+    await set_chapter_content(str(book_id), "c1a", "<p>stored</p>")
+
+    book = await get_chapter_by_id(str(book_id), "c1a")
+
+    # The subchapter, found server-side, with its stored body (not the inline one).
+    assert book["chapter"]["id"] == "c1a"
+    assert book["chapter"]["status"] == "draft"
+    assert book["chapter"]["content"] == "<p>stored</p>"
+    assert book["owner_id"] == USER
+    assert book["title"] == "Heavy Book"
+    assert book["genre"] == "nonfiction"
+    assert book["target_audience"] == "engineers"
+    # Nothing else of the book comes back.
+    assert "table_of_contents" not in book
+    assert "summary" not in book
+
+
+async def test_get_chapter_by_id_top_level_chapter_falls_back_to_inline_body(motor_reinit_db):
+    book_id = await _seed_book_with_heavy_chapters()
+
+    book = await get_chapter_by_id(str(book_id), "c1")
+
+    assert book["chapter"]["title"] == "Chapter One"
+    assert book["chapter"]["content"] == "<p>" + "x" * 20000 + "</p>"
+
+
+async def test_get_chapter_by_id_without_content(motor_reinit_db):
+    book_id = await _seed_book_with_heavy_chapters()
+
+    book = await get_chapter_by_id(str(book_id), "c1", include_content=False)
+
+    assert book["chapter"]["title"] == "Chapter One"
+    assert "content" not in book["chapter"]
+
+
+async def test_get_chapter_by_id_missing_chapter_book_and_malformed_id(motor_reinit_db):
+    book_id = await _seed_book_with_heavy_chapters()
+
+    book = await get_chapter_by_id(str(book_id), "nope")
+    assert book["owner_id"] == USER and book["chapter"] is None
+
+    assert await get_chapter_by_id(str(ObjectId()), "c1") is None
+    assert await get_chapter_by_id("not-an-object-id", "c1") is None
+
+
+async def test_get_chapter_by_id_treats_dollar_ids_as_literals(motor_reinit_db):
+    """An id like ``$genre`` must not be read as a field path of the book."""
+    book_id = await _seed_book_with_heavy_chapters()
+    books = await get_collection("books")
+    await books.update_one(
+        {"_id": book_id},
+        {"$push": {"table_of_contents.chapters": {"id": "nonfiction", "title": "N"}}},
+    )
+
+    book = await get_chapter_by_id(str(book_id), "$genre")
+
+    assert book["chapter"] is None
+
+
+async def test_get_chapters_by_ids_returns_only_requested_chapters(motor_reinit_db):
+    book_id = await _seed_book_with_heavy_chapters()
+    books = await get_collection("books")
+    await books.update_one(
+        {"_id": book_id},
+        {"$push": {"table_of_contents.chapters": {"id": "c2", "title": "Two", "content": "<p>2</p>"}}},
+    )
+
+    book = await get_chapters_by_ids(str(book_id), ["c2", "c1a", "missing", "c2"])
+
+    chapters = book["chapters"]
+    assert set(chapters) == {"c2", "c1a"}
+    assert chapters["c2"]["content"] == "<p>2</p>"
+    assert chapters["c1a"]["content"] == "<p>" + "y" * 20000 + "</p>"
+    assert book["owner_id"] == USER
+    assert "table_of_contents" not in book
+
+
 async def test_get_books_by_user_returns_newest_first(motor_reinit_db):
     """The dashboard must show a user's most recent books, not their oldest.
 
@@ -324,9 +415,8 @@ async def test_get_books_by_user_pagination_is_stable_across_pages(motor_reinit_
     Without an explicit sort the order is not guaranteed stable between queries,
     so skip/limit paging can show the same book twice and hide another entirely.
 
-    Distinct timestamps here on purpose: the production sort is updated_at alone
-    (see get_books_by_user for why an _id tiebreaker was measured and rejected),
-    so this pins page boundaries rather than tie-order.
+    Distinct timestamps here, so this pins page boundaries; tie-order is
+    covered by the keyset tests below.
     """
     books = await get_collection("books")
     for i in range(6):
@@ -343,3 +433,33 @@ async def test_get_books_by_user_pagination_is_stable_across_pages(motor_reinit_
     assert page1 == ["Book 5", "Book 4", "Book 3"]
     assert page2 == ["Book 2", "Book 1", "Book 0"]
     assert not set(page1) & set(page2), "pages must not overlap"
+
+
+async def test_get_books_by_user_keyset_pages_walk_ties_without_gaps(motor_reinit_db):
+    """Cursor pages follow (updated_at, _id) DESC, so books sharing an
+    updated_at are neither repeated nor skipped at a page boundary."""
+    books = await get_collection("books")
+    same = datetime(2026, 3, 1, tzinfo=timezone.utc)
+    for i in range(5):
+        await books.insert_one({
+            "owner_id": USER,
+            "title": f"Book {i}",
+            "updated_at": same if i < 4 else datetime(2026, 3, 2, tzinfo=timezone.utc),
+        })
+    await books.insert_one({"owner_id": "someone-else", "title": "Other", "updated_at": same})
+
+    seen, cursor = [], None
+    while True:
+        page = await get_books_by_user(USER, limit=2, cursor=cursor)
+        seen += [b["title"] for b in page]
+        if len(page) < 2:
+            break
+        cursor = encode_books_cursor(page[-1])
+
+    # Newest first, then the tie broken by _id (insertion order here) DESC.
+    assert seen == ["Book 4", "Book 3", "Book 2", "Book 1", "Book 0"]
+
+
+async def test_get_books_by_user_rejects_malformed_cursor(motor_reinit_db):
+    with pytest.raises(ValueError):
+        await get_books_by_user(USER, cursor="not-a-cursor")
@@ -16,6 +16,7 @@ from app.db.base import get_collection
 from app.db.questions import (
     delete_questions_for_chapter,
     count_questions_without_responses,
+    response_summary_fields,
 )
 
 pytestmark = pytest.mark.asyncio
@@ -28,15 +29,26 @@ USER = "user-1"
 async def _seed_question(qid: ObjectId, order: int = 1) -> str:
     coll = await get_collection("questions")
     await coll.insert_one(
-        {"_id": qid, "book_id": BOOK, "chapter_id": CH, "user_id": USER, "order": order}
+        {
+            "_id": qid,
+            "book_id": BOOK,
+            "chapter_id": CH,
+            "user_id": USER,
+            "order": order,
+            **response_summary_fields(None),
+        }
     )
     return str(qid)
 
 
 async def _seed_response(question_id: str) -> None:
+    """Insert a response and mirror its summary onto the question, as a save does."""
+    response = {"question_id": question_id, "user_id": USER, "response_text": "an answer"}
     coll = await get_collection("question_responses")
-    await coll.insert_one(
-        {"question_id": question_id, "user_id": USER, "response_text": "an answer"}
+    await coll.insert_one(response)
+    questions = await get_collection("questions")
+    await questions.update_one(
+        {"_id": ObjectId(question_id)}, {"$set": response_summary_fields(response)}
     )
 
 
@@ -80,10 +92,13 @@ async def test_count_is_zero_when_all_answered(motor_reinit_db):
 async def test_count_ignores_other_users_and_chapters(motor_reinit_db):
     await _seed_question(ObjectId())  # our unanswered question
     coll = await get_collection("questions")
+    unanswered = response_summary_fields(None)
     await coll.insert_one(
-        {"_id": ObjectId(), "book_id": BOOK, "chapter_id": "other-ch", "user_id": USER, "order": 1}
+        {"_id": ObjectId(), "book_id": BOOK, "chapter_id": "other-ch", "user_id": USER,
+         "order": 1, **unanswered}
     )
     await coll.insert_one(
-        {"_id": ObjectId(), "book_id": BOOK, "chapter_id": CH, "user_id": "other-user", "order": 1}
+        {"_id": ObjectId(), "book_id": BOOK, "chapter_id": CH, "user_id": "other-user",
+         "order": 1, **unanswered}
     )
     assert await count_questions_without_responses(BOOK, CH, USER) == 1
@@ -18,7 +18,16 @@ import pytest
 from bson import ObjectId
 
 from app.db.base import get_collection
-from app.db.questions import get_questions_for_chapter
+from app.db.questions import (
+    count_questions_without_responses,
+    get_chapter_question_progress,
+    get_questions_for_chapter,
+    replace_question_in_place,
+    response_summary_fields,
+    save_question_response,
+    save_question_responses_batch,
+)
+from app.schemas.book import QuestionResponseCreate
 
 pytestmark = pytest.mark.asyncio
 
@@ -51,6 +60,14 @@ async def _seed_chapter() -> dict:
     ids_by_order = {}
     for order, status in sorted(SEED.items()):
         qid = ObjectId()
+        response = None
+        if status != "none":
+            response = {
+                "question_id": str(qid),
+                "user_id": USER,
+                "response_text": "an answer",
+                "status": status,
+            }
         await questions.insert_one({
             "_id": qid,
             "book_id": BOOK,
@@ -62,16 +79,12 @@ async def _seed_chapter() -> dict:
             "category": "general",
             "order": order,
             "metadata": {"suggested_response_length": "short"},
+            **response_summary_fields(response),
         })
         ids_by_order[order] = str(qid)
 
-        if status != "none":
-            await responses.insert_one({
-                "question_id": str(qid),
-                "user_id": USER,
-                "response_text": "an answer",
-                "status": status,
-            })
+        if response:
+            await responses.insert_one(response)
 
     return ids_by_order
 
@@ -256,3 +269,110 @@ async def test_unknown_status_value_is_ignored_as_before(motor_reinit_db):
 
     assert len(result.questions) == 7
     assert result.total == 7
+
+
+# --- Denormalized response summary on the question document -----------------
+
+
+async def _question_doc(question_id: str) -> dict:
+    questions = await get_collection("questions")
+    return await questions.find_one({"_id": ObjectId(question_id)})
+
+
+async def test_reads_count_a_question_without_the_summary_as_not_answered(motor_reinit_db):
+    """Until the backfill script has run, a legacy question has no summary
+    fields; it must read as not answered rather than fall out of the filters."""
+    ids = await _seed_chapter()
+    questions = await get_collection("questions")
+    await questions.update_one(
+        {"_id": ObjectId(ids[2])},
+        {"$unset": {"response_status": "", "has_response": "", "word_count": ""}},
+    )
+
+    not_answered = await get_questions_for_chapter(
+        BOOK, CH, USER, status="not_answered", limit=50
+    )
+    assert sorted(q.id for q in not_answered.questions) == sorted([ids[2], ids[6]])
+    assert not_answered.questions[0].response_status == "not_answered"
+    progress = await get_chapter_question_progress(BOOK, CH, USER)
+    assert progress.total == 7
+    assert progress.completed == 4 and progress.in_progress == 1
+    assert await count_questions_without_responses(BOOK, CH, USER) == 2
+
+
+async def test_save_response_moves_question_between_status_filters(motor_reinit_db):
+    ids = await _seed_chapter()
+
+    await save_question_response(
+        ids[2],
+        QuestionResponseCreate(response_text="three words here", status="draft"),
+        USER,
+    )
+    draft = await get_questions_for_chapter(BOOK, CH, USER, status="draft", limit=50)
+    assert sorted(q.id for q in draft.questions) == sorted([ids[2], ids[4]])
+    assert (await _question_doc(ids[2]))["word_count"] == 3
+
+    await save_question_response(
+        ids[2],
+        QuestionResponseCreate(response_text="done now", status="completed"),
+        USER,
+    )
+    completed = await get_questions_for_chapter(BOOK, CH, USER, status="completed", limit=50)
+    assert ids[2] in [q.id for q in completed.questions]
+    assert completed.total == 5
+
+
+async def test_save_response_survives_a_failed_status_sync(motor_reinit_db, monkeypatch):
+    """The response is saved before the question's summary; failing the second
+    write must not report the save as failed."""
+    ids = await _seed_chapter()
+
+    def boom(_response):
+        raise RuntimeError("questions write failed")
+
+    monkeypatch.setattr("app.db.questions.response_summary_fields", boom)
+    saved = await save_question_response(
+        ids[2], QuestionResponseCreate(response_text="kept anyway", status="draft"), USER
+    )
+
+    responses = await get_collection("question_responses")
+    stored = await responses.find_one({"question_id": ids[2], "user_id": USER})
+    assert stored["response_text"] == "kept anyway"
+    assert saved["id"] == str(stored["_id"])
+
+
+async def test_batch_save_updates_every_question(motor_reinit_db):
+    ids = await _seed_chapter()
+
+    result = await save_question_responses_batch(
+        [
+            {"question_id": ids[2], "response_text": "first try", "status": "draft"},
+            {"question_id": ids[6], "response_text": "a b c d", "status": "completed"},
+            # Repeated id collapses to one write; the last item wins.
+            {"question_id": ids[2], "response_text": "final answer here", "status": "completed"},
+        ],
+        USER,
+        BOOK,
+        CH,
+    )
+
+    assert result["saved"] == 3
+    assert (await _question_doc(ids[2]))["response_status"] == "completed"
+    assert (await _question_doc(ids[2]))["word_count"] == 3
+    assert (await _question_doc(ids[6]))["word_count"] == 4
+    not_answered = await get_questions_for_chapter(BOOK, CH, USER, status="not_answered")
+    assert not_answered.total == 0
+
+
+async def test_regenerated_question_is_unanswered_again(motor_reinit_db):
+    ids = await _seed_chapter()
+
+    await replace_question_in_place(ids[1], USER, 0, {"question_text": "Reworded?"})
+
+    doc = await _question_doc(ids[1])
+    assert doc["response_status"] == "not_answered"
+    assert doc["has_response"] is False
+    assert doc["word_count"] == 0
+    progress = await get_chapter_question_progress(BOOK, CH, USER)
+    assert progress.completed == 3 and progress.in_progress == 1
+    assert await count_questions_without_responses(BOOK, CH, USER) == 3
@@ -0,0 +1,41 @@
+"""Test the TOC op log's rebase decision (app/db/toc_op_log.py)"""
+
+from app.db.toc_op_log import TOC_OP_LOG_LENGTH, can_rebase, push_toc_op, toc_ops_since
+
+
+def _book(version, *ops):
+    return {
+        "table_of_contents": {"version": version},
+        "toc_ops": [{"chapters": list(op)} for op in ops],
+    }
+
+
+def test_push_toc_op_is_capped_and_deduplicated():
+    update = {"$push": {"table_of_contents.chapters": {"id": "n"}}}
+
+    push_toc_op(update, ["b", "a", "b", None])
+
+    assert update["$push"]["toc_ops"] == {
+        "$each": [{"chapters": ["a", "b"]}],
+        "$slice": -TOC_OP_LOG_LENGTH,
+    }
+    assert "table_of_contents.chapters" in update["$push"]
+
+
+def test_ops_since_are_the_last_entries():
+    book = _book(5, ["a"], ["b"], ["c"])
+
+    assert toc_ops_since(book, 3) == [{"chapters": ["b"]}, {"chapters": ["c"]}]
+    assert toc_ops_since(book, 1) is None  # older than the log reaches
+    assert toc_ops_since(book, 5) is None  # not behind at all
+    assert toc_ops_since(book, None) is None  # legacy TOC without a version
+
+
+def test_can_rebase_only_over_disjoint_edits():
+    book = _book(3, ["a"], ["b", "c"])
+
+    assert can_rebase(book, 1, ["d"])
+    assert not can_rebase(book, 1, ["c"])
+    assert can_rebase(book, 2, ["a"])  # the edit to a predates our read
+    assert not can_rebase(book, 1, [])
+    assert not can_rebase(_book(3, ["a"], []), 1, ["d"])  # an entry with no ids
@@ -729,3 +729,241 @@ async def test_audit_failure_does_not_fail_a_committed_toc_update(
     stored = await _get_toc(book_id)
     assert stored["chapters"][0]["title"] == "Renamed"
     assert stored["version"] == 2
+
+
+@pytest.mark.asyncio
+async def test_single_chapter_ops_send_only_the_change(seed_book, monkeypatch):
+    """Add/rename/reorder/delete are targeted writes, not whole-TOC rewrites."""
+    book_id, owner = await seed_book(
+        toc=_toc(version=1, chapters=[
+            {"id": "c1", "title": "One", "content": "legacy inline body"},
+            {"id": "c2", "title": "Two"},
+        ])
+    )
+    updates = []
+    real_update_one = tx.books_collection.update_one
+
+    async def recording_update_one(filter, update, *args, **kwargs):
+        updates.append(update)
+        return await real_update_one(filter, update, *args, **kwargs)
+
+    monkeypatch.setattr(tx.books_collection, "update_one", recording_update_one)
+
+    await tx.add_chapter_with_transaction(book_id, {"id": "c3", "title": "Three"}, owner)
+    await tx.update_chapter_with_transaction(book_id, "c2", {"title": "Renamed"}, owner)
+    await tx.reorder_chapters_with_transaction(
+        book_id, [{"id": "c2", "order": 1}, {"id": "c1", "order": 2}], owner
+    )
+    await tx.delete_chapter_with_transaction(book_id, "c3", owner)
+
+    add, rename, reorder, delete = updates
+    assert [c["id"] for c in add["$push"]["table_of_contents.chapters"]["$each"]] == ["c3"]
+    assert set(rename["$set"]) >= {"table_of_contents.chapters.$[c0].title"}
+    assert delete["$pull"] == {"table_of_contents.chapters": {"id": "c3"}}
+    for update in (add, rename, delete):
+        assert "table_of_contents" not in update["$set"]
+    # The reorder names positions in the stored array, never chapter bodies.
+    assert "legacy inline body" not in repr(reorder)
+
+    stored = await _get_toc(book_id)
+    assert [c["id"] for c in stored["chapters"]] == ["c2", "c1"]
+    assert stored["chapters"][0]["title"] == "Renamed"
+    assert stored["chapters"][1]["content"] == "legacy inline body"  # untouched
+    assert stored["version"] == 5
+
+
+@pytest.mark.asyncio
+async def test_targeted_ops_keep_stats(seed_book):
+    book_id, owner = await seed_book(
+        toc=_toc(version=1, chapters=[
+            {"id": "p", "word_count": 10, "status": "draft", "subchapters": [
+                {"id": "s", "word_count": 5, "status": "completed"},
+            ]},
+        ])
+    )
+
+    await tx.add_chapter_with_transaction(
+        book_id, {"title": "New", "word_count": 7}, owner, parent_chapter_id="p"
+    )
+    await tx.delete_chapter_with_transaction(book_id, "s", owner)
+
+    stored = await tx.books_collection.find_one({"_id": ObjectId(book_id)})
+    assert stored["stats"]["total_chapters"] == 2
+    assert stored["stats"]["total_word_count"] == 17
+    assert stored["stats"]["status_counts"]["completed"] == 0
+
+
+@pytest.mark.asyncio
+async def test_targeted_ops_increment_stored_stats(seed_book, monkeypatch):
+    toc = _toc(version=1, chapters=[
+        {"id": "p", "word_count": 10, "status": "draft", "subchapters": [
+            {"id": "s", "word_count": 5, "status": "completed"},
+        ]},
+    ])
+    book_id, owner = await seed_book(toc=toc)
+    await tx.books_collection.update_one(
+        {"_id": ObjectId(book_id)}, {"$set": {"stats": tx.compute_book_stats(toc)}}
+    )
+    updates = []
+    real_update_one = tx.books_collection.update_one
+
+    async def recording_update_one(filter, update, *args, **kwargs):
+        updates.append(update)
+        return await real_update_one(filter, update, *args, **kwargs)
+
+    monkeypatch.setattr(tx.books_collection, "update_one", recording_update_one)
+
+    await tx.add_chapter_with_transaction(
+        book_id, {"title": "New", "word_count": 7, "status": "draft"}, owner
+    )
+    await tx.update_chapter_with_transaction(book_id, "p", {"title": "Renamed"}, owner)
+    await tx.delete_chapter_with_transaction(book_id, "s", owner)
+
+    add, rename, delete = updates
+    for update in updates:
+        assert "stats" not in update["$set"]
+    assert add["$inc"]["stats.total_chapters"] == 1
+    assert add["$inc"]["stats.total_word_count"] == 7
+    assert set(rename["$inc"]) == {"table_of_contents.version"}
+    assert delete["$inc"]["stats.status_counts.completed"] == -1
+    stored = await tx.books_collection.find_one({"_id": ObjectId(book_id)})
+    assert stored["stats"] == tx.compute_book_stats(stored["table_of_contents"])
+
+
+def _interleave_autosave(monkeypatch, book_id, owner, chapter_id):
+    """Run a logged autosave to ``chapter_id`` right after the first read."""
+    from app.db.book import apply_chapter_content_update
+
+    real_find_one = tx.books_collection.find_one
+    state = {"fired": False}
+
+    async def find_one_then_autosave(*args, **kwargs):
+        doc = await real_find_one(*args, **kwargs)
+        if not state["fired"]:
+            state["fired"] = True
+            assert await apply_chapter_content_update(
+                book_id, chapter_id, None, {"word_count": 3}, owner
+            )
+        return doc
+
+    monkeypatch.setattr(tx.books_collection, "find_one", find_one_then_autosave)
+    return state
+
+
+@pytest.mark.asyncio
+async def test_stale_write_to_another_chapter_is_rebased(seed_book, monkeypatch):
+    book_id, owner = await seed_book(
+        toc=_toc(version=1, chapters=[{"id": "c1", "title": "One"}, {"id": "c2"}])
+    )
+    state = _interleave_autosave(monkeypatch, book_id, owner, "c2")
+
+    await tx.update_chapter_with_transaction(book_id, "c1", {"title": "Renamed"}, owner)
+
+    assert state["fired"]
+    stored = await tx.books_collection.find_one({"_id": ObjectId(book_id)})
+    assert stored["table_of_contents"]["version"] == 3
+    assert stored["table_of_contents"]["chapters"][0]["title"] == "Renamed"
+    assert stored["table_of_contents"]["chapters"][1]["word_count"] == 3
+    assert stored["toc_ops"] == [{"chapters": ["c2"]}, {"chapters": ["c1"]}]
+
+
+@pytest.mark.asyncio
+async def test_rebased_appends_get_distinct_default_orders(seed_book, monkeypatch):
+    """Two appends racing through a version miss must not share an ``order``:
+    the rebased one works its default out again from the TOC it re-reads."""
+    book_id, owner = await seed_book(toc=_toc(version=1, chapters=[{"id": "c1", "order": 1}]))
+    real_find_one = tx.books_collection.find_one
+    state = {"fired": False}
+
+    async def find_one_then_append(*args, **kwargs):
+        doc = await real_find_one(*args, **kwargs)
+        if not state["fired"]:
+            state["fired"] = True
+            await tx.add_chapter_with_transaction(book_id, {"title": "Second"}, owner)
+        return doc
+
+    monkeypatch.setattr(tx.books_collection, "find_one", find_one_then_append)
+    first = {"title": "First"}
+    created = await tx.add_chapter_with_transaction(book_id, first, owner)
+
+    assert state["fired"]
+    chapters = (await _get_toc(book_id))["chapters"]
+    assert [c["order"] for c in chapters] == [1, 2, 3]
+    assert chapters[2]["id"] == created["id"] == first["id"]
+    assert first.get("order") is None
+
+
+@pytest.mark.asyncio
+async def test_stale_write_to_the_same_chapter_conflicts(seed_book, monkeypatch):
+    book_id, owner = await seed_book(
+        toc=_toc(version=1, chapters=[{"id": "c1", "title": "One"}, {"id": "c2"}])
+    )
+    _interleave_autosave(monkeypatch, book_id, owner, "c1")
+
+    with pytest.raises(ValueError, match="Version conflict"):
+        await tx.update_chapter_with_transaction(book_id, "c1", {"title": "Renamed"}, owner)
+
+    assert (await _get_toc(book_id))["chapters"][0]["title"] == "One"
+
+
+@pytest.mark.asyncio
+async def test_bulk_status_with_stale_version_rebases_over_other_chapters(seed_book):
+    from app.db.book import apply_chapter_content_update
+
+    book_id, owner = await seed_book(
+        toc=_toc(version=1, chapters=[{"id": "c1"}, {"id": "c2"}])
+    )
+    await apply_chapter_content_update(book_id, "c2", None, {"word_count": 3}, owner)
+
+    await tx.update_chapter_statuses_with_version_guard(
+        book_id, ["c1"], "completed", owner, expected_version=1
+    )
+    assert (await _get_toc(book_id))["chapters"][0]["status"] == "completed"
+
+    with pytest.raises(ValueError, match="Version conflict"):
+        await tx.update_chapter_statuses_with_version_guard(
+            book_id, ["c2"], "completed", owner, expected_version=1
+        )
+
+
+@pytest.mark.asyncio
+async def test_bulk_status_is_one_targeted_write(seed_book, monkeypatch):
+    toc = _toc(version=1, chapters=[
+        {"id": "p1", "status": "draft", "subchapters": [
+            {"id": "s1", "status": "draft"},
+            {"id": "s2", "status": "in-progress"},
+        ]},
+        {"id": "p2", "status": "completed", "subchapters": [
+            {"id": "s3", "status": "draft"},
+        ]},
+    ])
+    book_id, owner = await seed_book(toc=toc)
+    await tx.books_collection.update_one(
+        {"_id": ObjectId(book_id)},
+        {"$set": {"stats": tx.compute_book_stats(toc)}},
+    )
+    calls = []
+    real_update_one = tx.books_collection.update_one
+
+    async def recording_update_one(filter, update, *args, **kwargs):
+        calls.append((update, kwargs.get("array_filters")))
+        return await real_update_one(filter, update, *args, **kwargs)
+
+    monkeypatch.setattr(tx.books_collection, "update_one", recording_update_one)
+
+    await tx.update_chapter_statuses_with_version_guard(
+        book_id, ["p1", "s1", "s3"], "completed", owner, expected_version=1
+    )
+
+    [(update, array_filters)] = calls
+    assert "table_of_contents" not in update["$set"]
+    assert update["$inc"]["stats.status_counts.completed"] == 3
+    assert len(array_filters) == 3  # one per level of each nesting depth
+    stored = await tx.books_collection.find_one({"_id": ObjectId(book_id)})
+    statuses = {c["id"]: c["status"] for c in tx.TocIndex(stored["table_of_contents"]["chapters"])}
+    assert statuses == {
+        "p1": "completed", "s1": "completed", "s2": "in-progress",
+        "p2": "completed", "s3": "completed",
+    }
+    assert stored["stats"] == tx.compute_book_stats(stored["table_of_contents"])
+    assert stored["table_of_contents"]["version"] == 2
@@ -13,6 +13,8 @@ import app.db.user as user_dao
 from app.db import base
 from app.db.user import (
     get_user_by_auth_id,
+    get_auth_user_by_auth_id,
+    get_user_profile,
     get_user_by_id,
     get_user_by_email,
     create_user,
@@ -58,6 +60,19 @@ class TestUserLookups:
     async def test_get_by_auth_id_missing(self, motor_reinit_db):
         assert await get_user_by_auth_id("nope") is None
 
+    async def test_auth_projection_is_slim(self, motor_reinit_db):
+        await _make_user(auth_id="auth-p", plan="pro", bio="x" * 500, book_ids=["b1"])
+        found = await get_auth_user_by_auth_id("auth-p")
+        assert found["plan"] == "pro"
+        assert set(found) <= set(user_dao.AUTH_USER_FIELDS)
+        assert "bio" not in found and "book_ids" not in found
+
+    async def test_profile_drops_book_ids_only(self, motor_reinit_db):
+        await _make_user(auth_id="auth-q", bio="hello", book_ids=["b1"])
+        profile = await get_user_profile("auth-q")
+        assert profile["bio"] == "hello"
+        assert "book_ids" not in profile
+
     async def test_get_by_email(self, motor_reinit_db):
         await _make_user(email="hit@example.com")
         found = await get_user_by_email("hit@example.com")
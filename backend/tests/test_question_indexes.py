@@ -18,6 +18,7 @@ async def test_ensure_question_indexes(motor_reinit_db):
     assert 'book_chapter_user_idx' in index_names, "Missing book_chapter_user_idx"
     assert 'user_created_idx' in index_names, "Missing user_created_idx"
     assert 'chapter_order_idx' in index_names, "Missing chapter_order_idx"
+    assert 'chapter_status_order_idx' in index_names, "Missing chapter_status_order_idx"
 
     # Verify indexes on question_responses collection
     responses_collection = await get_collection("question_responses")
@@ -151,7 +151,7 @@ class TestQuestionSaveVerification:
         ]
 
         # Mock database operations
-        with patch('app.services.question_generation_service.get_book_by_id', new_callable=AsyncMock) as mock_get_book, \
+        with patch('app.services.question_generation_service.get_chapter_by_id', new_callable=AsyncMock) as mock_get_book, \
              patch('app.services.question_generation_service.create_questions_batch', new_callable=AsyncMock) as mock_batch, \
              patch('app.services.question_generation_service.db_get_questions_for_chapter', new_callable=AsyncMock) as mock_get_questions:
 
@@ -161,15 +161,11 @@ class TestQuestionSaveVerification:
                 "title": "Test Book",
                 "genre": "Fiction",
                 "target_audience": "Adults",
-                "table_of_contents": {
-                    "chapters": [
-                        {
-                            "id": "chapter-456",
-                            "title": "Test Chapter",
-                            "content": "Test content",
-                            "description": "Test description"
-                        }
-                    ]
+                "chapter": {
+                    "id": "chapter-456",
+                    "title": "Test Chapter",
+                    "content": "Test content",
+                    "description": "Test description"
                 }
             }
 
@@ -227,7 +223,7 @@ class TestQuestionSaveVerification:
         ]
 
         # Mock database operations
-        with patch('app.services.question_generation_service.get_book_by_id', new_callable=AsyncMock) as mock_get_book, \
+        with patch('app.services.question_generation_service.get_chapter_by_id', new_callable=AsyncMock) as mock_get_book, \
              patch('app.services.question_generation_service.create_questions_batch', new_callable=AsyncMock) as mock_batch, \
              patch('app.services.question_generation_service.db_get_questions_for_chapter', new_callable=AsyncMock) as mock_get_questions:
 
@@ -237,15 +233,11 @@ class TestQuestionSaveVerification:
                 "title": "Test Book",
                 "genre": "Fiction",
                 "target_audience": "Adults",
-                "table_of_contents": {
-                    "chapters": [
-                        {
-                            "id": "chapter-456",
-                            "title": "Test Chapter",
-                            "content": "Test content",
-                            "description": "Test description"
-                        }
-                    ]
+                "chapter": {
+                    "id": "chapter-456",
+                    "title": "Test Chapter",
+                    "content": "Test content",
+                    "description": "Test description"
                 }
             }
 
@@ -292,7 +284,7 @@ class TestQuestionSaveVerification:
         ]
 
         # Mock database operations
-        with patch('app.services.question_generation_service.get_book_by_id', new_callable=AsyncMock) as mock_get_book, \
+        with patch('app.services.question_generation_service.get_chapter_by_id', new_callable=AsyncMock) as mock_get_book, \
              patch('app.services.question_generation_service.create_questions_batch', new_callable=AsyncMock) as mock_batch, \
              patch('app.services.question_generation_service.db_get_questions_for_chapter', new_callable=AsyncMock) as mock_get_questions:
 
@@ -302,15 +294,11 @@ class TestQuestionSaveVerification:
                 "title": "Test Book",
                 "genre": "Fiction",
                 "target_audience": "Adults",
-                "table_of_contents": {
-                    "chapters": [
-                        {
-                            "id": "chapter-456",
-                            "title": "Test Chapter",
-                            "content": "Test content",
-                            "description": "Test description"
-                        }
-                    ]
+                "chapter": {
+                    "id": "chapter-456",
+                    "title": "Test Chapter",
+                    "content": "Test content",
+                    "description": "Test description"
                 }
             }
 
@@ -354,7 +342,7 @@ class TestQuestionSaveVerification:
         ]
 
         # Mock database operations
-        with patch('app.services.question_generation_service.get_book_by_id', new_callable=AsyncMock) as mock_get_book, \
+        with patch('app.services.question_generation_service.get_chapter_by_id', new_callable=AsyncMock) as mock_get_book, \
              patch('app.services.question_generation_service.create_questions_batch', new_callable=AsyncMock) as mock_batch, \
              patch('app.services.question_generation_service.db_get_questions_for_chapter', new_callable=AsyncMock) as mock_get_questions:
 
@@ -364,15 +352,11 @@ class TestQuestionSaveVerification:
                 "title": "Test Book",
                 "genre": "Fiction",
                 "target_audience": "Adults",
-                "table_of_contents": {
-                    "chapters": [
-                        {
-                            "id": "chapter-456",
-                            "title": "Test Chapter",
-                            "content": "Test content",
-                            "description": "Test description"
-                        }
-                    ]
+                "chapter": {
+                    "id": "chapter-456",
+                    "title": "Test Chapter",
+                    "content": "Test content",
+                    "description": "Test description"
                 }
             }
 
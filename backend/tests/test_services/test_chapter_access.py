@@ -2,8 +2,8 @@
 
 import pytest
 from app.services.chapter_access_service import ChapterAccessService
-from datetime import datetime
-from unittest.mock import AsyncMock, MagicMock
+from datetime import datetime, timezone
+from unittest.mock import AsyncMock, MagicMock, patch
 
 
 @pytest.fixture
@@ -12,8 +12,19 @@ def access_service():
     return ChapterAccessService()
 
 
+@pytest.fixture(autouse=True)
+def rollups():
+    """Keep the derived-view writes off the (mocked) database."""
+    from app.services import chapter_access_service as svc
+
+    with patch.object(svc, "record_daily_rollups", AsyncMock()) as record, \
+         patch.object(svc, "record_recent_chapters", AsyncMock()), \
+         patch.object(svc, "live_book_events", AsyncMock(side_effect=lambda docs: docs)):
+        yield record
+
+
 @pytest.mark.asyncio
-async def test_log_chapter_access(access_service):
+async def test_log_chapter_access(access_service, rollups):
     """Test logging chapter access"""
     # Mock the collection
     mock_collection = MagicMock()
@@ -30,6 +41,8 @@ async def test_log_chapter_access(access_service):
 
     assert result == "123"
     mock_collection.insert_one.assert_called_once()
+    (logged,), _ = rollups.call_args
+    assert logged[0]["access_type"] == "view"
 
     # Log edit access with metadata
     edit_result = await access_service.log_access(
@@ -46,31 +59,28 @@ async def test_log_chapter_access(access_service):
 @pytest.mark.asyncio
 async def test_get_user_tab_state(access_service):
     """Test retrieving user tab state"""
-    # Mock the collection
-    mock_cursor = MagicMock()
-    mock_cursor.sort = MagicMock(return_value=mock_cursor)
-    mock_cursor.limit = MagicMock(return_value=mock_cursor)
-    mock_cursor.to_list = AsyncMock(return_value=[{
+    from app.services import chapter_access_service as svc
+
+    mock_collection = MagicMock()
+    mock_collection.find_one = AsyncMock(return_value={
+        "_id": "user123:book456",
         "user_id": "user123",
         "book_id": "book456",
-        "access_type": "tab_state",
         "metadata": {
             "active_chapter_id": "ch1",
             "open_tab_ids": ["ch1", "ch2"],
             "tab_order": ["ch1", "ch2"]
         }
-    }])
-
-    mock_collection = MagicMock()
-    mock_collection.find = MagicMock(return_value=mock_cursor)
-    access_service._get_collection = AsyncMock(return_value=mock_collection)
+    })
 
-    # Get tab state
-    state = await access_service.get_user_tab_state(
-        user_id="user123",
-        book_id="book456"
-    )
+    with patch.object(svc, "get_collection", AsyncMock(return_value=mock_collection)) as get_coll:
+        state = await access_service.get_user_tab_state(
+            user_id="user123",
+            book_id="book456"
+        )
 
+    get_coll.assert_awaited_once_with("chapter_tab_states")
+    mock_collection.find_one.assert_awaited_once_with({"_id": "user123:book456"})
     assert state is not None
     assert state["user_id"] == "user123"
     assert state["metadata"]["active_chapter_id"] == "ch1"
@@ -79,78 +89,243 @@ async def test_get_user_tab_state(access_service):
 @pytest.mark.asyncio
 async def test_get_chapter_analytics(access_service):
     """Test getting chapter analytics"""
-    # Mock the collection
+    from app.services import chapter_access_service as svc
+
     mock_cursor = MagicMock()
     mock_cursor.to_list = AsyncMock(return_value=[
         {"_id": {"chapter_id": "ch1", "access_type": "view"}, "count": 10, "last_access": datetime.now()},
-        {"_id": {"chapter_id": "ch2", "access_type": "edit"}, "count": 5, "last_access": datetime.now()}
+        {"_id": {"chapter_id": "ch1", "access_type": "edit"}, "count": 5, "last_access": datetime.now()}
     ])
 
     mock_collection = MagicMock()
     mock_collection.aggregate = MagicMock(return_value=mock_cursor)
-    access_service._get_collection = AsyncMock(return_value=mock_collection)
 
-    # Get analytics
-    analytics = await access_service.get_chapter_analytics(
-        book_id="book456",
-        days=30
-    )
+    with patch.object(svc, "get_collection", AsyncMock(return_value=mock_collection)) as get_coll:
+        analytics = await access_service.get_chapter_analytics(
+            book_id="book456",
+            days=30,
+            chapter_id="ch1",
+        )
 
+    get_coll.assert_awaited_once_with("chapter_access_daily")
+    match = mock_collection.aggregate.call_args.args[0][0]["$match"]
+    assert match["book_id"] == "book456"
+    assert match["chapter_id"] == "ch1"
     assert isinstance(analytics, list)
     assert len(analytics) == 2
     assert analytics[0]["count"] == 10
 
 
+def test_daily_rollup_ops_collapse_per_key_and_weight_samples():
+    from app.services.chapter_access_service import daily_rollup_ops
+
+    def event(access_type, hour, rate=1.0):
+        return {
+            "book_id": "b1", "chapter_id": "ch1", "access_type": access_type,
+            "timestamp": datetime(2026, 5, 4, hour, tzinfo=timezone.utc), "sample_rate": rate,
+        }
+
+    ops = daily_rollup_ops([event("view", 9), event("view", 17), event("read_content", 10, rate=0.25)])
+
+    by_id = {op._filter["_id"]: op._doc for op in ops}
+    assert set(by_id) == {"b1:ch1:view:2026-05-04", "b1:ch1:read_content:2026-05-04"}
+    view = by_id["b1:ch1:view:2026-05-04"]
+    assert view["$inc"] == {"count": 2.0}
+    assert view["$max"] == {"last_access": datetime(2026, 5, 4, 17, tzinfo=timezone.utc)}
+    assert view["$setOnInsert"]["day"] == datetime(2026, 5, 4, tzinfo=timezone.utc)
+    assert by_id["b1:ch1:read_content:2026-05-04"]["$inc"] == {"count": 4.0}
+    assert all(op._upsert for op in ops)
+
+
 @pytest.mark.asyncio
 async def test_save_tab_state(access_service):
     """Test saving tab state"""
-    # Mock the collection
-    mock_collection = MagicMock()
-    mock_collection.insert_one = AsyncMock(return_value=MagicMock(inserted_id="456"))
-    access_service._get_collection = AsyncMock(return_value=mock_collection)
+    from app.services import chapter_access_service as svc
 
-    # Save tab state
-    result = await access_service.save_tab_state(
-        user_id="user123",
-        book_id="book456",
-        active_chapter_id="ch1",
-        open_tab_ids=["ch1", "ch2", "ch3"],
-        tab_order=["ch1", "ch2", "ch3"],
-        session_id="session123"
-    )
+    mock_collection = MagicMock()
+    mock_collection.update_one = AsyncMock()
+    access_service._get_collection = AsyncMock()
 
-    assert result == "456"
-    mock_collection.insert_one.assert_called_once()
+    with patch.object(svc, "get_collection", AsyncMock(return_value=mock_collection)):
+        result = await access_service.save_tab_state(
+            user_id="user123",
+            book_id="book456",
+            active_chapter_id="ch1",
+            open_tab_ids=["ch1", "ch2", "ch3"],
+            tab_order=["ch1", "ch2", "ch3"],
+            session_id="session123"
+        )
 
-    # Verify the metadata was saved correctly
-    call_args = mock_collection.insert_one.call_args[0][0]
-    assert call_args["metadata"]["active_chapter_id"] == "ch1"
-    assert call_args["metadata"]["open_tab_ids"] == ["ch1", "ch2", "ch3"]
-    assert call_args["metadata"]["tab_order"] == ["ch1", "ch2", "ch3"]
+    assert result == "user123:book456"
+    # One upserted document per (user, book); nothing goes to the access log.
+    access_service._get_collection.assert_not_called()
+    mock_collection.update_one.assert_awaited_once()
+    query, update = mock_collection.update_one.call_args.args
+    assert query == {"_id": "user123:book456"}
+    assert mock_collection.update_one.call_args.kwargs["upsert"] is True
+    saved = update["$set"]
+    assert saved["metadata"]["active_chapter_id"] == "ch1"
+    assert saved["metadata"]["open_tab_ids"] == ["ch1", "ch2", "ch3"]
+    assert saved["metadata"]["tab_order"] == ["ch1", "ch2", "ch3"]
+    assert saved["session_id"] == "session123"
 
 
 @pytest.mark.asyncio
 async def test_get_user_recent_chapters(access_service):
     """Test getting user's recent chapters"""
-    # Mock the collection
-    mock_cursor = MagicMock()
-    mock_cursor.to_list = AsyncMock(return_value=[
-        {"_id": "ch1", "last_access": datetime.now(), "access_count": 5},
-        {"_id": "ch2", "last_access": datetime.now(), "access_count": 3}
-    ])
+    from app.services import chapter_access_service as svc
 
     mock_collection = MagicMock()
-    mock_collection.aggregate = MagicMock(return_value=mock_cursor)
-    access_service._get_collection = AsyncMock(return_value=mock_collection)
+    mock_collection.find_one = AsyncMock(return_value={
+        "_id": "user123:book456",
+        "chapters": [
+            {"chapter_id": "ch1", "last_access": datetime.now(), "access_count": 5},
+            {"chapter_id": "ch2", "last_access": datetime.now(), "access_count": 3},
+        ],
+    })
 
-    # Get recent chapters
-    recent = await access_service.get_user_recent_chapters(
-        user_id="user123",
-        book_id="book456",
-        limit=10
-    )
+    with patch.object(svc, "get_collection", AsyncMock(return_value=mock_collection)) as get_coll:
+        recent = await access_service.get_user_recent_chapters(
+            user_id="user123",
+            book_id="book456",
+            limit=10
+        )
 
+    get_coll.assert_awaited_once_with("chapter_recent")
+    query, projection = mock_collection.find_one.call_args.args
+    assert query == {"_id": "user123:book456"}
+    assert projection == {"chapters": {"$slice": 10}}
     assert isinstance(recent, list)
     assert len(recent) == 2
     assert recent[0]["_id"] == "ch1"
     assert recent[0]["access_count"] == 5
+
+
+def test_recent_chapter_ops_one_update_per_user_book_most_recent_first():
+    from app.services.chapter_access_service import recent_chapter_ops
+
+    def event(user_id, chapter_id, minute, access_type="view"):
+        return {
+            "user_id": user_id, "book_id": "b1", "chapter_id": chapter_id,
+            "access_type": access_type,
+            "timestamp": datetime(2026, 5, 4, 9, minute, tzinfo=timezone.utc),
+        }
+
+    ops = recent_chapter_ops([
+        event("u1", "ch1", 1),
+        event("u1", "ch2", 2, access_type="edit"),
+        event("u1", "ch1", 3),
+        event("u1", "ch3", 4, access_type="read_content"),  # not a recency event
+        event("u2", "ch9", 5),
+    ])
+
+    by_id = {op._filter["_id"]: op._doc for op in ops}
+    assert set(by_id) == {"u1:b1", "u2:b1"}
+    merged = by_id["u1:b1"][0]["$set"]["chapters"]["$let"]["in"]["$slice"][0]["$concatArrays"]
+    fresh = merged[0]["$map"]["input"]["$literal"]
+    assert [(e["chapter_id"], e["access_count"]) for e in fresh] == [("ch1", 2), ("ch2", 1)]
+    assert recent_chapter_ops([event("u1", "ch3", 4, access_type="read_content")]) == []
+
+
+def _writer(**kwargs):
+    from app.services.chapter_access_service import ChapterAccessWriter
+
+    opts = {"max_queue": 100, "batch_size": 50, "flush_interval": 60}
+    opts.update(kwargs)
+    return ChapterAccessWriter(**opts)
+
+
+@pytest.mark.asyncio
+class TestAccessLogIngestion:
+    async def test_running_writer_buffers_and_returns_client_id(self, access_service):
+        from app.services import chapter_access_service as svc
+
+        mock_collection = MagicMock()
+        mock_collection.insert_one = AsyncMock()
+        access_service._get_collection = AsyncMock(return_value=mock_collection)
+        writer = _writer()
+        with patch.object(svc, "chapter_access_writer", writer):
+            writer.start()
+            log_id = await access_service.log_access(
+                user_id="u1", book_id="b1", chapter_id="ch1", access_type="read_content"
+            )
+            assert writer.stats()["queue_depth"] == 1
+            batch_collection = AsyncMock()
+            with patch.object(svc, "get_collection", AsyncMock(return_value=batch_collection)):
+                await writer.stop()
+        mock_collection.insert_one.assert_not_called()
+        batch_collection.insert_many.assert_awaited_once()
+        assert len(log_id) == 24
+
+    async def test_sampling_keeps_configured_fraction(self, access_service):
+        from app.services import chapter_access_service as svc
+
+        mock_collection = MagicMock()
+        mock_collection.insert_one = AsyncMock(return_value=MagicMock(inserted_id="1"))
+        access_service._get_collection = AsyncMock(return_value=mock_collection)
+        with patch.object(svc.settings, "CHAPTER_ACCESS_SAMPLE_RATES", "read_content=0.5"), \
+             patch.object(svc.random, "random", side_effect=[0.7, 0.2]):
+            dropped = await access_service.log_access(
+                user_id="u1", book_id="b1", chapter_id="ch1", access_type="read_content"
+            )
+            kept = await access_service.log_access(
+                user_id="u1", book_id="b1", chapter_id="ch1", access_type="read_content"
+            )
+        assert dropped is None
+        assert kept == "1"
+        doc = mock_collection.insert_one.call_args.args[0]
+        assert doc["sample_rate"] == 0.5
+
+    async def test_sampled_types_are_shed_under_backpressure(self, access_service):
+        from app.services import chapter_access_service as svc
+
+        writer = _writer(max_queue=2)
+        with patch.object(svc, "chapter_access_writer", writer), \
+             patch.object(svc.settings, "CHAPTER_ACCESS_SAMPLE_RATES", "read_content=0.99"), \
+             patch.object(svc.random, "random", return_value=0.0):
+            writer.start()
+            await access_service.log_access(
+                user_id="u1", book_id="b1", chapter_id="ch1", access_type="edit"
+            )
+            shed = await access_service.log_access(
+                user_id="u1", book_id="b1", chapter_id="ch1", access_type="read_content"
+            )
+            kept = await access_service.log_access(
+                user_id="u1", book_id="b1", chapter_id="ch1", access_type="export_pdf"
+            )
+            stats = writer.stats()
+            with patch.object(svc, "get_collection", AsyncMock(return_value=AsyncMock())):
+                await writer.stop()
+        assert shed is None
+        assert kept is not None
+        assert stats["shed"] == 1
+
+    async def test_flush_skips_deleted_books(self, access_service):
+        """Events queued before a book's cascade delete must not recreate its data."""
+        from app.services import chapter_access_service as svc
+
+        writer = _writer()
+        batch = [
+            {"book_id": "live", "access_type": "view"},
+            {"book_id": "gone", "access_type": "view"},
+        ]
+        logs = AsyncMock()
+        with patch.object(svc, "live_book_events", AsyncMock(return_value=batch[:1])), \
+             patch.object(svc, "get_collection", AsyncMock(return_value=logs)):
+            await writer.insert_many(batch)
+
+        logs.insert_many.assert_awaited_once_with(batch[:1], ordered=False)
+        assert writer.stats()["deleted_book_events"] == 1
+
+    async def test_rollup_failure_is_not_a_write_failure(self, access_service, rollups):
+        from app.services import chapter_access_service as svc
+
+        rollups.side_effect = RuntimeError("rollup down")
+        writer = _writer()
+        with patch.object(svc, "get_collection", AsyncMock(return_value=AsyncMock())):
+            await writer._write([{"book_id": "b1", "access_type": "view"}])
+
+        stats = writer.stats()
+        assert stats["written"] == 1
+        assert stats["write_failures"] == 0
+        assert stats["rollup_failures"] == 1
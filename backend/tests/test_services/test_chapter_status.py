@@ -162,3 +162,17 @@ def test_validate_bulk_update(status_service):
     assert result["valid_count"] == 1
     assert result["invalid_count"] == 3
     assert len(result["invalid_updates"]) == 3
+
+
+def test_validate_bulk_update_checks_transitions(status_service):
+    """An update carrying current_status must be an allowed transition"""
+    result = status_service.validate_bulk_update([
+        {"chapter_id": "ch1", "status": "completed", "current_status": "draft"},
+        {"chapter_id": "ch2", "status": "published", "current_status": "draft"},
+        {"chapter_id": "ch3", "status": "draft", "current_status": "draft"},
+    ])
+
+    assert result["valid"] is False
+    assert result["valid_count"] == 2
+    assert result["invalid_updates"][0]["update"]["chapter_id"] == "ch2"
+    assert "draft -> published" in result["invalid_updates"][0]["error"]
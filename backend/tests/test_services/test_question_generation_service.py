@@ -389,37 +389,27 @@ class TestGenerateChapterQuestions:
 class TestGenerateQuestionsForChapter:
     async def test_ai_service_error_propagates_to_caller(self, service, mock_ai_service):
         """The orchestration layer must not re-swallow structured AI errors (#182)."""
-        book = {"title": "Bk", "table_of_contents": {"chapters": []}}
+        book = {"title": "Bk", "chapter": None}
         mock_ai_service.generate_chapter_questions.side_effect = AIRateLimitError("outage")
-        with patch(f"{MODULE}.get_book_by_id", AsyncMock(return_value=book)):
+        with patch(f"{MODULE}.get_chapter_by_id", AsyncMock(return_value=book)):
             with pytest.raises(AIServiceError):
                 await service.generate_questions_for_chapter(
                     book_id="book-1", chapter_id="ch-1", user_id="u1"
                 )
 
     async def test_book_not_found_raises(self, service):
-        with patch(f"{MODULE}.get_book_by_id", AsyncMock(return_value=None)):
+        with patch(f"{MODULE}.get_chapter_by_id", AsyncMock(return_value=None)):
             with pytest.raises(ValueError, match="Book not found"):
                 await service.generate_questions_for_chapter(
                     book_id="missing", chapter_id="ch-1", user_id="u1"
                 )
 
-    async def test_happy_path_finds_subchapter_and_saves(self, service, mock_ai_service):
+    async def test_happy_path_uses_chapter_and_saves(self, service, mock_ai_service):
         book = {
             "title": "Bk",
             "genre": "Fantasy",
             "target_audience": "Adults",
-            "table_of_contents": {
-                "chapters": [
-                    {
-                        "id": "parent",
-                        "title": "Parent",
-                        "subchapters": [
-                            {"id": "ch-1", "title": "Target", "content": "c", "description": "d"}
-                        ],
-                    }
-                ]
-            },
+            "chapter": {"id": "ch-1", "title": "Target", "content": "c", "description": "d"},
         }
         mock_ai_service.generate_chapter_questions.return_value = [
             {"question_text": "A good question for the saved path here?", "question_type": "plot", "difficulty": "medium"}
@@ -427,12 +417,12 @@ class TestGenerateQuestionsForChapter:
         saved = [_saved_question_dict("q1", 1), _saved_question_dict("q2", 2)]
         verify = QuestionListResponse(questions=[], total=2, page=1, pages=1)
 
-        with patch(f"{MODULE}.get_book_by_id", AsyncMock(return_value=book)), \
+        with patch(f"{MODULE}.get_chapter_by_id", AsyncMock(return_value=book)), \
              patch(f"{MODULE}.create_questions_batch", AsyncMock(return_value=saved)), \
              patch(f"{MODULE}.db_get_questions_for_chapter", AsyncMock(return_value=verify)):
             result = await service.generate_questions_for_chapter(
                 book_id="book-1",
-                chapter_id="ch-1",  # only reachable via subchapter recursion (86-89)
+                chapter_id="ch-1",
                 count=2,
                 difficulty="invalid-level",  # invalid -> MEDIUM (113-114)
                 focus=["character", "bogus"],  # bogus skipped (121-122)
@@ -442,13 +432,13 @@ class TestGenerateQuestionsForChapter:
         assert result.total == 2
 
     async def test_question_conversion_error_raises(self, service, mock_ai_service):
-        book = {"title": "Bk", "table_of_contents": {"chapters": []}}
+        book = {"title": "Bk", "chapter": None}
         mock_ai_service.generate_chapter_questions.return_value = [
             {"question_text": "A question to drive the save path here?", "question_type": "plot", "difficulty": "easy"}
         ]
         bad_saved = [{"id": "q1"}]  # missing required Question fields -> conversion error (153-157)
 
-        with patch(f"{MODULE}.get_book_by_id", AsyncMock(return_value=book)), \
+        with patch(f"{MODULE}.get_chapter_by_id", AsyncMock(return_value=book)), \
              patch(f"{MODULE}.create_questions_batch", AsyncMock(return_value=bad_saved)):
             with pytest.raises(Exception):
                 await service.generate_questions_for_chapter(
@@ -456,11 +446,11 @@ class TestGenerateQuestionsForChapter:
                 )
 
     async def test_batch_save_failure_raises(self, service, mock_ai_service):
-        book = {"title": "Bk", "table_of_contents": {"chapters": []}}
+        book = {"title": "Bk", "chapter": None}
         mock_ai_service.generate_chapter_questions.return_value = [
             {"question_text": "A question to drive the save path here?", "question_type": "plot", "difficulty": "easy"}
         ]
-        with patch(f"{MODULE}.get_book_by_id", AsyncMock(return_value=book)), \
+        with patch(f"{MODULE}.get_chapter_by_id", AsyncMock(return_value=book)), \
              patch(f"{MODULE}.create_questions_batch", AsyncMock(side_effect=RuntimeError("db boom"))):
             with pytest.raises(Exception, match="Failed to save questions"):
                 await service.generate_questions_for_chapter(
@@ -468,14 +458,14 @@ class TestGenerateQuestionsForChapter:
                 )
 
     async def test_persistence_verification_mismatch_raises(self, service, mock_ai_service):
-        book = {"title": "Bk", "table_of_contents": {"chapters": []}}
+        book = {"title": "Bk", "chapter": None}
         mock_ai_service.generate_chapter_questions.return_value = [
             {"question_text": "A question to drive the save path here?", "question_type": "plot", "difficulty": "easy"}
         ]
         saved = [_saved_question_dict("q1", 1), _saved_question_dict("q2", 2)]
         # verification reports fewer than saved -> discrepancy (174-181)
         verify = QuestionListResponse(questions=[], total=1, page=1, pages=1)
-        with patch(f"{MODULE}.get_book_by_id", AsyncMock(return_value=book)), \
+        with patch(f"{MODULE}.get_chapter_by_id", AsyncMock(return_value=book)), \
              patch(f"{MODULE}.create_questions_batch", AsyncMock(return_value=saved)), \
              patch(f"{MODULE}.db_get_questions_for_chapter", AsyncMock(return_value=verify)):
             with pytest.raises(Exception, match="Failed to save questions"):
@@ -650,7 +640,7 @@ class TestRegenerationImprovements:
         existing["regeneration_count"] = 1
         book = {
             "id": "book-1", "title": "Bk", "genre": "", "target_audience": "",
-            "table_of_contents": {"chapters": [{"id": "ch-1", "title": "Ch", "content": ""}]},
+            "chapter": {"id": "ch-1", "title": "Ch", "content": ""},
         }
         mock_ai_service.generate_chapter_questions.return_value = [
             {"question_text": "A brand new distinct question about the hero?", "question_type": "character", "difficulty": "medium"}
@@ -661,7 +651,7 @@ class TestRegenerationImprovements:
         updated["regeneration_count"] = 2
 
         with patch(f"{MODULE}.get_question_by_id", AsyncMock(return_value=existing)), \
-             patch(f"{MODULE}.get_book_by_id", AsyncMock(return_value=book)), \
+             patch(f"{MODULE}.get_chapter_by_id", AsyncMock(return_value=book)), \
              patch(f"{MODULE}.db_get_questions_for_chapter",
                    AsyncMock(return_value=QuestionListResponse(questions=[existing], total=1, page=1, pages=1))), \
              patch(f"{MODULE}.db_get_ratings_for_chapter", AsyncMock(return_value=[])), \
@@ -685,13 +675,13 @@ class TestRegenerationImprovements:
         existing = _saved_question_dict(qid="q-old", order=1)
         book = {
             "id": "book-1", "title": "Bk", "genre": "", "target_audience": "",
-            "table_of_contents": {"chapters": [{"id": "ch-1", "title": "Ch", "content": ""}]},
+            "chapter": {"id": "ch-1", "title": "Ch", "content": ""},
         }
         mock_ai_service.generate_chapter_questions.return_value = [
             {"question_text": "A distinct new question about the plot?", "question_type": "plot", "difficulty": "medium"}
         ]
         with patch(f"{MODULE}.get_question_by_id", AsyncMock(return_value=existing)), \
-             patch(f"{MODULE}.get_book_by_id", AsyncMock(return_value=book)), \
+             patch(f"{MODULE}.get_chapter_by_id", AsyncMock(return_value=book)), \
              patch(f"{MODULE}.db_get_questions_for_chapter",
                    AsyncMock(return_value=QuestionListResponse(questions=[existing], total=1, page=1, pages=1))), \
              patch(f"{MODULE}.db_get_ratings_for_chapter", AsyncMock(return_value=[])), \
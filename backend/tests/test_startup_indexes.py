@@ -32,7 +32,8 @@ async def test_create_all_indexes_creates_owner_and_ttl_indexes(motor_reinit_db)
 
     books_indexes = await _index_map(base._db.books)
     assert "owner_book_id_idx" in books_indexes
-    assert "owner_updated_idx" in books_indexes
+    assert "owner_updated_id_idx" in books_indexes
+    assert "owner_updated_idx" not in books_indexes
 
     access_indexes = await _index_map(base._db.chapter_access_logs)
     assert "access_logs_ttl_idx" in access_indexes
@@ -41,12 +42,10 @@ async def test_create_all_indexes_creates_owner_and_ttl_indexes(motor_reinit_db)
         "user_book_timestamp_idx",
         "book_chapter_timestamp_idx",
         "user_access_type_timestamp_idx",
-        "user_book_access_type_idx",
     ):
         assert name in access_indexes
-    assert access_indexes["user_book_access_type_idx"]["partialFilterExpression"] == {
-        "access_type": "tab_state"
-    }
+    # Tab state moved to chapter_tab_states; its partial index is gone.
+    assert "user_book_access_type_idx" not in access_indexes
 
 
 @pytest.mark.asyncio
@@ -78,6 +77,37 @@ async def test_no_text_index_on_books(motor_reinit_db):
     assert "chapter_content_text_idx" not in books_indexes
 
 
+@pytest.mark.asyncio
+async def test_stale_tab_state_index_is_dropped(motor_reinit_db):
+    await _warm_collections()
+    await base._db.chapter_access_logs.create_index(
+        [("user_id", 1), ("book_id", 1), ("access_type", 1)],
+        name="user_book_access_type_idx",
+        partialFilterExpression={"access_type": "tab_state"},
+    )
+    await ChapterTabIndexManager(base._db).create_all_indexes()
+
+    access_indexes = await _index_map(base._db.chapter_access_logs)
+    assert "user_book_access_type_idx" not in access_indexes
+
+
+@pytest.mark.asyncio
+async def test_superseded_owner_updated_index_is_replaced(motor_reinit_db):
+    await _warm_collections()
+    await base._db.books.create_index(
+        [("owner_id", 1), ("updated_at", -1)], name="owner_updated_idx"
+    )
+    await ChapterTabIndexManager(base._db).create_all_indexes()
+
+    books_indexes = await _index_map(base._db.books)
+    assert "owner_updated_idx" not in books_indexes
+    assert list(books_indexes["owner_updated_id_idx"]["key"].items()) == [
+        ("owner_id", 1),
+        ("updated_at", -1),
+        ("_id", -1),
+    ]
+
+
 @pytest.mark.asyncio
 async def test_lifespan_creates_owner_and_ttl_indexes(motor_reinit_db):
     """The actual #183 bug: app startup never created these indexes. Run the
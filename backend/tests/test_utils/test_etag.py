@@ -0,0 +1,32 @@
+"""Test the conditional-request helpers (app/utils/etag.py)"""
+
+from app.utils.etag import book_etag, etag_matches, make_etag
+
+
+def test_make_etag_is_quoted_and_deterministic():
+    etag = make_etag(3, "2026-01-01")
+
+    assert etag.startswith('"') and etag.endswith('"')
+    assert etag == make_etag(3, "2026-01-01")
+    assert etag != make_etag(4, "2026-01-01")
+    assert make_etag(1) != make_etag("1")
+
+
+def test_book_etag_follows_version_and_updated_at():
+    book = {"table_of_contents": {"version": 2}, "updated_at": "t1"}
+
+    assert book_etag(book) == book_etag({**book, "title": "ignored"})
+    assert book_etag(book) != book_etag({**book, "updated_at": "t2"})
+    assert book_etag(book) != book_etag(book, "toc")
+    assert book_etag({}) == book_etag({"table_of_contents": None})
+
+
+def test_etag_matches_lists_wildcard_and_weak_tags():
+    etag = make_etag(1)
+
+    assert etag_matches(f'"other", {etag}', etag)
+    assert etag_matches("*", etag)
+    assert etag_matches(f"W/{etag}", etag)
+    assert not etag_matches(f"W/{etag}", etag, weak=False)
+    assert not etag_matches(None, etag)
+    assert not etag_matches('"other"', etag)
@@ -0,0 +1,37 @@
+"""Test the delta-autosave patch applier (app/utils/text_patch.py)"""
+
+import pytest
+
+from app.utils.text_patch import TextPatchError, apply_text_patch
+
+
+def test_retain_delete_insert_with_implicit_tail():
+    ops = [{"retain": 6}, {"delete": 5}, {"insert": "there"}]
+
+    assert apply_text_patch("Hello world, again", ops) == "Hello there, again"
+
+
+def test_empty_patch_and_empty_base():
+    assert apply_text_patch("same", []) == "same"
+    assert apply_text_patch("", [{"insert": "new"}]) == "new"
+
+
+def test_counts_are_code_points():
+    assert apply_text_patch("café ok", [{"retain": 4}, {"insert": "!"}]) == "café! ok"
+
+
+@pytest.mark.parametrize(
+    "ops",
+    [
+        [{"retain": 10}],  # past the end
+        [{"delete": -1}],
+        [{"retain": True}],
+        [{"insert": 3}],
+        [{"replace": "x"}],
+        [{"retain": 1, "insert": "x"}],
+        ["retain"],
+    ],
+)
+def test_malformed_ops_are_rejected(ops):
+    with pytest.raises(TextPatchError):
+        apply_text_patch("short", ops)
@@ -0,0 +1,57 @@
+"""Test the TOC index (app/utils/toc_index.py)"""
+
+from app.utils.toc_index import TocIndex
+
+CHAPTERS = [
+    {
+        "id": "a",
+        "title": "A",
+        "subchapters": [
+            {"id": "a1", "title": "A1", "subchapters": [{"id": "a1x", "title": "A1x"}]},
+            {"id": "a2", "title": "A2"},
+        ],
+    },
+    {"id": "b", "title": "B"},
+]
+
+
+def test_flattens_in_toc_order():
+    index = TocIndex(CHAPTERS)
+
+    assert [chapter["id"] for chapter in index] == ["a", "a1", "a1x", "a2", "b"]
+    assert [node.position for node in index.nodes()] == [0, 1, 2, 3, 4]
+    assert len(index) == 5
+
+
+def test_lookup_parent_and_depth_at_every_level():
+    index = TocIndex(CHAPTERS)
+
+    assert index.get("a1x")["title"] == "A1x"
+    assert index.node("a1x").depth == 3
+    assert index.parent_id("a1x") == "a1"
+    assert index.parent_id("a2") == "a"
+    assert index.parent_id("b") is None
+    assert index.node("b").depth == 1
+    assert "missing" not in index
+    assert index.get("missing") is None
+    assert index.parent_id("missing") is None
+
+
+def test_nodes_share_the_toc_dicts():
+    chapters = [{"id": "a", "status": "draft"}]
+
+    TocIndex(chapters).get("a")["status"] = "completed"
+
+    assert chapters[0]["status"] == "completed"
+
+
+def test_duplicate_id_resolves_to_first_occurrence():
+    index = TocIndex([{"id": "x", "title": "first"}, {"id": "x", "title": "second"}])
+
+    assert index.get("x")["title"] == "first"
+    assert len(index) == 2
+
+
+def test_from_book_tolerates_missing_toc():
+    assert len(TocIndex.from_book({})) == 0
+    assert len(TocIndex.from_book({"table_of_contents": None})) == 0